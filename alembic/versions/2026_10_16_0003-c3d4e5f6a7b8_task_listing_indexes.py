@@ -0,0 +1,60 @@
+"""Task listing indexes for keyset pagination
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6g7
+Create Date: 2026-10-16 00:00:00.000000+00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Revision tanimlayicilari (Alembic tarafindan kullanilir)
+revision: str = "c3d4e5f6a7b8"
+down_revision: Union[str, None] = "b2c3d4e5f6g7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (indeks adi, kolonlar)
+_INDEXES = (
+    ("ix_tasks_created_at_id", ["created_at", "id"]),
+    ("ix_tasks_status_created_at_id", ["status", "created_at", "id"]),
+    ("ix_tasks_agent_created_at_id", ["agent", "created_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    """Keyset sayfalama ve filtreli listeleme indekslerini olusturur.
+
+    Buyuk tablolarda yazmalari kilitlememek icin indeksler
+    PostgreSQL'de CONCURRENTLY ile olusturulur. (created_at, id)
+    indeksi eski tek kolonlu created_at indeksini kapsar.
+    """
+    with op.get_context().autocommit_block():
+        for name, columns in _INDEXES:
+            op.create_index(
+                name, "tasks", columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index(
+            "ix_tasks_created_at", table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Listeleme indekslerini kaldirir, created_at indeksini geri yukler."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_created_at", "tasks", ["created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, _ in reversed(_INDEXES):
+            op.drop_index(
+                name, table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
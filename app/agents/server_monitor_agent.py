@@ -5,13 +5,14 @@ risk/aciliyet seviyelerini belirler ve gerektiginde bildirim gonderir.
 """
 
 import asyncio
-import platform
 import logging
+import platform
+import shlex
 from typing import Any
 
 from app.agents.base_agent import BaseAgent, TaskResult
 from app.config import settings
-from app.core.decision_matrix import RiskLevel, UrgencyLevel, ActionType
+from app.core.decision_matrix import ActionType, RiskLevel, UrgencyLevel
 from app.models.server import (
     CpuMetrics,
     DiskMetrics,
@@ -22,26 +23,32 @@ from app.models.server import (
     ServerMetrics,
     ServiceStatus,
 )
-from app.tools.ssh_manager import SSHManager
+from app.tools.ssh_pool import SSHConnectionPool, get_ssh_pool
 
 logger = logging.getLogger("atlas.agent.server_monitor")
 
+# Probe ciktisindaki bolum basligi oneki
+_PROBE_MARKER = "@@atlas:"
+
 
 class ServerMonitorAgent(BaseAgent):
     """Sunucu saglik izleme agent'i.
 
     SSH uzerinden sunucularin CPU, RAM, disk ve servis metriklerini toplar,
-    esik degerlerine gore siniflandirir ve raporlar.
+    esik degerlerine gore siniflandirir ve raporlar. Metrikler havuzdaki
+    kalici baglanti uzerinden tek bir probe betigiyle toplanir.
 
     Attributes:
         servers: Izlenecek sunucu yapilandirmalari.
         thresholds: Metrik esik degerleri.
+        ssh_pool: SSH baglanti havuzu.
     """
 
     def __init__(
         self,
         servers: list[ServerConfig] | None = None,
         thresholds: MetricThresholds | None = None,
+        ssh_pool: SSHConnectionPool | None = None,
     ) -> None:
         """ServerMonitorAgent'i baslatir.
 
@@ -50,9 +57,12 @@ class ServerMonitorAgent(BaseAgent):
                 Bos ise config'den varsayilan sunucu eklenir.
             thresholds: Metrik esik degerleri.
                 Bos ise varsayilan degerler kullanilir.
+            ssh_pool: SSH baglanti havuzu.
+                Bos ise surec genelindeki paylasilan havuz kullanilir.
         """
         super().__init__(name="server_monitor")
         self.thresholds = thresholds or MetricThresholds()
+        self.ssh_pool = ssh_pool or get_ssh_pool()
         self.servers: list[ServerConfig] = list(servers) if servers else []
 
         # Config'den varsayilan sunucu ekle
@@ -302,27 +312,27 @@ class ServerMonitorAgent(BaseAgent):
                 overall_status=MetricStatus.CRITICAL,
             )
 
-        # SSH ile metrik toplama
+        # Havuzdaki baglanti uzerinden tek probe ile metrik toplama
         try:
-            async with SSHManager(
+            async with self.ssh_pool.lease(
                 host=server.host,
                 user=server.user,
                 key_path=server.key_path,
                 port=server.port,
             ) as ssh:
-                cpu = await self._collect_cpu(ssh)
-                ram = await self._collect_ram(ssh)
-                disks = await self._collect_disks(ssh)
-                services = await self._check_services(ssh, server.services)
-
-                return ServerMetrics(
-                    host=host,
-                    reachable=True,
-                    cpu=cpu,
-                    ram=ram,
-                    disks=disks,
-                    services=services,
+                stdout, _, _ = await ssh.execute_command(
+                    self._build_probe(server.services)
                 )
+            sections = self._split_probe(stdout)
+
+            return ServerMetrics(
+                host=host,
+                reachable=True,
+                cpu=self._parse_cpu(sections.get("cpu", ""), sections.get("load", "")),
+                ram=self._parse_ram(sections.get("mem", "")),
+                disks=self._parse_disks(sections.get("disk", "")),
+                services=self._parse_services(sections.get("svc", ""), server.services),
+            )
         except Exception as exc:
             self.logger.error("SSH metrik toplama hatasi [%s]: %s", host, exc)
             return ServerMetrics(
@@ -353,39 +363,85 @@ class ServerMonitorAgent(BaseAgent):
             )
             returncode = await asyncio.wait_for(proc.wait(), timeout=5)
             return returncode == 0
-        except (asyncio.TimeoutError, OSError) as exc:
+        except (TimeoutError, OSError) as exc:
             self.logger.debug("Ping hatasi [%s]: %s", host, exc)
             return False
 
-    async def _collect_cpu(self, ssh: SSHManager) -> CpuMetrics:
-        """SSH uzerinden CPU metriklerini toplar.
+    @staticmethod
+    def _build_probe(services: list[str]) -> str:
+        """Tum metrikleri tek seferde toplayan shell betigi.
+
+        Her bolum ``@@atlas:<ad>`` satiriyla baslar; bir bolumun
+        hatasi digerlerini etkilemez.
 
         Args:
-            ssh: Aktif SSH baglantisi.
+            services: Kontrol edilecek servis adlari.
+
+        Returns:
+            Shell betigi.
+        """
+        parts = [
+            f"echo '{_PROBE_MARKER}cpu'",
+            "top -bn1 | grep 'Cpu(s)' | awk '{print $2+$4}'",
+            f"echo '{_PROBE_MARKER}load'",
+            "cat /proc/loadavg",
+            f"echo '{_PROBE_MARKER}mem'",
+            "free -m | grep Mem",
+            f"echo '{_PROBE_MARKER}disk'",
+            "df -BG --output=target,size,used,avail,pcent | tail -n +2",
+            f"echo '{_PROBE_MARKER}svc'",
+        ]
+        for svc_name in services:
+            quoted = shlex.quote(svc_name)
+            parts.append(
+                f"printf '%s %s\\n' {quoted} "
+                f"\"$(systemctl is-active {quoted} 2>/dev/null)\""
+            )
+        return "; ".join(parts)
+
+    @staticmethod
+    def _split_probe(stdout: str) -> dict[str, str]:
+        """Probe ciktisini bolumlere ayirir.
+
+        Args:
+            stdout: Probe ciktisi.
+
+        Returns:
+            Bolum adi -> bolum metni.
+        """
+        sections: dict[str, list[str]] = {}
+        current: list[str] | None = None
+        for line in stdout.splitlines():
+            if line.startswith(_PROBE_MARKER):
+                current = sections.setdefault(line[len(_PROBE_MARKER):].strip(), [])
+            elif current is not None:
+                current.append(line)
+        return {name: "\n".join(lines).strip() for name, lines in sections.items()}
+
+    def _parse_cpu(self, usage_out: str, load_out: str) -> CpuMetrics:
+        """CPU metriklerini ayristirir.
+
+        Args:
+            usage_out: CPU kullanim yuzdesi ciktisi.
+            load_out: /proc/loadavg ciktisi.
 
         Returns:
             CPU metrikleri.
         """
-        # CPU kullanim yuzdesi
-        stdout, _, _ = await ssh.execute_command(
-            "top -bn1 | grep 'Cpu(s)' | awk '{print $2+$4}'"
-        )
         usage = 0.0
         try:
-            usage = float(stdout.strip())
+            usage = float(usage_out.strip())
         except (ValueError, IndexError):
-            self.logger.warning("CPU yuzdesi ayristirilamadi: %s", stdout)
+            self.logger.warning("CPU yuzdesi ayristirilamadi: %s", usage_out)
 
-        # Load average
-        stdout2, _, _ = await ssh.execute_command("cat /proc/loadavg")
         load_1m = load_5m = load_15m = 0.0
         try:
-            parts = stdout2.strip().split()
+            parts = load_out.strip().split()
             load_1m = float(parts[0])
             load_5m = float(parts[1])
             load_15m = float(parts[2])
         except (ValueError, IndexError):
-            self.logger.warning("Load average ayristirilamadi: %s", stdout2)
+            self.logger.warning("Load average ayristirilamadi: %s", load_out)
 
         return CpuMetrics(
             usage_percent=usage,
@@ -394,16 +450,15 @@ class ServerMonitorAgent(BaseAgent):
             load_15m=load_15m,
         )
 
-    async def _collect_ram(self, ssh: SSHManager) -> RamMetrics:
-        """SSH uzerinden RAM metriklerini toplar.
+    def _parse_ram(self, stdout: str) -> RamMetrics:
+        """RAM metriklerini ayristirir.
 
         Args:
-            ssh: Aktif SSH baglantisi.
+            stdout: ``free -m | grep Mem`` ciktisi.
 
         Returns:
             RAM metrikleri.
         """
-        stdout, _, _ = await ssh.execute_command("free -m | grep Mem")
         total = used = available = 0
         usage_pct = 0.0
         try:
@@ -423,18 +478,15 @@ class ServerMonitorAgent(BaseAgent):
             usage_percent=round(usage_pct, 1),
         )
 
-    async def _collect_disks(self, ssh: SSHManager) -> list[DiskMetrics]:
-        """SSH uzerinden disk metriklerini toplar.
+    def _parse_disks(self, stdout: str) -> list[DiskMetrics]:
+        """Disk metriklerini ayristirir.
 
         Args:
-            ssh: Aktif SSH baglantisi.
+            stdout: ``df`` ciktisi (baslik satiri haric).
 
         Returns:
             Disk metrikleri listesi.
         """
-        stdout, _, _ = await ssh.execute_command(
-            "df -BG --output=target,size,used,avail,pcent | tail -n +2"
-        )
         disks: list[DiskMetrics] = []
         for line in stdout.strip().splitlines():
             try:
@@ -457,24 +509,28 @@ class ServerMonitorAgent(BaseAgent):
                 self.logger.warning("Disk satiri ayristirilamadi: %s", line)
         return disks
 
-    async def _check_services(
-        self, ssh: SSHManager, services: list[str]
-    ) -> list[ServiceStatus]:
-        """SSH uzerinden systemd servis durumlarini kontrol eder.
+    @staticmethod
+    def _parse_services(stdout: str, services: list[str]) -> list[ServiceStatus]:
+        """Servis durumlarini ayristirir.
+
+        Ciktida bulunmayan servisler durmus sayilir.
 
         Args:
-            ssh: Aktif SSH baglantisi.
-            services: Kontrol edilecek servis adlari.
+            stdout: ``<servis> <durum>`` satirlari.
+            services: Kontrol edilen servis adlari.
 
         Returns:
             Servis durumlari listesi.
         """
+        states: dict[str, str] = {}
+        for line in stdout.splitlines():
+            name, _, state = line.rpartition(" ")
+            if name:
+                states[name] = state.strip()
+
         statuses: list[ServiceStatus] = []
         for svc_name in services:
-            stdout, _, exit_code = await ssh.execute_command(
-                f"systemctl is-active {svc_name}"
-            )
-            is_active = stdout.strip() == "active" and exit_code == 0
+            is_active = states.get(svc_name) == "active"
             statuses.append(ServiceStatus(
                 name=svc_name,
                 is_active=is_active,
@@ -26,15 +26,19 @@ class TaskListResponse(BaseModel):
 
     Attributes:
         tasks: Gorev listesi.
-        total: Toplam sonuc sayisi.
+        total: Filtreye uyan toplam gorev sayisi.
         limit: Sayfa basi kayit siniri.
         offset: Baslangic ofseti.
+        next_cursor: Sonraki sayfa imleci (son sayfada None).
+        total_exact: Toplam kesin mi (False ise tahmini).
     """
 
     tasks: list[TaskResponse]
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
+    total_exact: bool = True
 
 
 class TaskDetailResponse(BaseModel):
@@ -177,18 +181,26 @@ async def list_tasks(
     agent: str | None = Query(default=None, description="Agent adi filtresi"),
     limit: int = Query(default=50, ge=1, le=200, description="Sayfa basi kayit"),
     offset: int = Query(default=0, ge=0, description="Baslangic ofseti"),
+    cursor: str | None = Query(default=None, description="Sonraki sayfa imleci"),
 ) -> TaskListResponse:
     """Gorevleri filtreli listeler.
 
+    Derin sayfalar icin ``offset`` yerine onceki yanitin
+    ``next_cursor`` degeri ``cursor`` olarak gonderilmelidir.
+
     Args:
         request: FastAPI istek nesnesi.
         status: Durum filtresi (pending, running, completed, failed, cancelled).
         agent: Agent adi filtresi.
         limit: Sayfa basi kayit siniri.
         offset: Baslangic ofseti.
+        cursor: Keyset sayfalama imleci.
 
     Returns:
         Gorev listesi yaniti.
+
+    Raises:
+        HTTPException: Gecersiz durum veya imlec (400).
     """
     task_manager = _get_task_manager(request)
 
@@ -201,15 +213,20 @@ async def list_tasks(
                 detail=f"Gecersiz durum: {status}. Gecerli: {', '.join(valid_statuses)}",
             )
 
-    tasks = await task_manager.list_tasks(
-        status=status, agent=agent, limit=limit, offset=offset,
-    )
+    try:
+        page = await task_manager.list_tasks_page(
+            status=status, agent=agent, limit=limit, cursor=cursor, offset=offset,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     return TaskListResponse(
-        tasks=tasks,
-        total=len(tasks),
+        tasks=page.tasks,
+        total=page.total,
         limit=limit,
         offset=offset,
+        next_cursor=page.next_cursor,
+        total_exact=page.total_exact,
     )
 
 
@@ -377,7 +394,7 @@ async def search_memory(
         raise HTTPException(
             status_code=503,
             detail="Semantik hafiza kullanilamiyor",
-        )
+        ) from exc
 
     return MemorySearchResponse(
         results=results,
@@ -5,6 +5,7 @@ Periyodik gorevler (monitor tasklari) burada zamanlanir.
 """
 
 import logging
+from typing import Any
 
 from celery import Celery
 
@@ -33,25 +34,92 @@ celery_app.conf.update(
 celery_app.autodiscover_tasks(["app.tasks"])
 
 # Beat zamanlama — periyodik monitor gorevleri
-celery_app.conf.beat_schedule = {
-    "server-monitor": {
-        "task": "app.tasks.monitor_tasks.run_server_monitor",
-        "schedule": settings.server_monitor_interval,
-    },
-    "security-monitor": {
-        "task": "app.tasks.monitor_tasks.run_security_monitor",
-        "schedule": settings.security_monitor_interval,
-    },
-    "ads-monitor": {
-        "task": "app.tasks.monitor_tasks.run_ads_monitor",
-        "schedule": settings.ads_monitor_interval,
-    },
-    "opportunity-monitor": {
-        "task": "app.tasks.monitor_tasks.run_opportunity_monitor",
-        "schedule": settings.opportunity_monitor_interval,
-    },
+# (monitor adi, beat girdisi, task, aralik)
+_MONITOR_SCHEDULE: tuple[tuple[str, str, str, int], ...] = (
+    ("server", "server-monitor",
+     "app.tasks.monitor_tasks.run_server_monitor", settings.server_monitor_interval),
+    ("security", "security-monitor",
+     "app.tasks.monitor_tasks.run_security_monitor", settings.security_monitor_interval),
+    ("ads", "ads-monitor",
+     "app.tasks.monitor_tasks.run_ads_monitor", settings.ads_monitor_interval),
+    ("opportunity", "opportunity-monitor",
+     "app.tasks.monitor_tasks.run_opportunity_monitor", settings.opportunity_monitor_interval),
+)
+
+# Monitor adi -> soft time limit (saniye); tekil task'lar da buradan okur
+MONITOR_SOFT_TIME_LIMITS: dict[str, int] = {
+    "server": 270,
+    "security": 3300,
+    "ads": 3300,
+    "opportunity": 82800,
 }
 
+# Grup butcesi payi: uye wait_for siniri once dolar
+GROUP_TIME_MARGIN = 60
+
+
+def group_time_limits(names: list[str]) -> tuple[int, int]:
+    """Monitor grubu icin zaman sinirlarini hesaplar.
+
+    Soft limit grubun en uzun uyesinin siniri arti paydir;
+    boylece kisa monitorlerden olusan bir grup en uzun
+    monitorun butcesini devralmaz.
+
+    Args:
+        names: Gruptaki monitor adlari.
+
+    Returns:
+        (soft time limit, time limit) ikilisi.
+    """
+    soft = max(MONITOR_SOFT_TIME_LIMITS[name] for name in names) + GROUP_TIME_MARGIN
+    return soft, soft + GROUP_TIME_MARGIN
+
+
+def build_beat_schedule(fanout: bool = False) -> dict[str, dict[str, Any]]:
+    """Monitor beat zamanlamasini olusturur.
+
+    Fan-out modunda ayni araliga sahip monitorler tek bir
+    ``run_monitor_group`` girdisinde toplanir ve worker'in
+    kalici dongusunde esanli calisir; tek basina kalan
+    monitorler kendi task'ini kullanir. Grup girdileri
+    uyelerine gore hesaplanan zaman sinirlarini
+    ``options`` ile tasir.
+
+    Args:
+        fanout: Ayni aralikli monitorleri grupla.
+
+    Returns:
+        Beat schedule sozlugu.
+    """
+    if not fanout:
+        return {
+            entry: {"task": task, "schedule": interval}
+            for _, entry, task, interval in _MONITOR_SCHEDULE
+        }
+
+    groups: dict[int, list[tuple[str, str, str, int]]] = {}
+    for spec in _MONITOR_SCHEDULE:
+        groups.setdefault(spec[3], []).append(spec)
+
+    schedule: dict[str, dict[str, Any]] = {}
+    for interval, members in groups.items():
+        if len(members) == 1:
+            _, entry, task, _ = members[0]
+            schedule[entry] = {"task": task, "schedule": interval}
+            continue
+        names = [name for name, _, _, _ in members]
+        soft_limit, hard_limit = group_time_limits(names)
+        schedule[f"monitor-group-{interval}"] = {
+            "task": "app.tasks.monitor_tasks.run_monitor_group",
+            "schedule": interval,
+            "args": (names,),
+            "options": {"soft_time_limit": soft_limit, "time_limit": hard_limit},
+        }
+    return schedule
+
+
+celery_app.conf.beat_schedule = build_beat_schedule(settings.celery_monitor_fanout)
+
 logger.info(
     "Celery uygulama yapilandirildi (broker=%s, %d periyodik gorev)",
     settings.celery_broker_url,
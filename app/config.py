@@ -42,6 +42,10 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6379/0"
     redis_max_connections: int = 10
+    redis_near_cache_enabled: bool = False
+    redis_near_cache_size: int = 10000
+    redis_near_cache_ttl: int = 30
+    redis_invalidation_channel: str = "atlas:invalidate"
 
     # Qdrant (Vektor Veritabani)
     qdrant_host: str = "localhost"
@@ -51,15 +55,23 @@ class Settings(BaseSettings):
     qdrant_collection_prefix: str = "atlas"
     qdrant_embedding_model: str = "BAAI/bge-small-en-v1.5"
     qdrant_embedding_dimension: int = 384
+    qdrant_embedding_batch_size: int = 32
+    qdrant_embedding_batch_wait_ms: float = 5.0
+    qdrant_embedding_cache_size: int = 4096
 
     # Celery
     celery_broker_url: str = "redis://localhost:6379/1"
     celery_result_backend: str = "redis://localhost:6379/2"
+    celery_async_runtime: bool = True
+    celery_monitor_fanout: bool = False
 
     # SSH
     ssh_default_host: str = ""
     ssh_default_user: str = ""
     ssh_default_key_path: str = "~/.ssh/id_rsa"
+    ssh_pool_idle_timeout: float = 300.0
+    ssh_pool_keepalive: int = 30
+    ssh_pool_max_channels: int = 4
 
     # Research
     tavily_api_key: SecretStr = Field(default=SecretStr(""))
@@ -95,6 +107,13 @@ class Settings(BaseSettings):
     task_manager_max_concurrent: int = 5
     task_manager_retry_backoff_base: int = 5
     task_manager_retry_backoff_max: int = 300
+    task_manager_scheduler: str = "fifo"  # fifo | fair
+    task_manager_agent_concurrency: dict[str, int] = Field(default_factory=dict)
+    task_manager_agent_weights: dict[str, float] = Field(default_factory=dict)
+    task_manager_write_behind: bool = False
+    task_manager_flush_interval: float = 0.5
+    task_manager_flush_max_batch: int = 500
+    task_manager_journal_path: str = ""  # write-behind icin zorunlu
 
     # Monitor Intervals (saniye)
     server_monitor_interval: int = 300
@@ -1,10 +1,16 @@
 """ATLAS Monte Carlo simulasyon modulu.
 
 Sonuc dagilimi, duyarlilik analizi ve what-if senaryolari
-icin Monte Carlo simulasyon motoru.
+icin Monte Carlo simulasyon motoru. Dizi-uyumlu modeller
+tum ornek sutunlarini tek cagrida alir; buyuk kosular
+parcali (sinirli bellekli) modda calistirilabilir.
 """
 
 import logging
+import pickle
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from typing import Any, Callable
 
 import numpy as np
@@ -19,6 +25,74 @@ from app.models.probability import (
 
 logger = logging.getLogger("atlas.autonomy.monte_carlo")
 
+_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Havuz kullanimi icin is parcacigi basina en az ornek
+_MIN_SAMPLES_PER_WORKER = 2000
+
+
+def vectorized(model_fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Model fonksiyonunu dizi-uyumlu olarak isaretler.
+
+    Isaretli model her degisken icin ornek dizisini
+    keyword arg olarak alir ve ayni uzunlukta bir dizi
+    (veya yayinlanabilir bir skaler) dondurmelidir.
+
+    Args:
+        model_fn: NumPy islemleriyle yazilmis model.
+
+    Returns:
+        Ayni fonksiyon (``vectorized = True`` ile).
+    """
+    model_fn.vectorized = True  # type: ignore[attr-defined]
+    return model_fn
+
+
+def _evaluate_scalar(
+    model_fn: Callable[..., float],
+    columns: dict[str, np.ndarray],
+    n: int,
+) -> np.ndarray:
+    """Skaler modeli her ornek icin calistirir.
+
+    Process havuzunda da kullanildigi icin modul
+    duzeyindedir.
+
+    Args:
+        model_fn: Skaler model.
+        columns: Degisken -> ornek dizisi.
+        n: Ornek sayisi.
+
+    Returns:
+        Sonuc dizisi.
+    """
+    out = np.empty(n)
+    lists = {name: arr.tolist() for name, arr in columns.items()}
+    for i in range(n):
+        out[i] = model_fn(
+            **{name: vals[i] for name, vals in lists.items()},
+        )
+    return out
+
+
+def _picklable(model_fn: Callable[..., Any]) -> bool:
+    """Model process havuzuna gonderilebilir mi.
+
+    Args:
+        model_fn: Model.
+
+    Returns:
+        Pickle edilebiliyorsa True.
+    """
+    try:
+        pickle.dumps(model_fn)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        logger.warning(
+            "Model pickle edilemiyor, seri degerlendirme kullaniliyor",
+        )
+        return False
+    return True
+
 
 class MonteCarloSimulator:
     """Monte Carlo simulasyon motoru.
@@ -26,21 +100,30 @@ class MonteCarloSimulator:
     Tanimlanan degiskenler ve model fonksiyonu ile
     tekrarli simulasyon calistirarak sonuc dagilimi uretir.
 
+    Model ``vectorized`` ile isaretlenmisse ornek
+    sutunlari tek cagrida verilir; degilse ornek
+    basina cagrilir ve ``workers`` > 1 ise bu dongu
+    process havuzuna dagitilir.
+
     Attributes:
         config: Simulasyon yapilandirmasi.
         rng: Numpy rasgele sayi ureteci.
+        workers: Skaler modeller icin process sayisi.
     """
 
     def __init__(
         self,
         config: SimulationConfig | None = None,
+        workers: int = 0,
     ) -> None:
         """MonteCarloSimulator'u baslatir.
 
         Args:
             config: Simulasyon yapilandirmasi (None ise varsayilan).
+            workers: Skaler model process sayisi (0/1: kapali).
         """
         self.config = config or SimulationConfig()
+        self.workers = workers
         seed = self.config.random_seed
         self.rng = np.random.default_rng(seed)
         logger.info(
@@ -65,60 +148,122 @@ class MonteCarloSimulator:
         """
         cfg = config or self.config
         n = cfg.n_simulations
+        rng = self._rng_for(cfg, config)
 
-        if cfg.random_seed is not None and config is not None:
-            rng = np.random.default_rng(cfg.random_seed)
-        else:
-            rng = self.rng
-
-        # Degisken orneklerini uret
-        samples: dict[str, np.ndarray] = {}
-        for var_name, var_config in cfg.variables.items():
-            samples[var_name] = self._generate_samples(
-                var_config, n, rng,
-            )
+        # Degisken orneklerini uret ve modeli calistir
+        samples = self._draw(cfg, n, rng)
+        results, mode = self._evaluate(model_fn, samples, n)
 
-        # Model fonksiyonunu her ornek icin calistir
-        results = np.zeros(n)
-        for i in range(n):
-            kwargs = {
-                name: float(arr[i]) for name, arr in samples.items()
-            }
-            results[i] = model_fn(**kwargs)
-
-        # Istatistikler
         mean = float(np.mean(results))
         std = float(np.std(results, ddof=1)) if n > 1 else 0.0
 
-        percentiles = {
-            "5": float(np.percentile(results, 5)),
-            "25": float(np.percentile(results, 25)),
-            "50": float(np.percentile(results, 50)),
-            "75": float(np.percentile(results, 75)),
-            "95": float(np.percentile(results, 95)),
-        }
+        return self._build_result(
+            mean=mean,
+            std=std,
+            n=n,
+            percentiles=self._percentiles(results),
+            convergence=self._check_convergence(results),
+            metadata={"mode": mode},
+        )
 
-        # Guven araligi
-        se = std / np.sqrt(n) if n > 0 else 0.0
-        if n >= 30:
-            lower, upper = stats.norm.interval(0.95, loc=mean, scale=se)
-        else:
-            lower, upper = (mean - 2 * se, mean + 2 * se)
+    def simulate_streaming(
+        self,
+        model_fn: Callable[..., float],
+        config: SimulationConfig | None = None,
+        chunk_size: int = 100_000,
+        convergence_threshold: float = 0.01,
+        early_stop: bool = False,
+        reservoir_size: int = 100_000,
+    ) -> SimulationResult:
+        """Parcali, sinirli bellekli simulasyon.
 
-        ci = ConfidenceInterval(
-            lower=float(lower), upper=float(upper),
-            confidence_level=0.95, mean=mean,
-        )
+        Ornekler ``chunk_size``'lik parcalarda uretilip
+        degerlendirilir. Ortalama/varyans parca bazli
+        birlestirilen moment'lerle, yuzdelikler sabit
+        boyutlu rasgele rezervuardan hesaplanir. Her
+        parcadan sonra parca ortalamasi ile kosan
+        ortalama karsilastirilir; ``early_stop`` ise
+        yakinsayinca durulur. Process havuzu
+        gerekiyorsa kosu boyunca bir kez acilir.
 
-        convergence = self._check_convergence(results)
+        Args:
+            model_fn: Model fonksiyonu.
+            config: Ozel yapilandirma (None ise self.config).
+            chunk_size: Parca basina ornek.
+            convergence_threshold: Yakinsaklik esigi.
+            early_stop: Yakinsayinca erken dur.
+            reservoir_size: Yuzdelik rezervuar boyutu.
 
-        return SimulationResult(
+        Returns:
+            Simulasyon sonucu.
+        """
+        cfg = config or self.config
+        n = cfg.n_simulations
+        rng = self._rng_for(cfg, config)
+        chunk_size = max(1, chunk_size)
+
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        chunks = 0
+        converged = False
+        mode = ""
+        kept = np.empty(0)
+        kept_keys = np.empty(0)
+
+        with self._shared_pool(model_fn, min(chunk_size, n)) as pool:
+            while count < n:
+                size = min(chunk_size, n - count)
+                samples = self._draw(cfg, size, rng)
+                values, mode = self._evaluate(
+                    model_fn, samples, size, pool,
+                )
+
+                # Chan et al. paralel moment birlestirmesi
+                chunk_mean = float(np.mean(values))
+                chunk_m2 = float(np.sum((values - chunk_mean) ** 2))
+                total = count + size
+                delta = chunk_mean - mean
+                m2 += chunk_m2 + delta * delta * count * size / total
+                mean += delta * size / total
+                count = total
+                chunks += 1
+
+                # Rezervuar: en kucuk rasgele anahtarli ornekler
+                kept = np.concatenate((kept, values))
+                kept_keys = np.concatenate((kept_keys, rng.random(size)))
+                if len(kept) > reservoir_size:
+                    idx = np.argpartition(
+                        kept_keys, reservoir_size - 1,
+                    )[:reservoir_size]
+                    kept = kept[idx]
+                    kept_keys = kept_keys[idx]
+
+                if chunks == 1:
+                    converged = self._check_convergence(
+                        values, convergence_threshold,
+                    )
+                else:
+                    converged = self._means_close(
+                        chunk_mean, mean, convergence_threshold,
+                    )
+                if converged and early_stop:
+                    break
+
+        std = float(np.sqrt(m2 / (count - 1))) if count > 1 else 0.0
+
+        return self._build_result(
             mean=mean,
             std=std,
-            percentiles=percentiles,
-            confidence_interval=ci,
-            n_simulations=n,
-            convergence_achieved=convergence,
+            n=count,
+            percentiles=self._percentiles(kept),
+            convergence=converged,
+            metadata={
+                "mode": mode,
+                "streaming": True,
+                "chunks": chunks,
+                "reservoir_size": len(kept),
+            },
         )
 
     def sensitivity_analysis(
@@ -139,26 +284,11 @@ class MonteCarloSimulator:
         """
         cfg = config or self.config
         n = cfg.n_simulations
+        rng = self._rng_for(cfg, config)
 
-        if cfg.random_seed is not None and config is not None:
-            rng = np.random.default_rng(cfg.random_seed)
-        else:
-            rng = self.rng
-
-        # Ornekleme
-        samples: dict[str, np.ndarray] = {}
-        for var_name, var_config in cfg.variables.items():
-            samples[var_name] = self._generate_samples(
-                var_config, n, rng,
-            )
-
-        # Ciktilari hesapla
-        outputs = np.zeros(n)
-        for i in range(n):
-            kwargs = {
-                name: float(arr[i]) for name, arr in samples.items()
-            }
-            outputs[i] = model_fn(**kwargs)
+        # Ornekleme ve ciktilar
+        samples = self._draw(cfg, n, rng)
+        outputs, _ = self._evaluate(model_fn, samples, n)
 
         base_value = float(np.mean(outputs))
 
@@ -242,6 +372,236 @@ class MonteCarloSimulator:
 
         return results
 
+    def _rng_for(
+        self,
+        cfg: SimulationConfig,
+        config: SimulationConfig | None,
+    ) -> np.random.Generator:
+        """Kosu icin rasgele sayi ureteci secer.
+
+        Args:
+            cfg: Etkin yapilandirma.
+            config: Cagriya verilen yapilandirma.
+
+        Returns:
+            Uretec.
+        """
+        if cfg.random_seed is not None and config is not None:
+            return np.random.default_rng(cfg.random_seed)
+        return self.rng
+
+    def _draw(
+        self,
+        cfg: SimulationConfig,
+        n: int,
+        rng: np.random.Generator,
+    ) -> dict[str, np.ndarray]:
+        """Tum degiskenler icin ornek sutunlari uretir.
+
+        Args:
+            cfg: Yapilandirma.
+            n: Ornek sayisi.
+            rng: Uretec.
+
+        Returns:
+            Degisken -> ornek dizisi.
+        """
+        return {
+            var_name: self._generate_samples(var_config, n, rng)
+            for var_name, var_config in cfg.variables.items()
+        }
+
+    def _evaluate(
+        self,
+        model_fn: Callable[..., Any],
+        samples: dict[str, np.ndarray],
+        n: int,
+        pool: ProcessPoolExecutor | None = None,
+    ) -> tuple[np.ndarray, str]:
+        """Modeli ornek sutunlari uzerinde calistirir.
+
+        Args:
+            model_fn: Model fonksiyonu.
+            samples: Degisken -> ornek dizisi.
+            n: Ornek sayisi.
+            pool: Paylasilan process havuzu (opsiyonel).
+
+        Returns:
+            (sonuc dizisi, kullanilan mod).
+
+        Raises:
+            ValueError: Vektorel cikti n ile uyumsuz.
+        """
+        if getattr(model_fn, "vectorized", False):
+            out = np.asarray(model_fn(**samples), dtype=float)
+            if out.shape != (n,):
+                out = np.broadcast_to(out, (n,)).copy()
+            return out, "vectorized"
+
+        if (
+            self.workers > 1
+            and n >= self.workers * _MIN_SAMPLES_PER_WORKER
+        ):
+            out = self._evaluate_pool(model_fn, samples, n, pool)
+            if out is not None:
+                return out, "process_pool"
+
+        return _evaluate_scalar(model_fn, samples, n), "scalar"
+
+    def _evaluate_pool(
+        self,
+        model_fn: Callable[..., float],
+        samples: dict[str, np.ndarray],
+        n: int,
+        pool: ProcessPoolExecutor | None = None,
+    ) -> np.ndarray | None:
+        """Skaler modeli process havuzunda calistirir.
+
+        Args:
+            model_fn: Modul duzeyinde (pickle edilebilir) model.
+            samples: Degisken -> ornek dizisi.
+            n: Ornek sayisi.
+            pool: Paylasilan havuz (None ise bu cagri icin acilir).
+
+        Returns:
+            Sonuc dizisi veya model pickle edilemezse None.
+        """
+        if pool is None:
+            if not _picklable(model_fn):
+                return None
+            with ProcessPoolExecutor(max_workers=self.workers) as own:
+                return self._map_pool(own, model_fn, samples, n)
+        return self._map_pool(pool, model_fn, samples, n)
+
+    @contextmanager
+    def _shared_pool(
+        self,
+        model_fn: Callable[..., Any],
+        size: int,
+    ) -> Iterator[ProcessPoolExecutor | None]:
+        """Cok parcali kosu icin tek process havuzu acar.
+
+        Model vektorel ise, havuz kapaliysa, parca
+        havuz esiginin altindaysa veya model pickle
+        edilemiyorsa None verir.
+
+        Args:
+            model_fn: Model fonksiyonu.
+            size: Parca basina ornek.
+
+        Yields:
+            Havuz veya None.
+        """
+        if (
+            getattr(model_fn, "vectorized", False)
+            or self.workers <= 1
+            or size < self.workers * _MIN_SAMPLES_PER_WORKER
+            or not _picklable(model_fn)
+        ):
+            yield None
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            yield pool
+
+    def _map_pool(
+        self,
+        pool: ProcessPoolExecutor,
+        model_fn: Callable[..., float],
+        samples: dict[str, np.ndarray],
+        n: int,
+    ) -> np.ndarray:
+        """Ornekleri dilimleyip havuzda degerlendirir.
+
+        Args:
+            pool: Process havuzu.
+            model_fn: Model.
+            samples: Degisken -> ornek dizisi.
+            n: Ornek sayisi.
+
+        Returns:
+            Sonuc dizisi.
+        """
+        parts = self.workers * 4
+        bounds = np.linspace(0, n, parts + 1, dtype=int)
+        slices = [
+            (int(lo), int(hi))
+            for lo, hi in zip(bounds[:-1], bounds[1:], strict=True)
+            if hi > lo
+        ]
+        chunks = pool.map(
+            _evaluate_scalar,
+            [model_fn] * len(slices),
+            [
+                {name: arr[lo:hi] for name, arr in samples.items()}
+                for lo, hi in slices
+            ],
+            [hi - lo for lo, hi in slices],
+        )
+        return np.concatenate(list(chunks))
+
+    def _percentiles(
+        self,
+        values: np.ndarray,
+    ) -> dict[str, float]:
+        """Standart yuzdelikleri hesaplar.
+
+        Args:
+            values: Sonuclar.
+
+        Returns:
+            Yuzdelik -> deger.
+        """
+        if len(values) == 0:
+            return {str(p): 0.0 for p in _PERCENTILES}
+        computed = np.percentile(values, _PERCENTILES)
+        return {
+            str(p): float(v)
+            for p, v in zip(_PERCENTILES, computed, strict=True)
+        }
+
+    def _build_result(
+        self,
+        mean: float,
+        std: float,
+        n: int,
+        percentiles: dict[str, float],
+        convergence: bool,
+        metadata: dict[str, Any],
+    ) -> SimulationResult:
+        """Guven araligiyla sonuc olusturur.
+
+        Args:
+            mean: Ortalama.
+            std: Standart sapma.
+            n: Ornek sayisi.
+            percentiles: Yuzdelikler.
+            convergence: Yakinsadi mi.
+            metadata: Ek bilgiler.
+
+        Returns:
+            Simulasyon sonucu.
+        """
+        se = std / np.sqrt(n) if n > 0 else 0.0
+        if n >= 30:
+            lower, upper = stats.norm.interval(0.95, loc=mean, scale=se)
+        else:
+            lower, upper = (mean - 2 * se, mean + 2 * se)
+
+        ci = ConfidenceInterval(
+            lower=float(lower), upper=float(upper),
+            confidence_level=0.95, mean=mean,
+        )
+
+        return SimulationResult(
+            mean=mean,
+            std=std,
+            percentiles=percentiles,
+            confidence_interval=ci,
+            n_simulations=n,
+            convergence_achieved=convergence,
+            metadata=metadata,
+        )
+
     def _generate_samples(
         self,
         variable_config: dict[str, Any],
@@ -309,10 +669,27 @@ class MonteCarloSimulator:
         if n < 20:
             return False
 
-        full_mean = np.mean(results)
+        full_mean = float(np.mean(results))
         tail_start = int(n * 0.9)
-        tail_mean = np.mean(results[tail_start:])
+        tail_mean = float(np.mean(results[tail_start:]))
+        return self._means_close(tail_mean, full_mean, threshold)
+
+    @staticmethod
+    def _means_close(
+        tail_mean: float,
+        full_mean: float,
+        threshold: float,
+    ) -> bool:
+        """Kuyruk ortalamasi genel ortalamaya yakin mi.
+
+        Args:
+            tail_mean: Son orneklerin ortalamasi.
+            full_mean: Tum orneklerin ortalamasi.
+            threshold: Yakinsaklik esigi.
 
+        Returns:
+            True ise yakinsamis.
+        """
         if abs(full_mean) < 1e-10:
             return bool(abs(tail_mean - full_mean) < threshold)
 
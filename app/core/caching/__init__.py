@@ -17,30 +17,70 @@ from app.core.caching.caching_orchestrator import (
 from app.core.caching.distributed_cache import (
     DistributedCache,
 )
+from app.core.caching.eviction_policy import (
+    EvictionPolicy,
+    FIFOPolicy,
+    FrequencySketch,
+    LFUPolicy,
+    LRUPolicy,
+    TinyLFUPolicy,
+    create_policy,
+)
+from app.core.caching.hash_ring import (
+    ConsistentHashRing,
+    stable_hash,
+)
 from app.core.caching.lazy_loader import (
     LazyLoader,
 )
 from app.core.caching.memory_cache import (
+    CacheRecord,
     MemoryCache,
 )
+from app.core.caching.near_cache import (
+    NearCache,
+)
 from app.core.caching.profiler import (
     PerformanceProfiler,
 )
 from app.core.caching.query_optimizer import (
     QueryOptimizer,
 )
+from app.core.caching.redis_cache import (
+    RedisDistributedCache,
+)
 from app.core.caching.response_compressor import (
     ResponseCompressor,
 )
+from app.core.caching.segmented_cache import (
+    SegmentedCache,
+)
+from app.core.caching.timer_wheel import (
+    TimerWheel,
+)
 
 __all__ = [
     "BatchProcessor",
     "CacheManager",
+    "CacheRecord",
     "CachingOrchestrator",
+    "ConsistentHashRing",
     "DistributedCache",
+    "EvictionPolicy",
+    "FIFOPolicy",
+    "FrequencySketch",
+    "LFUPolicy",
+    "LRUPolicy",
     "LazyLoader",
     "MemoryCache",
+    "NearCache",
     "PerformanceProfiler",
     "QueryOptimizer",
+    "RedisDistributedCache",
     "ResponseCompressor",
+    "SegmentedCache",
+    "TimerWheel",
+    "TinyLFUPolicy",
+    "create_policy",
+    "stable_hash",
 ]
@@ -6,11 +6,15 @@ isitma ve isabet takibi.
 """
 
 import logging
-import time
 from typing import Any
 
+from app.core.caching.eviction_policy import (
+    create_policy,
+)
+from app.core.caching.timer_wheel import (
+    TimerWheel,
+)
 from app.models.caching import (
-    CacheLayer,
     CacheStrategy,
 )
 
@@ -25,34 +29,38 @@ class CacheManager:
 
     Attributes:
         _stores: Katman depolari.
-        _stats: Istatistikler.
+        _policy: Tahliye politikasi.
+        _wheel: TTL zamanlayici carki.
     """
 
     def __init__(
         self,
         default_ttl: int = 300,
         strategy: CacheStrategy = CacheStrategy.LRU,
+        ttl_resolution: float = 1.0,
     ) -> None:
         """Onbellek yoneticisini baslatir.
 
         Args:
             default_ttl: Varsayilan TTL (sn).
             strategy: Onbellek stratejisi.
+            ttl_resolution: TTL kova genisligi (sn).
         """
         self._stores: dict[
             str, dict[str, Any]
         ] = {}
-        self._ttls: dict[str, float] = {}
-        self._access_times: dict[
-            str, float
-        ] = {}
-        self._access_counts: dict[str, int] = {}
         self._default_ttl = default_ttl
-        self._strategy = strategy
+        self._strategy = CacheStrategy(strategy)
         self._hits = 0
         self._misses = 0
         self._max_size = 10000
         self._warm_keys: list[str] = []
+        self._policy = create_policy(
+            self._strategy, self._max_size,
+        )
+        self._wheel = TimerWheel(
+            resolution=ttl_resolution,
+        )
 
         logger.info("CacheManager baslatildi")
 
@@ -70,20 +78,12 @@ class CacheManager:
         Returns:
             Deger veya varsayilan.
         """
-        if key in self._stores:
-            # TTL kontrolu
-            expiry = self._ttls.get(key, 0)
-            if expiry and time.time() > expiry:
-                self._remove(key)
-                self._misses += 1
-                return default
-
+        self._expire()
+        entry = self._stores.get(key)
+        if entry is not None:
             self._hits += 1
-            self._access_times[key] = time.time()
-            self._access_counts[key] = (
-                self._access_counts.get(key, 0) + 1
-            )
-            return self._stores[key]["value"]
+            self._policy.on_access(key)
+            return entry["value"]
 
         self._misses += 1
         return default
@@ -103,27 +103,28 @@ class CacheManager:
             ttl: Yasam suresi.
             layer: Katman.
         """
-        # Boyut limiti
-        if (
-            key not in self._stores
-            and len(self._stores) >= self._max_size
-        ):
-            self._evict()
+        self._expire()
+        now = self._wheel.now
+        if key in self._stores:
+            self._policy.on_access(key)
+        else:
+            # Boyut limiti
+            if len(self._stores) >= self._max_size:
+                self._evict(key)
+            self._policy.on_insert(key)
 
         actual_ttl = ttl if ttl is not None else self._default_ttl
         self._stores[key] = {
             "value": value,
             "layer": layer,
-            "set_at": time.time(),
+            "set_at": now,
         }
         if actual_ttl > 0:
-            self._ttls[key] = (
-                time.time() + actual_ttl
+            self._wheel.schedule(
+                key, now + actual_ttl,
             )
-        self._access_times[key] = time.time()
-        self._access_counts[key] = (
-            self._access_counts.get(key, 0)
-        )
+        else:
+            self._wheel.cancel(key)
 
     def delete(self, key: str) -> bool:
         """Onbellekten siler.
@@ -154,9 +155,8 @@ class CacheManager:
         if not pattern:
             count = len(self._stores)
             self._stores.clear()
-            self._ttls.clear()
-            self._access_times.clear()
-            self._access_counts.clear()
+            self._policy.clear()
+            self._wheel.clear()
             return count
 
         keys_to_remove = [
@@ -197,14 +197,8 @@ class CacheManager:
         Returns:
             Varsa True.
         """
-        if key not in self._stores:
-            return False
-
-        expiry = self._ttls.get(key, 0)
-        if expiry and time.time() > expiry:
-            self._remove(key)
-            return False
-        return True
+        self._expire()
+        return key in self._stores
 
     def get_stats(self) -> dict[str, Any]:
         """Istatistikleri getirir.
@@ -212,6 +206,7 @@ class CacheManager:
         Returns:
             Istatistik bilgisi.
         """
+        policy_stats = self._policy.get_stats()
         total = self._hits + self._misses
         hit_rate = (
             round(self._hits / max(1, total), 3)
@@ -223,36 +218,52 @@ class CacheManager:
             "hit_rate": hit_rate,
             "entries": len(self._stores),
             "strategy": self._strategy.value,
+            "expirations": (
+                self._wheel.expired_count
+            ),
+            "admissions": policy_stats[
+                "admissions"
+            ],
+            "rejections": policy_stats[
+                "rejections"
+            ],
+            "evictions": policy_stats[
+                "evictions"
+            ],
         }
 
-    def _evict(self) -> None:
-        """Tahliye politikasi uygular."""
+    def _expire(self) -> None:
+        """Suresi dolan kovalari bosaltir."""
+        for key in self._wheel.advance():
+            if self._stores.pop(key, None) is not None:
+                self._policy.on_remove(key)
+
+    def _evict(
+        self,
+        candidate: str | None = None,
+    ) -> None:
+        """Tahliye politikasi uygular.
+
+        Args:
+            candidate: Eklenecek yeni anahtar.
+        """
         if not self._stores:
             return
 
-        if self._strategy == CacheStrategy.LRU:
-            oldest_key = min(
-                self._access_times,
-                key=self._access_times.get,
-            )
-            self._remove(oldest_key)
-        elif self._strategy == CacheStrategy.LFU:
-            least_key = min(
-                self._access_counts,
-                key=self._access_counts.get,
+        if self._policy.capacity != self._max_size:
+            self._policy.resize(self._max_size)
+
+        victim = None
+        if self._strategy == CacheStrategy.TTL:
+            # En yakin suresi dolacak
+            victim = self._wheel.peek()
+        if victim is None:
+            victim = self._policy.select_victim(
+                candidate,
             )
-            self._remove(least_key)
-        elif self._strategy == CacheStrategy.FIFO:
-            first_key = next(iter(self._stores))
-            self._remove(first_key)
-        else:
-            # TTL: en yakin suresi dolacak
-            if self._ttls:
-                nearest = min(
-                    self._ttls,
-                    key=self._ttls.get,
-                )
-                self._remove(nearest)
+        if victim is not None:
+            self._remove(victim)
+            self._policy.record_eviction()
 
     def _remove(self, key: str) -> None:
         """Anahtari kaldirir.
@@ -261,9 +272,8 @@ class CacheManager:
             key: Anahtar.
         """
         self._stores.pop(key, None)
-        self._ttls.pop(key, None)
-        self._access_times.pop(key, None)
-        self._access_counts.pop(key, None)
+        self._policy.on_remove(key)
+        self._wheel.cancel(key)
 
     @property
     def size(self) -> int:
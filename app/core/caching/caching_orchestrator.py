@@ -9,35 +9,45 @@ konfiguration.
 import logging
 import time
 from typing import Any
+from uuid import uuid4
 
-from app.models.caching import (
-    CachingSnapshot,
-    CompressionType,
+from app.core.caching.batch_processor import (
+    BatchProcessor,
 )
-
 from app.core.caching.cache_manager import (
     CacheManager,
 )
+from app.core.caching.distributed_cache import (
+    DistributedCache,
+)
+from app.core.caching.lazy_loader import (
+    LazyLoader,
+)
 from app.core.caching.memory_cache import (
     MemoryCache,
 )
-from app.core.caching.distributed_cache import (
-    DistributedCache,
+from app.core.caching.near_cache import (
+    decode_invalidation,
+    encode_invalidation,
+)
+from app.core.caching.profiler import (
+    PerformanceProfiler,
 )
 from app.core.caching.query_optimizer import (
     QueryOptimizer,
 )
+from app.core.caching.redis_cache import (
+    RedisDistributedCache,
+)
 from app.core.caching.response_compressor import (
     ResponseCompressor,
 )
-from app.core.caching.lazy_loader import (
-    LazyLoader,
-)
-from app.core.caching.batch_processor import (
-    BatchProcessor,
+from app.core.caching.segmented_cache import (
+    SegmentedCache,
 )
-from app.core.caching.profiler import (
-    PerformanceProfiler,
+from app.models.caching import (
+    CachingSnapshot,
+    CompressionType,
 )
 
 logger = logging.getLogger(__name__)
@@ -50,6 +60,12 @@ class CachingOrchestrator:
     koordine eder ve birlesik
     arayuz saglar.
 
+    Redis dugumleri verilirse bellek
+    onbellegi (L1) bir gecersiz kilma
+    kanalini dinler: diger iscilerin
+    ``cached_set`` / ``invalidate_all``
+    yazimlari yerel kopyayi dusurur.
+
     Attributes:
         cache: Onbellek yoneticisi.
         memory: Bellek onbellegi.
@@ -66,6 +82,9 @@ class CachingOrchestrator:
         default_ttl: int = 300,
         max_cache_size: int = 10000,
         compression_threshold: int = 1024,
+        memory_segments: int = 0,
+        distributed_nodes: dict[str, Any] | None = None,
+        invalidation_channel: str = "atlas:invalidate:cache",
     ) -> None:
         """Orkestratoru baslatir.
 
@@ -73,15 +92,37 @@ class CachingOrchestrator:
             default_ttl: Varsayilan TTL.
             max_cache_size: Maks onbellek.
             compression_threshold: Sikistirma esigi.
+            memory_segments: Segment sayisi
+                (0: tek kilitli bellek onbellegi).
+            distributed_nodes: Redis dugumleri
+                (None: surec ici simulasyon).
+            invalidation_channel: L1 gecersiz
+                kilma kanali (Redis dugumleriyle).
         """
         self.cache = CacheManager(
             default_ttl=default_ttl,
         )
-        self.memory = MemoryCache(
-            max_size=max_cache_size,
-            default_ttl=default_ttl,
+        self.memory: MemoryCache | SegmentedCache
+        if memory_segments > 0:
+            self.memory = SegmentedCache(
+                max_size=max_cache_size,
+                default_ttl=default_ttl,
+                segments=memory_segments,
+            )
+        else:
+            self.memory = MemoryCache(
+                max_size=max_cache_size,
+                default_ttl=default_ttl,
+            )
+        self.distributed: (
+            DistributedCache | RedisDistributedCache
         )
-        self.distributed = DistributedCache()
+        if distributed_nodes:
+            self.distributed = RedisDistributedCache(
+                nodes=distributed_nodes,
+            )
+        else:
+            self.distributed = DistributedCache()
         self.queries = QueryOptimizer()
         self.compressor = ResponseCompressor(
             threshold=compression_threshold,
@@ -89,6 +130,29 @@ class CachingOrchestrator:
         self.loader = LazyLoader()
         self.batches = BatchProcessor()
         self.profiler = PerformanceProfiler()
+        self._tier_counts = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "loads": 0,
+        }
+
+        # Capraz isci L1 gecersiz kilma
+        self._origin = uuid4().hex
+        self._channel = invalidation_channel
+        # Dinleyici her dusurmede arttirir;
+        # L2'den dolduran okuma degisirse yazmaz
+        self._epoch = 0
+        self._subscription: Any = None
+        if isinstance(
+            self.distributed, RedisDistributedCache,
+        ):
+            self._subscription = (
+                self.distributed.subscribe(
+                    invalidation_channel,
+                    self._on_invalidation,
+                    self._on_bus_reset,
+                )
+            )
 
         logger.info(
             "CachingOrchestrator baslatildi",
@@ -119,21 +183,28 @@ class CachingOrchestrator:
         # L1: Memory cache
         val = self.memory.get(key)
         if val is not None:
+            self._tier_counts["l1_hits"] += 1
             self.profiler.stop_timer(
                 f"get:{key}",
             )
             return val
 
         # L2: Distributed cache
+        epoch = self._epoch
         val = self.distributed.get(key)
         if val is not None:
-            self.memory.set(key, val, ttl)
+            self._tier_counts["l2_hits"] += 1
+            # Okuma sirasinda gecersiz kilindiysa
+            # bayat olabilir; L1'e yazilmaz
+            if self._epoch == epoch:
+                self.memory.set(key, val, ttl)
             self.profiler.stop_timer(
                 f"get:{key}",
             )
             return val
 
         # Yukle
+        self._tier_counts["loads"] += 1
         if callable(loader):
             val = loader()
             if val is not None:
@@ -162,6 +233,7 @@ class CachingOrchestrator:
         self.distributed.set(
             key, value, ttl or 0,
         )
+        self._publish(key)
 
     def invalidate_all(
         self,
@@ -177,11 +249,73 @@ class CachingOrchestrator:
         """
         m = self.memory.delete(key)
         d = self.distributed.delete(key)
+        self._publish(key)
         return {
             "memory": m,
             "distributed": d,
         }
 
+    def _publish(self, *keys: str) -> None:
+        """Diger iscilere gecersiz kilma yayinlar.
+
+        Args:
+            *keys: Degisen anahtarlar.
+        """
+        if self._subscription is None or not isinstance(
+            self.distributed, RedisDistributedCache,
+        ):
+            return
+        self.distributed.publish(
+            self._channel,
+            encode_invalidation(self._origin, keys),
+        )
+
+    def _on_invalidation(self, data: Any) -> None:
+        """Kanal mesajiyla L1 kopyalarini dusurur.
+
+        Args:
+            data: Ham mesaj verisi.
+        """
+        keys = decode_invalidation(data, self._origin)
+        if not keys:
+            return
+        self._epoch += 1
+        for key in keys:
+            self.memory.delete(key)
+
+    def _on_bus_reset(self) -> None:
+        """Kanal senkronu kaybolunca L1'i bosaltir."""
+        self._epoch += 1
+        self.memory.clear()
+
+    def close(self) -> None:
+        """Gecersiz kilma dinleyicisini durdurur."""
+        if self._subscription is not None:
+            self._subscription.stop()
+            self._subscription = None
+
+    def get_tier_stats(self) -> dict[str, Any]:
+        """L1/L2 katman isabetlerini getirir.
+
+        Returns:
+            Katman istatistikleri.
+        """
+        counts = self._tier_counts
+        lookups = sum(counts.values())
+        l2_lookups = counts["l2_hits"] + counts["loads"]
+        return {
+            **counts,
+            "invalidation_listening": (
+                self._subscription is not None
+            ),
+            "l1_hit_ratio": round(
+                counts["l1_hits"] / max(1, lookups), 3,
+            ),
+            "l2_hit_ratio": round(
+                counts["l2_hits"] / max(1, l2_lookups), 3,
+            ),
+        }
+
     def compress_and_cache(
         self,
         key: str,
@@ -289,6 +423,7 @@ class CachingOrchestrator:
         query_stats = self.queries.get_stats()
         prof_summary = self.profiler.get_summary()
         batch_stats = self.batches.get_stats()
+        tier_stats = self.get_tier_stats()
 
         total_hits = (
             memory_stats["hits"]
@@ -327,6 +462,12 @@ class CachingOrchestrator:
             "batch_processed": (
                 batch_stats["total_processed"]
             ),
+            "l1_hit_ratio": (
+                tier_stats["l1_hit_ratio"]
+            ),
+            "l2_hit_ratio": (
+                tier_stats["l2_hit_ratio"]
+            ),
         }
 
     def get_snapshot(self) -> CachingSnapshot:
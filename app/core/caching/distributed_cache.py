@@ -9,6 +9,10 @@ import logging
 import time
 from typing import Any
 
+from app.core.caching.hash_ring import (
+    ConsistentHashRing,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +55,10 @@ class DistributedCache:
                 "role": "primary",
             },
         }
+        # Surecler arasi kararli yerlesim
+        self._ring = ConsistentHashRing()
+        for i in range(num_shards):
+            self._ring.add_node(str(i))
 
         logger.info(
             "DistributedCache baslatildi",
@@ -65,7 +73,7 @@ class DistributedCache:
         Returns:
             Bolum indeksi.
         """
-        return hash(key) % self._num_shards
+        return int(self._ring.get_node(key) or 0)
 
     def get(
         self,
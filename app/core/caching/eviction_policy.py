@@ -0,0 +1,606 @@
+"""ATLAS Tahliye Politikasi modulu.
+
+O(1) LRU, LFU, FIFO ve W-TinyLFU
+tahliye politikalari, frekans
+tahmini ve kabul istatistikleri.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from app.models.caching import CacheStrategy
+
+logger = logging.getLogger(__name__)
+
+# Sayaclari yariya indiren ceviri tablosu
+_HALVE_TABLE = bytes(i >> 1 for i in range(256))
+
+# Sayim-min derinligi ve karistirma tohumu
+_SKETCH_DEPTH = 4
+_SKETCH_SEED = 0x9E3779B97F4A7C15
+
+
+class EvictionPolicy:
+    """Tahliye politikasi temeli.
+
+    Onbellek girdilerinin sirasini tutar
+    ve kapasite doldugunda kurbani O(1)
+    secer. Onbellek depoyu, politika ise
+    yalnizca anahtar sirasini yonetir.
+
+    Attributes:
+        _capacity: Kapasite.
+        _stats: Istatistikler.
+    """
+
+    name = ""
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """Politikayi baslatir.
+
+        Args:
+            capacity: Maks girdi sayisi.
+        """
+        self._capacity = max(1, capacity)
+        self._stats = {
+            "admissions": 0,
+            "rejections": 0,
+            "evictions": 0,
+        }
+
+    def on_insert(self, key: str) -> None:
+        """Yeni anahtari kaydeder.
+
+        Args:
+            key: Anahtar.
+        """
+        raise NotImplementedError
+
+    def on_access(self, key: str) -> None:
+        """Erisimi kaydeder.
+
+        Args:
+            key: Anahtar.
+        """
+
+    def on_remove(self, key: str) -> None:
+        """Anahtari kaldirir.
+
+        Args:
+            key: Anahtar.
+        """
+        raise NotImplementedError
+
+    def select_victim(
+        self,
+        candidate: str | None = None,
+    ) -> str | None:
+        """Tahliye edilecek anahtari secer.
+
+        Args:
+            candidate: Eklenecek yeni anahtar.
+
+        Returns:
+            Kurban anahtar veya None.
+        """
+        raise NotImplementedError
+
+    def record_eviction(self) -> None:
+        """Tahliyeyi sayar."""
+        self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Tum sirayi temizler."""
+        raise NotImplementedError
+
+    def resize(self, capacity: int) -> None:
+        """Kapasiteyi gunceller.
+
+        Args:
+            capacity: Yeni kapasite.
+        """
+        self._capacity = max(1, capacity)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Istatistik getirir.
+
+        Returns:
+            Istatistik.
+        """
+        return {
+            "policy": self.name,
+            **self._stats,
+        }
+
+    @property
+    def capacity(self) -> int:
+        """Kapasite."""
+        return self._capacity
+
+
+class LRUPolicy(EvictionPolicy):
+    """En az yakin zamanda kullanilan.
+
+    Sirali sozluk ile O(1) erisim
+    ve tahliye.
+    """
+
+    name = CacheStrategy.LRU.value
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """LRU politikasini baslatir.
+
+        Args:
+            capacity: Maks girdi sayisi.
+        """
+        super().__init__(capacity)
+        self._order: OrderedDict[
+            str, None
+        ] = OrderedDict()
+
+    def on_insert(self, key: str) -> None:
+        """Yeni anahtari kaydeder."""
+        self._order[key] = None
+        self._order.move_to_end(key)
+        self._stats["admissions"] += 1
+
+    def on_access(self, key: str) -> None:
+        """Anahtari en yeniye tasir."""
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def on_remove(self, key: str) -> None:
+        """Anahtari kaldirir."""
+        self._order.pop(key, None)
+
+    def select_victim(
+        self,
+        candidate: str | None = None,
+    ) -> str | None:
+        """En eski erisilen anahtari secer."""
+        if not self._order:
+            return None
+        return next(iter(self._order))
+
+    def clear(self) -> None:
+        """Tum sirayi temizler."""
+        self._order.clear()
+
+
+class FIFOPolicy(EvictionPolicy):
+    """Ilk giren ilk cikar.
+
+    Ekleme sirasini korur, erisimler
+    sirayi degistirmez.
+    """
+
+    name = CacheStrategy.FIFO.value
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """FIFO politikasini baslatir.
+
+        Args:
+            capacity: Maks girdi sayisi.
+        """
+        super().__init__(capacity)
+        # Duz dict bastan silmelerde bosluk
+        # tarar; bagli liste O(1) kalir
+        self._order: OrderedDict[
+            str, None
+        ] = OrderedDict()
+
+    def on_insert(self, key: str) -> None:
+        """Yeni anahtari kaydeder."""
+        self._order[key] = None
+        self._stats["admissions"] += 1
+
+    def on_remove(self, key: str) -> None:
+        """Anahtari kaldirir."""
+        self._order.pop(key, None)
+
+    def select_victim(
+        self,
+        candidate: str | None = None,
+    ) -> str | None:
+        """Ilk eklenen anahtari secer."""
+        if not self._order:
+            return None
+        return next(iter(self._order))
+
+    def clear(self) -> None:
+        """Tum sirayi temizler."""
+        self._order.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """En az sik kullanilan.
+
+    Frekans kovalari ile O(1) LFU;
+    esit frekansta en eski erisilen
+    anahtar tahliye edilir.
+    """
+
+    name = CacheStrategy.LFU.value
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """LFU politikasini baslatir.
+
+        Args:
+            capacity: Maks girdi sayisi.
+        """
+        super().__init__(capacity)
+        self._freq: dict[str, int] = {}
+        self._buckets: dict[
+            int, OrderedDict[str, None]
+        ] = {}
+        self._min_freq = 0
+        self._min_dirty = False
+
+    def on_insert(self, key: str) -> None:
+        """Yeni anahtari kaydeder."""
+        if key in self._freq:
+            self.on_access(key)
+            return
+        self._freq[key] = 1
+        self._buckets.setdefault(
+            1, OrderedDict(),
+        )[key] = None
+        self._min_freq = 1
+        self._min_dirty = False
+        self._stats["admissions"] += 1
+
+    def on_access(self, key: str) -> None:
+        """Frekansi bir artirir."""
+        freq = self._freq.get(key)
+        if freq is None:
+            return
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(
+            freq + 1, OrderedDict(),
+        )[key] = None
+
+    def on_remove(self, key: str) -> None:
+        """Anahtari kaldirir."""
+        freq = self._freq.pop(key, None)
+        if freq is None:
+            return
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                # Bir sonraki eklemede 1 olur,
+                # gerekirse tembel hesaplanir
+                self._min_dirty = True
+
+    def select_victim(
+        self,
+        candidate: str | None = None,
+    ) -> str | None:
+        """En dusuk frekansli anahtari secer."""
+        if not self._freq:
+            return None
+        if (
+            self._min_dirty
+            or self._min_freq not in self._buckets
+        ):
+            self._min_freq = min(self._buckets)
+            self._min_dirty = False
+        return next(
+            iter(self._buckets[self._min_freq]),
+        )
+
+    def clear(self) -> None:
+        """Tum sirayi temizler."""
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+        self._min_dirty = False
+
+    def frequency(self, key: str) -> int:
+        """Anahtar frekansini getirir.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Erisim frekansi.
+        """
+        return self._freq.get(key, 0)
+
+
+class FrequencySketch:
+    """Sayim-min frekans tahmincisi.
+
+    4 bitlik doygun sayaclar ve periyodik
+    yaslandirma ile sabit bellekte
+    yaklasik erisim frekansi tutar.
+
+    Attributes:
+        _rows: Sayac satirlari.
+        _mask: Indeks maskesi.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """Tahminciyi baslatir.
+
+        Args:
+            capacity: Beklenen girdi sayisi.
+        """
+        # Carpismalari sinirlamak icin girdi
+        # basina 4 sayac (satir basina bayt)
+        width = 1
+        while width < 4 * max(16, capacity):
+            width <<= 1
+        self._mask = width - 1
+        self._rows = [
+            bytearray(width)
+            for _ in range(_SKETCH_DEPTH)
+        ]
+        self._sample_size = 10 * max(16, capacity)
+        self._additions = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        """Satir indekslerini hesaplar.
+
+        Tek hash uzerinden cift hashleme
+        (h1 + i*h2) ile satir basina
+        bagimsiz indeks uretir.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Her satir icin indeks.
+        """
+        h1 = hash(key)
+        h2 = ((h1 * _SKETCH_SEED) >> 32) | 1
+        mask = self._mask
+        return [
+            (h1 + i * h2) & mask
+            for i in range(_SKETCH_DEPTH)
+        ]
+
+    def increment(self, key: str) -> None:
+        """Frekansi artirir.
+
+        Args:
+            key: Anahtar.
+        """
+        added = False
+        rows = self._rows
+        for i, idx in enumerate(self._indexes(key)):
+            row = rows[i]
+            if row[idx] < 15:
+                row[idx] += 1
+                added = True
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._reset()
+
+    def estimate(self, key: str) -> int:
+        """Frekans tahmini getirir.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Tahmini frekans.
+        """
+        rows = self._rows
+        a, b, c, d = self._indexes(key)
+        return min(
+            rows[0][a], rows[1][b],
+            rows[2][c], rows[3][d],
+        )
+
+    def _reset(self) -> None:
+        """Tum sayaclari yariya indirir."""
+        for i, row in enumerate(self._rows):
+            self._rows[i] = bytearray(
+                row.translate(_HALVE_TABLE),
+            )
+        self._additions //= 2
+
+    def clear(self) -> None:
+        """Sayaclari sifirlar."""
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._additions = 0
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """Pencereli TinyLFU politikasi.
+
+    Kucuk bir LRU penceresi yeni girdileri
+    karsilar; pencereden tasan aday, ana
+    bolgenin (probation/protected SLRU)
+    kurbaniyla frekans tahminine gore
+    yarisir ve yalnizca daha sik
+    kullaniliyorsa kabul edilir.
+
+    Attributes:
+        _window: Pencere LRU.
+        _probation: Deneme bolgesi.
+        _protected: Korumali bolge.
+        _sketch: Frekans tahmincisi.
+    """
+
+    name = CacheStrategy.TINYLFU.value
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8,
+    ) -> None:
+        """TinyLFU politikasini baslatir.
+
+        Args:
+            capacity: Maks girdi sayisi.
+            window_ratio: Pencere orani.
+            protected_ratio: Korumali bolge orani.
+        """
+        super().__init__(capacity)
+        self._window_ratio = window_ratio
+        self._protected_ratio = protected_ratio
+        self._window: OrderedDict[
+            str, None
+        ] = OrderedDict()
+        self._probation: OrderedDict[
+            str, None
+        ] = OrderedDict()
+        self._protected: OrderedDict[
+            str, None
+        ] = OrderedDict()
+        self._sketch = FrequencySketch(capacity)
+        self._resize_regions()
+
+    def _resize_regions(self) -> None:
+        """Bolge kapasitelerini hesaplar."""
+        self._window_cap = max(
+            1, int(self._capacity * self._window_ratio),
+        )
+        main_cap = max(
+            0, self._capacity - self._window_cap,
+        )
+        self._protected_cap = int(
+            main_cap * self._protected_ratio,
+        )
+
+    def resize(self, capacity: int) -> None:
+        """Kapasiteyi gunceller."""
+        super().resize(capacity)
+        self._resize_regions()
+
+    def on_insert(self, key: str) -> None:
+        """Yeni anahtari pencereye alir."""
+        self._sketch.increment(key)
+        if (
+            key in self._window
+            or key in self._probation
+            or key in self._protected
+        ):
+            self.on_access(key)
+            return
+        self._window[key] = None
+        # Pencereden tasan aday ana bolgeye
+        while len(self._window) > self._window_cap:
+            moved, _ = self._window.popitem(
+                last=False,
+            )
+            self._probation[moved] = None
+            self._stats["admissions"] += 1
+
+    def on_access(self, key: str) -> None:
+        """Erisimi kaydeder, terfi ettirir."""
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if (
+                len(self._protected)
+                > self._protected_cap
+            ):
+                demoted, _ = self._protected.popitem(
+                    last=False,
+                )
+                self._probation[demoted] = None
+
+    def on_remove(self, key: str) -> None:
+        """Anahtari kaldirir."""
+        if self._window.pop(key, 0) is None:
+            return
+        if self._probation.pop(key, 0) is None:
+            return
+        self._protected.pop(key, None)
+
+    def _main_victim(self) -> str | None:
+        """Ana bolge kurbanini getirir.
+
+        Returns:
+            Anahtar veya None.
+        """
+        if self._probation:
+            return next(iter(self._probation))
+        if self._protected:
+            return next(iter(self._protected))
+        return None
+
+    def select_victim(
+        self,
+        candidate: str | None = None,
+    ) -> str | None:
+        """Kabul yarismasiyla kurban secer."""
+        main_victim = self._main_victim()
+        if not self._window:
+            return main_victim
+        window_victim = next(iter(self._window))
+        if main_victim is None:
+            return window_victim
+        if len(self._window) < self._window_cap:
+            return main_victim
+
+        # Aday (pencere kurbani) ana bolgeye
+        # yalnizca daha sikca kullaniliyorsa girer
+        if (
+            self._sketch.estimate(window_victim)
+            > self._sketch.estimate(main_victim)
+        ):
+            return main_victim
+        self._stats["rejections"] += 1
+        return window_victim
+
+    def clear(self) -> None:
+        """Tum sirayi temizler."""
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._sketch.clear()
+
+
+_POLICIES: dict[str, type[EvictionPolicy]] = {
+    CacheStrategy.LRU.value: LRUPolicy,
+    CacheStrategy.LFU.value: LFUPolicy,
+    CacheStrategy.FIFO.value: FIFOPolicy,
+    CacheStrategy.TINYLFU.value: TinyLFUPolicy,
+    # TTL: en yakin bitis once; sira FIFO
+    CacheStrategy.TTL.value: FIFOPolicy,
+}
+
+
+def create_policy(
+    strategy: CacheStrategy | str = CacheStrategy.LRU,
+    capacity: int = 1000,
+) -> EvictionPolicy:
+    """Stratejiye uygun politika olusturur.
+
+    Args:
+        strategy: Onbellek stratejisi.
+        capacity: Maks girdi sayisi.
+
+    Returns:
+        Tahliye politikasi.
+
+    Raises:
+        ValueError: Bilinmeyen strateji.
+    """
+    name = CacheStrategy(strategy).value
+    cls = _POLICIES.get(name)
+    if cls is None:
+        raise ValueError(
+            f"Bilinmeyen strateji: {name}",
+        )
+    return cls(capacity)
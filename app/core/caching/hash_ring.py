@@ -0,0 +1,262 @@
+"""ATLAS Tutarli Hash Halkasi modulu.
+
+Surec bagimsiz kararli hash, sanal
+dugumler, bisect ile O(log n) arama
+ve etkilenen yay hesabi.
+"""
+
+import bisect
+import hashlib
+import logging
+from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def stable_hash(key: str) -> int:
+    """Surecler arasi kararli 64-bit hash.
+
+    Python hash() rastgelelestirildigi icin
+    dugum yerlesiminde kullanilamaz.
+
+    Args:
+        key: Anahtar.
+
+    Returns:
+        64-bit tamsayi.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(
+            key.encode("utf-8"), digest_size=8,
+        ).digest(),
+        "big",
+    )
+
+
+class ConsistentHashRing:
+    """Tutarli hash halkasi.
+
+    Her dugum halkaya sanal noktalar olarak
+    yerlestirilir; bir dugum eklendiginde
+    yalnizca yaklasik 1/N anahtar yer
+    degistirir.
+
+    Attributes:
+        _points: Sirali halka noktalari.
+        _owners: Nokta -> dugum esleme.
+    """
+
+    def __init__(self, vnodes: int = 160) -> None:
+        """Halkayi baslatir.
+
+        Args:
+            vnodes: Agirlik basina sanal dugum.
+        """
+        self._vnodes = max(1, vnodes)
+        self._points: list[int] = []
+        self._owners: dict[int, str] = {}
+        self._weights: dict[str, int] = {}
+
+    def _node_points(
+        self,
+        node_id: str,
+        weight: int,
+    ) -> list[int]:
+        """Dugumun halka noktalarini hesaplar.
+
+        Args:
+            node_id: Dugum ID.
+            weight: Agirlik.
+
+        Returns:
+            Nokta listesi.
+        """
+        return [
+            stable_hash(f"{node_id}#{i}")
+            for i in range(self._vnodes * weight)
+        ]
+
+    def add_node(
+        self,
+        node_id: str,
+        weight: int = 1,
+    ) -> list[tuple[int, int, str]]:
+        """Dugum ekler.
+
+        Args:
+            node_id: Dugum ID.
+            weight: Agirlik.
+
+        Returns:
+            Yeni dugume gecen yaylar
+            (baslangic, bitis, onceki sahip).
+        """
+        if node_id in self._weights:
+            return []
+        weight = max(1, weight)
+        moved: list[tuple[int, int, str]] = []
+        for point in self._node_points(node_id, weight):
+            if point in self._owners:
+                continue
+            previous = self._owner_at(point)
+            bisect.insort(self._points, point)
+            self._owners[point] = node_id
+            if previous is not None and previous != node_id:
+                moved.append(
+                    (self._predecessor(point), point, previous),
+                )
+        self._weights[node_id] = weight
+        return moved
+
+    def remove_node(self, node_id: str) -> bool:
+        """Dugum kaldirir.
+
+        Args:
+            node_id: Dugum ID.
+
+        Returns:
+            Basarili ise True.
+        """
+        weight = self._weights.pop(node_id, None)
+        if weight is None:
+            return False
+        for point in self._node_points(node_id, weight):
+            if self._owners.get(point) != node_id:
+                continue
+            del self._owners[point]
+            idx = bisect.bisect_left(self._points, point)
+            del self._points[idx]
+        return True
+
+    def _owner_at(self, point: int) -> str | None:
+        """Noktanin sahibini getirir.
+
+        Args:
+            point: Halka noktasi.
+
+        Returns:
+            Dugum ID veya None.
+        """
+        if not self._points:
+            return None
+        idx = bisect.bisect_left(self._points, point)
+        if idx == len(self._points):
+            idx = 0
+        return self._owners[self._points[idx]]
+
+    def _predecessor(self, point: int) -> int:
+        """Onceki halka noktasini getirir.
+
+        Args:
+            point: Halka noktasi.
+
+        Returns:
+            Onceki nokta.
+        """
+        idx = bisect.bisect_left(self._points, point)
+        return self._points[idx - 1]
+
+    def get_node(self, key: str) -> str | None:
+        """Anahtarin dugumunu getirir.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Dugum ID veya None.
+        """
+        return self._owner_at(stable_hash(key))
+
+    def get_nodes(
+        self,
+        key: str,
+        count: int,
+    ) -> list[str]:
+        """Anahtar icin farkli ardil dugumler.
+
+        Replika yerlesimi icin kullanilir.
+
+        Args:
+            key: Anahtar.
+            count: Istenen dugum sayisi.
+
+        Returns:
+            Dugum listesi.
+        """
+        if not self._points:
+            return []
+        count = min(count, len(self._weights))
+        idx = bisect.bisect_left(
+            self._points, stable_hash(key),
+        )
+        result: list[str] = []
+        total = len(self._points)
+        for step in range(total):
+            node = self._owners[
+                self._points[(idx + step) % total]
+            ]
+            if node not in result:
+                result.append(node)
+                if len(result) == count:
+                    break
+        return result
+
+    def group_keys(
+        self,
+        keys: Iterable[str],
+    ) -> dict[str, list[str]]:
+        """Anahtarlari dugumlere gruplar.
+
+        Args:
+            keys: Anahtarlar.
+
+        Returns:
+            Dugum -> anahtar listesi.
+        """
+        groups: dict[str, list[str]] = {}
+        points = self._points
+        if not points:
+            return groups
+        owners = self._owners
+        total = len(points)
+        for key in keys:
+            idx = bisect.bisect_left(
+                points, stable_hash(key),
+            )
+            node = owners[points[idx % total]]
+            groups.setdefault(node, []).append(key)
+        return groups
+
+    @staticmethod
+    def in_arc(
+        value: int,
+        start: int,
+        end: int,
+    ) -> bool:
+        """Deger (start, end] yayinda mi.
+
+        Args:
+            value: Hash degeri.
+            start: Yay baslangici (haric).
+            end: Yay bitisi (dahil).
+
+        Returns:
+            Yay icindeyse True.
+        """
+        if start < end:
+            return start < value <= end
+        # Sifirdan donen yay
+        return value > start or value <= end
+
+    @property
+    def nodes(self) -> list[str]:
+        """Dugum listesi."""
+        return list(self._weights)
+
+    def __len__(self) -> int:
+        """Dugum sayisi."""
+        return len(self._weights)
+
+    def __contains__(self, node_id: object) -> bool:
+        """Dugum halkada mi."""
+        return node_id in self._weights
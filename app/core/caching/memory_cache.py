@@ -7,12 +7,55 @@ guvenligi ve sure asimi.
 
 import logging
 import threading
-import time
 from typing import Any
 
+from app.core.caching.eviction_policy import (
+    create_policy,
+)
+from app.core.caching.timer_wheel import (
+    TimerWheel,
+)
+from app.models.caching import CacheStrategy
+
 logger = logging.getLogger(__name__)
 
 
+class CacheRecord:
+    """Kompakt onbellek girdisi.
+
+    Girdi basina sozluk yerine sabit
+    yuvali kayit; bellek ve erisim
+    maliyetini dusurur.
+    """
+
+    __slots__ = (
+        "value",
+        "hits",
+        "created_at",
+        "last_access",
+        "expires_at",
+    )
+
+    def __init__(
+        self,
+        value: Any,
+        now: float,
+        expires_at: float,
+    ) -> None:
+        """Girdiyi olusturur.
+
+        Args:
+            value: Deger.
+            now: Olusturma zamani.
+            expires_at: Bitis zamani (0: suresiz).
+        """
+        self.value = value
+        self.hits = 0
+        self.created_at = now
+        self.last_access = now
+        self.expires_at = expires_at
+
+
 class MemoryCache:
     """Bellek onbellegi.
 
@@ -22,27 +65,39 @@ class MemoryCache:
     Attributes:
         _data: Veri deposu.
         _lock: Thread kilidi.
+        _policy: Tahliye politikasi.
+        _wheel: TTL zamanlayici carki.
     """
 
     def __init__(
         self,
         max_size: int = 1000,
         default_ttl: int = 300,
+        policy: CacheStrategy | str = CacheStrategy.LRU,
+        ttl_resolution: float = 1.0,
     ) -> None:
         """Bellek onbellegini baslatir.
 
         Args:
             max_size: Maks girdi sayisi.
             default_ttl: Varsayilan TTL.
+            policy: Tahliye stratejisi.
+            ttl_resolution: TTL kova genisligi (sn).
         """
         self._data: dict[
-            str, dict[str, Any]
+            str, CacheRecord
         ] = {}
         self._max_size = max_size
         self._default_ttl = default_ttl
         self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
+        self._policy = create_policy(
+            policy, max_size,
+        )
+        self._wheel = TimerWheel(
+            resolution=ttl_resolution,
+        )
 
         logger.info("MemoryCache baslatildi")
 
@@ -61,22 +116,33 @@ class MemoryCache:
             Deger veya varsayilan.
         """
         with self._lock:
-            entry = self._data.get(key)
-            if not entry:
-                self._misses += 1
-                return default
-
-            # TTL kontrolu
-            if entry["expires_at"] > 0:
-                if time.time() > entry["expires_at"]:
-                    del self._data[key]
-                    self._misses += 1
-                    return default
-
-            entry["hits"] += 1
-            entry["last_access"] = time.time()
-            self._hits += 1
-            return entry["value"]
+            self._expire()
+            return self._lookup(key, default)
+
+    def _lookup(
+        self,
+        key: str,
+        default: Any,
+    ) -> Any:
+        """Kilit altinda deger arar.
+
+        Args:
+            key: Anahtar.
+            default: Varsayilan.
+
+        Returns:
+            Deger veya varsayilan.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+
+        entry.hits += 1
+        entry.last_access = self._wheel.now
+        self._policy.on_access(key)
+        self._hits += 1
+        return entry.value
 
     def set(
         self,
@@ -92,30 +158,44 @@ class MemoryCache:
             ttl: Yasam suresi.
         """
         with self._lock:
-            if (
-                key not in self._data
-                and len(self._data)
-                >= self._max_size
-            ):
-                self._evict_one()
-
-            actual_ttl = (
-                ttl if ttl is not None
-                else self._default_ttl
-            )
-            expires = (
-                time.time() + actual_ttl
-                if actual_ttl > 0
-                else 0
-            )
-
-            self._data[key] = {
-                "value": value,
-                "hits": 0,
-                "created_at": time.time(),
-                "last_access": time.time(),
-                "expires_at": expires,
-            }
+            self._expire()
+            self._store(key, value, ttl)
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None,
+    ) -> None:
+        """Kilit altinda girdi yazar.
+
+        Args:
+            key: Anahtar.
+            value: Deger.
+            ttl: Yasam suresi.
+        """
+        now = self._wheel.now
+        if key in self._data:
+            self._policy.on_access(key)
+        else:
+            if len(self._data) >= self._max_size:
+                self._evict_one(key)
+            self._policy.on_insert(key)
+
+        actual_ttl = (
+            ttl if ttl is not None
+            else self._default_ttl
+        )
+        if actual_ttl > 0:
+            expires = now + actual_ttl
+            self._wheel.schedule(key, expires)
+        else:
+            expires = 0
+            self._wheel.cancel(key)
+
+        self._data[key] = CacheRecord(
+            value, now, expires,
+        )
 
     def delete(self, key: str) -> bool:
         """Siler.
@@ -128,7 +208,7 @@ class MemoryCache:
         """
         with self._lock:
             if key in self._data:
-                del self._data[key]
+                self._remove(key)
                 return True
             return False
 
@@ -141,6 +221,8 @@ class MemoryCache:
         with self._lock:
             count = len(self._data)
             self._data.clear()
+            self._policy.clear()
+            self._wheel.clear()
             return count
 
     def exists(self, key: str) -> bool:
@@ -153,14 +235,8 @@ class MemoryCache:
             Varsa True.
         """
         with self._lock:
-            entry = self._data.get(key)
-            if not entry:
-                return False
-            if entry["expires_at"] > 0:
-                if time.time() > entry["expires_at"]:
-                    del self._data[key]
-                    return False
-            return True
+            self._expire()
+            return key in self._data
 
     def get_many(
         self,
@@ -168,6 +244,8 @@ class MemoryCache:
     ) -> dict[str, Any]:
         """Birden fazla deger getirir.
 
+        Kilit tum parti icin bir kez alinir.
+
         Args:
             keys: Anahtar listesi.
 
@@ -175,10 +253,13 @@ class MemoryCache:
             Anahtar-deger cifti.
         """
         result: dict[str, Any] = {}
-        for key in keys:
-            val = self.get(key)
-            if val is not None:
-                result[key] = val
+        missing = object()
+        with self._lock:
+            self._expire()
+            for key in keys:
+                val = self._lookup(key, missing)
+                if val is not missing and val is not None:
+                    result[key] = val
         return result
 
     def set_many(
@@ -188,6 +269,8 @@ class MemoryCache:
     ) -> int:
         """Birden fazla deger yazar.
 
+        Kilit tum parti icin bir kez alinir.
+
         Args:
             entries: Anahtar-deger cifti.
             ttl: Yasam suresi.
@@ -195,11 +278,11 @@ class MemoryCache:
         Returns:
             Yazilan girdi sayisi.
         """
-        count = 0
-        for key, value in entries.items():
-            self.set(key, value, ttl)
-            count += 1
-        return count
+        with self._lock:
+            self._expire()
+            for key, value in entries.items():
+                self._store(key, value, ttl)
+        return len(entries)
 
     def cleanup_expired(self) -> int:
         """Suresi dolanlari temizler.
@@ -208,28 +291,46 @@ class MemoryCache:
             Temizlenen girdi sayisi.
         """
         with self._lock:
-            now = time.time()
-            expired = [
-                k for k, v in self._data.items()
-                if v["expires_at"] > 0
-                and now > v["expires_at"]
-            ]
-            for k in expired:
-                del self._data[k]
-            return len(expired)
-
-    def _evict_one(self) -> None:
-        """Bir girdi tahliye eder (LRU)."""
-        if not self._data:
-            return
+            return self._expire()
 
-        oldest_key = min(
-            self._data,
-            key=lambda k: (
-                self._data[k]["last_access"]
-            ),
+    def _expire(self) -> int:
+        """Suresi dolan kovalari bosaltir.
+
+        Returns:
+            Dusurulen girdi sayisi.
+        """
+        expired = self._wheel.advance()
+        for k in expired:
+            if self._data.pop(k, None) is not None:
+                self._policy.on_remove(k)
+        return len(expired)
+
+    def _remove(self, key: str) -> None:
+        """Anahtari tum yapilardan kaldirir.
+
+        Args:
+            key: Anahtar.
+        """
+        del self._data[key]
+        self._policy.on_remove(key)
+        self._wheel.cancel(key)
+
+    def _evict_one(
+        self,
+        candidate: str | None = None,
+    ) -> None:
+        """Politikaya gore bir girdi tahliye eder.
+
+        Args:
+            candidate: Eklenecek yeni anahtar.
+        """
+        victim = self._policy.select_victim(
+            candidate,
         )
-        del self._data[oldest_key]
+        if victim is None or victim not in self._data:
+            return
+        self._remove(victim)
+        self._policy.record_eviction()
 
     def get_stats(self) -> dict[str, Any]:
         """Istatistik getirir.
@@ -246,6 +347,10 @@ class MemoryCache:
             "hit_rate": round(
                 self._hits / max(1, total), 3,
             ),
+            "expirations": (
+                self._wheel.expired_count
+            ),
+            **self._policy.get_stats(),
         }
 
     @property
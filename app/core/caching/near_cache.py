@@ -0,0 +1,394 @@
+"""ATLAS Yakin Onbellek modulu.
+
+Redis onunde surec ici L1 katmani,
+pub/sub ile capraz isci gecersiz
+kilma ve L1/L2 isabet oranlari.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import Iterable
+from typing import Any
+from uuid import uuid4
+
+from app.core.caching.memory_cache import (
+    MemoryCache,
+)
+
+logger = logging.getLogger(__name__)
+
+# L1'de bulunamadi isareti
+_MISSING = object()
+
+# Dinleyici yeniden abonelik bekleme araligi (sn)
+_RECONNECT_MIN = 0.5
+_RECONNECT_MAX = 30.0
+
+
+def encode_invalidation(origin: str, keys: Iterable[str]) -> str:
+    """Gecersiz kilma mesaji olusturur.
+
+    Args:
+        origin: Yayinlayan surecin kimligi.
+        keys: Degisen anahtarlar.
+
+    Returns:
+        JSON mesaj.
+    """
+    return json.dumps({"origin": origin, "keys": list(keys)})
+
+
+def decode_invalidation(data: Any, origin: str) -> list[str] | None:
+    """Gecersiz kilma mesajini cozer.
+
+    Args:
+        data: Ham mesaj verisi.
+        origin: Alan surecin kimligi.
+
+    Returns:
+        Dusurulecek anahtarlar; bozuk veya
+        kendi mesajiysa None.
+    """
+    try:
+        message = json.loads(data)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(message, dict) or message.get("origin") == origin:
+        return None
+    return list(message.get("keys", []))
+
+
+class NearCache:
+    """Surec ici yakin onbellek (L1).
+
+    Sik okunan Redis degerlerini cozulmus
+    halde bellekte tutar. Yazan isci degisikligi
+    bir Redis kanalina yayinlar; diger isciler
+    kanali dinleyip kendi L1 kopyalarini dusurur.
+    Mesaj kaybina karsi L1 girdileri kisa bir
+    TTL ile sinirlidir.
+
+    Redis okumasi surerken gelen gecersiz kilma
+    okunan degeri bayat yapar; ``begin_fill`` /
+    ``end_fill`` anahtar surumunu karsilastirir
+    ve bu durumda L1'e yazilmaz.
+
+    L1'den donen nesneler paylasimlidir ve
+    yalnizca okunmalidir.
+
+    Attributes:
+        _l1: Bellek onbellegi.
+        _origin: Bu surecin yayin kimligi.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: int = 30,
+        channel: str = "atlas:invalidate",
+    ) -> None:
+        """Yakin onbellegi baslatir.
+
+        Args:
+            max_size: Maks L1 girdi sayisi.
+            ttl: L1 ust TTL siniri (sn).
+            channel: Gecersiz kilma kanali.
+        """
+        self._l1 = MemoryCache(
+            max_size=max_size, default_ttl=ttl,
+        )
+        self._ttl = ttl
+        self._channel = channel
+        self._origin = uuid4().hex
+        self._task: asyncio.Task[None] | None = None
+        self._pubsub: Any = None
+        self._redis: Any = None
+        self._reconnects = 0
+        # Suren doldurmalar: anahtar -> (surum, okuyucu sayisi)
+        self._fills: dict[str, list[int]] = {}
+        self._stale_fills = 0
+        self._l1_hits = 0
+        self._l2_hits = 0
+        self._l2_misses = 0
+        self._published = 0
+        self._received = 0
+
+        logger.info("NearCache baslatildi")
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """L1'den deger arar.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            (bulundu mu, deger).
+        """
+        value = self._l1.get(key, _MISSING)
+        if value is _MISSING:
+            return False, None
+        self._l1_hits += 1
+        return True, value
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+    ) -> None:
+        """L1'e deger yazar.
+
+        Args:
+            key: Anahtar.
+            value: Cozulmus deger.
+            ttl: Kaynak TTL (L1 ust sinirla kirpilir).
+        """
+        l1_ttl = (
+            min(ttl, self._ttl)
+            if ttl and ttl > 0
+            else self._ttl
+        )
+        self._l1.set(key, value, l1_ttl)
+
+    def begin_fill(self, key: str) -> int:
+        """Redis okumasi oncesi anahtar surumunu alir.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            ``end_fill``'e verilecek surum.
+        """
+        fill = self._fills.get(key)
+        if fill is None:
+            fill = self._fills[key] = [0, 0]
+        fill[1] += 1
+        return fill[0]
+
+    def end_fill(self, key: str, version: int) -> bool:
+        """Redis okumasini bitirir.
+
+        Her ``begin_fill`` icin bir kez cagrilmalidir.
+
+        Args:
+            key: Anahtar.
+            version: ``begin_fill`` surumu.
+
+        Returns:
+            Arada gecersiz kilma olmadiysa True
+            (deger L1'e yazilabilir).
+        """
+        fill = self._fills.get(key)
+        if fill is None:
+            return False
+        fresh = fill[0] == version
+        fill[1] -= 1
+        if fill[1] <= 0:
+            del self._fills[key]
+        if not fresh:
+            self._stale_fills += 1
+        return fresh
+
+    def _bump(self, key: str) -> None:
+        """Suren doldurmalari bayat isaretler."""
+        fill = self._fills.get(key)
+        if fill is not None:
+            fill[0] += 1
+
+    def _drop_all(self) -> None:
+        """Tum L1'i ve suren doldurmalari gecersiz kilar."""
+        for fill in self._fills.values():
+            fill[0] += 1
+        self._l1.clear()
+
+    def record_l2(self, hit: bool) -> None:
+        """L2 (Redis) sonucunu sayar.
+
+        Args:
+            hit: Redis'te bulundu mu.
+        """
+        if hit:
+            self._l2_hits += 1
+        else:
+            self._l2_misses += 1
+
+    def invalidate(self, key: str) -> bool:
+        """Yerel L1 kopyasini dusurur.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Silindiyse True.
+        """
+        self._bump(key)
+        return self._l1.delete(key)
+
+    async def publish(
+        self,
+        redis: Any,
+        *keys: str,
+    ) -> None:
+        """Diger iscilere gecersiz kilma yayinlar.
+
+        Args:
+            redis: Async Redis istemcisi.
+            *keys: Degisen anahtarlar.
+        """
+        if not keys:
+            return
+        payload = encode_invalidation(self._origin, keys)
+        try:
+            await redis.publish(self._channel, payload)
+            self._published += 1
+        except Exception as exc:
+            logger.warning(
+                "Gecersiz kilma yayinlanamadi: %s", exc,
+            )
+
+    def handle_message(self, data: Any) -> int:
+        """Kanal mesajini isler.
+
+        Args:
+            data: Ham mesaj verisi.
+
+        Returns:
+            Dusurulen anahtar sayisi.
+        """
+        keys = decode_invalidation(data, self._origin)
+        if keys is None:
+            return 0
+
+        self._received += 1
+        dropped = 0
+        for key in keys:
+            self._bump(key)
+            if self._l1.delete(key):
+                dropped += 1
+        return dropped
+
+    async def start(self, redis: Any) -> None:
+        """Kanal dinleyicisini baslatir.
+
+        Args:
+            redis: Async Redis istemcisi.
+        """
+        if self._task is not None:
+            return
+        self._redis = redis
+        self._pubsub = redis.pubsub()
+        await self._pubsub.subscribe(self._channel)
+        self._task = asyncio.create_task(
+            self._listen(),
+        )
+        logger.info(
+            "NearCache dinleniyor: %s", self._channel,
+        )
+
+    async def _listen(self) -> None:
+        """Gecersiz kilma mesajlarini dinler.
+
+        Baglanti hatasinda artan beklemeyle yeniden
+        abone olur; kacirilan mesajlar bayat veri
+        birakabilecegi icin L1 her seferinde bosaltilir.
+        """
+        delay = _RECONNECT_MIN
+        while True:
+            try:
+                await self._receive()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(
+                    "NearCache dinleyici hatasi, %.1fs sonra "
+                    "yeniden abone olunacak: %s", delay, exc,
+                )
+                self._drop_all()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX)
+                try:
+                    await self._resubscribe()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as sub_exc:
+                    logger.warning(
+                        "NearCache yeniden abonelik hatasi: %s",
+                        sub_exc,
+                    )
+                    continue
+                # Abonelik arasinda gelen yazimlar kacirilmis olabilir
+                self._drop_all()
+                self._reconnects += 1
+                delay = _RECONNECT_MIN
+
+    async def _receive(self) -> None:
+        """Kanal mesajlarini hata olana dek isler."""
+        while True:
+            message = await self._pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=1.0,
+            )
+            if message and message.get("type") == "message":
+                self.handle_message(message["data"])
+
+    async def _resubscribe(self) -> None:
+        """Eski aboneligi kapatip kanala yeniden abone olur."""
+        with contextlib.suppress(Exception):
+            await self._pubsub.close()
+        self._pubsub = self._redis.pubsub()
+        await self._pubsub.subscribe(self._channel)
+
+    async def stop(self) -> None:
+        """Dinleyiciyi durdurur."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(
+                    self._channel,
+                )
+                await self._pubsub.close()
+            except Exception:
+                pass
+            self._pubsub = None
+        self._l1.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Katman istatistikleri getirir.
+
+        Returns:
+            L1/L2 isabet oranlari.
+        """
+        lookups = (
+            self._l1_hits
+            + self._l2_hits
+            + self._l2_misses
+        )
+        l2_lookups = self._l2_hits + self._l2_misses
+        return {
+            "l1_size": self._l1.size,
+            "l1_hits": self._l1_hits,
+            "l2_hits": self._l2_hits,
+            "l2_misses": self._l2_misses,
+            "l1_hit_ratio": round(
+                self._l1_hits / max(1, lookups), 3,
+            ),
+            "l2_hit_ratio": round(
+                self._l2_hits / max(1, l2_lookups), 3,
+            ),
+            "published": self._published,
+            "received": self._received,
+            "stale_fills": self._stale_fills,
+            "reconnects": self._reconnects,
+            "listening": self._task is not None,
+        }
+
+    @property
+    def origin(self) -> str:
+        """Bu surecin yayin kimligi."""
+        return self._origin
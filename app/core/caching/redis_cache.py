@@ -0,0 +1,909 @@
+"""ATLAS Redis Dagitik Onbellek modulu.
+
+Gercek Redis dugumleri, tutarli hash
+yerlesimi, pipeline/MGET toplu islem,
+anahtar tasima ve dugum gecikme
+istatistikleri.
+"""
+
+import contextlib
+import json
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from redis import Redis, RedisError
+
+from app.core.caching.hash_ring import (
+    ConsistentHashRing,
+)
+
+logger = logging.getLogger(__name__)
+
+# Dugum basina tutulan gecikme ornegi
+_LATENCY_WINDOW = 1024
+
+# Tasima sirasinda SCAN parti boyutu
+_SCAN_COUNT = 500
+
+# Kanal dinleyicisi yeniden baglanma bekleme araligi (sn)
+_BUS_RETRY_MIN = 0.5
+_BUS_RETRY_MAX = 30.0
+
+
+class _NodeStats:
+    """Dugum gecikme istatistikleri."""
+
+    __slots__ = (
+        "ops",
+        "errors",
+        "total_ms",
+        "max_ms",
+        "samples",
+    )
+
+    def __init__(self) -> None:
+        """Istatistikleri baslatir."""
+        self.ops = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples: deque[float] = deque(
+            maxlen=_LATENCY_WINDOW,
+        )
+
+    def record(self, elapsed_ms: float) -> None:
+        """Bir islem suresini kaydeder.
+
+        Args:
+            elapsed_ms: Sure (ms).
+        """
+        self.ops += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        self.samples.append(elapsed_ms)
+
+    def percentile(self, pct: float) -> float:
+        """Son orneklerden yuzdelik getirir.
+
+        Args:
+            pct: Yuzdelik (0-100).
+
+        Returns:
+            Gecikme (ms).
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        idx = min(
+            len(ordered) - 1,
+            int(len(ordered) * pct / 100),
+        )
+        return ordered[idx]
+
+
+class _Subscription:
+    """Arka plan kanal dinleyicisi.
+
+    Abonelik onayi (ilk abonelik ve baglanti
+    kopmasi sonrasi yeniden abonelik) ile her
+    hatada ``on_reset`` cagrilir; arada kacirilan
+    mesajlar olabilecegi icin dinleyen taraf
+    yerel kopyalarini dusurmelidir.
+    """
+
+    def __init__(
+        self,
+        pubsub: Any,
+        channel: str,
+        on_message: Callable[[Any], None],
+        on_reset: Callable[[], None],
+    ) -> None:
+        """Dinleyiciyi olusturur.
+
+        Args:
+            pubsub: Redis PubSub nesnesi.
+            channel: Kanal.
+            on_message: Mesaj verisi geri cagrisi.
+            on_reset: Senkron kaybi geri cagrisi.
+        """
+        self._pubsub = pubsub
+        self._channel = channel
+        self._on_message = on_message
+        self._on_reset = on_reset
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"pubsub:{channel}",
+            daemon=True,
+        )
+        self.errors = 0
+
+    def start(self) -> None:
+        """Kanala abone olur ve dinlemeye baslar.
+
+        Raises:
+            RedisError: Abonelik hatasi.
+        """
+        self._pubsub.subscribe(self._channel)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Mesaj dongusu."""
+        delay = _BUS_RETRY_MIN
+        while not self._stop.is_set():
+            try:
+                message = self._pubsub.get_message(timeout=1.0)
+            except Exception as exc:
+                self.errors += 1
+                logger.warning(
+                    "Kanal dinleyici hatasi (%s), %.1fs sonra "
+                    "yeniden baglanilacak: %s",
+                    self._channel, delay, exc,
+                )
+                self._on_reset()
+                self._stop.wait(delay)
+                delay = min(delay * 2, _BUS_RETRY_MAX)
+                continue
+            if not message:
+                continue
+            if message["type"] == "subscribe":
+                self._on_reset()
+                delay = _BUS_RETRY_MIN
+            elif message["type"] == "message":
+                self._on_message(message["data"])
+
+    def stop(self) -> None:
+        """Dinleyiciyi durdurur."""
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+        with contextlib.suppress(Exception):
+            self._pubsub.close()
+
+    @property
+    def alive(self) -> bool:
+        """Dinleyici calisiyor mu."""
+        return self._thread.is_alive()
+
+
+class RedisDistributedCache:
+    """Redis tabanli dagitik onbellek.
+
+    Anahtarlari sanal dugumlu tutarli hash
+    halkasi ile gercek Redis dugumlerine
+    yerlestirir. Toplu islemler dugum
+    basina tek MGET/pipeline turuna indirilir.
+
+    Attributes:
+        _clients: Dugum -> Redis istemcisi.
+        _ring: Tutarli hash halkasi.
+        _nodes: Dugum bilgileri.
+    """
+
+    def __init__(
+        self,
+        nodes: dict[str, Any] | None = None,
+        prefix: str = "atlas:dcache",
+        vnodes: int = 160,
+    ) -> None:
+        """Redis dagitik onbellegi baslatir.
+
+        Args:
+            nodes: Dugum ID -> Redis URL
+                veya hazir istemci.
+            prefix: Anahtar on eki.
+            vnodes: Dugum basina sanal nokta.
+        """
+        self._prefix = prefix
+        self._ring = ConsistentHashRing(vnodes)
+        self._clients: dict[str, Any] = {}
+        self._nodes: dict[
+            str, dict[str, Any]
+        ] = {}
+        self._stats: dict[str, _NodeStats] = {}
+        # Pub/sub icin sabit dugum (ilk yapilandirilan)
+        self._bus: str | None = None
+        self._hits = 0
+        self._misses = 0
+        self._migrated = 0
+
+        for node_id, target in (nodes or {}).items():
+            self.add_node(
+                node_id, target, role="primary",
+            )
+
+        logger.info(
+            "RedisDistributedCache baslatildi (%d dugum)",
+            len(self._clients),
+        )
+
+    @staticmethod
+    def _connect(target: Any) -> Any:
+        """Redis istemcisi olusturur.
+
+        Args:
+            target: URL veya hazir istemci.
+
+        Returns:
+            Redis istemcisi.
+        """
+        if isinstance(target, str):
+            return Redis.from_url(
+                target, decode_responses=True,
+            )
+        return target
+
+    def _key(self, key: str) -> str:
+        """On ekli Redis anahtari.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Redis anahtari.
+        """
+        return f"{self._prefix}:{key}"
+
+    def _strip(self, redis_key: str) -> str:
+        """On eki kaldirir.
+
+        Args:
+            redis_key: Redis anahtari.
+
+        Returns:
+            Anahtar.
+        """
+        return redis_key[len(self._prefix) + 1:]
+
+    def _call(
+        self,
+        node_id: str,
+        fn: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Dugum uzerinde zamanli cagri yapar.
+
+        Args:
+            node_id: Dugum ID.
+            fn: Cagrilacak fonksiyon.
+            *args: Arguman.
+            **kwargs: Anahtar arguman.
+
+        Returns:
+            Sonuc.
+
+        Raises:
+            RedisError: Redis hatasi.
+        """
+        stats = self._stats[node_id]
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        except RedisError:
+            stats.errors += 1
+            raise
+        finally:
+            stats.record(
+                (time.perf_counter() - start) * 1000,
+            )
+
+    def _node_for(self, key: str) -> str | None:
+        """Anahtarin dugumunu getirir.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Dugum ID veya None.
+        """
+        return self._ring.get_node(key)
+
+    def get(
+        self,
+        key: str,
+        default: Any = None,
+    ) -> Any:
+        """Deger getirir.
+
+        Args:
+            key: Anahtar.
+            default: Varsayilan.
+
+        Returns:
+            Deger veya varsayilan.
+        """
+        node_id = self._node_for(key)
+        if node_id is None:
+            self._misses += 1
+            return default
+        try:
+            raw = self._call(
+                node_id,
+                self._clients[node_id].get,
+                self._key(key),
+            )
+        except RedisError as exc:
+            logger.warning(
+                "Redis okuma hatasi (%s): %s",
+                node_id, exc,
+            )
+            self._misses += 1
+            return default
+
+        if raw is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        return json.loads(raw)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = 0,
+    ) -> None:
+        """Deger yazar.
+
+        Args:
+            key: Anahtar.
+            value: Deger (JSON-serializable).
+            ttl: Yasam suresi (0: suresiz).
+        """
+        node_id = self._node_for(key)
+        if node_id is None:
+            return
+        try:
+            self._call(
+                node_id,
+                self._clients[node_id].set,
+                self._key(key),
+                json.dumps(value, default=str),
+                ex=ttl if ttl > 0 else None,
+            )
+        except RedisError as exc:
+            logger.warning(
+                "Redis yazma hatasi (%s): %s",
+                node_id, exc,
+            )
+
+    def delete(self, key: str) -> bool:
+        """Siler.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Basarili ise True.
+        """
+        node_id = self._node_for(key)
+        if node_id is None:
+            return False
+        try:
+            deleted = self._call(
+                node_id,
+                self._clients[node_id].delete,
+                self._key(key),
+            )
+        except RedisError:
+            return False
+        return deleted > 0
+
+    def exists(self, key: str) -> bool:
+        """Var mi kontrol eder.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Varsa True.
+        """
+        node_id = self._node_for(key)
+        if node_id is None:
+            return False
+        try:
+            return self._call(
+                node_id,
+                self._clients[node_id].exists,
+                self._key(key),
+            ) > 0
+        except RedisError:
+            return False
+
+    def get_many(
+        self,
+        keys: list[str],
+    ) -> dict[str, Any]:
+        """Birden fazla deger getirir.
+
+        Dugum basina tek MGET turu.
+
+        Args:
+            keys: Anahtar listesi.
+
+        Returns:
+            Anahtar-deger cifti.
+        """
+        result: dict[str, Any] = {}
+        for node_id, group in self._ring.group_keys(
+            keys,
+        ).items():
+            try:
+                values = self._call(
+                    node_id,
+                    self._clients[node_id].mget,
+                    [self._key(k) for k in group],
+                )
+            except RedisError as exc:
+                logger.warning(
+                    "Redis MGET hatasi (%s): %s",
+                    node_id, exc,
+                )
+                self._misses += len(group)
+                continue
+            for key, raw in zip(group, values, strict=True):
+                if raw is None:
+                    self._misses += 1
+                    continue
+                self._hits += 1
+                result[key] = json.loads(raw)
+        return result
+
+    def set_many(
+        self,
+        entries: dict[str, Any],
+        ttl: int = 0,
+    ) -> int:
+        """Birden fazla deger yazar.
+
+        Dugum basina tek pipeline turu.
+
+        Args:
+            entries: Anahtar-deger cifti.
+            ttl: Yasam suresi.
+
+        Returns:
+            Yazilan girdi sayisi.
+        """
+        written = 0
+        for node_id, group in self._ring.group_keys(
+            entries,
+        ).items():
+            pipe = self._clients[node_id].pipeline(
+                transaction=False,
+            )
+            for key in group:
+                pipe.set(
+                    self._key(key),
+                    json.dumps(
+                        entries[key], default=str,
+                    ),
+                    ex=ttl if ttl > 0 else None,
+                )
+            try:
+                self._call(node_id, pipe.execute)
+            except RedisError as exc:
+                logger.warning(
+                    "Redis pipeline hatasi (%s): %s",
+                    node_id, exc,
+                )
+                continue
+            written += len(group)
+        return written
+
+    def flush(self) -> int:
+        """On ekli tum anahtarlari siler.
+
+        Returns:
+            Silinen girdi sayisi.
+        """
+        total = 0
+        for node_id in list(self._clients):
+            try:
+                for batch in self._scan_batches(node_id):
+                    total += self._call(
+                        node_id,
+                        self._clients[node_id].delete,
+                        *batch,
+                    )
+            except RedisError as exc:
+                logger.warning(
+                    "Redis flush hatasi (%s): %s",
+                    node_id, exc,
+                )
+        return total
+
+    def _count(self, node_id: str) -> int:
+        """Dugumdeki on ekli anahtarlari sayar.
+
+        DBSIZE ayni veritabanindaki baska
+        anahtarlari da sayacagi icin SCAN
+        kullanilir.
+
+        Args:
+            node_id: Dugum ID.
+
+        Returns:
+            Anahtar sayisi.
+
+        Raises:
+            RedisError: Redis hatasi.
+        """
+        return sum(
+            len(batch)
+            for batch in self._scan_batches(node_id)
+        )
+
+    def _scan_batches(
+        self,
+        node_id: str,
+    ) -> Any:
+        """Dugumdeki on ekli anahtarlari partiler.
+
+        Args:
+            node_id: Dugum ID.
+
+        Yields:
+            Redis anahtar partileri.
+        """
+        client = self._clients[node_id]
+        batch: list[str] = []
+        for redis_key in client.scan_iter(
+            match=f"{self._prefix}:*",
+            count=_SCAN_COUNT,
+        ):
+            batch.append(redis_key)
+            if len(batch) >= _SCAN_COUNT:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _migrate(
+        self,
+        source: str,
+        only_to: str | None = None,
+    ) -> int:
+        """Sahibi degisen anahtarlari tasir.
+
+        TTL korunur; tasima dugum basina
+        pipeline ile yapilir.
+
+        Args:
+            source: Kaynak dugum.
+            only_to: Yalnizca bu hedefe gidenler.
+
+        Returns:
+            Tasinan anahtar sayisi.
+        """
+        moved = 0
+        src = self._clients[source]
+        for batch in list(self._scan_batches(source)):
+            plan: dict[str, list[str]] = {}
+            for redis_key in batch:
+                target = self._ring.get_node(
+                    self._strip(redis_key),
+                )
+                if target is None or target == source:
+                    continue
+                if only_to and target != only_to:
+                    continue
+                plan.setdefault(target, []).append(
+                    redis_key,
+                )
+            if not plan:
+                continue
+
+            keys = [k for group in plan.values() for k in group]
+            read = src.pipeline(transaction=False)
+            for redis_key in keys:
+                read.get(redis_key)
+                read.pttl(redis_key)
+            raw = self._call(source, read.execute)
+            values = {
+                k: (raw[2 * i], raw[2 * i + 1])
+                for i, k in enumerate(keys)
+            }
+
+            for target, group in plan.items():
+                write = self._clients[target].pipeline(
+                    transaction=False,
+                )
+                for redis_key in group:
+                    value, pttl = values[redis_key]
+                    if value is None:
+                        continue
+                    write.set(
+                        redis_key, value,
+                        px=pttl if pttl and pttl > 0 else None,
+                    )
+                self._call(target, write.execute)
+            self._call(source, src.delete, *keys)
+            moved += len(keys)
+
+        self._migrated += moved
+        return moved
+
+    def add_node(
+        self,
+        node_id: str,
+        target: Any = None,
+        role: str = "primary",
+        weight: int = 1,
+    ) -> dict[str, Any]:
+        """Dugum ekler ve etkilenen anahtarlari tasir.
+
+        Yalnizca yeni dugumun yaylarini onceden
+        tutan dugumler taranir.
+
+        Args:
+            node_id: Dugum ID.
+            target: Redis URL veya istemci.
+            role: Rol (primary/replica).
+            weight: Halka agirligi.
+
+        Returns:
+            Dugum bilgisi.
+        """
+        if node_id in self._nodes:
+            return self._nodes[node_id]
+        if target is None:
+            raise ValueError(
+                f"Dugum hedefi gerekli: {node_id}",
+            )
+
+        self._clients[node_id] = self._connect(target)
+        self._stats[node_id] = _NodeStats()
+        node: dict[str, Any] = {
+            "status": "active",
+            "role": role,
+            "weight": weight,
+        }
+        self._nodes[node_id] = node
+        if role != "primary":
+            return node
+        if self._bus is None:
+            self._bus = node_id
+
+        arcs = self._ring.add_node(node_id, weight)
+        previous = {owner for _, _, owner in arcs}
+        moved = 0
+        for source in previous:
+            try:
+                moved += self._migrate(
+                    source, only_to=node_id,
+                )
+            except RedisError as exc:
+                logger.warning(
+                    "Tasima hatasi (%s -> %s): %s",
+                    source, node_id, exc,
+                )
+        node["migrated_in"] = moved
+        return node
+
+    def remove_node(
+        self,
+        node_id: str,
+    ) -> bool:
+        """Dugum kaldirir, anahtarlarini dagitir.
+
+        Args:
+            node_id: Dugum ID.
+
+        Returns:
+            Basarili ise True.
+        """
+        if node_id not in self._nodes:
+            return False
+        in_ring = self._ring.remove_node(node_id)
+        if in_ring and len(self._ring):
+            try:
+                self._migrate(node_id)
+            except RedisError as exc:
+                logger.warning(
+                    "Tasima hatasi (%s): %s",
+                    node_id, exc,
+                )
+        del self._nodes[node_id]
+        self._clients.pop(node_id, None)
+        self._stats.pop(node_id, None)
+        return True
+
+    def failover(
+        self,
+        failed_node: str,
+    ) -> dict[str, Any]:
+        """Failover yapar.
+
+        Basan dugum halkadan cikarilir (erisilemez
+        kabul edildigi icin tasima yapilmaz); varsa
+        aktif bir replika onun yerine halkaya girer.
+
+        Args:
+            failed_node: Basan dugum.
+
+        Returns:
+            Failover sonucu.
+        """
+        node = self._nodes.get(failed_node)
+        if not node:
+            return {
+                "success": False,
+                "reason": "node_not_found",
+            }
+
+        node["status"] = "failed"
+        self._ring.remove_node(failed_node)
+
+        for nid, n in self._nodes.items():
+            if (
+                n["role"] == "replica"
+                and n["status"] == "active"
+            ):
+                n["role"] = "primary"
+                self._ring.add_node(
+                    nid, n.get("weight", 1),
+                )
+                return {
+                    "success": True,
+                    "promoted": nid,
+                }
+
+        return {
+            "success": True,
+            "promoted": None,
+        }
+
+    def _bus_node(self) -> str | None:
+        """Pub/sub dugumunu getirir.
+
+        Tum isciler ayni dugum listesiyle
+        yapilandirildigindan ilk dugum ortaktir.
+
+        Returns:
+            Dugum ID veya None.
+        """
+        if self._bus in self._clients:
+            return self._bus
+        return next(iter(self._clients), None)
+
+    def publish(
+        self,
+        channel: str,
+        message: str,
+    ) -> int:
+        """Kanala mesaj yayinlar.
+
+        Args:
+            channel: Kanal.
+            message: Mesaj.
+
+        Returns:
+            Mesaji alan abone sayisi.
+        """
+        node_id = self._bus_node()
+        if node_id is None:
+            return 0
+        try:
+            return int(self._call(
+                node_id,
+                self._clients[node_id].publish,
+                channel, message,
+            ))
+        except RedisError as exc:
+            logger.warning(
+                "Redis yayin hatasi (%s): %s",
+                node_id, exc,
+            )
+            return 0
+
+    def subscribe(
+        self,
+        channel: str,
+        on_message: Callable[[Any], None],
+        on_reset: Callable[[], None],
+    ) -> _Subscription | None:
+        """Kanali arka plan is parcaciginda dinler.
+
+        Args:
+            channel: Kanal.
+            on_message: Mesaj verisi geri cagrisi.
+            on_reset: Abonelik (yeniden) kuruldugunda
+                veya baglanti koptugunda cagrilir.
+
+        Returns:
+            Durdurulabilir dinleyici veya None
+            (dugum yok ya da abonelik hatasi).
+        """
+        node_id = self._bus_node()
+        if node_id is None:
+            return None
+        subscription = _Subscription(
+            self._clients[node_id].pubsub(),
+            channel, on_message, on_reset,
+        )
+        try:
+            subscription.start()
+        except RedisError as exc:
+            logger.warning(
+                "Redis abonelik hatasi (%s): %s",
+                node_id, exc,
+            )
+            return None
+        return subscription
+
+    def get_shard_stats(
+        self,
+    ) -> list[dict[str, Any]]:
+        """Dugum istatistikleri getirir.
+
+        Returns:
+            Dugum basina girdi ve gecikme.
+        """
+        result: list[dict[str, Any]] = []
+        for node_id, node in self._nodes.items():
+            stats = self._stats[node_id]
+            try:
+                entries = self._call(
+                    node_id, self._count, node_id,
+                )
+            except RedisError:
+                entries = None
+            result.append({
+                "shard": node_id,
+                "role": node["role"],
+                "status": node["status"],
+                "entries": entries,
+                "ops": stats.ops,
+                "errors": stats.errors,
+                "avg_ms": round(
+                    stats.total_ms / max(1, stats.ops), 3,
+                ),
+                "p95_ms": round(stats.percentile(95), 3),
+                "max_ms": round(stats.max_ms, 3),
+            })
+        return result
+
+    def get_stats(self) -> dict[str, Any]:
+        """Istatistik getirir.
+
+        Returns:
+            Istatistik.
+        """
+        total = self._hits + self._misses
+        return {
+            "total_entries": self.total_entries,
+            "shards": len(self._ring),
+            "nodes": len(self._nodes),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(
+                self._hits / max(1, total), 3,
+            ),
+            "migrated": self._migrated,
+        }
+
+    @property
+    def total_entries(self) -> int:
+        """Toplam girdi sayisi (on ekli anahtarlar)."""
+        total = 0
+        for node_id in self._ring.nodes:
+            try:
+                total += self._count(node_id)
+            except RedisError:
+                continue
+        return total
+
+    @property
+    def node_count(self) -> int:
+        """Dugum sayisi."""
+        return len(self._nodes)
+
+    @property
+    def shard_count(self) -> int:
+        """Halkadaki dugum sayisi."""
+        return len(self._ring)
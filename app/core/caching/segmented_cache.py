@@ -0,0 +1,293 @@
+"""ATLAS Segmentli Onbellek modulu.
+
+Kilit bolumleme, bagimsiz segmentler,
+toplu okuma/yazma ve birlesik
+istatistikler.
+"""
+
+import logging
+from typing import Any
+
+from app.core.caching.memory_cache import (
+    MemoryCache,
+)
+from app.models.caching import CacheStrategy
+
+logger = logging.getLogger(__name__)
+
+
+class SegmentedCache:
+    """Segmentli bellek onbellegi.
+
+    Anahtarlari hash ile N bagimsiz
+    segmente dagitir. Her segment kendi
+    kilidi, tahliye politikasi ve TTL
+    carkina sahip bir MemoryCache'tir;
+    boylece is parcaciklari tek bir
+    global kilit uzerinde sirlanmaz.
+
+    Attributes:
+        _segments: Segment listesi.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 300,
+        segments: int = 16,
+        policy: CacheStrategy | str = CacheStrategy.LRU,
+        ttl_resolution: float = 1.0,
+    ) -> None:
+        """Segmentli onbellegi baslatir.
+
+        Args:
+            max_size: Toplam maks girdi.
+            default_ttl: Varsayilan TTL.
+            segments: Segment sayisi.
+            policy: Tahliye stratejisi.
+            ttl_resolution: TTL kova genisligi (sn).
+        """
+        count = max(1, segments)
+        per_segment = max(
+            1, -(-max_size // count),
+        )
+        self._segments = [
+            MemoryCache(
+                max_size=per_segment,
+                default_ttl=default_ttl,
+                policy=policy,
+                ttl_resolution=ttl_resolution,
+            )
+            for _ in range(count)
+        ]
+        self._count = count
+        self._max_size = per_segment * count
+
+        logger.info(
+            "SegmentedCache baslatildi (%d segment)",
+            count,
+        )
+
+    def _segment_for(
+        self,
+        key: str,
+    ) -> MemoryCache:
+        """Anahtarin segmentini getirir.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Segment.
+        """
+        return self._segments[
+            hash(key) % self._count
+        ]
+
+    def _group(
+        self,
+        keys: Any,
+    ) -> dict[int, list[str]]:
+        """Anahtarlari segmentlere gruplar.
+
+        Args:
+            keys: Anahtarlar.
+
+        Returns:
+            Segment indeksi -> anahtarlar.
+        """
+        groups: dict[int, list[str]] = {}
+        count = self._count
+        for key in keys:
+            groups.setdefault(
+                hash(key) % count, [],
+            ).append(key)
+        return groups
+
+    def get(
+        self,
+        key: str,
+        default: Any = None,
+    ) -> Any:
+        """Deger getirir.
+
+        Args:
+            key: Anahtar.
+            default: Varsayilan.
+
+        Returns:
+            Deger veya varsayilan.
+        """
+        return self._segment_for(key).get(
+            key, default,
+        )
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+    ) -> None:
+        """Deger yazar.
+
+        Args:
+            key: Anahtar.
+            value: Deger.
+            ttl: Yasam suresi.
+        """
+        self._segment_for(key).set(
+            key, value, ttl,
+        )
+
+    def delete(self, key: str) -> bool:
+        """Siler.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Basarili ise True.
+        """
+        return self._segment_for(key).delete(key)
+
+    def exists(self, key: str) -> bool:
+        """Var mi kontrol eder.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Varsa True.
+        """
+        return self._segment_for(key).exists(key)
+
+    def get_many(
+        self,
+        keys: list[str],
+    ) -> dict[str, Any]:
+        """Birden fazla deger getirir.
+
+        Her segment kilidi bir kez alinir.
+
+        Args:
+            keys: Anahtar listesi.
+
+        Returns:
+            Anahtar-deger cifti.
+        """
+        result: dict[str, Any] = {}
+        for idx, group in self._group(
+            keys,
+        ).items():
+            result.update(
+                self._segments[idx].get_many(group),
+            )
+        return result
+
+    def set_many(
+        self,
+        entries: dict[str, Any],
+        ttl: int | None = None,
+    ) -> int:
+        """Birden fazla deger yazar.
+
+        Her segment kilidi bir kez alinir.
+
+        Args:
+            entries: Anahtar-deger cifti.
+            ttl: Yasam suresi.
+
+        Returns:
+            Yazilan girdi sayisi.
+        """
+        count = 0
+        for idx, group in self._group(
+            entries,
+        ).items():
+            count += self._segments[idx].set_many(
+                {k: entries[k] for k in group},
+                ttl,
+            )
+        return count
+
+    def clear(self) -> int:
+        """Tumu temizler.
+
+        Returns:
+            Silinen girdi sayisi.
+        """
+        return sum(
+            seg.clear() for seg in self._segments
+        )
+
+    def cleanup_expired(self) -> int:
+        """Suresi dolanlari temizler.
+
+        Returns:
+            Temizlenen girdi sayisi.
+        """
+        return sum(
+            seg.cleanup_expired()
+            for seg in self._segments
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Istatistik getirir.
+
+        Returns:
+            Birlesik istatistik.
+        """
+        per_segment = [
+            seg.get_stats() for seg in self._segments
+        ]
+        totals = {
+            field: sum(s[field] for s in per_segment)
+            for field in (
+                "size",
+                "hits",
+                "misses",
+                "expirations",
+                "admissions",
+                "rejections",
+                "evictions",
+            )
+        }
+        lookups = totals["hits"] + totals["misses"]
+        return {
+            **totals,
+            "max_size": self._max_size,
+            "hit_rate": round(
+                totals["hits"] / max(1, lookups), 3,
+            ),
+            "policy": per_segment[0]["policy"],
+            "segments": self._count,
+            "segment_sizes": [
+                s["size"] for s in per_segment
+            ],
+        }
+
+    @property
+    def size(self) -> int:
+        """Girdi sayisi."""
+        return sum(
+            seg.size for seg in self._segments
+        )
+
+    @property
+    def segment_count(self) -> int:
+        """Segment sayisi."""
+        return self._count
+
+    @property
+    def hit_count(self) -> int:
+        """Isabet sayisi."""
+        return sum(
+            seg.hit_count for seg in self._segments
+        )
+
+    @property
+    def miss_count(self) -> int:
+        """Iskalanma sayisi."""
+        return sum(
+            seg.miss_count for seg in self._segments
+        )
@@ -0,0 +1,202 @@
+"""ATLAS Zamanlayici Carki modulu.
+
+Tembel TTL sure asimi, kova bazli
+zamanlama ve toplu tahliye.
+"""
+
+import heapq
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class TimerWheel:
+    """Tembel zamanlayici carki.
+
+    Anahtarlari sure asimi zamanina gore
+    kovalara dagitir. Her okumada girdi
+    bazli zaman kontrolu yerine, saat
+    ilerledikce suresi dolan kovalar
+    topluca bosaltilir. Girdiler en fazla
+    bir cozunurluk adimi gec dusurulur,
+    asla erken dusurulmez.
+
+    Attributes:
+        _buckets: Adim -> anahtar kovasi.
+        _key_tick: Anahtar -> adim esleme.
+        _ticks: Dolu adimlarin min-yigini.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Zamanlayici carkini baslatir.
+
+        Args:
+            resolution: Kova genisligi (sn).
+            clock: Zaman kaynagi.
+        """
+        if resolution <= 0:
+            raise ValueError(
+                "resolution pozitif olmali",
+            )
+        self._resolution = resolution
+        self._clock = clock
+        self._buckets: dict[
+            int, OrderedDict[str, None]
+        ] = {}
+        self._key_tick: dict[str, int] = {}
+        self._ticks: list[int] = []
+        self._now = clock()
+        self._expired_total = 0
+
+    def schedule(
+        self,
+        key: str,
+        expires_at: float,
+    ) -> None:
+        """Anahtari zamanlar.
+
+        Args:
+            key: Anahtar.
+            expires_at: Mutlak bitis zamani.
+        """
+        tick = math.ceil(
+            expires_at / self._resolution,
+        )
+        old = self._key_tick.get(key)
+        if old == tick:
+            return
+        if old is not None:
+            self._discard(key, old)
+
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = OrderedDict()
+            self._buckets[tick] = bucket
+            heapq.heappush(self._ticks, tick)
+        bucket[key] = None
+        self._key_tick[key] = tick
+
+    def cancel(self, key: str) -> bool:
+        """Zamanlamayi iptal eder.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Zamanlanmissa True.
+        """
+        tick = self._key_tick.pop(key, None)
+        if tick is None:
+            return False
+        bucket = self._buckets.get(tick)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[tick]
+        return True
+
+    def advance(
+        self,
+        now: float | None = None,
+    ) -> list[str]:
+        """Saati ilerletir, dolanlari dondurur.
+
+        Args:
+            now: Simdiki zaman.
+
+        Returns:
+            Suresi dolan anahtarlar.
+        """
+        self._now = (
+            self._clock() if now is None
+            else now
+        )
+        if not self._ticks:
+            return []
+
+        current = math.floor(
+            self._now / self._resolution,
+        )
+        expired: list[str] = []
+        while (
+            self._ticks
+            and self._ticks[0] <= current
+        ):
+            tick = heapq.heappop(self._ticks)
+            bucket = self._buckets.pop(
+                tick, None,
+            )
+            if not bucket:
+                continue
+            for key in bucket:
+                del self._key_tick[key]
+            expired.extend(bucket)
+
+        self._expired_total += len(expired)
+        return expired
+
+    def peek(self) -> str | None:
+        """En erken dolacak anahtari getirir.
+
+        Returns:
+            Anahtar veya None.
+        """
+        while self._ticks:
+            bucket = self._buckets.get(
+                self._ticks[0],
+            )
+            if bucket:
+                return next(iter(bucket))
+            # Iptallerle bosalmis kova
+            heapq.heappop(self._ticks)
+        return None
+
+    def clear(self) -> None:
+        """Tum zamanlamalari temizler."""
+        self._buckets.clear()
+        self._key_tick.clear()
+        self._ticks.clear()
+
+    def _discard(
+        self,
+        key: str,
+        tick: int,
+    ) -> None:
+        """Anahtari eski kovasindan cikarir.
+
+        Args:
+            key: Anahtar.
+            tick: Eski adim.
+        """
+        bucket = self._buckets.get(tick)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[tick]
+
+    def __contains__(self, key: object) -> bool:
+        """Anahtar zamanlanmis mi."""
+        return key in self._key_tick
+
+    @property
+    def now(self) -> float:
+        """Son ilerletme zamani."""
+        return self._now
+
+    @property
+    def scheduled_count(self) -> int:
+        """Zamanlanmis anahtar sayisi."""
+        return len(self._key_tick)
+
+    @property
+    def expired_count(self) -> int:
+        """Toplam dusurulen anahtar."""
+        return self._expired_total
@@ -3,42 +3,84 @@
 Mesaj kuyrugu, oncelik kuyruklari,
 dead letter isleme, en az bir kez
 teslim ve tam bir kez semantigi.
+Opsiyonel olarak segment dosyalarinda
+kalici calisir.
 """
 
+import heapq
+import itertools
+import json
 import logging
+import os
 import time
+from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from app.core.distributed.segment_log import SegmentLog
+
 logger = logging.getLogger(__name__)
 
+# Segment kayit turleri
+_LIVE = 1
+_DEAD = 2
+
+_decode = json.JSONDecoder().decode
+
 
 class DistributedQueue:
     """Dagitik mesaj kuyrugu.
 
-    Dagitik mesaj kuyrugu yonetimi.
+    Dagitik mesaj kuyrugu yonetimi. Her kuyruk
+    (oncelik, sira no, mesaj ID) girdili bir ikili
+    heap'tir; ayni oncelikte FIFO korunur, ekleme
+    ve alma O(log n) calisir.
+
+    ``data_dir`` verilirse mesajlar ``SegmentLog``
+    segmentlerine yazilir; bellekte yalnizca mesaj
+    ID -> kayit sira numarasi tutulur ve mesaj
+    alinirken diskten okunur. Ack, nack ve purge kaydi tamamlandi
+    isaretler; yeniden baslatmada tamamlanmamis
+    kayitlar kuyruga (havadakiler dahil, en az bir
+    kez teslim) ve dead letter'a geri yuklenir.
 
     Attributes:
-        _queues: Kuyruk tanimlari.
+        _queues: Kuyruk heap'leri.
+        _queued: Mesaj ID -> kuyruktaki mesaj (bellek modu).
         _dead_letter: Dead letter kuyrugu.
+        _pending_dedup: Bekleyen/havadaki tekillestirme ID'leri.
+        _log: Kalici segment gunlugu (opsiyonel).
+        _refs: Mesaj ID -> kayit sira numarasi (kalici mod).
     """
 
     def __init__(
         self,
         max_retries: int = 3,
+        data_dir: str = "",
+        fsync: str = "interval",
+        fsync_interval_ms: float = 50.0,
+        segment_bytes: int = 64 * 1024 * 1024,
     ) -> None:
         """Dagitik kuyrugu baslatir.
 
         Args:
             max_retries: Maks yeniden deneme.
+            data_dir: Segment dizini. Bos ise sadece bellek.
+            fsync: fsync politikasi (always/interval/never).
+            fsync_interval_ms: Grup commit araligi (ms).
+            segment_bytes: Segment boyut siniri.
         """
         self._queues: dict[
-            str, list[dict[str, Any]]
+            str,
+            list[tuple[int, int, str]],
         ] = {}
+        self._queued: dict[str, dict[str, Any]] = {}
         self._dead_letter: list[
             dict[str, Any]
         ] = []
         self._processed_ids: set[str] = set()
+        self._pending_dedup: dict[str, str] = {}
+        self._seq = itertools.count()
         self._in_flight: dict[
             str, dict[str, Any]
         ] = {}
@@ -50,8 +92,19 @@ class DistributedQueue:
         }
         self._max_retries = max_retries
 
+        self._log: SegmentLog | None = None
+        self._refs: dict[str, int] = {}
+        self._processed_fd = -1
+        self._processed_buf: list[str] = []
+        if data_dir:
+            self._open_log(
+                data_dir, fsync,
+                fsync_interval_ms, segment_bytes,
+            )
+
         logger.info(
-            "DistributedQueue baslatildi",
+            "DistributedQueue baslatildi (path=%s)",
+            data_dir or "memory",
         )
 
     def create_queue(
@@ -95,7 +148,10 @@ class DistributedQueue:
             self._queues[queue_name] = []
 
         # Exactly-once: tekillestime
-        if dedup_id and dedup_id in self._processed_ids:
+        if dedup_id and (
+            dedup_id in self._processed_ids
+            or dedup_id in self._pending_dedup
+        ):
             return {
                 "status": "duplicate",
                 "dedup_id": dedup_id,
@@ -113,15 +169,9 @@ class DistributedQueue:
         }
 
         # Oncelik sirasi: kucuk = yuksek oncelik
-        queue = self._queues[queue_name]
-        inserted = False
-        for i, existing in enumerate(queue):
-            if priority < existing["priority"]:
-                queue.insert(i, message)
-                inserted = True
-                break
-        if not inserted:
-            queue.append(message)
+        self._push(message)
+        if dedup_id:
+            self._pending_dedup[dedup_id] = msg_id
 
         self._stats["enqueued"] += 1
         return {
@@ -149,10 +199,9 @@ class DistributedQueue:
         if not queue:
             return None
 
-        message = queue.pop(0)
-        self._in_flight[
-            message["message_id"]
-        ] = message
+        message_id = heapq.heappop(queue)[2]
+        message = self._load(message_id, take=True)
+        self._in_flight[message_id] = message
         self._stats["dequeued"] += 1
         return message
 
@@ -175,9 +224,18 @@ class DistributedQueue:
             return False
 
         if message.get("dedup_id"):
+            self._pending_dedup.pop(
+                message["dedup_id"], None,
+            )
             self._processed_ids.add(
                 message["dedup_id"],
             )
+            if self._log is not None:
+                with self._log.lock:
+                    self._processed_buf.append(
+                        message["dedup_id"],
+                    )
+        self._release(message_id)
 
         self._stats["acked"] += 1
         return True
@@ -205,9 +263,16 @@ class DistributedQueue:
 
         message["retry_count"] += 1
         self._stats["nacked"] += 1
+        # Yeni kayit yazilmadan eski kayit tamamlanmamali
+        old_ref = self._refs.pop(message_id, None)
 
         if message["retry_count"] >= self._max_retries:
             self._dead_letter.append(message)
+            if self._log is not None:
+                self._refs[message_id] = self._log.append(
+                    _DEAD, self._encode(message),
+                )
+                self._release_ref(old_ref)
             return {
                 "message_id": message_id,
                 "status": "dead_lettered",
@@ -215,10 +280,8 @@ class DistributedQueue:
             }
 
         # Kuyruga geri ekle
-        queue_name = message["queue_name"]
-        if queue_name not in self._queues:
-            self._queues[queue_name] = []
-        self._queues[queue_name].append(message)
+        self._push(message)
+        self._release_ref(old_ref)
 
         return {
             "message_id": message_id,
@@ -243,7 +306,7 @@ class DistributedQueue:
         )
         if not queue:
             return None
-        return dict(queue[0])
+        return dict(self._load(queue[0][2]))
 
     def get_queue_depth(
         self,
@@ -277,6 +340,12 @@ class DistributedQueue:
         if not queue:
             return 0
         count = len(queue)
+        for _, _, message_id in queue:
+            message = self._load(message_id, take=True)
+            self._pending_dedup.pop(
+                message["dedup_id"], None,
+            )
+            self._release(message_id)
         queue.clear()
         return count
 
@@ -304,10 +373,9 @@ class DistributedQueue:
                 continue
 
             msg["retry_count"] = 0
-            qn = msg["queue_name"]
-            if qn not in self._queues:
-                self._queues[qn] = []
-            self._queues[qn].append(msg)
+            old_ref = self._refs.pop(msg["message_id"], None)
+            self._push(msg)
+            self._release_ref(old_ref)
             retried += 1
 
         self._dead_letter = remaining
@@ -316,6 +384,167 @@ class DistributedQueue:
             "remaining": len(remaining),
         }
 
+    def _push(
+        self,
+        message: dict[str, Any],
+    ) -> None:
+        """Mesaji kendi kuyruk heap'ine ekler.
+
+        Heap'e mesaj ID konur; mesaj bellek
+        modunda ``_queued``'da tutulur, kalici
+        modda gunluge yazilir ve kayit sira
+        numarasi ``_refs``'e konur.
+
+        Args:
+            message: Mesaj.
+        """
+        message_id = message["message_id"]
+        if self._log is not None:
+            self._refs[message_id] = self._log.append(
+                _LIVE, self._encode(message),
+            )
+        else:
+            self._queued[message_id] = message
+        queue = self._queues.setdefault(
+            message["queue_name"], [],
+        )
+        heapq.heappush(
+            queue,
+            (
+                message["priority"],
+                next(self._seq),
+                message_id,
+            ),
+        )
+
+    def _load(
+        self,
+        message_id: str,
+        take: bool = False,
+    ) -> dict[str, Any]:
+        """Kuyruktaki mesaji getirir.
+
+        Args:
+            message_id: Mesaj ID.
+            take: Bellek modunda mesaji depodan cikar.
+
+        Returns:
+            Mesaj.
+        """
+        if self._log is None:
+            if take:
+                return self._queued.pop(message_id)
+            return self._queued[message_id]
+        return _decode(
+            self._log.read(self._refs[message_id])[1].decode(),
+        )
+
+    @staticmethod
+    def _encode(message: dict[str, Any]) -> bytes:
+        """Mesaji kayit verisine cevirir."""
+        return json.dumps(
+            message, default=str,
+            separators=(",", ":"),
+        ).encode()
+
+    def _release(self, message_id: str) -> None:
+        """Mesajin kalici kaydini tamamlandi isaretler.
+
+        Args:
+            message_id: Mesaj ID.
+        """
+        self._release_ref(self._refs.pop(message_id, None))
+
+    def _release_ref(self, ref: int | None) -> None:
+        """Kayit sira numarasini tamamlandi isaretler.
+
+        Args:
+            ref: Kayit sira numarasi.
+        """
+        if self._log is not None and ref is not None:
+            self._log.release(ref)
+
+    def _open_log(
+        self,
+        data_dir: str,
+        fsync: str,
+        fsync_interval_ms: float,
+        segment_bytes: int,
+    ) -> None:
+        """Gunlugu acar ve kuyruk durumunu kurtarir.
+
+        Args:
+            data_dir: Segment dizini.
+            fsync: fsync politikasi.
+            fsync_interval_ms: Grup commit araligi (ms).
+            segment_bytes: Segment boyut siniri.
+        """
+        log = SegmentLog(
+            data_dir,
+            segment_bytes=segment_bytes,
+            fsync=fsync,
+            fsync_interval_ms=fsync_interval_ms,
+        )
+        processed = Path(data_dir) / "processed.ids"
+        if processed.exists():
+            self._processed_ids.update(
+                processed.read_text().split(),
+            )
+        self._processed_fd = os.open(
+            processed,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+            0o644,
+        )
+        log.on_commit.append(self._flush_processed)
+
+        for seq, kind, payload in log.replay():
+            message = _decode(payload.decode())
+            if message.get("dedup_id"):
+                self._pending_dedup[
+                    message["dedup_id"]
+                ] = message["message_id"]
+            self._refs[message["message_id"]] = seq
+            if kind == _DEAD:
+                self._dead_letter.append(message)
+            else:
+                heapq.heappush(
+                    self._queues.setdefault(
+                        message["queue_name"], [],
+                    ),
+                    (
+                        message["priority"],
+                        next(self._seq),
+                        message["message_id"],
+                    ),
+                )
+        self._log = log
+
+    def _flush_processed(self) -> None:
+        """Islenmis tekillestirme ID'lerini dosyaya yazar."""
+        # Gunluk kilidi altinda cagrilir (on_commit)
+        if not self._processed_buf or self._processed_fd < 0:
+            return
+        data = "".join(
+            f"{dedup_id}\n" for dedup_id in self._processed_buf
+        )
+        os.write(self._processed_fd, data.encode())
+        if self._log is not None and self._log.fsync != "never":
+            os.fsync(self._processed_fd)
+        self._processed_buf.clear()
+
+    def sync(self) -> None:
+        """Kalici modda bekleyen yazmalari diske zorlar."""
+        if self._log is not None:
+            self._log.commit()
+
+    def close(self) -> None:
+        """Kalici gunlugu kapatir."""
+        if self._log is None or self._processed_fd < 0:
+            return
+        self._log.close()
+        os.close(self._processed_fd)
+        self._processed_fd = -1
+
     def get_stats(self) -> dict[str, Any]:
         """Istatistik getirir.
 
@@ -333,6 +562,11 @@ class DistributedQueue:
             "dead_letters": len(
                 self._dead_letter,
             ),
+            "durable": self._log is not None,
+            **(
+                {"log": self._log.get_stats()}
+                if self._log is not None else {}
+            ),
         }
 
     @property
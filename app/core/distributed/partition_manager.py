@@ -5,9 +5,12 @@ yeniden dengeleme, consistent hashing
 ve bolum kurtarma.
 """
 
+import bisect
 import hashlib
 import logging
 import time
+from collections import Counter
+from collections.abc import Iterable
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -16,11 +19,18 @@ logger = logging.getLogger(__name__)
 class PartitionManager:
     """Bolum yoneticisi.
 
-    Veri bolumleme ve shard yonetimi.
+    Veri bolumleme ve shard yonetimi. Halka siralidir;
+    anahtar arama ``bisect`` ile O(log n) yapilir.
+    Anahtarlar sahibi olan halka noktasina gore
+    gruplanir; dugum eklenip cikarildiginda yalnizca
+    etkilenen yaylarin anahtarlari yeniden atanir.
 
     Attributes:
         _partitions: Bolum tanimlari.
-        _ring: Consistent hash halkasi.
+        _ring: Consistent hash halkasi (sirali).
+        _ring_hashes: Halka hash'leri (bisect icin).
+        _arcs: Halka noktasi -> anahtarlar.
+        _dirty_arcs: Dengelenmesi gereken yaylar.
     """
 
     def __init__(
@@ -40,6 +50,9 @@ class PartitionManager:
         self._ring: list[
             tuple[int, str]
         ] = []
+        self._ring_hashes: list[int] = []
+        self._arcs: dict[int, set[str]] = {}
+        self._dirty_arcs: set[int] = set()
         self._nodes: dict[
             str, dict[str, Any]
         ] = {}
@@ -78,13 +91,25 @@ class PartitionManager:
         }
         self._nodes[node_id] = node
 
-        # Hash halkasina ekle
-        for i in range(self._virtual_nodes):
-            key = f"{node_id}:{i}"
-            h = self._hash(key)
-            self._ring.append((h, node_id))
+        points = [
+            self._hash(f"{node_id}:{i}")
+            for i in range(self._virtual_nodes)
+        ]
+        # Yeni noktalarin bolerek kuculttugu yaylar
+        # (eski halkadaki ardillari)
+        if self._ring_hashes:
+            self._dirty_arcs.update(
+                self._ring_hashes[self._successor(h + 1)]
+                for h in points
+            )
+
+        # Hash halkasina ekle; indeks bir kez kurulur
+        self._ring.extend((h, node_id) for h in points)
+        self._ring.sort()
+        self._ring_hashes = [
+            rh for rh, _ in self._ring
+        ]
 
-        self._ring.sort(key=lambda x: x[0])
         return node
 
     def remove_node(
@@ -103,10 +128,17 @@ class PartitionManager:
             return False
 
         del self._nodes[node_id]
+        self._dirty_arcs.update(
+            h for h, n in self._ring
+            if n == node_id
+        )
         self._ring = [
             (h, n) for h, n in self._ring
             if n != node_id
         ]
+        self._ring_hashes = [
+            h for h, _ in self._ring
+        ]
 
         # Bolumlerini temizle
         to_remove = [
@@ -174,14 +206,13 @@ class PartitionManager:
                 "reason": "no_nodes",
             }
 
-        h = self._hash(key)
         # Saat yonunde ilk dugumu bul
-        node_id = self._ring[0][1]
-        for ring_hash, nid in self._ring:
-            if ring_hash >= h:
-                node_id = nid
-                break
-
+        point, node_id = self._ring[
+            self._successor(self._hash(key))
+        ]
+        self._arcs.setdefault(
+            point, set(),
+        ).add(key)
         self._data_map[key] = node_id
         return {
             "key": key,
@@ -189,6 +220,51 @@ class PartitionManager:
             "node_id": node_id,
         }
 
+    def assign_keys(
+        self,
+        keys: Iterable[str],
+    ) -> dict[str, Any]:
+        """Anahtarlari toplu olarak bolumlere atar.
+
+        Args:
+            keys: Anahtarlar.
+
+        Returns:
+            Atanan sayi ve dugum basina dagilim.
+        """
+        if not self._ring:
+            return {
+                "assigned": 0,
+                "reason": "no_nodes",
+            }
+
+        ring = self._ring
+        hashes = self._ring_hashes
+        size = len(hashes)
+        arcs = self._arcs
+        data_map = self._data_map
+        md5 = hashlib.md5
+        find = bisect.bisect_left
+        per_node: Counter[str] = Counter()
+
+        count = 0
+        for key in keys:
+            h = int(md5(key.encode()).hexdigest()[:8], 16)
+            i = find(hashes, h)
+            point, node_id = ring[i if i < size else 0]
+            bucket = arcs.get(point)
+            if bucket is None:
+                bucket = arcs[point] = set()
+            bucket.add(key)
+            data_map[key] = node_id
+            per_node[node_id] += 1
+            count += 1
+
+        return {
+            "assigned": count,
+            "nodes": dict(per_node),
+        }
+
     def lookup_key(
         self,
         key: str,
@@ -216,16 +292,27 @@ class PartitionManager:
             }
 
         moved = 0
-        # Her anahtari yeniden ata
-        for key in list(self._data_map.keys()):
-            old_node = self._data_map[key]
-            result = self.assign_key(key)
-            new_node = result.get("node_id")
-            if new_node and new_node != old_node:
-                moved += 1
+        scanned = 0
+        # Yalnizca etkilenen yaylarin anahtarlarini yeniden ata
+        dirty, self._dirty_arcs = self._dirty_arcs, set()
+        for point in dirty:
+            keys = self._arcs.pop(point, None)
+            if not keys:
+                continue
+            scanned += len(keys)
+            old = {
+                key: self._data_map.get(key)
+                for key in keys
+            }
+            self.assign_keys(keys)
+            moved += sum(
+                1 for key, node in old.items()
+                if self._data_map[key] != node
+            )
 
         record = {
             "moved": moved,
+            "scanned": scanned,
             "total_keys": len(self._data_map),
             "timestamp": time.time(),
         }
@@ -298,6 +385,18 @@ class PartitionManager:
         ).hexdigest()
         return int(h[:8], 16)
 
+    def _successor(self, h: int) -> int:
+        """Hash'ten saat yonundeki ilk halka indeksini bulur.
+
+        Args:
+            h: Hash degeri.
+
+        Returns:
+            Halka indeksi.
+        """
+        i = bisect.bisect_left(self._ring_hashes, h)
+        return i if i < len(self._ring_hashes) else 0
+
     def _get_least_loaded(self) -> str:
         """En az yuklu dugumu bulur.
 
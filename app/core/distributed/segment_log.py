@@ -0,0 +1,614 @@
+"""ATLAS Segment Log modulu.
+
+Kalici kuyruklar icin yalnizca-ekleme segment
+dosyalari, mmap'li ofset indeksi, kayit basina
+tamamlandi bit haritasi, grup commit ile fsync
+ve tamamen tamamlanan segmentlerin silinmesi.
+"""
+
+import bisect
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import weakref
+import zlib
+from array import array
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# uzunluk, crc32, tur
+_HEADER = struct.Struct("<IIB")
+_OFFSET = struct.Struct("<Q")
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+
+class _Segment:
+    """Tek segment: kayit dosyasi, indeks ve bit haritasi."""
+
+    def __init__(self, directory: Path, base: int) -> None:
+        self.base = base
+        stem = directory / f"{base:020d}"
+        self.log_path = stem.with_suffix(".log")
+        self.idx_path = stem.with_suffix(".idx")
+        self.done_path = stem.with_suffix(".done")
+        self.log_fd = os.open(self.log_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.idx_fd = os.open(self.idx_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.done_fd = os.open(self.done_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+        # Aktif segment: bellekte ofsetler ve yazilmamis tampon
+        self.offsets = array("Q")
+        self.buf = bytearray()
+        self.idx_buf = bytearray()
+        self.flushed = 0
+        self.idx_flushed = 0
+        self.size = 0
+        self.count = 0
+
+        # Muhurlu segment: mmap'li kayit ve indeks
+        self.sealed = False
+        self.log_map: mmap.mmap | None = None
+        self.idx_map: mmap.mmap | None = None
+
+        self.done = bytearray()
+        self.done_count = 0
+        self.dirty_lo = -1
+        self.dirty_hi = -1
+
+    def offset(self, ordinal: int) -> int:
+        """Kayit ofsetini dondurur."""
+        if self.idx_map is not None:
+            return _OFFSET.unpack_from(self.idx_map, ordinal * _OFFSET.size)[0]
+        return self.offsets[ordinal]
+
+    def read(self, ordinal: int) -> tuple[int, bytes]:
+        """Kaydi okur.
+
+        Returns:
+            (tur, veri) ikilisi.
+        """
+        pos = self.offset(ordinal)
+        if self.log_map is not None:
+            view = self.log_map
+        elif pos >= self.flushed:
+            view, pos = self.buf, pos - self.flushed
+        else:
+            view = os.pread(self.log_fd, _HEADER.size, pos)
+            length = _HEADER.unpack_from(view)[0]
+            view = os.pread(self.log_fd, _HEADER.size + length, pos)
+            pos = 0
+        length, _, kind = _HEADER.unpack_from(view, pos)
+        start = pos + _HEADER.size
+        return kind, bytes(view[start:start + length])
+
+    def append(self, kind: int, payload: bytes) -> None:
+        """Kaydi tampona ekler."""
+        crc = zlib.crc32(payload, kind)
+        self.offsets.append(self.size)
+        self.idx_buf += _OFFSET.pack(self.size)
+        self.buf += _HEADER.pack(len(payload), crc, kind)
+        self.buf += payload
+        self.size += _HEADER.size + len(payload)
+        self.count += 1
+        if len(self.done) * 8 < self.count:
+            self.done.append(0)
+
+    def mark_done(self, ordinal: int) -> bool:
+        """Kaydi tamamlandi isaretler.
+
+        Returns:
+            Yeni isaretlendi mi.
+        """
+        byte, bit = divmod(ordinal, 8)
+        if self.done[byte] & (1 << bit):
+            return False
+        self.done[byte] |= 1 << bit
+        self.done_count += 1
+        self.dirty_lo = byte if self.dirty_lo < 0 else min(self.dirty_lo, byte)
+        self.dirty_hi = max(self.dirty_hi, byte)
+        return True
+
+    def is_done(self, ordinal: int) -> bool:
+        """Kayit tamamlandi mi."""
+        byte, bit = divmod(ordinal, 8)
+        return bool(self.done[byte] & (1 << bit))
+
+    def flush(self) -> bool:
+        """Tamponlari ve kirli bit araligini dosyalara yazar.
+
+        Returns:
+            Yazilacak veri var miydi.
+        """
+        wrote = False
+        if self.buf:
+            os.pwrite(self.log_fd, self.buf, self.flushed)
+            os.pwrite(self.idx_fd, self.idx_buf, self.idx_flushed)
+            self.flushed += len(self.buf)
+            self.idx_flushed += len(self.idx_buf)
+            self.buf.clear()
+            self.idx_buf.clear()
+            wrote = True
+        if self.dirty_lo >= 0:
+            os.pwrite(
+                self.done_fd,
+                self.done[self.dirty_lo:self.dirty_hi + 1],
+                self.dirty_lo,
+            )
+            self.dirty_lo = self.dirty_hi = -1
+            wrote = True
+        return wrote
+
+    def fsync(self) -> None:
+        """Dosyalari diske zorlar."""
+        for fd in (self.log_fd, self.idx_fd, self.done_fd):
+            os.fsync(fd)
+
+    def seal(self) -> None:
+        """Segmenti muhurler ve okuma icin mmap'ler."""
+        self.flush()
+        self.sealed = True
+        if self.size:
+            self.log_map = mmap.mmap(self.log_fd, 0, access=mmap.ACCESS_READ)
+            self.idx_map = mmap.mmap(self.idx_fd, 0, access=mmap.ACCESS_READ)
+            self.offsets = array("Q")
+
+    def close(self) -> None:
+        """Dosyalari kapatir."""
+        for view in (self.log_map, self.idx_map):
+            if view is not None:
+                view.close()
+        for fd in (self.log_fd, self.idx_fd, self.done_fd):
+            os.close(fd)
+
+    def unlink(self) -> None:
+        """Segment dosyalarini siler."""
+        self.close()
+        for path in (self.log_path, self.idx_path, self.done_path):
+            path.unlink(missing_ok=True)
+
+
+class SegmentLog:
+    """Segmentli, kalici kayit gunlugu.
+
+    Kayitlar artan sira numarasi (seq) alir ve aktif segmente
+    eklenir; segment ``segment_bytes`` boyutunu asinca
+    muhurlenir ve okumalar mmap uzerinden yapilir. Her
+    segmentin kayit basina bir bitlik tamamlandi haritasi
+    vardir; tum kayitlari tamamlanan muhurlu segmentler
+    silinir.
+
+    fsync politikalari:
+        always: Her eklemede yaz ve fsync.
+        interval: Yazmalar toplanir; son commit'ten
+            ``fsync_interval_ms`` gectiyse bir sonraki islemde,
+            islem gelmezse arka plan zamanlayicisinda toplu
+            yaz ve fsync (grup commit).
+        never: Yalnizca tampon doldugunda yaz, fsync yapma.
+
+    Attributes:
+        directory: Segment dizini.
+        segment_bytes: Segment boyut siniri.
+        fsync: fsync politikasi.
+        fsync_interval: Grup commit araligi (saniye).
+        on_commit: Commit oncesi cagrilan kancalar.
+        lock: Gunluk islemlerini ve arka plan commit'ini
+            siralayan kilit.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_bytes: int = 64 * 1024 * 1024,
+        fsync: str = "interval",
+        fsync_interval_ms: float = 50.0,
+        buffer_bytes: int = 1024 * 1024,
+    ) -> None:
+        """Gunlugu acar, varsa mevcut segmentleri kurtarir.
+
+        Args:
+            directory: Segment dizini.
+            segment_bytes: Segment boyut siniri.
+            fsync: fsync politikasi (always/interval/never).
+            fsync_interval_ms: Grup commit araligi (ms).
+            buffer_bytes: Tampon yazma esigi.
+
+        Raises:
+            ValueError: Gecersiz fsync politikasi.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Gecersiz fsync politikasi: {fsync}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval_ms / 1000
+        self.buffer_bytes = buffer_bytes
+        self.on_commit: list[Callable[[], None]] = []
+        self.lock = threading.RLock()
+
+        self._segments: list[_Segment] = []
+        self._bases: list[int] = []
+        self._last_commit = time.monotonic()
+        self._dirty = False
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._stats: dict[str, Any] = {
+            "appends": 0,
+            "commits": 0,
+            "fsyncs": 0,
+            "compacted_segments": 0,
+            "recovered_records": 0,
+            "truncated_bytes": 0,
+            "recovery_seconds": 0.0,
+            "timer_commits": 0,
+        }
+        self._open()
+        if fsync == "interval":
+            self._flusher = threading.Thread(
+                target=_flush_loop,
+                args=(weakref.ref(self), self._stop, self.fsync_interval),
+                name="segment-log-flusher",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    @property
+    def next_seq(self) -> int:
+        """Bir sonraki kaydin sira numarasi."""
+        active = self._segments[-1]
+        return active.base + active.count
+
+    def append(self, kind: int, payload: bytes) -> int:
+        """Kayit ekler.
+
+        Args:
+            kind: Kayit turu (0-255).
+            payload: Kayit verisi.
+
+        Returns:
+            Kaydin sira numarasi.
+        """
+        with self.lock:
+            active = self._segments[-1]
+            seq = active.base + active.count
+            active.append(kind, payload)
+            self._stats["appends"] += 1
+
+            if active.size >= self.segment_bytes:
+                self._roll()
+            else:
+                self._after_write(len(active.buf))
+            return seq
+
+    def read(self, seq: int) -> tuple[int, bytes]:
+        """Kaydi okur.
+
+        Args:
+            seq: Sira numarasi.
+
+        Returns:
+            (tur, veri) ikilisi.
+
+        Raises:
+            KeyError: Kayit yoksa veya silinmisse.
+        """
+        with self.lock:
+            segment, ordinal = self._locate(seq)
+            return segment.read(ordinal)
+
+    def release(self, seq: int) -> None:
+        """Kaydi tamamlandi isaretler.
+
+        Muhurlu segmentin tum kayitlari tamamlandiysa
+        segment silinir.
+
+        Args:
+            seq: Sira numarasi.
+        """
+        with self.lock:
+            segment, ordinal = self._locate(seq)
+            if not segment.mark_done(ordinal):
+                return
+            if segment.sealed and segment.done_count == segment.count:
+                self._drop(segment)
+            else:
+                self._after_write(0)
+
+    def touch(self) -> None:
+        """Gunluge bagli harici tamponun (on_commit) yazilmasi
+        gerektigini isaretler; zamanlayici sonraki turda commit eder.
+        """
+        with self.lock:
+            self._after_write(0)
+
+    def replay(self) -> Iterator[tuple[int, int, bytes]]:
+        """Tamamlanmamis kayitlari sirayla dondurur.
+
+        Yields:
+            (seq, tur, veri) uclusu.
+        """
+        with self.lock:
+            segments = list(self._segments)
+        for segment in segments:
+            with self.lock:
+                segment.flush()
+            view = segment.log_map
+            if view is None and segment.size:
+                view = mmap.mmap(segment.log_fd, 0, access=mmap.ACCESS_READ)
+            try:
+                for ordinal in range(segment.count):
+                    if segment.is_done(ordinal):
+                        continue
+                    pos = segment.offset(ordinal)
+                    length, _, kind = _HEADER.unpack_from(view, pos)
+                    start = pos + _HEADER.size
+                    yield (
+                        segment.base + ordinal, kind,
+                        bytes(view[start:start + length]),
+                    )
+            finally:
+                if view is not None and view is not segment.log_map:
+                    view.close()
+
+    def commit(self) -> None:
+        """Tamponlari yazar ve politikaya gore fsync eder."""
+        with self.lock:
+            for hook in self.on_commit:
+                hook()
+            touched = [s for s in self._segments if s.flush()]
+            if self.fsync != "never":
+                for segment in touched:
+                    segment.fsync()
+                    self._stats["fsyncs"] += 1
+            self._last_commit = time.monotonic()
+            self._dirty = False
+            self._stats["commits"] += 1
+
+    def compact(self) -> int:
+        """Tamamen tamamlanmis muhurlu segmentleri siler.
+
+        Returns:
+            Silinen segment sayisi.
+        """
+        with self.lock:
+            removable = [
+                s for s in self._segments[:-1]
+                if s.done_count == s.count
+            ]
+            for segment in removable:
+                self._drop(segment)
+            return len(removable)
+
+    def close(self) -> None:
+        """Commit eder ve dosyalari kapatir."""
+        self._stop.set()
+        if (
+            self._flusher is not None
+            and self._flusher is not threading.current_thread()
+        ):
+            self._flusher.join()
+        with self.lock:
+            if not self._segments:
+                return
+            self.commit()
+            for segment in self._segments:
+                segment.close()
+            self._segments.clear()
+            self._bases.clear()
+
+    def _commit_if_due(self) -> None:
+        """Zamanlayici: bekleyen yazma varsa ve aralik dolduysa commit eder."""
+        with self.lock:
+            if not self._dirty or not self._segments:
+                return
+            if time.monotonic() - self._last_commit < self.fsync_interval:
+                return
+            self.commit()
+            self._stats["timer_commits"] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Gunluk istatistikleri.
+
+        Returns:
+            Ekleme, commit, fsync, segment ve kurtarma bilgileri.
+        """
+        return {
+            **self._stats,
+            "segments": len(self._segments),
+            "bytes": sum(s.size for s in self._segments),
+            "live_records": sum(
+                s.count - s.done_count for s in self._segments
+            ),
+        }
+
+    def _after_write(self, buffered: int) -> None:
+        """Politikaya gore commit eder.
+
+        Args:
+            buffered: Aktif segment tampon boyutu.
+        """
+        if self.fsync == "always":
+            self.commit()
+        elif self.fsync == "interval":
+            if time.monotonic() - self._last_commit >= self.fsync_interval:
+                self.commit()
+            else:
+                self._dirty = True
+                if buffered >= self.buffer_bytes:
+                    self._segments[-1].flush()
+        elif buffered >= self.buffer_bytes:
+            self._segments[-1].flush()
+
+    def _locate(self, seq: int) -> tuple[_Segment, int]:
+        """Sira numarasinin segmentini bulur."""
+        i = bisect.bisect_right(self._bases, seq) - 1
+        if i >= 0:
+            segment = self._segments[i]
+            ordinal = seq - segment.base
+            if ordinal < segment.count:
+                return segment, ordinal
+        raise KeyError(seq)
+
+    def _roll(self) -> None:
+        """Aktif segmenti muhurler ve yenisini acar."""
+        active = self._segments[-1]
+        self.commit()
+        active.seal()
+        self._add_segment(active.base + active.count)
+        if active.done_count == active.count:
+            self._drop(active)
+
+    def _add_segment(self, base: int) -> _Segment:
+        """Yeni segment ekler."""
+        segment = _Segment(self.directory, base)
+        self._segments.append(segment)
+        self._bases.append(base)
+        return segment
+
+    def _drop(self, segment: _Segment) -> None:
+        """Segmenti listeden cikarir ve siler."""
+        i = self._segments.index(segment)
+        del self._segments[i]
+        del self._bases[i]
+        segment.unlink()
+        self._stats["compacted_segments"] += 1
+        logger.debug("Segment silindi: %s", segment.log_path.name)
+
+    def _open(self) -> None:
+        """Diskteki segmentleri kurtarir."""
+        started = time.perf_counter()
+        bases = sorted(
+            int(p.stem) for p in self.directory.glob("*.log")
+            if p.stem.isdigit()
+        )
+        for base in bases:
+            segment = self._add_segment(base)
+            self._recover_segment(segment)
+            self._stats["recovered_records"] += segment.count - segment.done_count
+
+        if not self._segments:
+            self._add_segment(0)
+        else:
+            # Son segment aktif kalir; digerleri muhurlenir
+            for segment in self._segments[:-1]:
+                segment.seal()
+            self.compact()
+            last = self._segments[-1]
+            if last.size >= self.segment_bytes:
+                self._roll()
+        self._stats["recovery_seconds"] = round(
+            time.perf_counter() - started, 6,
+        )
+
+    def _recover_segment(self, segment: _Segment) -> None:
+        """Segmentin indeksini dogrular, yarim kaydi keser.
+
+        Indeks girdileri dosya icinde kalan kayitlar icin
+        kabul edilir; kalan kisim CRC ile taranir ve ilk
+        bozuk kayittan sonrasi kesilir.
+        """
+        file_size = os.fstat(segment.log_fd).st_size
+        raw_idx = os.pread(
+            segment.idx_fd,
+            os.fstat(segment.idx_fd).st_size,
+            0,
+        )
+        offsets = array("Q")
+        offsets.frombytes(raw_idx[:len(raw_idx) - len(raw_idx) % _OFFSET.size])
+
+        pos = 0
+        view = (
+            mmap.mmap(segment.log_fd, 0, access=mmap.ACCESS_READ)
+            if file_size else b""
+        )
+        try:
+            for i, offset in enumerate(offsets):
+                if offset != pos or offset + _HEADER.size > file_size:
+                    del offsets[i:]
+                    break
+                pos = offset + _HEADER.size + _HEADER.unpack_from(view, offset)[0]
+                if pos > file_size:
+                    del offsets[i:]
+                    pos = offset
+                    break
+
+            # Son indeksli kaydin butunlugunu dogrula
+            if offsets and not self._valid(view, offsets[-1], file_size):
+                pos = offsets.pop()
+
+            # Indeksten sonraki kayitlari tara
+            while self._valid(view, pos, file_size):
+                offsets.append(pos)
+                pos += _HEADER.size + _HEADER.unpack_from(view, pos)[0]
+        finally:
+            if isinstance(view, mmap.mmap):
+                view.close()
+
+        if pos < file_size:
+            os.ftruncate(segment.log_fd, pos)
+            self._stats["truncated_bytes"] += file_size - pos
+            logger.warning(
+                "Yarim kayit kesildi: %s (%d bayt)",
+                segment.log_path.name, file_size - pos,
+            )
+        raw = offsets.tobytes()
+        os.ftruncate(segment.idx_fd, 0)
+        os.pwrite(segment.idx_fd, raw, 0)
+
+        segment.offsets = offsets
+        segment.count = len(offsets)
+        segment.size = segment.flushed = pos
+        segment.idx_flushed = len(raw)
+
+        nbytes = (segment.count + 7) // 8
+        done = bytearray(os.pread(segment.done_fd, nbytes, 0))
+        done.extend(bytes(nbytes - len(done)))
+        # Gecerli kayit sayisinin otesindeki bitleri temizle
+        if segment.count % 8:
+            done[-1] &= (1 << (segment.count % 8)) - 1
+        segment.done = done
+        segment.done_count = int.from_bytes(done, "little").bit_count()
+
+    @staticmethod
+    def _valid(view: Any, pos: int, file_size: int) -> bool:
+        """``pos``'taki kayit tam ve CRC'si dogru mu."""
+        if pos + _HEADER.size > file_size:
+            return False
+        length, crc, kind = _HEADER.unpack_from(view, pos)
+        start = pos + _HEADER.size
+        if start + length > file_size:
+            return False
+        return zlib.crc32(view[start:start + length], kind) == crc
+
+
+def _flush_loop(
+    ref: "weakref.ReferenceType[SegmentLog]",
+    stop: threading.Event,
+    interval: float,
+) -> None:
+    """Arka plan grup commit dongusu.
+
+    Gunluge zayif referans tutar; gunluk kapatilir
+    veya toplanirsa sonlanir.
+
+    Args:
+        ref: Gunluge zayif referans.
+        stop: Durdurma olayi.
+        interval: Commit araligi (saniye).
+    """
+    tick = max(interval / 2, 0.001)
+    while not stop.wait(tick):
+        log = ref()
+        if log is None:
+            return
+        try:
+            log._commit_if_due()
+        except Exception:  # noqa: BLE001
+            logger.exception("Arka plan commit basarisiz")
+        del log
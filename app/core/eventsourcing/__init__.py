@@ -12,6 +12,9 @@ from app.core.eventsourcing.es_orchestrator import (
 from app.core.eventsourcing.event_handler import (
     EventHandler,
 )
+from app.core.eventsourcing.event_log import (
+    EventLog,
+)
 from app.core.eventsourcing.event_publisher import (
     EventPublisher,
 )
@@ -32,6 +35,7 @@ __all__ = [
     "AggregateRoot",
     "CommandBus",
     "EventHandler",
+    "EventLog",
     "EventPublisher",
     "EventSourcingOrchestrator",
     "EventStore",
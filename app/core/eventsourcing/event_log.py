@@ -0,0 +1,615 @@
+"""ATLAS Olay Gunlugu modulu.
+
+Global ekleme-yalniz gunluk, sutunlu
+pozisyon/ofset indeksi, akis bazli
+surum indeksleri ve mmap ile okunan
+disk segmentleri.
+"""
+
+import bisect
+import json
+import logging
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterator
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+# Kayit cercevesi: 4 bayt uzunluk + JSON govde
+_HEADER = struct.Struct("<I")
+
+_SEGMENT_PREFIX = "events-"
+_SEGMENT_SUFFIX = ".log"
+
+# Olu satir bu sayiyi ve canli satir sayisini asinca sikistirilir
+_COMPACT_MIN_DEAD = 1024
+
+
+class _StreamIndex:
+    """Akis surum indeksi.
+
+    Surumler artan sirada tutulur;
+    ``rows`` ayni siradaki gunluk satirlaridir.
+    """
+
+    __slots__ = ("versions", "rows", "version")
+
+    def __init__(self) -> None:
+        """Bos indeks olusturur."""
+        self.versions = array("Q")
+        self.rows = array("Q")
+        self.version = 0
+
+    def __len__(self) -> int:
+        """Canli olay sayisi."""
+        return len(self.rows)
+
+
+class EventLog:
+    """Ekleme-yalniz olay gunlugu.
+
+    Her olay global gunlukte bir satirdir.
+    Pozisyon, segment ve ofset sutunlari
+    ``array`` olarak tutulur; pozisyonlar
+    artan oldugundan global okumalar bisect
+    ile baslar, akis okumalari akis bazli
+    surum indeksinde bisect ile cozulur.
+
+    ``directory`` verilirse olaylar
+    segment dosyalarina cercevelenmis JSON
+    olarak yazilir ve bellekte yalnizca
+    (segment, ofset) tutulur; okumalar
+    mmap uzerinden yapilir. Silme ve
+    kirpma islemleri de gunluge kontrol
+    kaydi olarak eklenir, acilista tum
+    indeks dosyalardan yeniden kurulur.
+
+    Olu satirlar canli satirlari gecince
+    sutunlar sikistirilir; kirpilan akislar
+    indeksi sinirsiz buyutmez.
+
+    Attributes:
+        _positions: Satir -> global pozisyon.
+        _alive: Satir canli mi (1/0).
+        _streams: Akis ID -> surum indeksi.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        segment_bytes: int = 64 * 1024 * 1024,
+        fsync: bool = False,
+    ) -> None:
+        """Olay gunlugunu baslatir.
+
+        Args:
+            directory: Segment dizini (None: bellek).
+            segment_bytes: Segment boyut siniri.
+            fsync: Her eklemede fsync yap.
+        """
+        self._directory = directory
+        self._segment_bytes = max(1, segment_bytes)
+        self._fsync = fsync
+
+        self._positions = array("Q")
+        self._segments = array("I")
+        self._offsets = array("Q")
+        self._alive = bytearray()
+        self._events: list[dict[str, Any] | None] = []
+
+        self._streams: dict[str, _StreamIndex] = {}
+        self._position = 0
+        self._live = 0
+        self._compactions = 0
+
+        self._segment_no = 0
+        self._segment_size = 0
+        self._writer: IO[bytes] | None = None
+        self._maps: dict[int, mmap.mmap] = {}
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._recover()
+
+    # ---- yazma ----
+
+    def append(self, event: dict[str, Any]) -> int:
+        """Olayi gunluge ekler.
+
+        Olay ``stream_id``, ``version`` ve
+        ``position`` alanlarini icermelidir.
+
+        Args:
+            event: Olay kaydi.
+
+        Returns:
+            Gunluk satiri.
+
+        Raises:
+            ValueError: Pozisyon artan degil.
+        """
+        if event["position"] <= self._position:
+            raise ValueError(
+                f"Position must increase: "
+                f"{event['position']} <= {self._position}"
+            )
+        segment, offset = 0, 0
+        if self._directory:
+            segment, offset = self._write(event)
+        return self._index(event, segment, offset)
+
+    def delete_stream(self, stream_id: str) -> bool:
+        """Akisi siler (satirlar olu isaretlenir).
+
+        Args:
+            stream_id: Akis ID.
+
+        Returns:
+            Basarili mi.
+        """
+        if stream_id not in self._streams:
+            return False
+        if self._directory:
+            self._write({"$op": "delete", "stream_id": stream_id})
+        self._apply_delete(stream_id)
+        return True
+
+    def truncate_stream(
+        self,
+        stream_id: str,
+        keep: int,
+    ) -> int:
+        """Akisin en eski olaylarini dusurur.
+
+        Args:
+            stream_id: Akis ID.
+            keep: Kalacak son olay sayisi.
+
+        Returns:
+            Dusurulen olay sayisi.
+        """
+        index = self._streams.get(stream_id)
+        if index is None or len(index) <= keep:
+            return 0
+        first = index.versions[len(index) - keep] if keep else (
+            index.version + 1
+        )
+        if self._directory:
+            self._write({
+                "$op": "truncate",
+                "stream_id": stream_id,
+                "version": first,
+            })
+        return self._apply_truncate(stream_id, first)
+
+    def _index(
+        self,
+        event: dict[str, Any],
+        segment: int,
+        offset: int,
+    ) -> int:
+        """Olayi sutunlara ve akis indeksine ekler.
+
+        Args:
+            event: Olay kaydi.
+            segment: Segment numarasi.
+            offset: Cerceve ofseti.
+
+        Returns:
+            Gunluk satiri.
+        """
+        stream_id = event["stream_id"]
+        row = len(self._positions)
+        self._positions.append(event["position"])
+        self._alive.append(1)
+        if self._directory:
+            self._segments.append(segment)
+            self._offsets.append(offset)
+        else:
+            self._events.append(event)
+
+        index = self._streams.get(stream_id)
+        if index is None:
+            index = self._streams[stream_id] = _StreamIndex()
+        index.versions.append(event["version"])
+        index.rows.append(row)
+        index.version = event["version"]
+        self._position = event["position"]
+        self._live += 1
+        return row
+
+    def _kill(self, row: int) -> None:
+        """Satiri olu isaretler.
+
+        Args:
+            row: Gunluk satiri.
+        """
+        self._alive[row] = 0
+        if not self._directory:
+            self._events[row] = None
+
+    def _apply_delete(self, stream_id: str) -> None:
+        """Silme islemini indekse uygular.
+
+        Args:
+            stream_id: Akis ID.
+        """
+        index = self._streams.pop(stream_id, None)
+        if index is None:
+            return
+        for row in index.rows:
+            self._kill(row)
+        self._live -= len(index)
+        self._maybe_compact()
+
+    def _apply_truncate(
+        self,
+        stream_id: str,
+        first_version: int,
+    ) -> int:
+        """Kirpma islemini indekse uygular.
+
+        Args:
+            stream_id: Akis ID.
+            first_version: Kalan ilk surum.
+
+        Returns:
+            Dusurulen olay sayisi.
+        """
+        index = self._streams.get(stream_id)
+        if index is None:
+            return 0
+        cut = bisect.bisect_left(index.versions, first_version)
+        for row in index.rows[:cut]:
+            self._kill(row)
+        del index.rows[:cut]
+        del index.versions[:cut]
+        self._live -= cut
+        self._maybe_compact()
+        return cut
+
+    def _maybe_compact(self) -> None:
+        """Olu satir orani esigi gecerse sikistirir."""
+        dead = len(self._positions) - self._live
+        if dead >= _COMPACT_MIN_DEAD and dead > self._live:
+            self.compact()
+
+    def compact(self) -> int:
+        """Olu satirlari sutunlardan atar.
+
+        Canli satirlar sirasini korur; akis
+        indeksleri yeni satir numaralarina
+        tasinir. Disk segmentlerine dokunulmaz.
+
+        Returns:
+            Atilan satir sayisi.
+        """
+        total = len(self._positions)
+        if self._live == total:
+            return 0
+        alive = self._alive
+        remap = array("Q", bytes(8 * total))
+        positions = array("Q")
+        segments = array("I")
+        offsets = array("Q")
+        events: list[dict[str, Any] | None] = []
+        new_row = 0
+        for row in range(total):
+            if not alive[row]:
+                continue
+            remap[row] = new_row
+            positions.append(self._positions[row])
+            if self._directory:
+                segments.append(self._segments[row])
+                offsets.append(self._offsets[row])
+            else:
+                events.append(self._events[row])
+            new_row += 1
+
+        for index in self._streams.values():
+            index.rows = array("Q", [remap[r] for r in index.rows])
+        self._positions = positions
+        self._segments = segments
+        self._offsets = offsets
+        self._events = events
+        self._alive = bytearray(b"\x01") * new_row
+        self._compactions += 1
+        return total - new_row
+
+    # ---- okuma ----
+
+    def read_stream(
+        self,
+        stream_id: str,
+        from_version: int = 0,
+        to_version: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Akisi surum araliginda okur.
+
+        Args:
+            stream_id: Akis ID.
+            from_version: Baslangic surumu.
+            to_version: Bitis surumu (dahil).
+
+        Returns:
+            Olay listesi.
+        """
+        index = self._streams.get(stream_id)
+        if index is None:
+            return []
+        lo = bisect.bisect_left(index.versions, from_version)
+        hi = (
+            bisect.bisect_right(index.versions, to_version)
+            if to_version is not None else len(index)
+        )
+        return [self._load(row) for row in index.rows[lo:hi]]
+
+    def read_all(
+        self,
+        from_position: int = 0,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Global sirada okur.
+
+        Args:
+            from_position: Baslangic pozisyonu.
+            limit: Limit.
+
+        Returns:
+            Olay listesi.
+        """
+        result: list[dict[str, Any]] = []
+        if limit <= 0:
+            return result
+        for event in self.iter_all(from_position):
+            result.append(event)
+            if len(result) >= limit:
+                break
+        return result
+
+    def iter_all(
+        self,
+        from_position: int = 0,
+    ) -> Iterator[dict[str, Any]]:
+        """Global sirada tembel dolasir.
+
+        Yeniden oynatma icin: olaylar tek tek
+        cozulur, tumu bellekte tutulmaz.
+
+        Args:
+            from_position: Baslangic pozisyonu.
+
+        Yields:
+            Olay kaydi.
+        """
+        row = bisect.bisect_left(self._positions, from_position)
+        generation = self._compactions
+        while row < len(self._positions):
+            if self._alive[row]:
+                event = self._load(row)
+                yield event
+                if generation != self._compactions:
+                    # Dolasim sirasinda sikistirildi; satirlar kaydi
+                    generation = self._compactions
+                    row = bisect.bisect_right(
+                        self._positions, event["position"],
+                    )
+                    continue
+            row += 1
+
+    def stream_version(self, stream_id: str) -> int:
+        """Akisin son surumu.
+
+        Args:
+            stream_id: Akis ID.
+
+        Returns:
+            Surum (yoksa 0).
+        """
+        index = self._streams.get(stream_id)
+        return index.version if index else 0
+
+    def stream_length(self, stream_id: str) -> int:
+        """Akistaki canli olay sayisi.
+
+        Args:
+            stream_id: Akis ID.
+
+        Returns:
+            Olay sayisi.
+        """
+        index = self._streams.get(stream_id)
+        return len(index) if index else 0
+
+    def streams(self) -> list[str]:
+        """Akis ID listesi."""
+        return list(self._streams)
+
+    def _load(self, row: int) -> dict[str, Any]:
+        """Satirin olayini getirir.
+
+        Args:
+            row: Gunluk satiri.
+
+        Returns:
+            Olay kaydi.
+        """
+        if not self._directory:
+            return self._events[row]  # type: ignore[return-value]
+        segment = self._segments[row]
+        offset = self._offsets[row]
+        view = self._map(segment, offset + _HEADER.size)
+        (length,) = _HEADER.unpack_from(view, offset)
+        start = offset + _HEADER.size
+        view = self._map(segment, start + length)
+        return json.loads(view[start:start + length])
+
+    # ---- disk ----
+
+    def _segment_path(self, number: int) -> str:
+        """Segment dosya yolu.
+
+        Args:
+            number: Segment numarasi.
+
+        Returns:
+            Yol.
+        """
+        return os.path.join(
+            self._directory,  # type: ignore[arg-type]
+            f"{_SEGMENT_PREFIX}{number:06d}{_SEGMENT_SUFFIX}",
+        )
+
+    def _write(
+        self,
+        record: dict[str, Any],
+    ) -> tuple[int, int]:
+        """Kaydi aktif segmente yazar.
+
+        Args:
+            record: Olay veya kontrol kaydi.
+
+        Returns:
+            (segment, ofset).
+        """
+        body = json.dumps(
+            record, default=str, separators=(",", ":"),
+        ).encode("utf-8")
+        if (
+            self._writer is None
+            or self._segment_size >= self._segment_bytes
+        ):
+            self._roll()
+        writer = self._writer
+        offset = self._segment_size
+        writer.write(_HEADER.pack(len(body)))  # type: ignore[union-attr]
+        writer.write(body)  # type: ignore[union-attr]
+        if self._fsync:
+            writer.flush()  # type: ignore[union-attr]
+            os.fsync(writer.fileno())  # type: ignore[union-attr]
+        self._segment_size += _HEADER.size + len(body)
+        return self._segment_no, offset
+
+    def _roll(self) -> None:
+        """Yeni segment acar."""
+        if self._writer is not None:
+            self._writer.close()
+        self._segment_no += 1
+        self._segment_size = 0
+        self._writer = open(  # noqa: SIM115
+            self._segment_path(self._segment_no), "ab",
+        )
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        """Segmentin mmap gorunumunu getirir.
+
+        Aktif segment buyudukce gorunum
+        yeniden eslenir.
+
+        Args:
+            segment: Segment numarasi.
+            end: Gereken bayt siniri.
+
+        Returns:
+            Salt okunur mmap.
+        """
+        view = self._maps.get(segment)
+        if view is not None and len(view) >= end:
+            return view
+        if segment == self._segment_no and self._writer:
+            self._writer.flush()
+        if view is not None:
+            view.close()
+        with open(self._segment_path(segment), "rb") as fh:
+            view = mmap.mmap(
+                fh.fileno(), 0, access=mmap.ACCESS_READ,
+            )
+        self._maps[segment] = view
+        return view
+
+    def _recover(self) -> None:
+        """Segment dosyalarindan indeksi kurar."""
+        numbers = sorted(
+            int(name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(self._directory)  # type: ignore[arg-type]
+            if name.startswith(_SEGMENT_PREFIX)
+            and name.endswith(_SEGMENT_SUFFIX)
+        )
+        for number in numbers:
+            path = self._segment_path(number)
+            with open(path, "rb") as fh:
+                data = fh.read()
+            offset = 0
+            while offset + _HEADER.size <= len(data):
+                (length,) = _HEADER.unpack_from(data, offset)
+                start = offset + _HEADER.size
+                if start + length > len(data):
+                    break
+                record = json.loads(data[start:start + length])
+                op = record.get("$op")
+                if op == "delete":
+                    self._apply_delete(record["stream_id"])
+                elif op == "truncate":
+                    self._apply_truncate(
+                        record["stream_id"], record["version"],
+                    )
+                else:
+                    self._index(record, number, offset)
+                offset = start + length
+            if offset < len(data):
+                # Yarim kalmis son yazim atilir
+                logger.warning(
+                    "Olay segmenti kirpildi: %s (%d bayt)",
+                    path, len(data) - offset,
+                )
+                with open(path, "r+b") as fh:
+                    fh.truncate(offset)
+            self._segment_no = number
+            self._segment_size = offset
+        if numbers:
+            self._writer = open(  # noqa: SIM115
+                self._segment_path(self._segment_no), "ab",
+            )
+
+    def close(self) -> None:
+        """Dosya ve mmap tutamaclarini kapatir."""
+        for view in self._maps.values():
+            view.close()
+        self._maps.clear()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Istatistik getirir.
+
+        Returns:
+            Satir, canli olay, akis ve segment sayilari.
+        """
+        return {
+            "rows": len(self._positions),
+            "live_events": self._live,
+            "compactions": self._compactions,
+            "streams": len(self._streams),
+            "segments": self._segment_no,
+            "persistent": bool(self._directory),
+            "position": self._position,
+        }
+
+    @property
+    def position(self) -> int:
+        """Son global pozisyon."""
+        return self._position
+
+    @property
+    def event_count(self) -> int:
+        """Canli olay sayisi."""
+        return self._live
+
+    @property
+    def stream_count(self) -> int:
+        """Akis sayisi."""
+        return len(self._streams)
@@ -7,39 +7,50 @@ ve eszamanlilik kontrolu.
 
 import logging
 import time
+from collections.abc import Iterator
 from typing import Any
 from uuid import uuid4
 
+from app.core.eventsourcing.event_log import EventLog
+
 logger = logging.getLogger(__name__)
 
 
 class EventStore:
     """Olay deposu.
 
-    Olaylari depolar ve yonetir.
+    Olaylari depolar ve yonetir. Olaylar
+    global ekleme-yalniz EventLog'da tutulur;
+    global ve akis okumalari indeksler
+    uzerinden bisect ile baslar.
 
     Attributes:
-        _streams: Olay akislari.
+        _log: Olay gunlugu.
         _snapshots: Snapshot deposu.
     """
 
     def __init__(
         self,
         max_stream_size: int = 10000,
+        log_dir: str | None = None,
+        segment_bytes: int = 64 * 1024 * 1024,
     ) -> None:
         """Olay deposunu baslatir.
 
         Args:
             max_stream_size: Maks akis boyutu.
+            log_dir: Segment dizini (None: bellek).
+            segment_bytes: Segment boyut siniri.
         """
-        self._streams: dict[
-            str, list[dict[str, Any]]
-        ] = {}
+        self._log = EventLog(
+            directory=log_dir,
+            segment_bytes=segment_bytes,
+        )
         self._snapshots: dict[
             str, dict[str, Any]
         ] = {}
         self._max_stream_size = max_stream_size
-        self._global_position: int = 0
+        self._global_position = self._log.position
 
         logger.info("EventStore baslatildi")
 
@@ -66,11 +77,9 @@ class EventStore:
         Raises:
             ValueError: Surum catismasi.
         """
-        if stream_id not in self._streams:
-            self._streams[stream_id] = []
-
-        stream = self._streams[stream_id]
-        current_version = len(stream)
+        current_version = self._log.stream_version(
+            stream_id,
+        )
 
         # Eszamanlilik kontrolu
         if (
@@ -95,12 +104,14 @@ class EventStore:
             "position": self._global_position,
             "timestamp": time.time(),
         }
-        stream.append(event)
+        self._log.append(event)
 
         # Boyut kontrolu
-        if len(stream) > self._max_stream_size:
-            half = len(stream) // 2
-            self._streams[stream_id] = stream[half:]
+        length = self._log.stream_length(stream_id)
+        if length > self._max_stream_size:
+            self._log.truncate_stream(
+                stream_id, length - length // 2,
+            )
 
         return event
 
@@ -120,19 +131,9 @@ class EventStore:
         Returns:
             Olay listesi.
         """
-        stream = self._streams.get(
-            stream_id, [],
+        return self._log.read_stream(
+            stream_id, from_version, to_version,
         )
-        result = [
-            e for e in stream
-            if e["version"] >= from_version
-        ]
-        if to_version is not None:
-            result = [
-                e for e in result
-                if e["version"] <= to_version
-            ]
-        return result
 
     def read_all(
         self,
@@ -148,19 +149,26 @@ class EventStore:
         Returns:
             Olay listesi.
         """
-        all_events = []
-        for events in self._streams.values():
-            all_events.extend(events)
-
-        all_events.sort(
-            key=lambda e: e["position"],
+        return self._log.read_all(
+            from_position, limit,
         )
 
-        filtered = [
-            e for e in all_events
-            if e["position"] >= from_position
-        ]
-        return filtered[:limit]
+    def iter_all(
+        self,
+        from_position: int = 0,
+    ) -> Iterator[dict[str, Any]]:
+        """Tum olaylari tembel dolasir.
+
+        Yeniden oynatmada olaylar tek tek
+        cozulur.
+
+        Args:
+            from_position: Baslangic pozisyonu.
+
+        Returns:
+            Olay yineleyicisi.
+        """
+        return self._log.iter_all(from_position)
 
     def get_stream_version(
         self,
@@ -174,12 +182,7 @@ class EventStore:
         Returns:
             Surum numarasi.
         """
-        stream = self._streams.get(
-            stream_id, [],
-        )
-        if not stream:
-            return 0
-        return stream[-1]["version"]
+        return self._log.stream_version(stream_id)
 
     def save_snapshot(
         self,
@@ -232,8 +235,7 @@ class EventStore:
         Returns:
             Basarili mi.
         """
-        if stream_id in self._streams:
-            del self._streams[stream_id]
+        if self._log.delete_stream(stream_id):
             self._snapshots.pop(stream_id, None)
             return True
         return False
@@ -244,19 +246,29 @@ class EventStore:
         Returns:
             Akis ID listesi.
         """
-        return list(self._streams.keys())
+        return self._log.streams()
+
+    def get_log_stats(self) -> dict[str, Any]:
+        """Olay gunlugu istatistikleri.
+
+        Returns:
+            Satir, akis ve segment bilgisi.
+        """
+        return self._log.get_stats()
+
+    def close(self) -> None:
+        """Gunluk dosyalarini kapatir."""
+        self._log.close()
 
     @property
     def stream_count(self) -> int:
         """Akis sayisi."""
-        return len(self._streams)
+        return self._log.stream_count
 
     @property
     def event_count(self) -> int:
         """Toplam olay sayisi."""
-        return sum(
-            len(s) for s in self._streams.values()
-        )
+        return self._log.event_count
 
     @property
     def snapshot_count(self) -> int:
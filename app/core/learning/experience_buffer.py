@@ -18,10 +18,15 @@ class SumTree:
     """Segment agaci tabanli toplam agaci.
 
     Oncelikli ornekleme icin O(log n) karmasiklik saglar.
+    Bir batch'in tum onek toplamlari ayni anda seviye
+    seviye NumPy ile indirilir; yapraga ulasan ornekler
+    maskelenerek yerinde birakilir. Toplam agacinin
+    yaninda minimum agaci da tutulur.
 
     Attributes:
         capacity: Yaprak dugum kapasitesi.
-        tree: Agac dizisi.
+        tree: Toplam agaci dizisi.
+        min_tree: Minimum agaci dizisi.
         data: Yaprak verileri.
         write_idx: Yazma indeksi.
         size: Mevcut eleman sayisi.
@@ -34,34 +39,28 @@ class SumTree:
             capacity: Maksimum eleman sayisi.
         """
         self.capacity = capacity
+        self._leaf_base = capacity - 1
+        # En derin yapragin seviyesi
+        self._depth = (2 * capacity - 1).bit_length() - 1
         self.tree = np.zeros(2 * capacity - 1)
+        self.min_tree = np.full(2 * capacity - 1, np.inf)
         self.data: list[Any] = [None] * capacity
         self.write_idx = 0
         self.size = 0
 
-    def _propagate(self, idx: int, change: float) -> None:
-        """Degisikligi kok dugume yayar."""
-        parent = (idx - 1) // 2
-        self.tree[parent] += change
-        if parent != 0:
-            self._propagate(parent, change)
-
-    def _retrieve(self, idx: int, s: float) -> int:
-        """Toplam degerine gore yaprak dugumu bulur."""
-        left = 2 * idx + 1
-        right = left + 1
-
-        if left >= len(self.tree):
-            return idx
-
-        if s <= self.tree[left]:
-            return self._retrieve(left, s)
-        return self._retrieve(right, s - self.tree[left])
-
     def total(self) -> float:
         """Toplam oncelik degerini dondurur."""
         return float(self.tree[0])
 
+    def min_priority(self) -> float:
+        """Dolu yapraklardaki en kucuk oncelik (bossa inf)."""
+        return float(self.min_tree[0])
+
+    def leaf_priorities(self) -> np.ndarray:
+        """Dolu yapraklarin oncelik gorunumu."""
+        base = self._leaf_base
+        return self.tree[base:base + self.size]
+
     def add(self, priority: float, data: Any) -> None:
         """Yeni eleman ekler veya en eskisini degistirir.
 
@@ -69,7 +68,7 @@ class SumTree:
             priority: Oncelik degeri.
             data: Depolanacak veri.
         """
-        idx = self.write_idx + self.capacity - 1
+        idx = self.write_idx + self._leaf_base
         self.data[self.write_idx] = data
         self._update(idx, priority)
 
@@ -77,11 +76,28 @@ class SumTree:
         self.size = min(self.size + 1, self.capacity)
 
     def _update(self, idx: int, priority: float) -> None:
-        """Agac dugumunu gunceller."""
-        change = priority - self.tree[idx]
-        self.tree[idx] = priority
-        if idx != 0:
-            self._propagate(idx, change)
+        """Agac dugumunu ve atalarini gunceller.
+
+        Toplam farki yukari yayilir; minimum agaci
+        bir atanin minimumu degismeyince durur.
+        """
+        tree = self.tree
+        min_tree = self.min_tree
+        change = priority - tree[idx]
+        tree[idx] = priority
+        min_tree[idx] = priority
+        update_min = True
+        while idx:
+            idx = (idx - 1) // 2
+            tree[idx] += change
+            if update_min:
+                left = min_tree[2 * idx + 1]
+                right = min_tree[2 * idx + 2]
+                lowest = left if left < right else right
+                if lowest == min_tree[idx]:
+                    update_min = False
+                else:
+                    min_tree[idx] = lowest
 
     def get(self, s: float) -> tuple[int, float, Any]:
         """Toplam degerine gore eleman getirir.
@@ -92,9 +108,42 @@ class SumTree:
         Returns:
             (indeks, oncelik, veri) uclusi.
         """
-        idx = self._retrieve(0, s)
-        data_idx = idx - self.capacity + 1
-        return idx, float(self.tree[idx]), self.data[data_idx]
+        tree = self.tree
+        leaf_base = self._leaf_base
+        idx = 0
+        while idx < leaf_base:
+            left = 2 * idx + 1
+            if s <= tree[left]:
+                idx = left
+            else:
+                s -= tree[left]
+                idx = left + 1
+        return idx, float(tree[idx]), self.data[idx - leaf_base]
+
+    def get_batch(
+        self,
+        values: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Bir batch onek toplamini birlikte indirir.
+
+        Args:
+            values: Ornekleme degerleri [0, total).
+
+        Returns:
+            (agac indeksleri, oncelikler, veri indeksleri).
+        """
+        tree = self.tree
+        leaf_base = self._leaf_base
+        s = np.asarray(values, dtype=np.float64).copy()
+        idx = np.zeros(len(s), dtype=np.int64)
+        for _ in range(self._depth):
+            inner = idx < leaf_base
+            left = np.where(inner, 2 * idx + 1, idx)
+            left_sum = tree[left]
+            right = inner & (s > left_sum)
+            s -= np.where(right, left_sum, 0.0)
+            idx = left + right
+        return idx, tree[idx], idx - leaf_base
 
     def update(self, idx: int, priority: float) -> None:
         """Mevcut elemanin onceligini gunceller.
@@ -105,6 +154,43 @@ class SumTree:
         """
         self._update(idx, priority)
 
+    def update_batch(
+        self,
+        indices: np.ndarray,
+        priorities: np.ndarray,
+    ) -> None:
+        """Oncelikleri toplu gunceller.
+
+        Ayni indeks birden fazla verilirse son deger
+        kazanir. Atalar seviye seviye tekillestirilip
+        cocuklarindan yeniden hesaplanir; farkli
+        derinlikteki yapraklarin ortak atalari son
+        kez tum cocuklari guncellendikten sonra
+        hesaplanir.
+
+        Args:
+            indices: Agac indeksleri.
+            priorities: Yeni oncelik degerleri.
+        """
+        idx = np.asarray(indices, dtype=np.int64)
+        if idx.size == 0:
+            return
+        values = np.asarray(priorities, dtype=np.float64)
+        idx, last = np.unique(idx[::-1], return_index=True)
+        values = values[::-1][last]
+
+        tree = self.tree
+        min_tree = self.min_tree
+        tree[idx] = values
+        min_tree[idx] = values
+        for _ in range(self._depth):
+            idx = np.unique((idx[idx > 0] - 1) // 2)
+            if idx.size == 0:
+                break
+            left = 2 * idx + 1
+            tree[idx] = tree[left] + tree[left + 1]
+            min_tree[idx] = np.minimum(min_tree[left], min_tree[left + 1])
+
 
 class ExperienceBuffer:
     """Oncelikli deneyim tekrari tamponu.
@@ -165,56 +251,77 @@ class ExperienceBuffer:
             batch_size: Ornek sayisi.
 
         Returns:
-            Oncelikli deneyim listesi.
+            Oncelikli deneyim listesi (``index`` agac indeksidir).
         """
+        indices, priorities, weights, experiences = self.sample_arrays(
+            batch_size,
+        )
+        # Deneyimler eklenirken dogrulandi; tekrar dogrulama gereksiz
+        return [
+            PrioritizedExperience.model_construct(
+                experience=exp,
+                priority=float(p),
+                weight=float(w),
+                index=int(i),
+            )
+            for i, p, w, exp in zip(
+                indices, priorities, weights, experiences, strict=True,
+            )
+        ]
+
+    def sample_arrays(
+        self,
+        batch_size: int = 32,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[Experience]]:
+        """Oncelikli ornekleme yapar (dizi ciktisi).
+
+        Her segmentten bir onek toplami cekilir ve tum
+        batch agacta birlikte indirilir.
+
+        Args:
+            batch_size: Ornek sayisi.
+
+        Returns:
+            (agac indeksleri, oncelikler, agirliklar, deneyimler).
+        """
+        empty = np.empty(0)
         n = min(batch_size, len(self))
         if n == 0:
-            return []
+            return empty.astype(np.int64), empty, empty, []
 
         self.beta = min(1.0, self.beta + self.beta_increment)
 
-        total = self._tree.total()
+        tree = self._tree
+        total = tree.total()
         if total <= 0:
-            return []
+            return empty.astype(np.int64), empty, empty, []
 
         segment = total / n
-        samples: list[PrioritizedExperience] = []
-
-        min_prob = 1e-6
-        if self._tree.size > 0:
-            min_prob = max(min_prob, np.min(
-                self._tree.tree[-self._tree.capacity:][:self._tree.size],
-            ) / total)
-
-        max_weight = (min_prob * self._tree.size) ** (-self.beta)
+        values = (np.arange(n) + np.random.uniform(size=n)) * segment
+        indices, priorities, data_idx = tree.get_batch(values)
+
+        # Yuvarlama ile bos yapraga dusen ornekler atlanir
+        valid = (data_idx < tree.size) & (priorities > 0)
+        if not valid.all():
+            indices = indices[valid]
+            priorities = priorities[valid]
+            data_idx = data_idx[valid]
+
+        min_prob = max(1e-6, tree.min_priority() / total)
+        max_weight = (min_prob * tree.size) ** (-self.beta)
         if max_weight <= 0:
             max_weight = 1.0
 
-        for i in range(n):
-            lo = segment * i
-            hi = segment * (i + 1)
-            s = np.random.uniform(lo, hi)
-
-            idx, priority, data = self._tree.get(s)
-            if data is None:
-                continue
-
-            prob = priority / total
-            weight = (prob * self._tree.size) ** (-self.beta)
-            weight = weight / max_weight
-
-            samples.append(PrioritizedExperience(
-                experience=data,
-                priority=priority,
-                weight=weight,
-            ))
-
-        return samples
+        probs = priorities / total
+        weights = (probs * tree.size) ** (-self.beta) / max_weight
+        data = tree.data
+        experiences = [data[i] for i in data_idx.tolist()]
+        return indices, priorities, weights, experiences
 
     def update_priorities(
         self,
-        indices: list[int],
-        priorities: list[float],
+        indices: list[int] | np.ndarray,
+        priorities: list[float] | np.ndarray,
     ) -> None:
         """Deneyim onceliklerini gunceller.
 
@@ -222,10 +329,14 @@ class ExperienceBuffer:
             indices: Agac indeksleri.
             priorities: Yeni oncelik degerleri.
         """
-        for idx, p in zip(indices, priorities):
-            p = max(abs(p) ** self.alpha, 1e-6)
-            self._tree.update(idx, p)
-            self._max_priority = max(self._max_priority, p)
+        p = np.maximum(
+            np.abs(np.asarray(priorities, dtype=np.float64)) ** self.alpha,
+            1e-6,
+        )
+        if p.size == 0:
+            return
+        self._tree.update_batch(np.asarray(indices), p)
+        self._max_priority = max(self._max_priority, float(p.max()))
 
     def __len__(self) -> int:
         """Tampondaki deneyim sayisi."""
@@ -1,10 +1,10 @@
 """ATLAS Q-Learning modulu.
 
 Q-tablosu, Double Q-Learning ve opsiyonel fonksiyon yaklasimi
-ile deger tabanli ogrenme.
+ile deger tabanli ogrenme. Q-tablolari durum/aksiyon
+kimlikleriyle indekslenen NumPy dizileridir.
 """
 
-import hashlib
 import json
 import logging
 from pathlib import Path
@@ -13,6 +13,7 @@ from typing import Any
 import numpy as np
 
 from app.core.learning.policy import EpsilonGreedyPolicy, Policy
+from app.core.learning.q_table import ActionIndex, QTable, StateIndex, state_key
 from app.models.learning import LearningConfig, LearningMetrics
 
 logger = logging.getLogger("atlas.learning.q_learning")
@@ -53,8 +54,10 @@ class QLearner:
         self.policy = policy or EpsilonGreedyPolicy()
 
         # Q-tablosu
-        self._q1: dict[str, dict[str, float]] = {}
-        self._q2: dict[str, dict[str, float]] = {}  # Double Q icin
+        self._states = StateIndex()
+        self._actions = ActionIndex()
+        self._q1 = QTable()
+        self._q2 = QTable()  # Double Q icin
 
         # Fonksiyon yaklasimi
         self._use_torch = self.config.use_torch and _try_import_torch()
@@ -87,12 +90,13 @@ class QLearner:
         if self._use_torch or self._weights is not None:
             return self._get_q_approx(state, action)
 
-        key = self._state_to_key(state)
+        sid = self._states.lookup(state)
+        aid = self._actions.lookup(action)
         if self.config.double_q:
-            q1 = self._q1.get(key, {}).get(action, 0.0)
-            q2 = self._q2.get(key, {}).get(action, 0.0)
+            q1 = self._q1.get(sid, aid)
+            q2 = self._q2.get(sid, aid)
             return (q1 + q2) / 2.0
-        return self._q1.get(key, {}).get(action, 0.0)
+        return self._q1.get(sid, aid)
 
     def update(
         self,
@@ -135,25 +139,20 @@ class QLearner:
         done: bool,
     ) -> float:
         """Tek Q-tablosu guncellemesi."""
-        key = self._state_to_key(state)
-        next_key = self._state_to_key(next_state)
+        sid = self._states.intern(state)
+        aid = self._actions.intern(action)
 
-        if key not in self._q1:
-            self._q1[key] = {}
-        if next_key not in self._q1:
-            self._q1[next_key] = {}
-
-        current_q = self._q1[key].get(action, 0.0)
+        current_q = self._q1.get(sid, aid)
 
         if done:
             target = reward
         else:
-            next_values = self._q1[next_key]
-            max_next = max(next_values.values()) if next_values else 0.0
+            best = self._q1.best(self._states.intern(next_state))
+            max_next = best[1] if best is not None else 0.0
             target = reward + self.config.gamma * max_next
 
         td_error = target - current_q
-        self._q1[key][action] = current_q + self.config.alpha * td_error
+        self._q1.set(sid, aid, current_q + self.config.alpha * td_error)
         return td_error
 
     def _update_double_q(
@@ -165,15 +164,8 @@ class QLearner:
         done: bool,
     ) -> float:
         """Double Q-Learning guncellemesi."""
-        key = self._state_to_key(state)
-        next_key = self._state_to_key(next_state)
-
-        # Tablolari baslat
-        for q in (self._q1, self._q2):
-            if key not in q:
-                q[key] = {}
-            if next_key not in q:
-                q[next_key] = {}
+        sid = self._states.intern(state)
+        aid = self._actions.intern(action)
 
         # Rastgele Q1 veya Q2 guncelle
         if self._rng.random() < 0.5:
@@ -181,22 +173,19 @@ class QLearner:
         else:
             update_q, eval_q = self._q2, self._q1
 
-        current_q = update_q[key].get(action, 0.0)
+        current_q = update_q.get(sid, aid)
 
         if done:
             target = reward
         else:
             # update_q'dan en iyi aksiyonu sec, eval_q'dan degerlend
-            next_actions = update_q[next_key]
-            if next_actions:
-                best_action = max(next_actions, key=next_actions.get)
-                max_next = eval_q[next_key].get(best_action, 0.0)
-            else:
-                max_next = 0.0
+            next_sid = self._states.intern(next_state)
+            best = update_q.best(next_sid)
+            max_next = eval_q.get(next_sid, best[0]) if best is not None else 0.0
             target = reward + self.config.gamma * max_next
 
         td_error = target - current_q
-        update_q[key][action] = current_q + self.config.alpha * td_error
+        update_q.set(sid, aid, current_q + self.config.alpha * td_error)
         return td_error
 
     def _get_q_approx(self, state: dict[str, Any], action: str) -> float:
@@ -268,13 +257,11 @@ class QLearner:
 
     def _get_known_actions(self, state: dict[str, Any]) -> list[str]:
         """Bilinen aksiyonlari dondurur."""
-        key = self._state_to_key(state)
-        actions = set()
-        if key in self._q1:
-            actions.update(self._q1[key].keys())
-        if self.config.double_q and key in self._q2:
-            actions.update(self._q2[key].keys())
-        return list(actions) if actions else ["default"]
+        sid = self._states.lookup(state)
+        aids = set(self._q1.known_actions(sid).tolist())
+        if self.config.double_q:
+            aids.update(self._q2.known_actions(sid).tolist())
+        return [self._actions.names[a] for a in sorted(aids)] or ["default"]
 
     def get_best_action(
         self,
@@ -293,8 +280,19 @@ class QLearner:
         if not available_actions:
             return ""
 
-        q_values = {a: self.get_q_value(state, a) for a in available_actions}
-        return max(q_values, key=q_values.get)
+        if self._use_torch or self._weights is not None:
+            q_values = {a: self.get_q_value(state, a) for a in available_actions}
+            return max(q_values, key=q_values.get)
+
+        sid = self._states.lookup(state)
+        aids = np.array([
+            -1 if (aid := self._actions.lookup(a)) is None else aid
+            for a in available_actions
+        ], dtype=np.int64)
+        values = self._q1.row(sid, aids)
+        if self.config.double_q:
+            values = (values + self._q2.row(sid, aids)) / 2.0
+        return available_actions[int(np.argmax(values))]
 
     def get_metrics(self) -> LearningMetrics:
         """Ogrenme metriklerini dondurur."""
@@ -302,9 +300,9 @@ class QLearner:
         avg = self._total_reward / n if n > 0 else 0.0
 
         # Q-tablosu boyutu
-        q_size = sum(len(v) for v in self._q1.values())
+        q_size = len(self._q1)
         if self.config.double_q:
-            q_size += sum(len(v) for v in self._q2.values())
+            q_size += len(self._q2)
 
         # Yakinsaklik orani (son 100 episode'un std'si)
         recent = self._reward_history[-100:] if self._reward_history else []
@@ -327,35 +325,119 @@ class QLearner:
     def save(self, path: str) -> None:
         """Q-tablosunu dosyaya kaydeder.
 
+        ``.npz`` uzantisinda diziler dogrudan yazilir;
+        diger uzantilarda eski JSON bicimi kullanilir.
+
         Args:
             path: Dosya yolu.
         """
-        data = {
-            "q1": self._q1,
-            "q2": self._q2 if self.config.double_q else {},
-            "config": self.config.model_dump(),
-            "metrics": {
-                "total_episodes": self._total_episodes,
-                "total_reward": self._total_reward,
-            },
-        }
-        Path(path).write_text(json.dumps(data, indent=2))
+        if Path(path).suffix == ".npz":
+            self._save_npz(path)
+        else:
+            data = {
+                "q1": self._table_to_dict(self._q1),
+                "q2": self._table_to_dict(self._q2) if self.config.double_q else {},
+                "config": self.config.model_dump(),
+                "metrics": {
+                    "total_episodes": self._total_episodes,
+                    "total_reward": self._total_reward,
+                },
+            }
+            Path(path).write_text(json.dumps(data, indent=2))
         logger.info("Q-tablosu kaydedildi: %s", path)
 
     def load(self, path: str) -> None:
         """Q-tablosunu dosyadan yukler.
 
         Args:
-            path: Dosya yolu.
+            path: Dosya yolu (``.npz`` veya JSON).
         """
-        data = json.loads(Path(path).read_text())
-        self._q1 = data.get("q1", {})
-        self._q2 = data.get("q2", {})
-        metrics = data.get("metrics", {})
-        self._total_episodes = metrics.get("total_episodes", 0)
-        self._total_reward = metrics.get("total_reward", 0.0)
+        self._states = StateIndex()
+        self._actions = ActionIndex()
+        if Path(path).suffix == ".npz":
+            self._load_npz(path)
+        else:
+            data = json.loads(Path(path).read_text())
+            self._q1 = self._table_from_dict(data.get("q1", {}))
+            self._q2 = self._table_from_dict(data.get("q2", {}))
+            metrics = data.get("metrics", {})
+            self._total_episodes = metrics.get("total_episodes", 0)
+            self._total_reward = metrics.get("total_reward", 0.0)
         logger.info("Q-tablosu yuklendi: %s", path)
 
+    def _save_npz(self, path: str) -> None:
+        """Tablolari ``.npz`` olarak yazar.
+
+        Args:
+            path: Dosya yolu.
+        """
+        shape = (len(self._states), len(self._actions))
+        q1, mask1 = self._q1.trimmed(*shape)
+        q2, mask2 = self._q2.trimmed(*shape) if self.config.double_q else (
+            np.zeros(shape), np.zeros(shape, dtype=bool),
+        )
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                q1=q1, mask1=mask1, q2=q2, mask2=mask2,
+                states=np.array(self._states.keys, dtype=str),
+                actions=np.array(self._actions.names, dtype=str),
+                config=np.array(json.dumps(self.config.model_dump())),
+                metrics=np.array([self._total_episodes, self._total_reward]),
+            )
+
+    def _load_npz(self, path: str) -> None:
+        """Tablolari ``.npz`` dosyasindan okur.
+
+        Args:
+            path: Dosya yolu.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            for key in data["states"].tolist():
+                self._states.intern_key(key)
+            for name in data["actions"].tolist():
+                self._actions.intern(name)
+            self._q1 = QTable.from_arrays(data["q1"], data["mask1"])
+            self._q2 = QTable.from_arrays(data["q2"], data["mask2"])
+            episodes, total = data["metrics"].tolist()
+        self._total_episodes = int(episodes)
+        self._total_reward = float(total)
+
+    def _table_to_dict(self, table: QTable) -> dict[str, dict[str, float]]:
+        """Tabloyu anahtar -> {aksiyon: deger} bicimine cevirir.
+
+        Args:
+            table: Q-tablosu.
+
+        Returns:
+            Sozluk bicimi.
+        """
+        out: dict[str, dict[str, float]] = {}
+        for sid, key in enumerate(self._states.keys):
+            aids = table.known_actions(sid)
+            if len(aids):
+                out[key] = {
+                    self._actions.names[a]: float(table.values[sid, a])
+                    for a in aids
+                }
+        return out
+
+    def _table_from_dict(self, data: dict[str, dict[str, float]]) -> QTable:
+        """Sozluk bicimindeki tabloyu diziye cevirir.
+
+        Args:
+            data: Anahtar -> {aksiyon: deger}.
+
+        Returns:
+            Q-tablosu.
+        """
+        table = QTable()
+        for key, values in data.items():
+            sid = self._states.intern_key(key)
+            for action, value in values.items():
+                table.set(sid, self._actions.intern(action), float(value))
+        return table
+
     @staticmethod
     def _state_to_key(state: dict[str, Any]) -> str:
         """Durumu hash anahtarina donusturur.
@@ -366,5 +448,4 @@ class QLearner:
         Returns:
             Deterministik hash anahtari.
         """
-        serialized = json.dumps(state, sort_keys=True, default=str)
-        return hashlib.md5(serialized.encode()).hexdigest()[:16]
+        return state_key(state)
@@ -0,0 +1,402 @@
+"""ATLAS Q-tablosu modulu.
+
+Durum interning (durum -> yogun tamsayi),
+aksiyon indeksi ve buyuyebilen NumPy 2-B
+Q-tablosu.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger("atlas.learning.q_table")
+
+_EMPTY = -1
+_DIRTY = -2
+
+
+def state_key(state: dict[str, Any]) -> str:
+    """Durumun kanonik hash anahtari.
+
+    Args:
+        state: Durum sozlugu.
+
+    Returns:
+        Deterministik hash anahtari.
+    """
+    serialized = json.dumps(state, sort_keys=True, default=str)
+    return hashlib.md5(serialized.encode()).hexdigest()[:16]
+
+
+def _freeze(value: Any) -> Hashable:
+    """Degeri hash'lenebilir kanonik bicime cevirir.
+
+    Skaler degerler tipiyle birlikte tutulur; ``True``,
+    ``1`` ve ``1.0`` Python'da esit olsa da kanonik
+    JSON anahtarlari farklidir.
+
+    Args:
+        value: Durum veya alt deger.
+
+    Returns:
+        Hash'lenebilir deger.
+
+    Raises:
+        TypeError: Desteklenmeyen hash'lenemez tip.
+    """
+    if isinstance(value, dict):
+        try:
+            flat = tuple(sorted(
+                (k, v.__class__, v) for k, v in value.items()
+            ))
+            hash(flat)
+            return flat
+        except TypeError:
+            return tuple(sorted(
+                (k, _freeze(v)) for k, v in value.items()
+            ))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    hash(value)
+    return (value.__class__, value)
+
+
+class StateIndex:
+    """Durum interning katmani.
+
+    Kanonik kimlik JSON+MD5 anahtaridir; bu
+    pahali anahtar her durum icin bir kez
+    hesaplanir ve durumun dondurulmus tuple
+    bicimi uzerinden onbellege alinir.
+
+    Attributes:
+        keys: Kimlik -> kanonik anahtar.
+    """
+
+    def __init__(self) -> None:
+        """Bos indeks olusturur."""
+        self.keys: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._cache: dict[Hashable, int] = {}
+
+    def lookup(self, state: dict[str, Any]) -> int | None:
+        """Durum kimligini getirir (eklemez).
+
+        Args:
+            state: Durum.
+
+        Returns:
+            Kimlik veya None.
+        """
+        try:
+            frozen = _freeze(state)
+        except TypeError:
+            return self._ids.get(state_key(state))
+        sid = self._cache.get(frozen)
+        if sid is None:
+            sid = self._ids.get(state_key(state))
+            if sid is not None:
+                self._cache[frozen] = sid
+        return sid
+
+    def intern(self, state: dict[str, Any]) -> int:
+        """Durum kimligini getirir, yoksa atar.
+
+        Args:
+            state: Durum.
+
+        Returns:
+            Kimlik.
+        """
+        try:
+            frozen: Hashable | None = _freeze(state)
+        except TypeError:
+            frozen = None
+        else:
+            sid = self._cache.get(frozen)
+            if sid is not None:
+                return sid
+
+        sid = self.intern_key(state_key(state))
+        if frozen is not None:
+            self._cache[frozen] = sid
+        return sid
+
+    def intern_key(self, key: str) -> int:
+        """Kanonik anahtarin kimligini getirir, yoksa atar.
+
+        Args:
+            key: Kanonik anahtar.
+
+        Returns:
+            Kimlik.
+        """
+        sid = self._ids.get(key)
+        if sid is None:
+            sid = len(self.keys)
+            self._ids[key] = sid
+            self.keys.append(key)
+        return sid
+
+    def id_of_key(self, key: str) -> int | None:
+        """Kanonik anahtarin kimligi.
+
+        Args:
+            key: Kanonik anahtar.
+
+        Returns:
+            Kimlik veya None.
+        """
+        return self._ids.get(key)
+
+    def __len__(self) -> int:
+        """Durum sayisi."""
+        return len(self.keys)
+
+
+class ActionIndex:
+    """Aksiyon -> sutun indeksi.
+
+    Attributes:
+        names: Sutun -> aksiyon adi.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """Indeksi olusturur.
+
+        Args:
+            names: Baslangic aksiyonlari.
+        """
+        self.names: list[str] = []
+        self._ids: dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    def lookup(self, action: str) -> int | None:
+        """Aksiyon sutunu (eklemez)."""
+        return self._ids.get(action)
+
+    def intern(self, action: str) -> int:
+        """Aksiyon sutununu getirir, yoksa atar.
+
+        Args:
+            action: Aksiyon adi.
+
+        Returns:
+            Sutun.
+        """
+        aid = self._ids.get(action)
+        if aid is None:
+            aid = len(self.names)
+            self._ids[action] = aid
+            self.names.append(action)
+        return aid
+
+    def __len__(self) -> int:
+        """Aksiyon sayisi."""
+        return len(self.names)
+
+
+class QTable:
+    """Buyuyebilen 2-B Q-tablosu.
+
+    Satirlar durum, sutunlar aksiyon kimlikleridir.
+    Hic yazilmamis hucreler 0.0'dir ve ``mask``
+    ile ayirt edilir; satir maksimumu yalnizca
+    yazilmis hucreler uzerinden alinir ve satir
+    basina artimli olarak onbellekte tutulur.
+
+    Attributes:
+        values: Q-degerleri (kapasite boyutunda).
+        mask: Hucre yazildi mi.
+    """
+
+    def __init__(
+        self,
+        states: int = 64,
+        actions: int = 8,
+    ) -> None:
+        """Bos tablo olusturur.
+
+        Args:
+            states: Baslangic satir kapasitesi.
+            actions: Baslangic sutun kapasitesi.
+        """
+        self.values = np.zeros((max(1, states), max(1, actions)))
+        self.mask = np.zeros(self.values.shape, dtype=bool)
+        self._count = 0
+        # Satir argmax onbellegi: -1 bos, -2 yeniden hesapla
+        self._best = np.full(self.values.shape[0], _EMPTY, dtype=np.int64)
+
+    def _ensure(self, sid: int, aid: int) -> None:
+        """Kapasiteyi gerekirse ikiye katlar.
+
+        Args:
+            sid: Durum kimligi.
+            aid: Aksiyon sutunu.
+        """
+        rows, cols = self.values.shape
+        if sid < rows and aid < cols:
+            return
+        while rows <= sid:
+            rows *= 2
+        while cols <= aid:
+            cols *= 2
+        values = np.zeros((rows, cols))
+        mask = np.zeros((rows, cols), dtype=bool)
+        old_rows, old_cols = self.values.shape
+        values[:old_rows, :old_cols] = self.values
+        mask[:old_rows, :old_cols] = self.mask
+        self.values = values
+        self.mask = mask
+        best = np.full(rows, _EMPTY, dtype=np.int64)
+        best[:old_rows] = self._best
+        self._best = best
+
+    def get(self, sid: int | None, aid: int | None) -> float:
+        """Q-degeri (bilinmiyorsa 0.0).
+
+        Args:
+            sid: Durum kimligi.
+            aid: Aksiyon sutunu.
+
+        Returns:
+            Deger.
+        """
+        if sid is None or aid is None:
+            return 0.0
+        rows, cols = self.values.shape
+        if sid >= rows or aid >= cols:
+            return 0.0
+        return float(self.values[sid, aid])
+
+    def set(self, sid: int, aid: int, value: float) -> None:
+        """Q-degeri yazar.
+
+        Args:
+            sid: Durum kimligi.
+            aid: Aksiyon sutunu.
+            value: Deger.
+        """
+        self._ensure(sid, aid)
+        if not self.mask[sid, aid]:
+            self.mask[sid, aid] = True
+            self._count += 1
+
+        best = int(self._best[sid])
+        if best == _EMPTY:
+            self._best[sid] = aid
+        elif best >= 0:
+            current = self.values[sid, best]
+            if aid == best:
+                if value < current:
+                    self._best[sid] = _DIRTY
+            elif value > current or (value == current and aid < best):
+                self._best[sid] = aid
+        self.values[sid, aid] = value
+
+    def row(self, sid: int | None, aids: np.ndarray) -> np.ndarray:
+        """Satirdaki secili sutunlarin degerleri.
+
+        Args:
+            sid: Durum kimligi.
+            aids: Sutunlar (bilinmeyen aksiyonlar -1).
+
+        Returns:
+            Degerler (bilinmeyenler 0.0).
+        """
+        out = np.zeros(len(aids))
+        rows, cols = self.values.shape
+        if sid is None or sid >= rows:
+            return out
+        valid = (aids >= 0) & (aids < cols)
+        out[valid] = self.values[sid, aids[valid]]
+        return out
+
+    def best(self, sid: int | None) -> tuple[int, float] | None:
+        """Satirdaki yazilmis hucrelerin argmax'i.
+
+        Args:
+            sid: Durum kimligi.
+
+        Returns:
+            (sutun, deger) veya satir bossa None.
+        """
+        if sid is None or sid >= self.values.shape[0]:
+            return None
+        aid = int(self._best[sid])
+        if aid == _EMPTY:
+            return None
+        if aid == _DIRTY:
+            known = self.mask[sid]
+            aid = int(np.argmax(np.where(known, self.values[sid], -np.inf)))
+            self._best[sid] = aid
+        return aid, float(self.values[sid, aid])
+
+    def known_actions(self, sid: int | None) -> np.ndarray:
+        """Satirda yazilmis sutunlar.
+
+        Args:
+            sid: Durum kimligi.
+
+        Returns:
+            Sutun dizisi.
+        """
+        if sid is None or sid >= self.values.shape[0]:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(self.mask[sid])
+
+    def trimmed(
+        self,
+        states: int,
+        actions: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Kullanilan bolgenin kopyasi.
+
+        Args:
+            states: Satir sayisi.
+            actions: Sutun sayisi.
+
+        Returns:
+            (degerler, maske).
+        """
+        out_v = np.zeros((states, actions))
+        out_m = np.zeros((states, actions), dtype=bool)
+        rows = min(states, self.values.shape[0])
+        cols = min(actions, self.values.shape[1])
+        out_v[:rows, :cols] = self.values[:rows, :cols]
+        out_m[:rows, :cols] = self.mask[:rows, :cols]
+        return out_v, out_m
+
+    @classmethod
+    def from_arrays(
+        cls,
+        values: np.ndarray,
+        mask: np.ndarray,
+    ) -> "QTable":
+        """Dizilerden tablo olusturur.
+
+        Args:
+            values: Degerler.
+            mask: Maske.
+
+        Returns:
+            Tablo.
+        """
+        table = cls(*values.shape)
+        rows, cols = values.shape
+        table.values[:rows, :cols] = values
+        table.mask[:rows, :cols] = mask
+        table._count = int(mask.sum())
+        table._best[:rows][mask.any(axis=1)] = _DIRTY
+        return table
+
+    def __len__(self) -> int:
+        """Yazilmis hucre sayisi."""
+        return self._count
@@ -9,6 +9,7 @@ __all__ = [
     "CostPerTokenTracker",
     "FallbackRouter",
     "LLMRouterOrchestrator",
+    "LLMResponseCache",
     "LatencyOptimizer",
     "ModelPerformanceComparator",
     "ModelRegistry",
@@ -7,10 +7,14 @@ istekler, zaman asimi yonetimi.
 """
 
 import logging
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
+from app.core.llmrouter.response_cache import (
+    TTLLRUCache,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,7 +23,8 @@ class LatencyOptimizer:
 
     Attributes:
         _latency_records: Gecikme kayitlari.
-        _cache_entries: Onbellek girdileri.
+        _cache_entries: Onbellek girdileri
+            (boyut ve TTL sinirli LRU).
         _timeout_config: Zaman asimi ayarlari.
         _stats: Istatistikler.
     """
@@ -35,12 +40,14 @@ class LatencyOptimizer:
         self,
         default_timeout_ms: int = 30000,
         cache_ttl_seconds: int = 3600,
+        max_cache_entries: int = 1024,
     ) -> None:
         """Optimizasyonu baslatir.
 
         Args:
             default_timeout_ms: Varsayilan timeout.
             cache_ttl_seconds: Onbellek suresi.
+            max_cache_entries: Azami onbellek girdisi.
         """
         self._default_timeout = (
             default_timeout_ms
@@ -52,9 +59,10 @@ class LatencyOptimizer:
         self._model_latencies: dict[
             str, list[float]
         ] = {}
-        self._cache_entries: dict[
-            str, dict
-        ] = {}
+        self._cache_entries: TTLLRUCache[str] = TTLLRUCache(
+            max_entries=max_cache_entries,
+            ttl_seconds=cache_ttl_seconds,
+        )
         self._timeout_config: dict[
             str, int
         ] = {}
@@ -124,7 +132,7 @@ class LatencyOptimizer:
                 "task_id": task_id,
                 "recorded_at": (
                     datetime.now(
-                        timezone.utc
+                        UTC
                     ).isoformat()
                 ),
             }
@@ -296,20 +304,21 @@ class LatencyOptimizer:
                     ),
                 }
 
-            self._cache_entries[
-                cache_key
-            ] = {
-                "cache_key": cache_key,
-                "response": response,
-                "model_id": model_id,
-                "strategy": strategy,
-                "created_at": (
-                    datetime.now(
-                        timezone.utc
-                    ).isoformat()
-                ),
-                "hit_count": 0,
-            }
+            self._cache_entries.set(
+                cache_key,
+                {
+                    "cache_key": cache_key,
+                    "response": response,
+                    "model_id": model_id,
+                    "strategy": strategy,
+                    "created_at": (
+                        datetime.now(
+                            UTC
+                        ).isoformat()
+                    ),
+                    "hit_count": 0,
+                },
+            )
 
             return {
                 "cache_key": cache_key,
@@ -568,6 +577,9 @@ class LatencyOptimizer:
                 "cache_entries": len(
                     self._cache_entries
                 ),
+                "cache_evictions": (
+                    self._cache_entries.evictions
+                ),
                 "cache_hit_rate": (
                     self.cache_hit_rate
                 ),
@@ -0,0 +1,445 @@
+"""
+LLM yanit onbellegi modulu.
+
+Kanonik istek ozeti, boyut ve TTL sinirli
+LRU depolama ve opsiyonel embedding
+benzerligi ile yakin-kopya arama.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterator, Sequence
+from typing import Any, Generic, TypeVar, cast
+
+import numpy as np
+
+from app.models.unifiedllm_models import (
+    FinishReason,
+    LLMRequest,
+    LLMResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[str], Sequence[float] | Awaitable[Sequence[float]]]
+
+# Onbellege alinabilir bitis nedenleri
+_CACHEABLE = frozenset({
+    FinishReason.STOP,
+    FinishReason.LENGTH,
+    FinishReason.TOOL_USE,
+})
+
+_MISSING = object()
+
+K = TypeVar("K", bound=Hashable)
+
+
+class TTLLRUCache(Generic[K]):
+    """Boyut ve TTL sinirli LRU sozluk.
+
+    Kapasite asildiginda en uzun suredir
+    kullanilmayan girdi atilir; suresi dolan
+    girdiler okunurken silinir.
+
+    Attributes:
+        max_entries: Azami girdi sayisi.
+        ttl_seconds: Girdi omru (0 ise sinirsiz).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Onbellegi olusturur.
+
+        Args:
+            max_entries: Azami girdi sayisi.
+            ttl_seconds: Girdi omru (saniye).
+            clock: Zaman kaynagi.
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: OrderedDict[
+            K, tuple[float, Any]
+        ] = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+        self.on_evict: Callable[[K], None] | None = None
+
+    def get(
+        self, key: K, default: Any = None,
+    ) -> Any:
+        """Girdiyi getirir ve en yeni yapar.
+
+        Args:
+            key: Anahtar.
+            default: Bulunamazsa donen deger.
+
+        Returns:
+            Deger veya default.
+        """
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires, value = item
+        if expires and expires <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: Any) -> None:
+        """Girdi ekler, gerekirse en eskisini atar.
+
+        Args:
+            key: Anahtar.
+            value: Deger.
+        """
+        expires = (
+            self._clock() + self.ttl_seconds
+            if self.ttl_seconds > 0 else 0.0
+        )
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def drop_expired(self, key: K) -> bool:
+        """Suresi dolmus girdiyi siler; LRU sirasi degismez.
+
+        Args:
+            key: Anahtar.
+
+        Returns:
+            Girdi silindi mi.
+        """
+        item = self._data.get(key)
+        if item is None or not item[0] or item[0] > self._clock():
+            return False
+        self._remove(key)
+        self.expirations += 1
+        return True
+
+    def _remove(self, key: K) -> None:
+        """Girdiyi siler ve dinleyiciyi bilgilendirir."""
+        del self._data[key]
+        if self.on_evict is not None:
+            self.on_evict(key)
+
+    def clear(self) -> None:
+        """Tum girdileri siler."""
+        for key in list(self._data):
+            self._remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Suresi dolmamis girdi var mi."""
+        if key not in self._data:
+            return False
+        return self.get(cast(K, key), _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[K]:
+        """Anahtarlar (eskiden yeniye)."""
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        """Girdi sayisi."""
+        return len(self._data)
+
+
+def canonical_request(
+    request: LLMRequest,
+    include_last_message: bool = True,
+) -> dict[str, Any]:
+    """Istegin yaniti etkileyen alanlarinin kanonik bicimi.
+
+    request_id, metadata ve stream gibi yaniti
+    etkilemeyen alanlar disarida birakilir; metinler
+    bas/son bosluklardan arindirilir.
+
+    Args:
+        request: LLM istegi.
+        include_last_message: Son mesaj dahil mi.
+
+    Returns:
+        JSON'a yazilabilir sozluk.
+    """
+    messages = request.messages
+    if not include_last_message:
+        messages = messages[:-1]
+    return {
+        "provider": request.provider.value,
+        "model": request.model,
+        "system": request.system_prompt.strip(),
+        "messages": [
+            {
+                "role": m.role.value,
+                "content": m.content.strip(),
+                "name": m.name,
+                "tool_call_id": m.tool_call_id,
+                "tool_calls": m.tool_calls,
+                "images": m.images,
+            }
+            for m in messages
+        ],
+        "tools": [t.model_dump() for t in request.tools],
+        "temperature": round(request.temperature, 4),
+        "top_p": round(request.top_p, 4),
+        "max_tokens": request.max_tokens,
+        "stop": list(request.stop_sequences),
+        "thinking": request.thinking_mode,
+        "context_1m": request.context_1m,
+    }
+
+
+def request_digest(payload: dict[str, Any]) -> str:
+    """Kanonik sozlugun SHA-256 ozeti.
+
+    Args:
+        payload: Kanonik sozluk.
+
+    Returns:
+        Hex ozet.
+    """
+    raw = json.dumps(
+        payload, sort_keys=True,
+        separators=(",", ":"), default=str,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """LLM yanit onbellegi.
+
+    Once kanonik istek ozetiyle birebir arar.
+    ``embed_fn`` verilirse, ayni kapsamdaki (son mesaj
+    haric tum alanlar ayni) girdilerin son mesaj
+    embedding'leri arasinda kosinus benzerligi
+    ``similarity_threshold`` ustunde olan en yakin
+    girdi de isabet sayilir.
+
+    Attributes:
+        similarity_threshold: Yakin-kopya esigi.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        embed_fn: EmbedFn | None = None,
+        similarity_threshold: float = 0.95,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Onbellegi olusturur.
+
+        Args:
+            max_entries: Azami girdi sayisi.
+            ttl_seconds: Girdi omru (saniye).
+            embed_fn: Metin -> vektor (sync veya async, opsiyonel).
+            similarity_threshold: Yakin-kopya esigi (kosinus).
+            clock: Zaman kaynagi.
+        """
+        self._store: TTLLRUCache[str] = TTLLRUCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            clock=clock,
+        )
+        self._store.on_evict = self._forget
+        self._embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        # kapsam -> {anahtar: birim vektor}
+        self._vectors: dict[str, dict[str, np.ndarray]] = {}
+        self._scope_of: dict[str, str] = {}
+        self._stats: dict[str, float] = {
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "saved_tokens": 0,
+            "saved_cost_usd": 0.0,
+        }
+
+    @property
+    def hit_rate(self) -> float:
+        """Onbellek isabet orani."""
+        hits = (
+            self._stats["exact_hits"]
+            + self._stats["semantic_hits"]
+        )
+        total = hits + self._stats["misses"]
+        if total == 0:
+            return 0.0
+        return round(hits / total, 4)
+
+    async def lookup(
+        self, request: LLMRequest,
+    ) -> LLMResponse | None:
+        """Istege uygun onbellek yanitini arar.
+
+        Args:
+            request: LLM istegi.
+
+        Returns:
+            Yanit kopyasi veya None.
+        """
+        key = request_digest(canonical_request(request))
+        response: LLMResponse | None = self._store.get(key)
+        kind = "exact"
+
+        if response is None and self._embed_fn and request.messages:
+            response = await self._lookup_similar(request)
+            kind = "semantic"
+
+        if response is None:
+            self._stats["misses"] += 1
+            return None
+
+        self._stats[f"{kind}_hits"] += 1
+        self._stats["saved_tokens"] += response.usage.total_tokens
+        self._stats["saved_cost_usd"] += response.usage.cost_usd
+        return response.model_copy(
+            deep=True,
+            update={
+                "latency_ms": 0.0,
+                "raw_response": {
+                    **response.raw_response,
+                    "cache_hit": kind,
+                },
+            },
+        )
+
+    async def store(
+        self,
+        request: LLMRequest,
+        response: LLMResponse,
+    ) -> bool:
+        """Basarili yaniti onbellege yazar.
+
+        Args:
+            request: LLM istegi.
+            response: LLM yaniti.
+
+        Returns:
+            Yazildi mi.
+        """
+        if response.finish_reason not in _CACHEABLE:
+            return False
+
+        key = request_digest(canonical_request(request))
+        self._store.set(key, response.model_copy(deep=True))
+        self._stats["stores"] += 1
+
+        if self._embed_fn and request.messages and key in self._store:
+            vector = await self._embed(request.messages[-1].content)
+            if vector is not None:
+                scope = request_digest(
+                    canonical_request(request, include_last_message=False),
+                )
+                self._vectors.setdefault(scope, {})[key] = vector
+                self._scope_of[key] = scope
+        return True
+
+    async def _lookup_similar(
+        self, request: LLMRequest,
+    ) -> LLMResponse | None:
+        """Ayni kapsamdaki en benzer girdiyi arar.
+
+        Args:
+            request: LLM istegi.
+
+        Returns:
+            Yanit veya None.
+        """
+        scope = request_digest(
+            canonical_request(request, include_last_message=False),
+        )
+        candidates = self._vectors.get(scope)
+        if not candidates:
+            return None
+        # Suresi dolanlar siralamaya girmez (_forget ile duser)
+        for key in list(candidates):
+            self._store.drop_expired(key)
+        candidates = self._vectors.get(scope)
+        if not candidates:
+            return None
+        vector = await self._embed(request.messages[-1].content)
+        if vector is None:
+            return None
+
+        keys = list(candidates)
+        scores = np.stack([candidates[k] for k in keys]) @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity_threshold:
+            return None
+        response: LLMResponse | None = self._store.get(keys[best])
+        return response
+
+    async def _embed(self, text: str) -> np.ndarray | None:
+        """Metni birim vektore cevirir.
+
+        Args:
+            text: Metin.
+
+        Returns:
+            Birim vektor veya None (hata).
+        """
+        assert self._embed_fn is not None
+        try:
+            result = self._embed_fn(text.strip())
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as exc:
+            logger.warning("Onbellek embedding hatasi: %s", exc)
+            return None
+        vector = np.asarray(result, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def _forget(self, key: str) -> None:
+        """Atilan girdinin vektorunu siler."""
+        scope = self._scope_of.pop(key, None)
+        if scope is None:
+            return
+        vectors = self._vectors.get(scope)
+        if vectors is not None:
+            vectors.pop(key, None)
+            if not vectors:
+                del self._vectors[scope]
+
+    def clear(self) -> None:
+        """Onbellegi temizler."""
+        self._store.clear()
+
+    def __len__(self) -> int:
+        """Girdi sayisi."""
+        return len(self._store)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Onbellek istatistikleri.
+
+        Returns:
+            Isabet, iskalama, tahliye, kazanilan
+            token/maliyet ve isabet orani.
+        """
+        return {
+            **self._stats,
+            "saved_cost_usd": round(
+                self._stats["saved_cost_usd"], 6,
+            ),
+            "entries": len(self._store),
+            "evictions": self._store.evictions,
+            "expirations": self._store.expirations,
+            "hit_rate": self.hit_rate,
+        }
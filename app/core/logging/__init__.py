@@ -23,6 +23,9 @@ from app.core.logging.log_exporter import (
 from app.core.logging.log_formatter import (
     LogFormatter,
 )
+from app.core.logging.log_index import (
+    LogIndex,
+)
 from app.core.logging.log_manager import (
     LogManager,
 )
@@ -40,6 +43,7 @@ __all__ = [
     "LogAnalyzer",
     "LogExporter",
     "LogFormatter",
+    "LogIndex",
     "LogManager",
     "LogSearcher",
     "LoggingOrchestrator",
@@ -0,0 +1,589 @@
+"""ATLAS Log Indeksi modulu.
+
+Trigram postings ile alt dizgi arama,
+seviye/kaynak bitmapleri, zaman sirali
+dizi uzerinde bisect araligi ve diske
+tasinabilen segmentler.
+"""
+
+import bisect
+import contextlib
+import json
+import logging
+import os
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Her bayt degeri icin set edilmis bit konumlari
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if value >> bit & 1)
+    for value in range(256)
+)
+
+
+def _bitmap(ids: Sequence[int]) -> int:
+    """Kimliklerden bitmap olusturur.
+
+    Args:
+        ids: Yerel kayit kimlikleri.
+
+    Returns:
+        Bitmap (Python int).
+    """
+    if not ids:
+        return 0
+    buf = bytearray((max(ids) >> 3) + 1)
+    for idx in ids:
+        buf[idx >> 3] |= 1 << (idx & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _iter_bits(bitmap: int) -> Iterator[int]:
+    """Bitmapteki set bitleri artan sirada dolasir.
+
+    Args:
+        bitmap: Bitmap.
+
+    Yields:
+        Bit konumlari.
+    """
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for pos, value in enumerate(data):
+        if value:
+            base = pos << 3
+            for bit in _BYTE_BITS[value]:
+                yield base + bit
+
+
+def _trigrams(text: str) -> set[str]:
+    """Metnin trigram kumesi.
+
+    Args:
+        text: Kucuk harfli metin.
+
+    Returns:
+        Trigramlar.
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _level_of(record: dict[str, Any]) -> str:
+    """Kaydin normalize seviyesi."""
+    return (record.get("level") or "").lower()
+
+
+def _timestamp_of(record: dict[str, Any]) -> float:
+    """Kaydin zaman damgasi."""
+    return record.get("timestamp") or 0
+
+
+class LogSegment:
+    """Tek log segmenti.
+
+    Kayitlar eklendikce seviye/kaynak postings
+    listeleri ve zaman sirali dizi guncellenir.
+    Trigram postings yazma yolunu yavaslatmamak
+    icin ilk metin sorgusunda toplu olarak
+    tamamlanir. Sorgu filtreleri bitmaplere
+    cevrilip AND ile kesistirilir.
+
+    Attributes:
+        records: Segment kayitlari.
+        levels: Segmentteki seviyeler.
+        sources: Segmentteki kaynaklar.
+    """
+
+    def __init__(self) -> None:
+        """Bos segment olusturur."""
+        self.records: list[dict[str, Any]] = []
+        self.levels: set[str] = set()
+        self.sources: set[str] = set()
+        self.min_ts = float("inf")
+        self.max_ts = float("-inf")
+        self._grams: dict[str, array] = {}
+        self._fields: dict[tuple[str, str], array] = {}
+        self._field_bits: dict[
+            tuple[str, str], tuple[int, int]
+        ] = {}
+        self._times: list[float] = []
+        self._time_ids: list[int] = []
+        self._text_indexed = 0
+        self._ordered = True
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Kayit ekler ve indeksler.
+
+        Args:
+            record: Log kaydi.
+        """
+        idx = len(self.records)
+        self.records.append(record)
+
+        level = _level_of(record)
+        source = record.get("source", "") or ""
+        self.levels.add(level)
+        self.sources.add(source)
+        for key in (("level", level), ("source", source)):
+            postings = self._fields.get(key)
+            if postings is None:
+                postings = self._fields[key] = array("I")
+            postings.append(idx)
+
+        ts = _timestamp_of(record)
+        if not self._times or ts >= self._times[-1]:
+            self._times.append(ts)
+            self._time_ids.append(idx)
+        else:
+            pos = bisect.bisect_right(self._times, ts)
+            self._times.insert(pos, ts)
+            self._time_ids.insert(pos, idx)
+            self._ordered = False
+        self.min_ts = min(self.min_ts, ts)
+        self.max_ts = max(self.max_ts, ts)
+
+    def _index_text(self) -> None:
+        """Bekleyen kayitlarin trigramlarini indeksler."""
+        grams = self._grams
+        records = self.records
+        for idx in range(self._text_indexed, len(records)):
+            message = records[idx].get("message", "") or ""
+            for gram in _trigrams(message.lower()):
+                postings = grams.get(gram)
+                if postings is None:
+                    postings = grams[gram] = array("I")
+                postings.append(idx)
+        self._text_indexed = len(records)
+
+    def _field_bitmap(self, key: tuple[str, str]) -> int:
+        """Alan degerinin bitmapini getirir.
+
+        Bitmap onbellekte tutulur; segment
+        buyudukce yalnizca yeni kimlikler eklenir.
+
+        Args:
+            key: (alan, deger).
+
+        Returns:
+            Bitmap.
+        """
+        postings = self._fields.get(key)
+        if postings is None:
+            return 0
+        seen, bitmap = self._field_bits.get(key, (0, 0))
+        if seen < len(postings):
+            bitmap |= _bitmap(postings[seen:])
+            self._field_bits[key] = (len(postings), bitmap)
+        return bitmap
+
+    def may_match(
+        self,
+        level: str = "",
+        source: str = "",
+        start: float | None = None,
+        end: float | None = None,
+    ) -> bool:
+        """Ozet bilgiye gore eslesme olasi mi.
+
+        Args:
+            level: Seviye filtresi.
+            source: Kaynak filtresi.
+            start: Baslangic zamani.
+            end: Bitis zamani.
+
+        Returns:
+            Eslesme olasiysa True.
+        """
+        if not self.records:
+            return False
+        if level and level.lower() not in self.levels:
+            return False
+        if source and source not in self.sources:
+            return False
+        if start is not None and self.max_ts < start:
+            return False
+        return end is None or self.min_ts <= end
+
+    def query(
+        self,
+        text: str = "",
+        case_sensitive: bool = False,
+        level: str = "",
+        source: str = "",
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Filtreleri kesistirerek arar.
+
+        Args:
+            text: Alt dizgi sorgusu.
+            case_sensitive: Buyuk/kucuk harf duyarli.
+            level: Seviye filtresi.
+            source: Kaynak filtresi.
+            start: Baslangic zamani.
+            end: Bitis zamani.
+
+        Returns:
+            Eslesen kayitlar (ekleme sirasinda).
+        """
+        if not self.may_match(level, source, start, end):
+            return []
+        masks: list[int] = []
+
+        if level:
+            masks.append(self._field_bitmap(("level", level.lower())))
+        if source:
+            masks.append(self._field_bitmap(("source", source)))
+
+        if start is not None or end is not None:
+            lo = (
+                bisect.bisect_left(self._times, start)
+                if start is not None else 0
+            )
+            hi = (
+                bisect.bisect_right(self._times, end)
+                if end is not None else len(self._times)
+            )
+            if hi <= lo:
+                return []
+            if lo > 0 or hi < len(self._times):
+                if self._ordered:
+                    # Sirali segmentte aralik ardisik kimliklerdir
+                    masks.append(((1 << (hi - lo)) - 1) << lo)
+                else:
+                    masks.append(_bitmap(self._time_ids[lo:hi]))
+
+        combined: int | None = None
+        if masks:
+            combined = masks[0]
+            for mask in masks[1:]:
+                combined &= mask
+            if not combined:
+                return []
+
+        lowered = text.lower()
+        candidates: Iterable[int]
+        if len(lowered) >= 3:
+            self._index_text()
+            postings = []
+            for gram in _trigrams(lowered):
+                found = self._grams.get(gram)
+                if found is None:
+                    return []
+                postings.append(found)
+            postings.sort(key=len)
+            # En seyrek liste dolasilir; ikinci en seyrek liste
+            # bit testiyle uygulanir, kalan adaylar zaten dogrulanir
+            if len(postings) > 1:
+                extra = _bitmap(postings[1])
+                combined = (
+                    extra if combined is None else combined & extra
+                )
+            if combined is None:
+                candidates = postings[0]
+            else:
+                bits = combined.to_bytes(
+                    (combined.bit_length() + 7) // 8, "little",
+                )
+                limit = len(bits) << 3
+                candidates = [
+                    i for i in postings[0]
+                    if i < limit and bits[i >> 3] >> (i & 7) & 1
+                ]
+        elif combined is not None:
+            candidates = _iter_bits(combined)
+        else:
+            candidates = range(len(self.records))
+
+        records = self.records
+        if not text:
+            return [records[i] for i in candidates]
+        if case_sensitive:
+            return [
+                records[i] for i in candidates
+                if text in (records[i].get("message", "") or "")
+            ]
+        return [
+            records[i] for i in candidates
+            if lowered in (records[i].get("message", "") or "").lower()
+        ]
+
+    def __len__(self) -> int:
+        """Kayit sayisi."""
+        return len(self.records)
+
+
+class _SpilledSegment:
+    """Diske tasinmis segment ozeti."""
+
+    __slots__ = (
+        "path",
+        "count",
+        "levels",
+        "sources",
+        "min_ts",
+        "max_ts",
+    )
+
+    def __init__(self, path: str, segment: LogSegment) -> None:
+        """Ozeti olusturur.
+
+        Args:
+            path: JSONL dosya yolu.
+            segment: Tasinan segment.
+        """
+        self.path = path
+        self.count = len(segment)
+        self.levels = segment.levels
+        self.sources = segment.sources
+        self.min_ts = segment.min_ts
+        self.max_ts = segment.max_ts
+
+    def may_match(
+        self,
+        level: str = "",
+        source: str = "",
+        start: float | None = None,
+        end: float | None = None,
+    ) -> bool:
+        """Ozet bilgiye gore eslesme olasi mi."""
+        if level and level.lower() not in self.levels:
+            return False
+        if source and source not in self.sources:
+            return False
+        if start is not None and self.max_ts < start:
+            return False
+        return end is None or self.min_ts <= end
+
+    def load(self) -> LogSegment:
+        """Segmenti diskten yukleyip yeniden indeksler.
+
+        Returns:
+            Segment.
+        """
+        segment = LogSegment()
+        with open(self.path, encoding="utf-8") as fh:
+            for line in fh:
+                segment.append(json.loads(line))
+        return segment
+
+    def __len__(self) -> int:
+        """Kayit sayisi."""
+        return self.count
+
+
+class LogIndex:
+    """Segmentli log indeksi.
+
+    Kayitlar aktif segmente eklenir;
+    ``segment_size`` dolunca segment muhurlenir
+    ve yenisi acilir. Bellekte en fazla
+    ``max_segments`` muhurlu segment tutulur;
+    fazlasi ``spill_dir`` verilmisse JSONL olarak
+    diske tasinir, verilmemisse en eskisi atilir
+    (bellekte en fazla ``segment_size *
+    (max_segments + 1)`` kayit kalir; atilan kayitlar
+    uyari olarak loglanir ve ``dropped_records``
+    ile raporlanir).
+    Diskteki segmentler yalnizca ozetleri
+    (zaman araligi, seviye/kaynak kumeleri)
+    sorguyla eslesebiliyorsa yuklenir.
+
+    Attributes:
+        _segments: Muhurlu segmentler (eski -> yeni).
+        _active: Aktif segment.
+    """
+
+    def __init__(
+        self,
+        segment_size: int = 65536,
+        max_segments: int = 16,
+        spill_dir: str | None = None,
+    ) -> None:
+        """Log indeksini baslatir.
+
+        Args:
+            segment_size: Segment basina kayit.
+            max_segments: Bellekteki maks muhurlu segment.
+            spill_dir: Tasima dizini (None: eskiyi at).
+        """
+        self._segment_size = max(1, segment_size)
+        self._max_segments = max(0, max_segments)
+        self._spill_dir = spill_dir
+        self._segments: list[
+            LogSegment | _SpilledSegment
+        ] = []
+        self._active = LogSegment()
+        self._sequence = 0
+        self._dropped = 0
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Kayit ekler.
+
+        Args:
+            record: Log kaydi.
+        """
+        if len(self._active) >= self._segment_size:
+            self._roll()
+        self._active.append(record)
+
+    def add_many(
+        self,
+        records: Iterable[dict[str, Any]],
+    ) -> int:
+        """Birden fazla kayit ekler.
+
+        Args:
+            records: Log kayitlari.
+
+        Returns:
+            Eklenen sayi.
+        """
+        count = 0
+        for record in records:
+            self.add(record)
+            count += 1
+        return count
+
+    def _roll(self) -> None:
+        """Aktif segmenti muhurler ve siniri uygular."""
+        self._segments.append(self._active)
+        self._active = LogSegment()
+        excess = sum(
+            isinstance(seg, LogSegment) for seg in self._segments
+        ) - self._max_segments
+        if excess <= 0:
+            return
+
+        kept: list[LogSegment | _SpilledSegment] = []
+        for segment in self._segments:
+            if excess > 0 and isinstance(segment, LogSegment):
+                excess -= 1
+                if self._spill_dir:
+                    kept.append(self._spill(segment))
+                else:
+                    self._dropped += len(segment)
+                    logger.warning(
+                        "Log indeksi siniri asildi, %d kayit atildi "
+                        "(toplam %d); spill_dir verilmeli",
+                        len(segment), self._dropped,
+                    )
+                continue
+            kept.append(segment)
+        self._segments = kept
+
+    def _spill(self, segment: LogSegment) -> _SpilledSegment:
+        """Segmenti diske yazar.
+
+        Args:
+            segment: Muhurlu segment.
+
+        Returns:
+            Disk ozeti.
+        """
+        os.makedirs(self._spill_dir, exist_ok=True)  # type: ignore[arg-type]
+        self._sequence += 1
+        path = os.path.join(
+            self._spill_dir,  # type: ignore[arg-type]
+            f"segment-{self._sequence:06d}.jsonl",
+        )
+        with open(path, "w", encoding="utf-8") as fh:
+            for record in segment.records:
+                fh.write(json.dumps(record, default=str))
+                fh.write("\n")
+        logger.debug(
+            "Log segmenti diske tasindi: %s (%d kayit)",
+            path, len(segment),
+        )
+        return _SpilledSegment(path, segment)
+
+    def _all_segments(self) -> list[LogSegment | _SpilledSegment]:
+        """Eski -> yeni tum segmentler."""
+        return [*self._segments, self._active]
+
+    def query(
+        self,
+        text: str = "",
+        case_sensitive: bool = False,
+        level: str = "",
+        source: str = "",
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Tum segmentlerde arar.
+
+        Args:
+            text: Alt dizgi sorgusu.
+            case_sensitive: Buyuk/kucuk harf duyarli.
+            level: Seviye filtresi.
+            source: Kaynak filtresi.
+            start: Baslangic zamani.
+            end: Bitis zamani.
+
+        Returns:
+            Eslesen kayitlar (ekleme sirasinda).
+        """
+        results: list[dict[str, Any]] = []
+        for segment in self._all_segments():
+            if not segment.may_match(level, source, start, end):
+                continue
+            if isinstance(segment, _SpilledSegment):
+                segment = segment.load()
+            results.extend(segment.query(
+                text, case_sensitive, level, source, start, end,
+            ))
+        return results
+
+    def scan(self) -> Iterator[dict[str, Any]]:
+        """Tum kayitlari ekleme sirasinda dolasir.
+
+        Yields:
+            Log kaydi.
+        """
+        for segment in self._all_segments():
+            if isinstance(segment, _SpilledSegment):
+                segment = segment.load()
+            yield from segment.records
+
+    def clear(self) -> int:
+        """Indeksi ve tasinan dosyalari temizler.
+
+        Returns:
+            Temizlenen kayit sayisi.
+        """
+        count = self.count
+        for segment in self._segments:
+            if isinstance(segment, _SpilledSegment):
+                with contextlib.suppress(OSError):
+                    os.remove(segment.path)
+        self._segments = []
+        self._active = LogSegment()
+        return count
+
+    def get_stats(self) -> dict[str, Any]:
+        """Istatistik getirir.
+
+        Returns:
+            Segment ve kayit sayilari.
+        """
+        spilled = [
+            s for s in self._segments
+            if isinstance(s, _SpilledSegment)
+        ]
+        return {
+            "records": self.count,
+            "in_memory_records": self.count - sum(
+                len(s) for s in spilled
+            ),
+            "segments": len(self._segments) + 1,
+            "spilled_segments": len(spilled),
+            "dropped_records": self._dropped,
+            "segment_size": self._segment_size,
+        }
+
+    @property
+    def count(self) -> int:
+        """Indeksteki kayit sayisi."""
+        return sum(len(s) for s in self._all_segments())
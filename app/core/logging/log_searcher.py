@@ -6,8 +6,13 @@ ve regex arama.
 """
 
 import logging
+import os
 import re
+import tempfile
 from typing import Any
+from uuid import uuid4
+
+from app.core.logging.log_index import LogIndex
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +20,46 @@ logger = logging.getLogger(__name__)
 class LogSearcher:
     """Log arayici.
 
-    Log kayitlarinda arama yapar.
+    Log kayitlarinda arama yapar. Indekslenen
+    kayitlar segmentli LogIndex'te tutulur;
+    sorgular tum listeyi taramak yerine
+    postings/bitmap kesisimi ile cozulur.
+
+    Bellekte en fazla ``max_segments`` muhurlu
+    segment tutulur; fazlasi diske tasinir, kayit
+    atilmaz. ``spill_dir`` verilmezse ilk tasimada
+    sistem gecici dizininde surece ozel bir dizin
+    olusturulur.
 
     Attributes:
         _index: Arama indeksi.
         _search_count: Arama sayisi.
     """
 
-    def __init__(self) -> None:
-        """Log arayiciyi baslatir."""
-        self._logs: list[dict[str, Any]] = []
+    def __init__(
+        self,
+        segment_size: int = 65536,
+        max_segments: int = 16,
+        spill_dir: str | None = None,
+    ) -> None:
+        """Log arayiciyi baslatir.
+
+        Args:
+            segment_size: Segment basina kayit.
+            max_segments: Bellekteki maks muhurlu segment.
+            spill_dir: Segment tasima dizini
+                (None: gecici dizin).
+        """
+        if spill_dir is None:
+            spill_dir = os.path.join(
+                tempfile.gettempdir(),
+                f"atlas-logs-{os.getpid()}-{uuid4().hex[:8]}",
+            )
+        self._index = LogIndex(
+            segment_size=segment_size,
+            max_segments=max_segments,
+            spill_dir=spill_dir,
+        )
         self._search_count = 0
 
         logger.info(
@@ -43,8 +78,7 @@ class LogSearcher:
         Returns:
             Indekslenen sayi.
         """
-        self._logs.extend(logs)
-        return len(logs)
+        return self._index.add_many(logs)
 
     def search(
         self,
@@ -61,16 +95,9 @@ class LogSearcher:
             Eslesen loglar.
         """
         self._search_count += 1
-        results = []
-        for log in self._logs:
-            msg = log.get("message", "")
-            if case_sensitive:
-                if query in msg:
-                    results.append(log)
-            else:
-                if query.lower() in msg.lower():
-                    results.append(log)
-        return results
+        return self._index.query(
+            text=query, case_sensitive=case_sensitive,
+        )
 
     def filter_by_level(
         self,
@@ -87,7 +114,9 @@ class LogSearcher:
             Filtrelenmis loglar.
         """
         self._search_count += 1
-        source = logs if logs is not None else self._logs
+        if logs is None and level:
+            return self._index.query(level=level)
+        source = logs if logs is not None else self._index.scan()
         return [
             r for r in source
             if r.get("level", "").lower()
@@ -111,8 +140,9 @@ class LogSearcher:
             Filtrelenmis loglar.
         """
         self._search_count += 1
-        source = logs if logs is not None else self._logs
-        result = source
+        if logs is None:
+            return self._index.query(start=start, end=end)
+        result = logs
         if start is not None:
             result = [
                 r for r in result
@@ -140,9 +170,11 @@ class LogSearcher:
             Filtrelenmis loglar.
         """
         self._search_count += 1
+        if logs is None and source:
+            return self._index.query(source=source)
         log_source = (
             logs if logs is not None
-            else self._logs
+            else self._index.scan()
         )
         return [
             r for r in log_source
@@ -164,7 +196,7 @@ class LogSearcher:
             Eslesen loglar.
         """
         self._search_count += 1
-        source = logs if logs is not None else self._logs
+        source = logs if logs is not None else self._index.scan()
         try:
             compiled = re.compile(pattern)
         except re.error:
@@ -198,38 +230,13 @@ class LogSearcher:
             Sonuclar.
         """
         self._search_count += 1
-        result = list(self._logs)
-
-        if query:
-            q_lower = query.lower()
-            result = [
-                r for r in result
-                if q_lower
-                in r.get("message", "").lower()
-            ]
-        if level:
-            result = [
-                r for r in result
-                if r.get("level", "").lower()
-                == level.lower()
-            ]
-        if source:
-            result = [
-                r for r in result
-                if r.get("source", "") == source
-            ]
-        if start is not None:
-            result = [
-                r for r in result
-                if r.get("timestamp", 0) >= start
-            ]
-        if end is not None:
-            result = [
-                r for r in result
-                if r.get("timestamp", 0) <= end
-            ]
-
-        return result
+        return self._index.query(
+            text=query,
+            level=level,
+            source=source,
+            start=start,
+            end=end,
+        )
 
     def clear_index(self) -> int:
         """Indeksi temizler.
@@ -237,14 +244,20 @@ class LogSearcher:
         Returns:
             Temizlenen sayi.
         """
-        count = len(self._logs)
-        self._logs = []
-        return count
+        return self._index.clear()
 
     @property
     def indexed_count(self) -> int:
         """Indekslenen log sayisi."""
-        return len(self._logs)
+        return self._index.count
+
+    def get_index_stats(self) -> dict[str, Any]:
+        """Indeks istatistiklerini getirir.
+
+        Returns:
+            Segment ve kayit sayilari.
+        """
+        return self._index.get_stats()
 
     @property
     def search_count(self) -> int:
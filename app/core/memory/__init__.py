@@ -3,11 +3,15 @@
 Kisa sureli (Redis), uzun sureli (PostgreSQL) ve semantik (Qdrant) hafiza yonetimi.
 """
 
+from app.core.memory.embedding_service import EmbeddingService
 from app.core.memory.long_term import LongTermMemory
 from app.core.memory.semantic import SemanticMemory
 from app.core.memory.short_term import ShortTermMemory
+from app.core.memory.text_index import BM25Index
 
 __all__ = [
+    "BM25Index",
+    "EmbeddingService",
     "LongTermMemory",
     "SemanticMemory",
     "ShortTermMemory",
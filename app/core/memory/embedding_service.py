@@ -0,0 +1,320 @@
+"""ATLAS embedding servisi modulu.
+
+Modeli is parcacigi havuzunda calistiran,
+eszamanli istekleri mikro partilerde birlestiren
+ve icerik hash'i ile son vektorleri onbellekleyen
+embedding katmani.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingService:
+    """Bloklamayan, partili ve onbellekli embedding.
+
+    Model cagrisi olay dongusu disinda, ayri bir
+    is parcacigi havuzunda yapilir. Ayni anda gelen
+    istekler en fazla ``max_batch`` metinlik ya da
+    ``max_wait_ms`` bekleyen mikro partilere toplanir.
+    Ayni metin icin bekleyen istekler tek bir model
+    cagrisini paylasir; tamamlanan vektorler icerik
+    hash'i ile LRU onbellekte tutulur.
+
+    Attributes:
+        _loader: Model nesnesini donduren fonksiyon.
+        _cache: Icerik hash'i -> vektor (LRU).
+        _pending: Partiye alinmayi bekleyenler.
+        _inflight: Hesaplanmakta olan hash -> future.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        model_name: str = "",
+        max_batch: int = 32,
+        max_wait_ms: float = 5.0,
+        cache_size: int = 4096,
+        workers: int = 1,
+    ) -> None:
+        """Embedding servisini baslatir.
+
+        Args:
+            loader: Model nesnesini donduren fonksiyon
+                (``embed(list[str])`` saglamali).
+            model_name: Onbellek anahtarina katilan model adi.
+            max_batch: Maks parti boyutu.
+            max_wait_ms: Parti dolmadan maks bekleme (ms).
+            cache_size: Onbellek kapasitesi (0: kapali).
+            workers: Model is parcacigi sayisi.
+        """
+        self._loader = loader
+        self._model_name = model_name
+        self._max_batch = max(1, max_batch)
+        self._max_wait = max(0.0, max_wait_ms) / 1000
+        self._cache_size = max(0, cache_size)
+        self._workers = max(1, workers)
+        self._cache: OrderedDict[
+            bytes, tuple[float, ...]
+        ] = OrderedDict()
+        self._pending: list[
+            tuple[bytes, str, asyncio.Future[list[float]]]
+        ] = []
+        self._inflight: dict[
+            bytes, asyncio.Future[list[float]]
+        ] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._load_lock = threading.Lock()
+        self._requests = 0
+        self._cache_hits = 0
+        self._coalesced = 0
+        self._batches = 0
+        self._embedded = 0
+
+        logger.info("EmbeddingService baslatildi")
+
+    def _digest(self, text: str) -> bytes:
+        """Model ve metin icin icerik hash'i.
+
+        Args:
+            text: Metin.
+
+        Returns:
+            SHA-256 ozeti.
+        """
+        return hashlib.sha256(
+            f"{self._model_name}\0{text}".encode(),
+        ).digest()
+
+    async def embed(self, text: str) -> list[float]:
+        """Tek metin icin embedding getirir.
+
+        Args:
+            text: Metin.
+
+        Returns:
+            Embedding vektoru.
+        """
+        self._requests += 1
+        digest = self._digest(text)
+        cached = self._cache.get(digest)
+        if cached is not None:
+            self._cache.move_to_end(digest)
+            self._cache_hits += 1
+            return list(cached)
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._bind(loop)
+
+        future = self._inflight.get(digest)
+        if future is not None:
+            self._coalesced += 1
+            return list(await asyncio.shield(future))
+
+        future = loop.create_future()
+        self._inflight[digest] = future
+        self._pending.append((digest, text, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(
+                self._max_wait, self._flush,
+            )
+        return list(await asyncio.shield(future))
+
+    async def embed_many(
+        self,
+        texts: list[str],
+    ) -> list[list[float]]:
+        """Birden fazla metin icin embedding getirir.
+
+        Args:
+            texts: Metin listesi.
+
+        Returns:
+            Sirasi korunmus vektor listesi.
+        """
+        if not texts:
+            return []
+        return list(await asyncio.gather(
+            *(self.embed(text) for text in texts),
+        ))
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Servisi yeni olay dongusune baglar.
+
+        Onceki donguden kalan bekleyen istekler
+        o donguyle birlikte gecersizdir.
+
+        Args:
+            loop: Calisan olay dongusu.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = []
+        self._inflight.clear()
+        self._loop = loop
+
+    def _flush(self) -> None:
+        """Bekleyen istekleri bir parti olarak gonderir."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch = self._pending[:self._max_batch]
+            del self._pending[:self._max_batch]
+            self._batches += 1
+            task = self._loop.run_in_executor(  # type: ignore[union-attr]
+                self._get_executor(),
+                self._run_model,
+                [text for _, text, _ in batch],
+            )
+            task.add_done_callback(
+                lambda done, b=batch: self._complete(b, done),
+            )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Model is parcacigi havuzunu getirir.
+
+        Returns:
+            Havuz.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers,
+                thread_name_prefix="atlas-embed",
+            )
+        return self._executor
+
+    def _run_model(
+        self,
+        texts: list[str],
+    ) -> list[list[float]]:
+        """Modeli calistirir (havuz is parcaciginda).
+
+        Args:
+            texts: Parti metinleri.
+
+        Returns:
+            Vektor listesi.
+        """
+        with self._load_lock:
+            model = self._loader()
+        return [
+            vector.tolist()
+            if hasattr(vector, "tolist")
+            else list(vector)
+            for vector in model.embed(texts)
+        ]
+
+    def _complete(
+        self,
+        batch: list[
+            tuple[bytes, str, asyncio.Future[list[float]]]
+        ],
+        done: asyncio.Future[list[list[float]]],
+    ) -> None:
+        """Parti sonucunu bekleyenlere dagitir.
+
+        Args:
+            batch: Parti istekleri.
+            done: Model cagrisi sonucu.
+        """
+        error = (
+            done.exception() if not done.cancelled()
+            else asyncio.CancelledError()
+        )
+        vectors = done.result() if error is None else []
+        if error is None and len(vectors) != len(batch):
+            error = RuntimeError(
+                f"Embedding sayisi uyusmuyor: "
+                f"{len(vectors)} != {len(batch)}",
+            )
+        if error is not None:
+            logger.error("Embedding partisi basarisiz: %s", error)
+
+        for idx, (digest, _, future) in enumerate(batch):
+            if self._inflight.get(digest) is future:
+                del self._inflight[digest]
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+                continue
+            vector = vectors[idx]
+            self._remember(digest, vector)
+            future.set_result(vector)
+        if error is None:
+            self._embedded += len(batch)
+
+    def _remember(
+        self,
+        digest: bytes,
+        vector: list[float],
+    ) -> None:
+        """Vektoru onbellege yazar.
+
+        Args:
+            digest: Icerik hash'i.
+            vector: Vektor.
+        """
+        if not self._cache_size:
+            return
+        self._cache[digest] = tuple(vector)
+        self._cache.move_to_end(digest)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def reset(self, model_name: str | None = None) -> None:
+        """Model degisikliginde onbellegi bosaltir.
+
+        Args:
+            model_name: Yeni model adi.
+        """
+        if model_name is not None:
+            self._model_name = model_name
+        self._cache.clear()
+
+    def close(self) -> None:
+        """Is parcacigi havuzunu kapatir."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Istatistik getirir.
+
+        Returns:
+            Istek, onbellek ve parti sayilari.
+        """
+        return {
+            "model": self._model_name,
+            "requests": self._requests,
+            "cache_hits": self._cache_hits,
+            "cache_size": len(self._cache),
+            "hit_rate": round(
+                self._cache_hits / max(1, self._requests), 3,
+            ),
+            "coalesced": self._coalesced,
+            "batches": self._batches,
+            "embedded": self._embedded,
+            "avg_batch_size": round(
+                self._embedded / max(1, self._batches), 2,
+            ),
+            "pending": len(self._pending),
+        }
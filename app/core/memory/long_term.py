@@ -3,29 +3,80 @@
 Gorev gecmisi, karar kayitlari ve agent loglarinin kalici saklanmasi.
 """
 
+import base64
+import binascii
+import json
 import logging
-from datetime import datetime, timezone
+import time
+from datetime import UTC, datetime, timezone
 from typing import Any
 
-from sqlalchemy import desc, select
+from sqlalchemy import bindparam, desc, func, select, text, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core import database as db
 from app.models.agent_log import AgentLogCreate, AgentLogRecord, AgentLogResponse
 from app.models.decision import DecisionCreate, DecisionRecord, DecisionResponse
-from app.models.task import TaskCreate, TaskRecord, TaskResponse, TaskStatus
+from app.models.task import TaskCreate, TaskPage, TaskRecord, TaskResponse, TaskStatus
 
 logger = logging.getLogger(__name__)
 
 
+def encode_task_cursor(task: TaskResponse) -> str:
+    """Gorevden keyset sayfalama imleci uretir.
+
+    Args:
+        task: Sayfanin son gorevi.
+
+    Returns:
+        URL-guvenli imlec.
+    """
+    raw = f"{task.created_at.isoformat()}|{task.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_task_cursor(cursor: str) -> tuple[datetime, str]:
+    """Keyset imlecini cozer.
+
+    Args:
+        cursor: encode_task_cursor ciktisi.
+
+    Returns:
+        (created_at, id) ikilisi.
+
+    Raises:
+        ValueError: Gecersiz imlec.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created, task_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created), task_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Gecersiz imlec: {cursor}") from exc
+
+
 class LongTermMemory:
     """PostgreSQL tabanli uzun sureli hafiza sinifi.
 
     Gorev gecmisi, karar kayitlari ve agent log CRUD islemlerini yonetir.
     """
 
-    def __init__(self) -> None:
-        """LongTermMemory'yi baslatir."""
+    def __init__(
+        self,
+        count_cache_ttl: float = 30.0,
+        exact_count_threshold: int = 10_000,
+    ) -> None:
+        """LongTermMemory'yi baslatir.
+
+        Args:
+            count_cache_ttl: Gorev sayim onbellegi suresi (saniye).
+            exact_count_threshold: PostgreSQL'de bu tahminin altinda
+                kesin COUNT yapilir, ustunde planlayici tahmini kullanilir.
+        """
+        self.count_cache_ttl = count_cache_ttl
+        self.exact_count_threshold = exact_count_threshold
+        # (status, agent) -> (son gecerlilik, sayi, kesin mi)
+        self._count_cache: dict[tuple[str | None, str | None], tuple[float, int, bool]] = {}
         logger.info("Uzun sureli hafiza modulu hazirlandi")
 
     async def _get_session(self) -> AsyncSession:
@@ -115,38 +166,222 @@ class LongTermMemory:
             logger.info("Gorev guncellendi: id=%s", task_id)
             return TaskResponse.model_validate(record)
 
+    async def bulk_update_tasks(
+        self,
+        updates: dict[str, dict[str, Any]],
+    ) -> int:
+        """Birden cok gorev kaydini tek islemde gunceller.
+
+        Ayni alan kumesine sahip guncellemeler tek bir
+        ``UPDATE ... WHERE id = :id`` ifadesiyle executemany
+        olarak gonderilir; tum gruplar tek commit ile yazilir.
+
+        Args:
+            updates: Gorev ID -> guncellenecek alanlar.
+
+        Returns:
+            Gonderilen gorev guncellemesi sayisi.
+        """
+        table = TaskRecord.__table__
+        columns = set(table.columns.keys()) - {"id"}
+        now = datetime.now(UTC)
+
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for task_id, fields in updates.items():
+            values = {k: v for k, v in fields.items() if k in columns}
+            if not values:
+                continue
+            if values.get("status") in (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value):
+                values.setdefault("completed_at", now)
+            values.setdefault("updated_at", now)
+            params = {f"b_{k}": v for k, v in values.items()}
+            params["b_id"] = task_id
+            groups.setdefault(tuple(sorted(values)), []).append(params)
+
+        if not groups:
+            return 0
+
+        session = await self._get_session()
+        async with session:
+            for keys, rows in groups.items():
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("b_id"))
+                    .values({k: bindparam(f"b_{k}") for k in keys})
+                )
+                await session.execute(stmt, rows)
+            await session.commit()
+
+        count = sum(len(rows) for rows in groups.values())
+        logger.debug("Toplu gorev guncellemesi: %d kayit, %d ifade", count, len(groups))
+        return count
+
     async def list_tasks(
         self,
         status: str | None = None,
         agent: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[TaskResponse]:
         """Gorev kayitlarini filtreli listeler.
 
+        Siralama (created_at, id) azalandir. ``cursor`` verilirse
+        ofset yerine keyset sayfalama kullanilir; derin sayfalar
+        da indeks uzerinden sabit maliyetle okunur.
+
         Args:
             status: Durum filtresi (opsiyonel).
             agent: Agent adi filtresi (opsiyonel).
             limit: Maksimum kayit sayisi.
-            offset: Baslangic ofseti.
+            offset: Baslangic ofseti (cursor yoksa).
+            cursor: Onceki sayfanin imleci (opsiyonel).
 
         Returns:
             Gorev yanitlari listesi.
+
+        Raises:
+            ValueError: Gecersiz imlec.
         """
         session = await self._get_session()
         async with session:
-            stmt = select(TaskRecord).order_by(desc(TaskRecord.created_at))
+            stmt = select(TaskRecord).order_by(
+                desc(TaskRecord.created_at), desc(TaskRecord.id),
+            )
+            stmt = self._filter_tasks(stmt, status, agent)
 
-            if status is not None:
-                stmt = stmt.where(TaskRecord.status == status)
-            if agent is not None:
-                stmt = stmt.where(TaskRecord.agent == agent)
+            if cursor is not None:
+                created_at, task_id = decode_task_cursor(cursor)
+                stmt = stmt.where(
+                    tuple_(TaskRecord.created_at, TaskRecord.id) < (created_at, task_id)
+                )
+            elif offset:
+                stmt = stmt.offset(offset)
 
-            stmt = stmt.limit(limit).offset(offset)
+            stmt = stmt.limit(limit)
             result = await session.execute(stmt)
             records = result.scalars().all()
             return [TaskResponse.model_validate(r) for r in records]
 
+    async def list_tasks_page(
+        self,
+        status: str | None = None,
+        agent: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        offset: int = 0,
+    ) -> TaskPage:
+        """Gorevleri sonraki sayfa imleci ve toplam sayiyla listeler.
+
+        Args:
+            status: Durum filtresi (opsiyonel).
+            agent: Agent adi filtresi (opsiyonel).
+            limit: Sayfa boyutu.
+            cursor: Onceki sayfanin imleci (opsiyonel).
+            offset: Baslangic ofseti (cursor yoksa).
+
+        Returns:
+            Gorev sayfasi.
+
+        Raises:
+            ValueError: Gecersiz imlec.
+        """
+        rows = await self.list_tasks(
+            status=status, agent=agent, limit=limit + 1,
+            offset=offset, cursor=cursor,
+        )
+        tasks = rows[:limit]
+        next_cursor = encode_task_cursor(tasks[-1]) if len(rows) > limit else None
+        total, exact = await self.count_tasks(status=status, agent=agent)
+        return TaskPage(
+            tasks=tasks, next_cursor=next_cursor,
+            total=total, total_exact=exact,
+        )
+
+    async def count_tasks(
+        self,
+        status: str | None = None,
+        agent: str | None = None,
+    ) -> tuple[int, bool]:
+        """Filtreye uyan gorev sayisi (onbellekli).
+
+        PostgreSQL'de once planlayici tahmini alinir; tahmin
+        ``exact_count_threshold`` altindaysa kesin COUNT yapilir.
+        Sonuc ``count_cache_ttl`` boyunca onbellekte tutulur.
+
+        Args:
+            status: Durum filtresi (opsiyonel).
+            agent: Agent adi filtresi (opsiyonel).
+
+        Returns:
+            (sayi, kesin mi) ikilisi.
+        """
+        key = (status, agent)
+        now = time.monotonic()
+        cached = self._count_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1], cached[2]
+
+        session = await self._get_session()
+        async with session:
+            count_stmt = self._filter_tasks(
+                select(func.count()).select_from(TaskRecord), status, agent,
+            )
+            dialect = getattr(getattr(session.bind, "dialect", None), "name", "")
+
+            exact = True
+            if dialect == "postgresql":
+                estimate = await self._estimate_rows(session, status, agent)
+                if estimate >= self.exact_count_threshold:
+                    count, exact = estimate, False
+            if exact:
+                count = int((await session.execute(count_stmt)).scalar_one())
+
+        self._count_cache[key] = (now + self.count_cache_ttl, count, exact)
+        return count, exact
+
+    @staticmethod
+    async def _estimate_rows(
+        session: AsyncSession,
+        status: str | None,
+        agent: str | None,
+    ) -> int:
+        """PostgreSQL planlayici satir tahmini.
+
+        Args:
+            session: Aktif session.
+            status: Durum filtresi.
+            agent: Agent filtresi.
+
+        Returns:
+            Tahmini satir sayisi.
+        """
+        clauses = []
+        params: dict[str, Any] = {}
+        if status is not None:
+            clauses.append("status = :status")
+            params["status"] = status
+        if agent is not None:
+            clauses.append("agent = :agent")
+            params["agent"] = agent
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        result = await session.execute(
+            text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM tasks{where}"), params,
+        )
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @staticmethod
+    def _filter_tasks(stmt: Any, status: str | None, agent: str | None) -> Any:
+        """Durum/agent filtrelerini uygular."""
+        if status is not None:
+            stmt = stmt.where(TaskRecord.status == status)
+        if agent is not None:
+            stmt = stmt.where(TaskRecord.agent == agent)
+        return stmt
+
     # === Karar gecmisi ===
 
     async def save_decision(self, decision_data: DecisionCreate) -> DecisionResponse:
@@ -4,6 +4,7 @@ Gorev gecmisi, kararlar, agent sonuclari ve konusmalarin
 vektor tabanli semantik arama ile yonetimi.
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
@@ -11,6 +12,10 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.exceptions import (
+    ResponseHandlingException,
+    UnexpectedResponse,
+)
 from qdrant_client.models import (
     Distance,
     FieldCondition,
@@ -21,6 +26,11 @@ from qdrant_client.models import (
 )
 
 from app.config import settings
+from app.core.memory.embedding_service import EmbeddingService
+from app.core.memory.text_index import (
+    BM25Index,
+    reciprocal_rank_fusion,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +79,15 @@ COLLECTIONS: dict[str, str] = {
     "conversations": "Konusma parca vektorleri",
 }
 
+# FTS terim govde uzunlugu (Turkce eklemeli yapi icin F5)
+FTS_PREFIX_LEN = 5
+
+# Hibrit aramada kaynak basina aday carpani
+HYBRID_CANDIDATES = 3
+
+# Qdrant erisim hatalari (yerel BM25 indeksine dusulur)
+_QDRANT_ERRORS = (UnexpectedResponse, ResponseHandlingException, OSError)
+
 
 class SemanticMemory:
     """Qdrant tabanli semantik hafiza sinifi.
@@ -92,6 +111,14 @@ class SemanticMemory:
         self._embedding_model = settings.qdrant_embedding_model
         self._embedding_dimension = settings.qdrant_embedding_dimension
         self._embedder: Any = None
+        self._embedding_service = EmbeddingService(
+            loader=self._get_embedder,
+            model_name=self._embedding_model,
+            max_batch=settings.qdrant_embedding_batch_size,
+            max_wait_ms=settings.qdrant_embedding_batch_wait_ms,
+            cache_size=settings.qdrant_embedding_cache_size,
+        )
+        self._text_indexes: dict[str, BM25Index] = {}
 
     async def connect(self) -> None:
         """Qdrant baglantisini kurar ve koleksiyonlari hazirlar."""
@@ -117,9 +144,11 @@ class SemanticMemory:
             len(collections.collections),
         )
 
-        # Koleksiyonlari olustur (yoksa)
+        # Koleksiyonlari olustur (yoksa); mevcut icerik
+        # yerel BM25 indeksine yuklenir
         for collection_name in COLLECTIONS:
-            await self.ensure_collection(collection_name)
+            if not await self.ensure_collection(collection_name):
+                await self._load_text_index(collection_name)
 
     async def close(self) -> None:
         """Qdrant baglantisini kapatir."""
@@ -127,6 +156,7 @@ class SemanticMemory:
             await self.client.close()
             self.client = None
             logger.info("Qdrant baglantisi kapatildi")
+        self._embedding_service.close()
 
     def _ensure_connected(self) -> AsyncQdrantClient:
         """Baglantinin aktif oldugunu dogrular.
@@ -196,6 +226,7 @@ class SemanticMemory:
         full_name = self._collection_name(name)
 
         result = await client.delete_collection(full_name)
+        self._text_indexes.pop(full_name, None)
         logger.info("Koleksiyon silindi: %s", full_name)
         return result
 
@@ -226,15 +257,17 @@ class SemanticMemory:
     async def _generate_embedding(self, text: str) -> list[float]:
         """Metin icin embedding vektoru uretir.
 
+        Model olay dongusu disinda calisir; eszamanli
+        cagrilar mikro partilerde birlestirilir ve
+        tekrar eden metinler onbellekten doner.
+
         Args:
             text: Embedding olusturulacak metin.
 
         Returns:
             Embedding vektoru (float listesi).
         """
-        embedder = self._get_embedder()
-        embeddings = list(embedder.embed([text]))
-        return embeddings[0].tolist()
+        return await self._embedding_service.embed(text)
 
     # === CRUD islemleri ===
 
@@ -283,6 +316,7 @@ class SemanticMemory:
                 ),
             ],
         )
+        self._text_index(full_name).add(pid, text, payload)
 
         logger.debug(
             "Semantik kayit eklendi: koleksiyon=%s, id=%s, metin=%s...",
@@ -311,9 +345,14 @@ class SemanticMemory:
 
         points: list[PointStruct] = []
         ids: list[str] = []
+        payloads: list[dict[str, Any]] = []
 
-        for entry in entries:
-            embedding = await self._generate_embedding(entry.text)
+        # Eszamanli istekler tek model partisinde birlesir
+        embeddings = await asyncio.gather(
+            *(self._generate_embedding(entry.text) for entry in entries),
+        )
+
+        for entry, embedding in zip(entries, embeddings, strict=True):
             pid = str(uuid.uuid4())
             ids.append(pid)
 
@@ -325,6 +364,7 @@ class SemanticMemory:
             if entry.metadata:
                 payload["metadata"] = entry.metadata
 
+            payloads.append(payload)
             points.append(
                 PointStruct(id=pid, vector=embedding, payload=payload)
             )
@@ -333,6 +373,9 @@ class SemanticMemory:
             collection_name=full_name,
             points=points,
         )
+        index = self._text_index(full_name)
+        for pid, payload in zip(ids, payloads, strict=True):
+            index.add(pid, payload["text"], payload)
 
         logger.info(
             "Toplu semantik kayit: koleksiyon=%s, adet=%d",
@@ -349,9 +392,15 @@ class SemanticMemory:
         score_threshold: float = 0.0,
         source_filter: str | None = None,
         metadata_filter: dict[str, Any] | None = None,
+        hybrid: bool = False,
     ) -> list[SemanticSearchResult]:
         """Semantik benzerlik aramasi yapar.
 
+        ``hybrid`` acikken vektor sonuclari yerel BM25
+        sonuclariyla karsilikli sira birlestirme (RRF)
+        ile harmanlanir; skor bu durumda RRF skorudur.
+        Qdrant erisilemezse yerel BM25 indeksine dusulur.
+
         Args:
             collection: Koleksiyon kisa adi.
             query: Arama sorgu metni.
@@ -359,24 +408,43 @@ class SemanticMemory:
             score_threshold: Minimum benzerlik skoru (0.0-1.0).
             source_filter: Kaynak etiketi filtresi (opsiyonel).
             metadata_filter: Metadata filtresi (opsiyonel).
+            hybrid: Vektor + BM25 hibrit siralama.
 
         Returns:
             Benzerlik sirasina gore siralanmis sonuc listesi.
         """
-        client = self._ensure_connected()
         full_name = self._collection_name(collection)
+        index = self._text_indexes.get(full_name)
 
-        query_embedding = await self._generate_embedding(query)
+        def matches(payload: dict[str, Any]) -> bool:
+            return self._payload_matches(
+                payload, source_filter, metadata_filter,
+            )
 
-        query_filter = self._build_filter(source_filter, metadata_filter)
+        if self.client is None and index:
+            logger.warning("Qdrant bagli degil, BM25'e dusuluyor")
+            return self._bm25_results(index, query, limit, matches)
+        client = self._ensure_connected()
 
-        results = await client.search(
-            collection_name=full_name,
-            query_vector=query_embedding,
-            limit=limit,
-            score_threshold=score_threshold,
-            query_filter=query_filter,
-        )
+        try:
+            query_embedding = await self._generate_embedding(query)
+            query_filter = self._build_filter(
+                source_filter, metadata_filter,
+            )
+            results = await client.search(
+                collection_name=full_name,
+                query_vector=query_embedding,
+                limit=limit * HYBRID_CANDIDATES if hybrid else limit,
+                score_threshold=score_threshold,
+                query_filter=query_filter,
+            )
+        except _QDRANT_ERRORS as exc:
+            if not index:
+                raise
+            logger.warning(
+                "Vektor aramasi basarisiz, BM25'e dusuluyor: %s", exc,
+            )
+            return self._bm25_results(index, query, limit, matches)
 
         search_results: list[SemanticSearchResult] = []
         for hit in results:
@@ -391,6 +459,15 @@ class SemanticMemory:
                 )
             )
 
+        if hybrid and index:
+            search_results = self._fuse(
+                search_results,
+                self._bm25_results(
+                    index, query, limit * HYBRID_CANDIDATES, matches,
+                ),
+                limit,
+            )
+
         logger.debug(
             "Semantik arama: koleksiyon=%s, sorgu=%s..., sonuc=%d",
             collection,
@@ -464,6 +541,10 @@ class SemanticMemory:
             collection_name=full_name,
             points_selector=point_ids,
         )
+        index = self._text_indexes.get(full_name)
+        if index is not None:
+            for pid in point_ids:
+                index.remove(str(pid))
 
         logger.debug(
             "Semantik kayitlar silindi: koleksiyon=%s, adet=%d",
@@ -500,6 +581,9 @@ class SemanticMemory:
                 ],
             ),
         )
+        index = self._text_indexes.get(full_name)
+        if index is not None:
+            index.remove_where(lambda p: p.get("source") == source)
 
         logger.info(
             "Kaynaga gore silme: koleksiyon=%s, kaynak=%s",
@@ -649,6 +733,7 @@ class SemanticMemory:
                 ),
             ],
         )
+        self._text_index(full_name).add(pid, text, payload)
         return pid
 
     async def search_agent_memory(
@@ -714,46 +799,190 @@ class SemanticMemory:
 
     def fts_search(
         self,
-        texts: list[str],
+        texts: list[str] | None,
         query: str,
         limit: int = 5,
+        collection: str | None = None,
     ) -> list[dict[str, Any]]:
         """Full-text arama (embedding olmadan fallback).
 
-        Qdrant erisilemedigi zaman basit
-        metin eslestirme ile arama yapar.
+        ``collection`` verilirse store/delete ile
+        guncel tutulan kalici BM25 indeksi kullanilir;
+        aksi halde verilen metinler icin gecici
+        bir indeks kurulur.
 
         Args:
             texts: Aranacak metin listesi.
             query: Arama sorgusu.
             limit: Maks sonuc.
+            collection: Koleksiyon kisa adi.
 
         Returns:
             Eslesen sonuclar.
         """
-        query_lower = query.lower()
-        query_terms = query_lower.split()
-        results: list[dict[str, Any]] = []
-
-        for i, text in enumerate(texts):
-            text_lower = text.lower()
-            score = 0.0
-            for term in query_terms:
-                if term in text_lower:
-                    score += 1.0 / len(query_terms)
-
-            if score > 0:
+        if collection is not None:
+            index = self._text_indexes.get(
+                self._collection_name(collection),
+            )
+            if index is None:
+                return []
+            results: list[dict[str, Any]] = []
+            for pid, score in index.search(query, limit):
+                text, payload = index.get(pid)  # type: ignore[misc]
                 results.append({
-                    "index": i,
+                    "id": pid,
                     "text": text,
                     "score": score,
+                    "metadata": payload.get("metadata", {}),
+                    "source": payload.get("source", ""),
                 })
+            return results
+
+        index = BM25Index(prefix_len=FTS_PREFIX_LEN)
+        for i, text in enumerate(texts or []):
+            index.add(str(i), text)
+        return [
+            {
+                "index": int(doc_id),
+                "text": texts[int(doc_id)],  # type: ignore[index]
+                "score": score,
+            }
+            for doc_id, score in index.search(query, limit)
+        ]
+
+    def _text_index(self, full_name: str) -> BM25Index:
+        """Koleksiyonun BM25 indeksini getirir.
 
-        results.sort(
-            key=lambda x: x["score"],
-            reverse=True,
+        Args:
+            full_name: Tam koleksiyon adi.
+
+        Returns:
+            Indeks (yoksa olusturulur).
+        """
+        index = self._text_indexes.get(full_name)
+        if index is None:
+            index = BM25Index(prefix_len=FTS_PREFIX_LEN)
+            self._text_indexes[full_name] = index
+        return index
+
+    async def rebuild_text_index(
+        self,
+        collection: str,
+        batch_size: int = 256,
+    ) -> int:
+        """BM25 indeksini Qdrant icerigiyle yeniden kurar.
+
+        ``connect`` mevcut koleksiyonlar icin bir kez
+        cagirir; sonrasinda indeks store/delete ile
+        artimli guncellenir.
+
+        Args:
+            collection: Koleksiyon kisa adi.
+            batch_size: Scroll parti boyutu.
+
+        Returns:
+            Indekslenen belge sayisi.
+        """
+        client = self._ensure_connected()
+        full_name = self._collection_name(collection)
+        index = BM25Index(prefix_len=FTS_PREFIX_LEN)
+        offset: Any = None
+        while True:
+            points, offset = await client.scroll(
+                collection_name=full_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+            for point in points:
+                payload = point.payload or {}
+                index.add(
+                    str(point.id), payload.get("text", ""), payload,
+                )
+            if offset is None:
+                break
+        self._text_indexes[full_name] = index
+        logger.info(
+            "BM25 indeksi kuruldu: %s (%d belge)", full_name, len(index),
         )
-        return results[:limit]
+        return len(index)
+
+    async def _load_text_index(self, collection: str) -> None:
+        """Baglanti sirasinda BM25 indeksini kurar.
+
+        Kurulamazsa indeks yalnizca sonraki
+        yazimlari icerir; hata loglanir.
+
+        Args:
+            collection: Koleksiyon kisa adi.
+        """
+        try:
+            await self.rebuild_text_index(collection)
+        except _QDRANT_ERRORS as exc:
+            logger.warning(
+                "BM25 indeksi kurulamadi (%s), yalnizca yeni "
+                "kayitlar aranabilir: %s", collection, exc,
+            )
+
+    @staticmethod
+    def _bm25_results(
+        index: BM25Index,
+        query: str,
+        limit: int,
+        predicate: Any,
+    ) -> list[SemanticSearchResult]:
+        """BM25 sonuclarini arama sonucuna donusturur.
+
+        Args:
+            index: BM25 indeksi.
+            query: Sorgu.
+            limit: Maks sonuc.
+            predicate: Veri filtresi.
+
+        Returns:
+            Sonuc listesi.
+        """
+        results: list[SemanticSearchResult] = []
+        for pid, score in index.search(query, limit, predicate):
+            text, payload = index.get(pid)  # type: ignore[misc]
+            results.append(
+                SemanticSearchResult(
+                    id=pid,
+                    text=text,
+                    score=score,
+                    metadata=payload.get("metadata", {}),
+                    source=payload.get("source", ""),
+                )
+            )
+        return results
+
+    @staticmethod
+    def _fuse(
+        vector_results: list[SemanticSearchResult],
+        text_results: list[SemanticSearchResult],
+        limit: int,
+    ) -> list[SemanticSearchResult]:
+        """Vektor ve BM25 sonuclarini RRF ile birlestirir.
+
+        Args:
+            vector_results: Vektor sonuclari.
+            text_results: BM25 sonuclari.
+            limit: Maks sonuc.
+
+        Returns:
+            Birlesik sonuc listesi.
+        """
+        by_id = {r.id: r for r in text_results}
+        by_id.update({r.id: r for r in vector_results})
+        fused = reciprocal_rank_fusion(
+            [r.id for r in vector_results],
+            [r.id for r in text_results],
+        )
+        return [
+            by_id[pid].model_copy(update={"score": score})
+            for pid, score in fused[:limit]
+        ]
 
     def expand_query(
         self,
@@ -784,6 +1013,14 @@ class SemanticMemory:
         """Aktif embedding saglayicisi."""
         return self._embedding_model
 
+    def get_embedding_stats(self) -> dict[str, Any]:
+        """Embedding servisi istatistiklerini getirir.
+
+        Returns:
+            Onbellek ve parti istatistikleri.
+        """
+        return self._embedding_service.get_stats()
+
     def set_embedding_model(
         self,
         model_name: str,
@@ -799,6 +1036,7 @@ class SemanticMemory:
         if dimension > 0:
             self._embedding_dimension = dimension
         self._embedder = None
+        self._embedding_service.reset(model_name)
         logger.info(
             "Embedding modeli degistirildi: %s",
             model_name,
@@ -806,6 +1044,31 @@ class SemanticMemory:
 
     # === Yardimci metodlar ===
 
+    @staticmethod
+    def _payload_matches(
+        payload: dict[str, Any],
+        source_filter: str | None = None,
+        metadata_filter: dict[str, Any] | None = None,
+    ) -> bool:
+        """Yerel indeks icin filtre kontrolu.
+
+        Args:
+            payload: Nokta verisi.
+            source_filter: Kaynak etiketi filtresi.
+            metadata_filter: Metadata alan filtreleri.
+
+        Returns:
+            Filtreye uyuyorsa True.
+        """
+        if source_filter and payload.get("source") != source_filter:
+            return False
+        if metadata_filter:
+            metadata = payload.get("metadata", {})
+            for key, value in metadata_filter.items():
+                if metadata.get(key) != value:
+                    return False
+        return True
+
     def _build_filter(
         self,
         source_filter: str | None = None,
@@ -5,11 +5,13 @@ Aktif gorev durumlari, oturum cache'i ve gecici verileri yonetir.
 
 import json
 import logging
+import time
 from typing import Any
 
 from redis.asyncio import Redis
 
 from app.config import settings
+from app.core.caching.near_cache import NearCache
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_SESSION_TTL = 3600   # 1 saat
 DEFAULT_TASK_TTL = 86400     # 24 saat
 
+# Aktif gorev okumalarinda MGET parti boyutu
+ACTIVE_TASK_BATCH = 1000
+
 
 class ShortTermMemory:
     """Redis tabanli kisa sureli hafiza sinifi.
@@ -26,16 +31,23 @@ class ShortTermMemory:
     Attributes:
         prefix: Redis anahtar on eki (namespace).
         redis: Async Redis istemcisi.
+        near_cache: Opsiyonel surec ici L1 katmani.
     """
 
-    def __init__(self, prefix: str = "atlas") -> None:
+    def __init__(
+        self,
+        prefix: str = "atlas",
+        near_cache: NearCache | None = None,
+    ) -> None:
         """ShortTermMemory'yi baslatir.
 
         Args:
             prefix: Redis anahtar on eki. Tum anahtarlar bu on ek ile baslar.
+            near_cache: Okumalari Redis onunde karsilayan L1 onbellek.
         """
         self.prefix = prefix
         self.redis: Redis | None = None  # type: ignore[type-arg]
+        self.near_cache = near_cache
 
     async def connect(self) -> None:
         """Redis baglantisini kurar."""
@@ -47,9 +59,13 @@ class ShortTermMemory:
         # Baglanti testi
         await self.redis.ping()
         logger.info("Redis baglantisi kuruldu: %s", settings.redis_url.split("@")[-1])
+        if self.near_cache is not None:
+            await self.near_cache.start(self.redis)
 
     async def close(self) -> None:
         """Redis baglantisini kapatir."""
+        if self.near_cache is not None:
+            await self.near_cache.stop()
         if self.redis is not None:
             await self.redis.close()
             self.redis = None
@@ -79,6 +95,53 @@ class ShortTermMemory:
         """
         return ":".join([self.prefix, *parts])
 
+    async def _read_json(self, key: str) -> Any | None:
+        """JSON degeri once L1'den, yoksa Redis'ten okur.
+
+        Args:
+            key: Tam Redis anahtari.
+
+        Returns:
+            Cozulmus deger veya None.
+        """
+        r = self._ensure_connected()
+        near = self.near_cache
+        if near is None:
+            data = await r.get(key)
+            return json.loads(data) if data is not None else None
+
+        found, value = near.get(key)
+        if found:
+            return value
+        version = near.begin_fill(key)
+        try:
+            data = await r.get(key)
+        finally:
+            # Okuma sirasinda gecersiz kilinan deger L1'e yazilmaz
+            fresh = near.end_fill(key, version)
+        near.record_l2(data is not None)
+        if data is None:
+            return None
+        value = json.loads(data)
+        if fresh:
+            near.put(key, value)
+        return value
+
+    async def _invalidate(self, key: str) -> None:
+        """Yazilan anahtarin L1 kopyalarini dusurur.
+
+        Yerel kopya silinir ve diger iscilere
+        gecersiz kilma yayinlanir.
+
+        Args:
+            key: Tam Redis anahtari.
+        """
+        near = self.near_cache
+        if near is None:
+            return
+        near.invalidate(key)
+        await near.publish(self._ensure_connected(), key)
+
     # === Aktif gorev durum yonetimi ===
 
     async def store_task_status(
@@ -97,6 +160,10 @@ class ShortTermMemory:
         r = self._ensure_connected()
         key = self._key("task", task_id)
         await r.set(key, json.dumps(status, default=str), ex=ttl)
+        # Indeks skoru bitis zamani: suresi dolanlar tek
+        # ZREMRANGEBYSCORE ile budanir
+        await r.zadd(self._task_index_key(), {task_id: time.time() + ttl})
+        await self._invalidate(key)
         logger.debug("Gorev durumu kaydedildi: %s", task_id)
 
     async def get_task_status(self, task_id: str) -> dict[str, Any] | None:
@@ -108,12 +175,8 @@ class ShortTermMemory:
         Returns:
             Gorev durum bilgisi veya None (bulunamazsa).
         """
-        r = self._ensure_connected()
         key = self._key("task", task_id)
-        data = await r.get(key)
-        if data is None:
-            return None
-        return json.loads(data)
+        return await self._read_json(key)
 
     async def delete_task_status(self, task_id: str) -> bool:
         """Aktif gorev durumunu siler.
@@ -127,24 +190,99 @@ class ShortTermMemory:
         r = self._ensure_connected()
         key = self._key("task", task_id)
         deleted = await r.delete(key)
+        await r.zrem(self._task_index_key(), task_id)
+        await self._invalidate(key)
         logger.debug("Gorev durumu silindi: %s (sonuc=%d)", task_id, deleted)
         return deleted > 0
 
-    async def get_active_tasks(self) -> list[dict[str, Any]]:
-        """Tum aktif gorev durumlarini listeler.
+    def _task_index_key(self) -> str:
+        """Aktif gorev indeksinin anahtari.
+
+        Returns:
+            Sorted set anahtari (ornek: 'atlas:tasks:active').
+        """
+        return self._key("tasks", "active")
+
+    async def _prune_task_index(self) -> None:
+        """Suresi dolmus gorevleri indeksten temizler."""
+        r = self._ensure_connected()
+        await r.zremrangebyscore(self._task_index_key(), "-inf", time.time())
+
+    async def count_active_tasks(self) -> int:
+        """Aktif gorev sayisini getirir (ZCARD).
+
+        Returns:
+            Aktif gorev sayisi.
+        """
+        r = self._ensure_connected()
+        await self._prune_task_index()
+        return int(await r.zcard(self._task_index_key()))
+
+    async def get_active_tasks(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aktif gorev durumlarini sayfali listeler.
+
+        Anahtar uzayini taramak yerine aktif gorev indeksinden
+        (sorted set) kimlikleri okur ve durumlari parti basina
+        tek MGET ile getirir. Indekste kalip anahtari kaybolmus
+        kimlikler indeksten dusurulur.
+
+        Args:
+            offset: Atlanacak gorev sayisi.
+            limit: Maks gorev sayisi (None: tumu).
 
         Returns:
             Aktif gorev durumlari listesi.
         """
         r = self._ensure_connected()
-        pattern = self._key("task", "*")
+        index_key = self._task_index_key()
+        await self._prune_task_index()
+
+        end = -1 if limit is None else offset + limit - 1
+        if limit is not None and limit <= 0:
+            return []
+        task_ids = await r.zrange(index_key, offset, end)
+
         tasks: list[dict[str, Any]] = []
-        async for key in r.scan_iter(match=pattern):
-            data = await r.get(key)
-            if data is not None:
-                tasks.append(json.loads(data))
+        stale: list[str] = []
+        for start in range(0, len(task_ids), ACTIVE_TASK_BATCH):
+            batch = task_ids[start:start + ACTIVE_TASK_BATCH]
+            values = await r.mget([self._key("task", tid) for tid in batch])
+            for task_id, data in zip(batch, values, strict=True):
+                if data is None:
+                    stale.append(task_id)
+                else:
+                    tasks.append(json.loads(data))
+
+        if stale:
+            await r.zrem(index_key, *stale)
         return tasks
 
+    async def rebuild_task_index(self) -> int:
+        """Aktif gorev indeksini anahtar uzayindan yeniden kurar.
+
+        Indeks oncesi yazilmis durumlar icin tek seferlik
+        gecistir; normal akista kullanilmaz.
+
+        Returns:
+            Indekslenen gorev sayisi.
+        """
+        r = self._ensure_connected()
+        index_key = self._task_index_key()
+        prefix = self._key("task", "")
+        now = time.time()
+        count = 0
+        async for key in r.scan_iter(match=prefix + "*"):
+            ttl = await r.ttl(key)
+            expires = now + (ttl if ttl and ttl > 0 else DEFAULT_TASK_TTL)
+            await r.zadd(index_key, {key[len(prefix):]: expires})
+            count += 1
+        logger.info("Aktif gorev indeksi yeniden kuruldu: %d gorev", count)
+        return count
+
     # === Oturum cache yonetimi ===
 
     async def store_session(
@@ -163,6 +301,7 @@ class ShortTermMemory:
         r = self._ensure_connected()
         key = self._key("session", session_id)
         await r.set(key, json.dumps(data, default=str), ex=ttl)
+        await self._invalidate(key)
         logger.debug("Oturum kaydedildi: %s (TTL=%ds)", session_id, ttl)
 
     async def get_session(self, session_id: str) -> dict[str, Any] | None:
@@ -174,12 +313,8 @@ class ShortTermMemory:
         Returns:
             Oturum verisi veya None (bulunamazsa veya suresi dolmussa).
         """
-        r = self._ensure_connected()
         key = self._key("session", session_id)
-        data = await r.get(key)
-        if data is None:
-            return None
-        return json.loads(data)
+        return await self._read_json(key)
 
     async def delete_session(self, session_id: str) -> bool:
         """Oturum verisini siler.
@@ -193,6 +328,7 @@ class ShortTermMemory:
         r = self._ensure_connected()
         key = self._key("session", session_id)
         deleted = await r.delete(key)
+        await self._invalidate(key)
         return deleted > 0
 
     # === Genel cache yonetimi ===
@@ -213,6 +349,7 @@ class ShortTermMemory:
         r = self._ensure_connected()
         key = self._key("cache", key_name)
         await r.set(key, json.dumps(value, default=str), ex=ttl)
+        await self._invalidate(key)
 
     async def cache_get(self, key_name: str) -> Any | None:
         """Genel amacli cache okuma.
@@ -223,12 +360,8 @@ class ShortTermMemory:
         Returns:
             Saklanan deger veya None.
         """
-        r = self._ensure_connected()
         key = self._key("cache", key_name)
-        data = await r.get(key)
-        if data is None:
-            return None
-        return json.loads(data)
+        return await self._read_json(key)
 
     async def cache_delete(self, key_name: str) -> bool:
         """Genel amacli cache silme.
@@ -242,4 +375,5 @@ class ShortTermMemory:
         r = self._ensure_connected()
         key = self._key("cache", key_name)
         deleted = await r.delete(key)
+        await self._invalidate(key)
         return deleted > 0
@@ -0,0 +1,345 @@
+"""ATLAS metin indeksi modulu.
+
+Turkce duyarli normalizasyon, artimli ters
+indeks, BM25 puanlama ve karsilikli sira
+birlestirme (RRF).
+"""
+
+import heapq
+import logging
+import math
+import re
+from collections.abc import Callable, Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Buyuk I/İ Turkce kurala gore kucultulur,
+# ardindan aksanlar ASCII'ye katlanir
+_TR_UPPER = str.maketrans({"I": "ı", "İ": "i"})
+_TR_FOLD = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Standart RRF sabiti
+RRF_K = 60
+
+
+def normalize(text: str, turkish: bool = True) -> str:
+    """Metni arama icin normalize eder.
+
+    Args:
+        text: Ham metin.
+        turkish: Turkce buyuk/kucuk harf ve
+            aksan katlama kurallari.
+
+    Returns:
+        Normalize metin.
+    """
+    if turkish:
+        return text.translate(_TR_UPPER).lower().translate(_TR_FOLD)
+    return text.lower()
+
+
+def tokenize(
+    text: str,
+    turkish: bool = True,
+    prefix_len: int = 0,
+) -> list[str]:
+    """Metni terimlere ayirir.
+
+    ``prefix_len`` verilirse terimler ilk N
+    karaktere kirpilir; Turkce gibi eklemeli
+    dillerde kaba ama etkili bir govdeleme.
+
+    Args:
+        text: Ham metin.
+        turkish: Turkce normalizasyon.
+        prefix_len: Govde uzunlugu (0: kapali).
+
+    Returns:
+        Terim listesi.
+    """
+    tokens = _TOKEN_RE.findall(normalize(text, turkish))
+    if prefix_len > 0:
+        return [t[:prefix_len] for t in tokens]
+    return tokens
+
+
+def reciprocal_rank_fusion(
+    *rankings: Iterable[str],
+    k: int = RRF_K,
+) -> list[tuple[str, float]]:
+    """Siralamalari RRF ile birlestirir.
+
+    Args:
+        *rankings: En iyiden kotuye kimlik dizileri.
+        k: RRF sabiti.
+
+    Returns:
+        (kimlik, birlesik skor) listesi, azalan.
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(
+        scores.items(), key=lambda item: item[1], reverse=True,
+    )
+
+
+class BM25Index:
+    """Artimli BM25 ters indeksi.
+
+    Her terim icin belge -> frekans postings
+    listesi tutar; sorgu yalnizca sorgu
+    terimlerinin listelerini dolasir, toplam
+    metin boyutuna bagli degildir. Belgeler
+    tek tek eklenip cikarilabilir.
+
+    Govdeleme acikken govde uzunlugundan kisa
+    sorgu terimleri (ornegin "serv") kelime
+    dagarcigindaki iceren kelimelerin
+    govdelerine genisletilir; eski alt metin
+    eslesmesi boylece korunur.
+
+    Attributes:
+        _postings: Terim -> {belge: frekans}.
+        _docs: Belge -> (frekanslar, uzunluk, metin, veri).
+        _words: Tam kelime -> belge sayisi (govdelemede).
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        turkish: bool = True,
+        prefix_len: int = 0,
+    ) -> None:
+        """Indeksi baslatir.
+
+        Args:
+            k1: Terim frekansi doygunlugu.
+            b: Uzunluk normalizasyonu.
+            turkish: Turkce normalizasyon.
+            prefix_len: Govde uzunlugu (0: kapali).
+        """
+        self._k1 = k1
+        self._b = b
+        self._turkish = turkish
+        self._prefix_len = prefix_len
+        self._postings: dict[str, dict[str, int]] = {}
+        self._words: dict[str, int] = {}
+        self._docs: dict[
+            str, tuple[dict[str, int], int, str, dict[str, Any]]
+        ] = {}
+        self._total_len = 0
+        self._queries = 0
+
+    def _terms(self, text: str) -> list[str]:
+        """Metni indeks terimlerine ayirir.
+
+        Args:
+            text: Metin.
+
+        Returns:
+            Terimler.
+        """
+        return tokenize(text, self._turkish, self._prefix_len)
+
+    def _track_words(self, text: str, delta: int) -> None:
+        """Kisa terim genisletmesi icin kelime dagarcigini gunceller.
+
+        Args:
+            text: Belge metni.
+            delta: +1 ekleme, -1 cikarma.
+        """
+        if self._prefix_len <= 0:
+            return
+        words = self._words
+        for word in set(tokenize(text, self._turkish)):
+            count = words.get(word, 0) + delta
+            if count > 0:
+                words[word] = count
+            else:
+                words.pop(word, None)
+
+    def _expand(self, term: str) -> set[str]:
+        """Sorgu terimini indeks terimlerine genisletir.
+
+        Args:
+            term: Sorgu terimi.
+
+        Returns:
+            Aranacak indeks terimleri.
+        """
+        prefix_len = self._prefix_len
+        if prefix_len <= 0 or len(term) >= prefix_len:
+            return {term}
+        return {
+            word[:prefix_len] for word in self._words if term in word
+        }
+
+    def add(
+        self,
+        doc_id: str,
+        text: str,
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        """Belge ekler (varsa degistirir).
+
+        Args:
+            doc_id: Belge kimligi.
+            text: Metin.
+            payload: Eslik eden veri.
+        """
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        freqs: dict[str, int] = {}
+        for term in self._terms(text):
+            freqs[term] = freqs.get(term, 0) + 1
+        for term, tf in freqs.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        length = sum(freqs.values())
+        self._docs[doc_id] = (freqs, length, text, payload or {})
+        self._total_len += length
+        self._track_words(text, 1)
+
+    def remove(self, doc_id: str) -> bool:
+        """Belgeyi cikarir.
+
+        Args:
+            doc_id: Belge kimligi.
+
+        Returns:
+            Bulunduysa True.
+        """
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return False
+        freqs, length = doc[0], doc[1]
+        for term in freqs:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+        self._total_len -= length
+        self._track_words(doc[2], -1)
+        return True
+
+    def remove_where(
+        self,
+        predicate: Callable[[dict[str, Any]], bool],
+    ) -> int:
+        """Verisi kosulu saglayan belgeleri cikarir.
+
+        Args:
+            predicate: Veri alan kosul.
+
+        Returns:
+            Cikarilan belge sayisi.
+        """
+        doomed = [
+            doc_id
+            for doc_id, (_, _, _, payload) in self._docs.items()
+            if predicate(payload)
+        ]
+        for doc_id in doomed:
+            self.remove(doc_id)
+        return len(doomed)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        predicate: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[tuple[str, float]]:
+        """BM25 ile arar.
+
+        Args:
+            query: Sorgu.
+            limit: Maks sonuc.
+            predicate: Veri filtresi.
+
+        Returns:
+            (belge, skor) listesi, azalan.
+        """
+        self._queries += 1
+        count = len(self._docs)
+        if not count or limit <= 0:
+            return []
+        avg_len = self._total_len / count or 1.0
+        k1, b = self._k1, self._b
+        docs = self._docs
+        scores: dict[str, float] = {}
+
+        terms: set[str] = set()
+        for term in self._terms(query):
+            terms |= self._expand(term)
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings.items():
+                norm = k1 * (1 - b + b * docs[doc_id][1] / avg_len)
+                scores[doc_id] = scores.get(doc_id, 0.0) + (
+                    idf * tf * (k1 + 1) / (tf + norm)
+                )
+
+        if predicate is not None:
+            scores = {
+                doc_id: score
+                for doc_id, score in scores.items()
+                if predicate(docs[doc_id][3])
+            }
+        return heapq.nlargest(
+            limit, scores.items(), key=lambda item: item[1],
+        )
+
+    def get(self, doc_id: str) -> tuple[str, dict[str, Any]] | None:
+        """Belgenin metni ve verisi.
+
+        Args:
+            doc_id: Belge kimligi.
+
+        Returns:
+            (metin, veri) veya None.
+        """
+        doc = self._docs.get(doc_id)
+        if doc is None:
+            return None
+        return doc[2], doc[3]
+
+    def clear(self) -> None:
+        """Indeksi bosaltir."""
+        self._postings.clear()
+        self._docs.clear()
+        self._words.clear()
+        self._total_len = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Istatistik getirir.
+
+        Returns:
+            Belge, terim ve sorgu sayilari.
+        """
+        count = len(self._docs)
+        return {
+            "documents": count,
+            "terms": len(self._postings),
+            "avg_doc_len": round(self._total_len / max(1, count), 2),
+            "queries": self._queries,
+        }
+
+    def __len__(self) -> int:
+        """Belge sayisi."""
+        return len(self._docs)
+
+    def __contains__(self, doc_id: object) -> bool:
+        """Belge indekste mi."""
+        return doc_id in self._docs
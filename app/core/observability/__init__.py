@@ -12,6 +12,10 @@ from app.core.observability.dashboard_builder import (
 from app.core.observability.health_checker import (
     HealthChecker,
 )
+from app.core.observability.histogram import (
+    BucketHistogram,
+    TDigest,
+)
 from app.core.observability.metrics_collector import (
     MetricsCollector,
 )
@@ -31,11 +35,13 @@ from app.core.observability.trace_manager import (
 __all__ = [
     "AlertManager",
     "AnomalyDetector",
+    "BucketHistogram",
     "DashboardBuilder",
     "HealthChecker",
     "MetricsCollector",
     "ObservabilityOrchestrator",
     "SLAMonitor",
     "SpanCollector",
+    "TDigest",
     "TraceManager",
 ]
@@ -0,0 +1,554 @@
+"""ATLAS Akan Histogram modulu.
+
+Sabit bellekli kovali (Prometheus tarzi)
+histogram ve birlestirilebilir t-digest
+ile yuzdelik tahmini.
+"""
+
+import bisect
+import logging
+import math
+from collections.abc import Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Prometheus istemcilerinin varsayilan kova sinirlari
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+    0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class StreamingHistogram:
+    """Akan histogram tabani.
+
+    Ornekleri saklamadan sayi, toplam,
+    min ve max tutar; yuzdelikleri alt
+    siniflar tahmin eder.
+
+    Attributes:
+        count: Gozlem sayisi.
+        total: Gozlem toplami.
+        min: En kucuk gozlem.
+        max: En buyuk gozlem.
+    """
+
+    kind = ""
+
+    def __init__(self) -> None:
+        """Bos histogram olusturur."""
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float) -> None:
+        """Gozlem ekler.
+
+        Args:
+            value: Gozlem degeri.
+        """
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        """Baska histogrami birlestirir.
+
+        Args:
+            other: Ayni turden histogram.
+        """
+        if type(other) is not type(self):
+            raise TypeError(
+                f"{self.kind} histograma "
+                f"{other.kind} birlestirilemez",
+            )
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Yuzdelik tahmini.
+
+        Args:
+            q: 0-1 arasi oran.
+
+        Returns:
+            Tahmini deger.
+        """
+        raise NotImplementedError
+
+    def cumulative_counts(
+        self,
+        bounds: Sequence[float],
+    ) -> list[int]:
+        """Her sinira kadar (dahil) gozlem sayisi.
+
+        Args:
+            bounds: Artan kova sinirlari.
+
+        Returns:
+            Kumulatif sayilar.
+        """
+        raise NotImplementedError
+
+    def summary(self) -> dict[str, Any]:
+        """Ozet istatistikler.
+
+        Returns:
+            Sayi, toplam, min/max, ortalama, yuzdelikler.
+        """
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Aktarilabilir durum.
+
+        Returns:
+            JSON uyumlu sozluk.
+        """
+        return {
+            "kind": self.kind,
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    def _load_common(self, state: dict[str, Any]) -> None:
+        """Ortak alanlari yukler.
+
+        Args:
+            state: to_dict ciktisi.
+        """
+        self.count = state["count"]
+        self.total = state["sum"]
+        if state["count"]:
+            self.min = state["min"]
+            self.max = state["max"]
+
+
+class BucketHistogram(StreamingHistogram):
+    """Kovali histogram.
+
+    Prometheus ``le`` semantigiyle sabit
+    sinirli kovalarda sayim tutar. Bellek
+    kova sayisiyla sinirlidir; yuzdelikler
+    kova icinde dogrusal ara degerle bulunur.
+
+    Attributes:
+        bounds: Artan kova ust sinirlari.
+        counts: Kova basina sayi (son kova +Inf).
+    """
+
+    kind = "bucket"
+
+    def __init__(
+        self,
+        bounds: Sequence[float] | None = None,
+    ) -> None:
+        """Kovali histogram olusturur.
+
+        Args:
+            bounds: Kova sinirlari (varsayilan Prometheus).
+        """
+        super().__init__()
+        self.bounds = tuple(
+            sorted(set(bounds or DEFAULT_BUCKETS)),
+        )
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Gozlem ekler.
+
+        Args:
+            value: Gozlem degeri.
+        """
+        super().observe(value)
+        self.counts[
+            bisect.bisect_left(self.bounds, value)
+        ] += 1
+
+    def merge(self, other: StreamingHistogram) -> None:
+        """Ayni sinirli histogrami birlestirir.
+
+        Args:
+            other: Kovali histogram.
+        """
+        super().merge(other)
+        if other.bounds != self.bounds:  # type: ignore[attr-defined]
+            raise ValueError("Kova sinirlari farkli")
+        for i, c in enumerate(other.counts):  # type: ignore[attr-defined]
+            self.counts[i] += c
+
+    def quantile(self, q: float) -> float:
+        """Kova ici dogrusal yuzdelik.
+
+        Args:
+            q: 0-1 arasi oran.
+
+        Returns:
+            Tahmini deger.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if not c or seen + c < rank:
+                seen += c
+                continue
+            lower = self.bounds[i - 1] if i > 0 else self.min
+            upper = (
+                self.bounds[i] if i < len(self.bounds)
+                else self.max
+            )
+            lower = max(lower, self.min)
+            upper = min(upper, self.max)
+            return lower + (upper - lower) * (
+                (rank - seen) / c
+            )
+        return self.max
+
+    def cumulative_counts(
+        self,
+        bounds: Sequence[float],
+    ) -> list[int]:
+        """Her sinira kadar (dahil) gozlem sayisi.
+
+        Args:
+            bounds: Artan kova sinirlari.
+
+        Returns:
+            Kumulatif sayilar.
+        """
+        if tuple(bounds) != self.bounds:
+            raise ValueError("Kova sinirlari farkli")
+        result = []
+        running = 0
+        for c in self.counts[:-1]:
+            running += c
+            result.append(running)
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """Aktarilabilir durum.
+
+        Returns:
+            JSON uyumlu sozluk.
+        """
+        state = super().to_dict()
+        state["bounds"] = list(self.bounds)
+        state["counts"] = list(self.counts)
+        return state
+
+    @classmethod
+    def from_dict(
+        cls,
+        state: dict[str, Any],
+    ) -> "BucketHistogram":
+        """Durumdan histogram olusturur.
+
+        Args:
+            state: to_dict ciktisi.
+
+        Returns:
+            Histogram.
+        """
+        hist = cls(state["bounds"])
+        hist._load_common(state)
+        hist.counts = list(state["counts"])
+        return hist
+
+
+class TDigest(StreamingHistogram):
+    """Birlestirilebilir t-digest.
+
+    Gozlemler tampona eklenir; tampon
+    doldugunda agirlikli merkezlerle
+    siralanip k1 olcek fonksiyonuna gore
+    sikistirilir. Merkez sayisi
+    ``compression`` ile sinirlidir ve
+    kuyruklarda (p99 gibi) daha ince
+    cozunurluk saglar.
+
+    Attributes:
+        compression: Sikistirma parametresi (delta).
+        means: Merkez ortalamalari (artan).
+        weights: Merkez agirliklari.
+    """
+
+    kind = "tdigest"
+
+    def __init__(
+        self,
+        compression: float = 100.0,
+    ) -> None:
+        """T-digest olusturur.
+
+        Args:
+            compression: Sikistirma parametresi.
+        """
+        if compression <= 0:
+            raise ValueError(
+                "compression pozitif olmali",
+            )
+        super().__init__()
+        self.compression = float(compression)
+        self.means: list[float] = []
+        self.weights: list[float] = []
+        self._buffer: list[float] = []
+        self._buffer_size = max(
+            32, int(compression * 5),
+        )
+
+    def observe(self, value: float) -> None:
+        """Gozlem ekler (amortize O(1)).
+
+        Args:
+            value: Gozlem degeri.
+        """
+        super().observe(value)
+        self._buffer.append(value)
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def merge(self, other: StreamingHistogram) -> None:
+        """Baska t-digest'i birlestirir.
+
+        Args:
+            other: T-digest.
+        """
+        super().merge(other)
+        self._compress(
+            list(zip(
+                other.means,  # type: ignore[attr-defined]
+                other.weights,  # type: ignore[attr-defined]
+                strict=True,
+            ))
+            + [
+                (v, 1.0)
+                for v in other._buffer  # type: ignore[attr-defined]
+            ],
+        )
+
+    def _k_limit(self, q: float) -> float:
+        """Sonraki merkezin ust oran siniri.
+
+        Args:
+            q: Birikmis agirlik orani.
+
+        Returns:
+            Bir k adimi sonraki oran.
+        """
+        scale = self.compression / (2 * math.pi)
+        k = scale * math.asin(2 * q - 1) + 1
+        if k / scale >= math.pi / 2:
+            return 1.0
+        return (math.sin(k / scale) + 1) / 2
+
+    def _compress(
+        self,
+        extra: list[tuple[float, float]] | None = None,
+    ) -> None:
+        """Tampon ve merkezleri sikistirir.
+
+        Args:
+            extra: Eklenecek agirlikli merkezler.
+        """
+        items = list(zip(self.means, self.weights, strict=True))
+        items.extend((v, 1.0) for v in self._buffer)
+        if extra:
+            items.extend(extra)
+        self._buffer = []
+        if not items:
+            return
+        items.sort(key=lambda item: item[0])
+        total = sum(w for _, w in items)
+
+        means: list[float] = []
+        weights: list[float] = []
+        cur_mean, cur_weight = items[0]
+        done = 0.0
+        limit = total * self._k_limit(0.0)
+        for mean, weight in items[1:]:
+            if done + cur_weight + weight <= limit:
+                cur_weight += weight
+                cur_mean += (mean - cur_mean) * (
+                    weight / cur_weight
+                )
+                continue
+            means.append(cur_mean)
+            weights.append(cur_weight)
+            done += cur_weight
+            limit = total * self._k_limit(
+                min(done / total, 1.0),
+            )
+            cur_mean, cur_weight = mean, weight
+        means.append(cur_mean)
+        weights.append(cur_weight)
+        self.means = means
+        self.weights = weights
+
+    def quantile(self, q: float) -> float:
+        """Merkezler arasi dogrusal yuzdelik.
+
+        Args:
+            q: 0-1 arasi oran.
+
+        Returns:
+            Tahmini deger.
+        """
+        if not self.count:
+            return 0.0
+        if self._buffer:
+            self._compress()
+        q = min(max(q, 0.0), 1.0)
+        means, weights = self.means, self.weights
+        target = q * self.count
+
+        # Merkez i, kumulatif agirlikta orta noktasini temsil eder
+        cum = weights[0] / 2
+        if target <= cum:
+            if weights[0] <= 1:
+                return means[0]
+            return self.min + (means[0] - self.min) * (
+                target / cum
+            )
+        for i in range(1, len(means)):
+            step = (weights[i - 1] + weights[i]) / 2
+            if target <= cum + step:
+                return means[i - 1] + (
+                    means[i] - means[i - 1]
+                ) * ((target - cum) / step)
+            cum += step
+        tail = self.count - cum
+        if weights[-1] <= 1 or tail <= 0:
+            return means[-1]
+        return means[-1] + (self.max - means[-1]) * min(
+            (target - cum) / tail, 1.0,
+        )
+
+    def cumulative_counts(
+        self,
+        bounds: Sequence[float],
+    ) -> list[int]:
+        """Her sinira kadar (dahil) tahmini sayi.
+
+        Args:
+            bounds: Artan kova sinirlari.
+
+        Returns:
+            Kumulatif sayilar.
+        """
+        if self._buffer:
+            self._compress()
+        return [self._rank(b) for b in bounds]
+
+    def _rank(self, x: float) -> int:
+        """x'e esit/kucuk tahmini gozlem sayisi.
+
+        Args:
+            x: Sinir.
+
+        Returns:
+            Sayi.
+        """
+        if not self.count or x < self.min:
+            return 0
+        if x >= self.max:
+            return self.count
+        means, weights = self.means, self.weights
+        cum = 0.0
+        prev_mean, prev_mid = self.min, 0.0
+        for mean, weight in zip(means, weights, strict=True):
+            if weight <= 1 and mean <= x:
+                cum += weight
+                prev_mean, prev_mid = mean, cum
+                continue
+            mid = cum + weight / 2
+            if x < mean:
+                span = mean - prev_mean
+                frac = (x - prev_mean) / span if span > 0 else 1.0
+                return int(round(
+                    prev_mid + (mid - prev_mid) * frac,
+                ))
+            cum += weight
+            prev_mean, prev_mid = mean, mid
+        return int(round(cum))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Aktarilabilir durum.
+
+        Returns:
+            JSON uyumlu sozluk.
+        """
+        if self._buffer:
+            self._compress()
+        state = super().to_dict()
+        state["compression"] = self.compression
+        state["means"] = list(self.means)
+        state["weights"] = list(self.weights)
+        return state
+
+    @classmethod
+    def from_dict(
+        cls,
+        state: dict[str, Any],
+    ) -> "TDigest":
+        """Durumdan t-digest olusturur.
+
+        Args:
+            state: to_dict ciktisi.
+
+        Returns:
+            T-digest.
+        """
+        digest = cls(state["compression"])
+        digest._load_common(state)
+        digest.means = list(state["means"])
+        digest.weights = list(state["weights"])
+        return digest
+
+    @property
+    def centroid_count(self) -> int:
+        """Merkez sayisi (tampon haric)."""
+        return len(self.means)
+
+
+HISTOGRAM_TYPES: dict[str, type[StreamingHistogram]] = {
+    BucketHistogram.kind: BucketHistogram,
+    TDigest.kind: TDigest,
+}
+
+
+def histogram_from_dict(
+    state: dict[str, Any],
+) -> StreamingHistogram:
+    """Durumdan uygun histogrami olusturur.
+
+    Args:
+        state: to_dict ciktisi.
+
+    Returns:
+        Histogram.
+    """
+    cls = HISTOGRAM_TYPES.get(state.get("kind", ""))
+    if cls is None:
+        raise ValueError(
+            f"Bilinmeyen histogram turu: {state.get('kind')}",
+        )
+    return cls.from_dict(state)  # type: ignore[attr-defined]
@@ -6,10 +6,19 @@ etiketleme ve disa aktarma.
 """
 
 import logging
-import math
 import time
+from collections.abc import Sequence
 from typing import Any
 
+from app.core.observability.histogram import (
+    DEFAULT_BUCKETS,
+    HISTOGRAM_TYPES,
+    BucketHistogram,
+    StreamingHistogram,
+    TDigest,
+    histogram_from_dict,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,15 +26,44 @@ class MetricsCollector:
     """Metrik toplayici.
 
     Cesitli metrikleri toplar ve raporlar.
+    Histogramlar ornek saklamaz; metrik
+    basina kovali histogram veya t-digest
+    secilir ve sabit bellekte tutulur.
 
     Attributes:
         _counters: Sayac metrikleri.
         _gauges: Gosterge metrikleri.
         _histograms: Histogram metrikleri.
+        _histogram_config: Metrik adi -> histogram ayari.
     """
 
-    def __init__(self) -> None:
-        """Metrik toplayiciyi baslatir."""
+    def __init__(
+        self,
+        histogram_type: str = TDigest.kind,
+        buckets: Sequence[float] | None = None,
+        compression: float = 100.0,
+    ) -> None:
+        """Metrik toplayiciyi baslatir.
+
+        Args:
+            histogram_type: Varsayilan histogram turu.
+            buckets: Varsayilan kova sinirlari.
+            compression: Varsayilan t-digest sikistirmasi.
+        """
+        if histogram_type not in HISTOGRAM_TYPES:
+            raise ValueError(
+                f"Bilinmeyen histogram turu: {histogram_type}",
+            )
+        self._default_histogram = {
+            "type": histogram_type,
+            "buckets": tuple(sorted(set(
+                buckets or DEFAULT_BUCKETS,
+            ))),
+            "compression": compression,
+        }
+        self._histogram_config: dict[
+            str, dict[str, Any]
+        ] = {}
         self._counters: dict[
             str, dict[str, Any]
         ] = {}
@@ -131,6 +169,80 @@ class MetricsCollector:
         gauge = self._gauges.get(key)
         return gauge["value"] if gauge else None
 
+    def configure_histogram(
+        self,
+        name: str,
+        histogram_type: str = BucketHistogram.kind,
+        buckets: Sequence[float] | None = None,
+        compression: float | None = None,
+    ) -> None:
+        """Metrik icin histogram turunu secer.
+
+        Yalnizca sonradan olusturulan
+        histogramlari etkiler.
+
+        Args:
+            name: Metrik adi.
+            histogram_type: bucket veya tdigest.
+            buckets: Kova sinirlari.
+            compression: T-digest sikistirmasi.
+        """
+        if histogram_type not in HISTOGRAM_TYPES:
+            raise ValueError(
+                f"Bilinmeyen histogram turu: {histogram_type}",
+            )
+        default = self._default_histogram
+        self._histogram_config[name] = {
+            "type": histogram_type,
+            "buckets": (
+                tuple(sorted(set(buckets)))
+                if buckets else default["buckets"]
+            ),
+            "compression": (
+                compression if compression is not None
+                else default["compression"]
+            ),
+        }
+
+    def _new_histogram(
+        self,
+        name: str,
+    ) -> StreamingHistogram:
+        """Metrik ayarina gore histogram olusturur.
+
+        Args:
+            name: Metrik adi.
+
+        Returns:
+            Bos histogram.
+        """
+        config = self._histogram_config.get(
+            name, self._default_histogram,
+        )
+        if config["type"] == BucketHistogram.kind:
+            return BucketHistogram(config["buckets"])
+        return TDigest(config["compression"])
+
+    def _bucket_bounds(
+        self,
+        name: str,
+        hist: StreamingHistogram,
+    ) -> tuple[float, ...]:
+        """Disa aktarim kova sinirlari.
+
+        Args:
+            name: Metrik adi.
+            hist: Histogram.
+
+        Returns:
+            Sinirlar.
+        """
+        if isinstance(hist, BucketHistogram):
+            return hist.bounds
+        return self._histogram_config.get(
+            name, self._default_histogram,
+        )["buckets"]
+
     def observe(
         self,
         name: str,
@@ -145,17 +257,16 @@ class MetricsCollector:
             labels: Etiketler.
         """
         key = self._make_key(name, labels)
-        if key not in self._histograms:
-            self._histograms[key] = {
+        entry = self._histograms.get(key)
+        if entry is None:
+            entry = self._histograms[key] = {
                 "name": name,
-                "values": [],
+                "histogram": self._new_histogram(name),
                 "labels": labels or {},
                 "created_at": time.time(),
             }
-        self._histograms[key]["values"].append(value)
-        self._histograms[key]["updated_at"] = (
-            time.time()
-        )
+        entry["histogram"].observe(value)
+        entry["updated_at"] = time.time()
 
     def get_histogram(
         self,
@@ -172,32 +283,111 @@ class MetricsCollector:
             Istatistikler veya None.
         """
         key = self._make_key(name, labels)
-        hist = self._histograms.get(key)
-        if not hist or not hist["values"]:
+        entry = self._histograms.get(key)
+        if not entry or not entry["histogram"].count:
             return None
 
-        values = hist["values"]
-        sorted_vals = sorted(values)
-        n = len(values)
-
+        hist = entry["histogram"]
         return {
             "name": name,
-            "count": n,
-            "sum": sum(values),
-            "min": sorted_vals[0],
-            "max": sorted_vals[-1],
-            "mean": sum(values) / n,
-            "p50": self._percentile(
-                sorted_vals, 50,
-            ),
-            "p95": self._percentile(
-                sorted_vals, 95,
-            ),
-            "p99": self._percentile(
-                sorted_vals, 99,
-            ),
+            "type": hist.kind,
+            **hist.summary(),
         }
 
+    def merge(
+        self,
+        other: "MetricsCollector",
+    ) -> dict[str, int]:
+        """Baska toplayicinin metriklerini birlestirir.
+
+        Sayaclar toplanir, gostergelerde en
+        son guncellenen kazanir, histogramlar
+        durumlari uzerinden birlestirilir.
+
+        Args:
+            other: Diger toplayici (or. is parcacigi).
+
+        Returns:
+            Birlestirilen sayilar.
+        """
+        for key, c in other._counters.items():
+            mine = self._counters.get(key)
+            if mine is None:
+                self._counters[key] = dict(c)
+            else:
+                mine["value"] += c["value"]
+                mine["updated_at"] = max(
+                    mine.get("updated_at", 0),
+                    c.get("updated_at", 0),
+                )
+
+        for key, g in other._gauges.items():
+            mine = self._gauges.get(key)
+            if (
+                mine is None
+                or g["updated_at"] >= mine["updated_at"]
+            ):
+                self._gauges[key] = dict(g)
+
+        for _, h in other._histograms.items():
+            self.merge_histogram(
+                h["name"], h["histogram"].to_dict(),
+                h["labels"],
+            )
+
+        return {
+            "counters": len(other._counters),
+            "gauges": len(other._gauges),
+            "histograms": len(other._histograms),
+        }
+
+    def merge_histogram(
+        self,
+        name: str,
+        state: dict[str, Any],
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Aktarilan histogram durumunu birlestirir.
+
+        Args:
+            name: Metrik adi.
+            state: Histogramin to_dict ciktisi.
+            labels: Etiketler.
+        """
+        incoming = histogram_from_dict(state)
+        key = self._make_key(name, labels)
+        entry = self._histograms.get(key)
+        if entry is None:
+            self._histograms[key] = {
+                "name": name,
+                "histogram": incoming,
+                "labels": labels or {},
+                "created_at": time.time(),
+                "updated_at": time.time(),
+            }
+            return
+        entry["histogram"].merge(incoming)
+        entry["updated_at"] = time.time()
+
+    def get_histogram_state(
+        self,
+        name: str,
+        labels: dict[str, str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Histogramin aktarilabilir durumunu getirir.
+
+        Args:
+            name: Metrik adi.
+            labels: Etiketler.
+
+        Returns:
+            Durum veya None.
+        """
+        entry = self._histograms.get(
+            self._make_key(name, labels),
+        )
+        return entry["histogram"].to_dict() if entry else None
+
     def set_custom(
         self,
         name: str,
@@ -261,13 +451,11 @@ class MetricsCollector:
             )
 
         for key, h in self._histograms.items():
-            if h["values"]:
+            hist = h["histogram"]
+            if hist.count:
                 report["histograms"][h["name"]] = {
-                    "count": len(h["values"]),
-                    "mean": (
-                        sum(h["values"])
-                        / len(h["values"])
-                    ),
+                    "count": hist.count,
+                    "mean": hist.total / hist.count,
                 }
 
         for name, c in self._custom.items():
@@ -302,6 +490,40 @@ class MetricsCollector:
                 f'{g["value"]}'
             )
 
+        typed: set[str] = set()
+        entries = sorted(
+            self._histograms.items(),
+            key=lambda item: item[1]["name"],
+        )
+        for _, h in entries:
+            hist = h["histogram"]
+            if not hist.count:
+                continue
+            name = h["name"]
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            bounds = self._bucket_bounds(name, hist)
+            cumulative = hist.cumulative_counts(bounds)
+            for bound, count in zip(bounds, cumulative, strict=True):
+                lines.append(
+                    f"{name}_bucket"
+                    f"{self._format_labels(h['labels'], le=bound)}"
+                    f" {count}"
+                )
+            lines.append(
+                f"{name}_bucket"
+                f"{self._format_labels(h['labels'], le='+Inf')}"
+                f" {hist.count}"
+            )
+            label_str = self._format_labels(h["labels"])
+            lines.append(
+                f"{name}_sum{label_str} {hist.total}"
+            )
+            lines.append(
+                f"{name}_count{label_str} {hist.count}"
+            )
+
         return "\n".join(lines)
 
     def reset(self) -> dict[str, int]:
@@ -346,49 +568,27 @@ class MetricsCollector:
     def _format_labels(
         self,
         labels: dict[str, str],
+        le: float | str | None = None,
     ) -> str:
         """Etiket formatlar.
 
         Args:
             labels: Etiketler.
+            le: Histogram kova siniri.
 
         Returns:
             Formatlanmis etiket.
         """
-        if not labels:
-            return ""
         parts = [
             f'{k}="{v}"'
             for k, v in sorted(labels.items())
         ]
+        if le is not None:
+            parts.append(f'le="{le}"')
+        if not parts:
+            return ""
         return "{" + ",".join(parts) + "}"
 
-    def _percentile(
-        self,
-        sorted_vals: list[float],
-        pct: float,
-    ) -> float:
-        """Yuzdelik deger hesaplar.
-
-        Args:
-            sorted_vals: Siralanmis degerler.
-            pct: Yuzdelik.
-
-        Returns:
-            Yuzdelik degeri.
-        """
-        n = len(sorted_vals)
-        if n == 0:
-            return 0.0
-        idx = (pct / 100.0) * (n - 1)
-        lower = int(math.floor(idx))
-        upper = min(lower + 1, n - 1)
-        frac = idx - lower
-        return (
-            sorted_vals[lower] * (1 - frac)
-            + sorted_vals[upper] * frac
-        )
-
     @property
     def counter_count(self) -> int:
         """Sayac sayisi."""
@@ -0,0 +1,198 @@
+"""ATLAS Parcali Akis modulu.
+
+Satir akisini sinirli parcalara bolme,
+asamalar arasi geri basincli on-okuma,
+akis istatistikleri ve bellek olcumu.
+"""
+
+import logging
+import queue
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+Row = dict[str, Any]
+Chunk = list[Row]
+
+# Ureticinin bitisini bildiren isaret
+_DONE = object()
+
+
+def iter_chunks(
+    rows: Iterable[Row],
+    chunk_size: int,
+) -> Iterator[Chunk]:
+    """Satirlari sabit boyutlu parcalara boler.
+
+    Args:
+        rows: Satirlar (liste veya uretec).
+        chunk_size: Parca boyutu.
+
+    Yields:
+        En fazla ``chunk_size`` satirlik parcalar.
+    """
+    size = max(1, chunk_size)
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bounded_prefetch(
+    chunks: Iterable[Chunk],
+    depth: int,
+) -> Iterator[Chunk]:
+    """Parcalari arka planda en fazla ``depth`` kadar on-okur.
+
+    Uretici ayri is parcaciginda calisir; kuyruk
+    dolunca bekler (geri basinc). Tuketici erken
+    birakirsa uretici durdurulur.
+
+    Args:
+        chunks: Kaynak parcalar.
+        depth: Kuyruk kapasitesi (parca).
+
+    Yields:
+        Kaynak sirasiyla parcalar.
+
+    Raises:
+        Exception: Ureticide olusan hata tuketicide yeniden firlatilir.
+    """
+    buffer: queue.Queue[Any] = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for chunk in chunks:
+                if not _put(chunk):
+                    return
+        except BaseException as exc:  # noqa: BLE001
+            _put(exc)
+            return
+        _put(_DONE)
+
+    worker = threading.Thread(
+        target=_produce, name="chunk-prefetch", daemon=True,
+    )
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        worker.join(timeout=1.0)
+
+
+class StreamStats:
+    """Akis istatistikleri.
+
+    Asamadan gecen satir ve parca sayilarini,
+    en buyuk parcayi ve hizi tutar.
+
+    Attributes:
+        rows: Gecen satir sayisi.
+        chunks: Gecen parca sayisi.
+        max_chunk_rows: En buyuk parca.
+    """
+
+    def __init__(self) -> None:
+        """Istatistikleri baslatir."""
+        self.rows = 0
+        self.chunks = 0
+        self.max_chunk_rows = 0
+        self._started = time.perf_counter()
+
+    def track(
+        self,
+        chunks: Iterable[Chunk],
+    ) -> Iterator[Chunk]:
+        """Parcalari sayarak aynen gecirir.
+
+        Args:
+            chunks: Parcalar.
+
+        Yields:
+            Ayni parcalar.
+        """
+        for chunk in chunks:
+            size = len(chunk)
+            self.rows += size
+            self.chunks += 1
+            if size > self.max_chunk_rows:
+                self.max_chunk_rows = size
+            yield chunk
+
+    @property
+    def elapsed(self) -> float:
+        """Baslangictan beri gecen sure."""
+        return time.perf_counter() - self._started
+
+    def to_dict(self) -> dict[str, Any]:
+        """Sozluk olarak dondurur.
+
+        Returns:
+            Satir, parca, sure ve satir/saniye.
+        """
+        elapsed = self.elapsed
+        return {
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "max_chunk_rows": self.max_chunk_rows,
+            "duration": round(elapsed, 4),
+            "rows_per_sec": round(
+                self.rows / elapsed, 1,
+            ) if elapsed > 0 else 0.0,
+        }
+
+
+@contextmanager
+def peak_memory(enabled: bool = True) -> Iterator[dict[str, Any]]:
+    """Blok icindeki tepe Python bellek kullanimini olcer.
+
+    ``tracemalloc`` zaten aciksa yalnizca tepe
+    sifirlanir ve izleme acik birakilir.
+
+    Args:
+        enabled: Kapaliysa olcum yapilmaz.
+
+    Yields:
+        Cikista ``peak_memory_mb`` yazilan sozluk.
+    """
+    stats: dict[str, Any] = {}
+    if not enabled:
+        yield stats
+        return
+    owner = not tracemalloc.is_tracing()
+    if owner:
+        tracemalloc.start()
+    else:
+        tracemalloc.reset_peak()
+    try:
+        yield stats
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        stats["peak_memory_mb"] = round(peak / 1048576, 2)
+        if owner:
+            tracemalloc.stop()
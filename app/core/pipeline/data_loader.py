@@ -7,8 +7,10 @@ yukleme islemleri.
 
 import logging
 import time
+from collections.abc import Iterable
 from typing import Any
 
+from app.core.pipeline.chunk_stream import Chunk
 from app.models.pipeline import SourceType
 
 logger = logging.getLogger(__name__)
@@ -111,6 +113,61 @@ class DataLoader:
         )
         return result
 
+    def load_stream(
+        self,
+        target_name: str,
+        chunks: Iterable[Chunk],
+        mode: str = "append",
+    ) -> dict[str, Any]:
+        """Parca akisini hedefe yukler.
+
+        Parcalar geldikce yazilir ve birakilir;
+        tum veri bellekte tutulmaz. Gecmise tek
+        kayit yazilir.
+
+        Args:
+            target_name: Hedef adi.
+            chunks: Parcalar.
+            mode: Yukleme modu.
+
+        Returns:
+            Yukleme sonucu.
+        """
+        target = self._targets.get(target_name)
+        if not target or not target["enabled"]:
+            return {
+                "success": False,
+                "target": target_name,
+                "reason": "target_not_found",
+                "loaded": 0,
+            }
+
+        start = time.time()
+        loaded = 0
+        batches = 0
+        for chunk in chunks:
+            loaded += len(chunk)
+            batches += 1
+        duration = time.time() - start
+
+        result = {
+            "success": True,
+            "target": target_name,
+            "type": target["type"],
+            "mode": mode,
+            "loaded": loaded,
+            "batches": batches,
+            "streamed": True,
+            "duration": round(duration, 4),
+        }
+        self._loads.append(result)
+
+        logger.info(
+            "Akis yuklendi: %s (%d kayit, %d parca)",
+            target_name, loaded, batches,
+        )
+        return result
+
     def load_batch(
         self,
         target_name: str,
@@ -4,11 +4,24 @@ Sema esleme, veri temizleme, tur
 donusumu, gruplama ve zenginlestirme.
 """
 
+import contextlib
 import logging
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
+from app.core.pipeline.chunk_stream import Chunk, Row
+
 logger = logging.getLogger(__name__)
 
+RowOp = Callable[[Row], Row]
+
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "int": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+}
+
 
 class DataTransformer:
     """Veri donusturucu.
@@ -280,6 +293,198 @@ class DataTransformer:
         })
         return result
 
+    def fuse(
+        self,
+        steps: list[dict[str, Any]],
+    ) -> Callable[[Chunk], Chunk]:
+        """Satir bazli adimlari tek gecise birlestirir.
+
+        Adimlar: ``{"type": "mapping", "name": ...}``,
+        ``{"type": "clean", "rules": {...}}`` (veya
+        kayitli kural icin ``"name"``),
+        ``{"type": "convert_types", "type_map": {...}}``,
+        ``{"type": "enrich", "name": ...}``. Turu
+        olmayan (bos) adim etkisizdir. Her satir
+        tum adimlardan tek seferde gecer; satir en
+        fazla bir kez kopyalanir, sonraki adimlar bu
+        kopya uzerinde yerinde calisir.
+
+        Args:
+            steps: Adim tanimlari.
+
+        Returns:
+            Parca -> donusmus parca fonksiyonu.
+
+        Raises:
+            ValueError: Bilinmeyen adim turu.
+        """
+        ops: list[RowOp] = []
+        owned = False
+        for step in steps:
+            built = self._row_op(step)
+            if built is None:
+                continue
+            op, creates_row = built
+            if not creates_row and not owned:
+                # Kaynak satiri degistirmemek icin tek kopya
+                ops.append(dict)
+            owned = True
+            ops.append(op)
+
+        if not ops:
+            return lambda chunk: chunk
+        if len(ops) == 1:
+            single = ops[0]
+            return lambda chunk: [single(row) for row in chunk]
+
+        def _apply(chunk: Chunk) -> Chunk:
+            out: Chunk = []
+            append = out.append
+            for row in chunk:
+                for op in ops:
+                    row = op(row)
+                append(row)
+            return out
+
+        return _apply
+
+    def transform_stream(
+        self,
+        chunks: Iterable[Chunk],
+        steps: list[dict[str, Any]],
+    ) -> Iterator[Chunk]:
+        """Parca akisina birlesik donusum uygular.
+
+        Args:
+            chunks: Girdi parcalari.
+            steps: Adim tanimlari (bkz. ``fuse``).
+
+        Returns:
+            Donusmus parca ureteci.
+
+        Raises:
+            ValueError: Bilinmeyen adim turu (hemen).
+        """
+        return self._fused_stream(
+            chunks, self.fuse(steps), steps,
+        )
+
+    def _fused_stream(
+        self,
+        chunks: Iterable[Chunk],
+        apply: Callable[[Chunk], Chunk],
+        steps: list[dict[str, Any]],
+    ) -> Iterator[Chunk]:
+        """Birlesik donusumu parcalara uygular ve gecmise yazar."""
+        count = 0
+        try:
+            for chunk in chunks:
+                count += len(chunk)
+                yield apply(chunk)
+        finally:
+            self._transforms.append({
+                "type": "fused",
+                "steps": [st.get("type", "") for st in steps],
+                "input_count": count,
+                "output_count": count,
+                "streamed": True,
+            })
+
+    def _row_op(
+        self,
+        step: dict[str, Any],
+    ) -> tuple[RowOp, bool] | None:
+        """Adim icin satir fonksiyonu uretir.
+
+        Args:
+            step: Adim tanimi.
+
+        Returns:
+            (fonksiyon, yeni satir uretir mi) veya etkisizse None.
+
+        Raises:
+            ValueError: Bilinmeyen adim turu.
+        """
+        kind = step.get("type", "")
+        if not kind:
+            # Bos yapilandirma: dogrudan gecis
+            return None
+
+        if kind == "mapping":
+            mapping = self._mappings.get(step.get("name", ""))
+            if not mapping:
+                return None
+            pairs = tuple(mapping.items())
+
+            def _map(row: Row) -> Row:
+                return {
+                    dst: row[src]
+                    for src, dst in pairs
+                    if src in row
+                }
+
+            return _map, True
+
+        if kind == "clean":
+            rules = step.get("rules") or self._cleaners.get(
+                step.get("name", ""), {},
+            ).get("rules", {})
+            strip = rules.get("strip_whitespace", True)
+            remove_nulls = rules.get("remove_nulls", False)
+            lower = rules.get("lowercase_keys", False)
+
+            def _clean(row: Row) -> Row:
+                new_row: Row = {}
+                for key, val in row.items():
+                    if remove_nulls and val is None:
+                        continue
+                    if strip and isinstance(val, str):
+                        val = val.strip()
+                    new_row[key.lower() if lower else key] = val
+                return new_row
+
+            return _clean, True
+
+        if kind == "convert_types":
+            fields = tuple(
+                (field, _CONVERTERS[target])
+                for field, target in (
+                    step.get("type_map") or {}
+                ).items()
+                if target in _CONVERTERS
+            )
+            if not fields:
+                return None
+
+            def _convert(row: Row) -> Row:
+                for field, converter in fields:
+                    if field in row:
+                        with contextlib.suppress(ValueError, TypeError):
+                            row[field] = converter(row[field])
+                return row
+
+            return _convert, False
+
+        if kind == "enrich":
+            enrichment = self._enrichments.get(
+                step.get("name", ""),
+            )
+            if not enrichment:
+                return None
+            defaults = tuple(
+                enrichment.get("defaults", {}).items(),
+            )
+
+            def _enrich(row: Row) -> Row:
+                for key, val in defaults:
+                    if key not in row:
+                        row[key] = val
+                return row
+
+            return _enrich, False
+
+        raise ValueError(f"Bilinmeyen donusum adimi: {kind}")
+
     def add_enrichment(
         self,
         name: str,
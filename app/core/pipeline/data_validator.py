@@ -6,8 +6,10 @@ ve benzersizlik kontrolleri.
 """
 
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any
 
+from app.core.pipeline.chunk_stream import Chunk
 from app.models.pipeline import ValidationLevel
 
 logger = logging.getLogger(__name__)
@@ -264,13 +266,9 @@ class DataValidator:
             data[0].keys(),
         )
         total_cells = len(data) * len(check_fields)
-        filled = 0
-
-        for row in data:
-            for field in check_fields:
-                val = row.get(field)
-                if val is not None and val != "":
-                    filled += 1
+        filled = self._count_filled(
+            data, check_fields,
+        )
 
         completeness = round(
             filled / max(1, total_cells), 3,
@@ -285,6 +283,87 @@ class DataValidator:
         self._results.append(result)
         return result
 
+    def validate_stream(
+        self,
+        chunks: Iterable[Chunk],
+        fields: list[str] | None = None,
+        min_score: float = 0.0,
+        report: dict[str, Any] | None = None,
+    ) -> Iterator[Chunk]:
+        """Parca akisinda kalite kontrolu yapar.
+
+        Parcalar degistirilmeden gecer; doluluk
+        sayaclari artimsal tutulur. Bir parcanin
+        skoru ``min_score`` altina duserse akis
+        durdurulur ve ``report["valid"]`` False olur.
+
+        Args:
+            chunks: Parcalar.
+            fields: Kontrol edilecek alanlar
+                (bos ise ilk satirin alanlari).
+            min_score: Parca basina minimum skor.
+            report: Sonucun yazilacagi sozluk.
+
+        Yields:
+            Dogrulanan parcalar.
+        """
+        report = report if report is not None else {}
+        check_fields = list(fields or [])
+        rows = 0
+        filled = 0
+        report["valid"] = True
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                if not check_fields:
+                    check_fields = list(chunk[0].keys())
+                chunk_filled = self._count_filled(
+                    chunk, check_fields,
+                )
+                rows += len(chunk)
+                filled += chunk_filled
+                cells = len(chunk) * len(check_fields)
+                if chunk_filled / max(1, cells) < min_score:
+                    report["valid"] = False
+                    report["failed_at_row"] = rows - len(chunk)
+                    return
+                yield chunk
+        finally:
+            completeness = round(
+                filled / max(1, rows * len(check_fields)), 3,
+            )
+            report.update({
+                "total_rows": rows,
+                "total_fields": len(check_fields),
+                "completeness": completeness,
+                "score": completeness,
+            })
+            self._results.append({**report, "streamed": True})
+
+    def _count_filled(
+        self,
+        data: list[dict[str, Any]],
+        fields: list[str],
+    ) -> int:
+        """Dolu hucre sayisini bulur.
+
+        Args:
+            data: Veri.
+            fields: Alanlar.
+
+        Returns:
+            Bos olmayan hucre sayisi.
+        """
+        filled = 0
+        for row in data:
+            get = row.get
+            for field in fields:
+                val = get(field)
+                if val is not None and val != "":
+                    filled += 1
+        return filled
+
     def add_rule(
         self,
         name: str,
@@ -43,6 +43,9 @@ class PipelineBuilder:
         self._conditions: dict[
             str, dict[str, Any]
         ] = {}
+        self._configs: dict[
+            str, dict[str, Any]
+        ] = {}
 
         logger.info("PipelineBuilder baslatildi")
 
@@ -97,9 +100,38 @@ class PipelineBuilder:
         self._dependencies[pipeline_id][
             step.step_id
         ] = []
+        self._configs[step.step_id] = config or {}
 
         return step
 
+    def get_step_config(
+        self,
+        step_id: str,
+    ) -> dict[str, Any]:
+        """Adim yapilandirmasini getirir.
+
+        Args:
+            step_id: Adim ID.
+
+        Returns:
+            Yapilandirma (yoksa bos).
+        """
+        return self._configs.get(step_id, {})
+
+    def get_dependencies(
+        self,
+        pipeline_id: str,
+    ) -> dict[str, list[str]]:
+        """Adim bagimliliklarini getirir.
+
+        Args:
+            pipeline_id: Pipeline ID.
+
+        Returns:
+            Adim ID -> onceki adimlar.
+        """
+        return self._dependencies.get(pipeline_id, {})
+
     def chain_steps(
         self,
         pipeline_id: str,
@@ -283,7 +315,8 @@ class PipelineBuilder:
         """
         if pipeline_id in self._pipelines:
             del self._pipelines[pipeline_id]
-            self._steps.pop(pipeline_id, None)
+            for step in self._steps.pop(pipeline_id, []):
+                self._configs.pop(step.step_id, None)
             self._dependencies.pop(
                 pipeline_id, None,
             )
@@ -7,6 +7,7 @@ optimizasyonu ve analitik.
 
 import logging
 import time
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from app.models.pipeline import (
@@ -16,6 +17,13 @@ from app.models.pipeline import (
     StepType,
 )
 
+from app.core.pipeline.chunk_stream import (
+    Chunk,
+    StreamStats,
+    bounded_prefetch,
+    iter_chunks,
+    peak_memory,
+)
 from app.core.pipeline.data_extractor import (
     DataExtractor,
 )
@@ -66,6 +74,7 @@ class PipelineOrchestrator:
         default_batch: int = 100,
         retry_attempts: int = 3,
         lineage_retention: int = 90,
+        chunk_size: int = 10_000,
     ) -> None:
         """Orkestratoru baslatir.
 
@@ -74,6 +83,7 @@ class PipelineOrchestrator:
             default_batch: Varsayilan parti.
             retry_attempts: Yeniden deneme.
             lineage_retention: Soy saklama (gun).
+            chunk_size: Akis modunda parca boyutu.
         """
         self.extractor = DataExtractor()
         self.transformer = DataTransformer()
@@ -91,6 +101,7 @@ class PipelineOrchestrator:
         )
 
         self._max_parallel = max_parallel
+        self._chunk_size = chunk_size
         self._executions: list[dict[str, Any]] = []
 
         logger.info(
@@ -193,6 +204,400 @@ class PipelineOrchestrator:
         )
         return result
 
+    def run_etl_stream(
+        self,
+        source_name: str,
+        target_name: str,
+        mapping_name: str = "",
+        query: str = "",
+        validate: bool = True,
+        transforms: list[dict[str, Any]] | None = None,
+        rows: Iterable[dict[str, Any]] | None = None,
+        chunk_size: int = 0,
+        prefetch: int = 0,
+        limit: int = 0,
+        trace_memory: bool = False,
+    ) -> dict[str, Any]:
+        """ETL'i parca parca akis olarak calistirir.
+
+        Asamalar uretec zinciridir: yukleyici bir
+        parca istedikce onceki asamalar bir parca
+        uretir, boylece bellekte en fazla birkac
+        parca bulunur. Donusumler tek satir gecisinde
+        birlestirilir. ``run_etl`` ile ayni sonuc
+        alanlarini ve hiz/bellek bilgisini dondurur.
+
+        Args:
+            source_name: Kaynak adi (``rows`` verilirse etiket).
+            target_name: Hedef adi.
+            mapping_name: Esleme adi.
+            query: Sorgu.
+            validate: Parca bazli kalite kontrolu.
+            transforms: Ek donusum adimlari
+                (bkz. ``DataTransformer.fuse``).
+            rows: Kaynak yerine kullanilacak satirlar.
+            chunk_size: Parca boyutu (0 ise varsayilan).
+            prefetch: Kaynak icin on-okuma derinligi
+                (0 ise kapali).
+            limit: Kaynak limiti.
+            trace_memory: Tepe bellek olcumu.
+
+        Returns:
+            ETL sonucu.
+        """
+        size = chunk_size or self._chunk_size
+        if rows is not None:
+            source: Iterator[Chunk] | None = iter_chunks(
+                rows, size,
+            )
+        else:
+            source = self.extractor.extract_stream(
+                source_name, query, limit, size,
+            )
+        if source is None:
+            return {
+                "success": False,
+                "stage": "extract",
+                "reason": "source_not_found",
+            }
+
+        steps: list[dict[str, Any]] = []
+        if mapping_name:
+            steps.append({"type": "mapping", "name": mapping_name})
+        steps.extend(transforms or [])
+
+        stages: list[tuple[str, Any]] = [("extract", {})]
+        if steps:
+            stages.append(("transform", steps))
+        if validate:
+            stages.append(("validate", {"min_score": 0.5}))
+        stages.append(("load", {"target": target_name}))
+
+        start = time.time()
+        with peak_memory(trace_memory) as memory:
+            run = self._drive_stream(
+                source, stages, prefetch,
+            )
+        duration = time.time() - start
+
+        if not run["success"]:
+            return run
+
+        self.lineage.record(
+            source_name, target_name,
+            f"etl_stream:{mapping_name}",
+        )
+
+        load_result = run["load"]
+        result = {
+            "success": True,
+            "source": source_name,
+            "target": target_name,
+            "extracted": run["extracted"],
+            "loaded": load_result["loaded"],
+            "chunks": load_result["batches"],
+            "stages": run["stages"],
+            "rows_per_sec": round(
+                run["extracted"] / duration, 1,
+            ) if duration > 0 else 0.0,
+            "duration": round(duration, 4),
+            "streamed": True,
+            **memory,
+        }
+        self._executions.append(result)
+
+        logger.info(
+            "Akis ETL tamamlandi: %s -> %s (%d kayit)",
+            source_name, target_name,
+            load_result["loaded"],
+        )
+        return result
+
+    def _drive_stream(
+        self,
+        source: Iterator[Chunk],
+        stages: list[tuple[str, Any]],
+        prefetch: int = 0,
+    ) -> dict[str, Any]:
+        """Asama zincirini kurar ve yukleyiciyle tuketir.
+
+        Istatistik ve dogrulama raporlari asama
+        anahtariyla tutulur (bkz. ``_stage_keys``).
+        Yukleme atomik degildir: dogrulama akisi
+        durdurdugunda onceki parcalar hedefe
+        yazilmis olur; hata sonucu yuklenen satir
+        sayisini ve hedefi bildirir.
+
+        Args:
+            source: Kaynak parcalari.
+            stages: (asama, yapilandirma) listesi;
+                extract ile baslar, load ile biter.
+            prefetch: Kaynak on-okuma derinligi.
+
+        Returns:
+            Basari, asama istatistikleri ve yukleme sonucu.
+        """
+        stats: dict[str, StreamStats] = {}
+        validation: dict[str, dict[str, Any]] = {}
+        stream: Iterable[Chunk] = source
+        if prefetch > 0:
+            stream = bounded_prefetch(stream, prefetch)
+
+        load_cfg: dict[str, Any] | None = None
+        keys = self._stage_keys(stages)
+        for key, (name, cfg) in zip(keys, stages, strict=True):
+            if name == "transform":
+                try:
+                    stream = self.transformer.transform_stream(
+                        stream, cfg,
+                    )
+                except ValueError as exc:
+                    return {
+                        "success": False,
+                        "stage": "transform",
+                        "reason": str(exc),
+                    }
+            elif name == "validate":
+                validation[key] = {}
+                stream = self.validator.validate_stream(
+                    stream, cfg.get("fields"),
+                    cfg.get("min_score", 0.0), validation[key],
+                )
+            elif name == "load":
+                load_cfg = cfg
+                continue
+            stats[key] = StreamStats()
+            stream = stats[key].track(stream)
+
+        if load_cfg is not None:
+            load_result = self.loader.load_stream(
+                load_cfg.get("target", ""), stream,
+                load_cfg.get("mode", "append"),
+            )
+        else:
+            # Hedefsiz: akisi tuketip say
+            count = sum(len(chunk) for chunk in stream)
+            load_result = {
+                "success": True, "loaded": count,
+                "batches": stats["extract"].chunks,
+            }
+
+        if not load_result["success"]:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+            return {
+                "success": False,
+                "stage": "load",
+                "reason": load_result.get(
+                    "reason", "load_failed",
+                ),
+            }
+        for key, report in validation.items():
+            if report["valid"]:
+                continue
+            return {
+                "success": False,
+                "stage": "validate",
+                "stage_key": key,
+                "reason": "low_quality",
+                "score": report["score"],
+                "failed_at_row": report.get(
+                    "failed_at_row", 0,
+                ),
+                "stages": {
+                    key: st.to_dict()
+                    for key, st in stats.items()
+                },
+                "validation": validation,
+                # Kismi yukleme: geri alinmaz
+                "target": load_result.get("target", ""),
+                "loaded": load_result["loaded"],
+            }
+
+        return {
+            "success": True,
+            "extracted": stats["extract"].rows,
+            "stages": {
+                key: st.to_dict()
+                for key, st in stats.items()
+            },
+            "validation": validation,
+            "load": load_result,
+        }
+
+    @staticmethod
+    def _stage_keys(
+        stages: list[tuple[str, Any]],
+    ) -> list[str]:
+        """Asama anahtarlarini uretir.
+
+        Tekrar eden asamalar numaralanir
+        (``validate``, ``validate_2``, ...).
+
+        Args:
+            stages: (asama, yapilandirma) listesi.
+
+        Returns:
+            Asama basina anahtar.
+        """
+        seen: dict[str, int] = {}
+        keys: list[str] = []
+        for name, _ in stages:
+            seen[name] = seen.get(name, 0) + 1
+            keys.append(
+                name if seen[name] == 1
+                else f"{name}_{seen[name]}",
+            )
+        return keys
+
+    def run_pipeline_stream(
+        self,
+        pipeline_id: str,
+        rows: Iterable[dict[str, Any]] | None = None,
+        chunk_size: int = 0,
+        prefetch: int = 0,
+        trace_memory: bool = False,
+    ) -> dict[str, Any]:
+        """Dogrusal pipeline'i akis modunda calistirir.
+
+        Adim yapilandirmalari: extract ``source``,
+        ``query``, ``limit``; transform bir donusum
+        adimi (``type`` ...) veya ``steps`` listesi;
+        validate ``fields``, ``min_score``; load
+        ``target``, ``mode``. Ardisik transform
+        adimlari tek geciste birlestirilir. Dallanma
+        ve birlestirme akis modunda desteklenmez.
+
+        Args:
+            pipeline_id: Pipeline ID.
+            rows: Extract adimi yerine satirlar.
+            chunk_size: Parca boyutu (0 ise varsayilan).
+            prefetch: Kaynak on-okuma derinligi.
+            trace_memory: Tepe bellek olcumu.
+
+        Returns:
+            Calistirma sonucu.
+        """
+        pipeline = self.builder.get_pipeline(
+            pipeline_id,
+        )
+        if not pipeline:
+            return {
+                "success": False,
+                "reason": "pipeline_not_found",
+            }
+
+        by_id = {
+            step.step_id: step
+            for step in self.builder.get_steps(pipeline_id)
+        }
+        deps = self.builder.get_dependencies(pipeline_id)
+        ordered = [
+            by_id[sid]
+            for sid in self.builder.get_execution_order(
+                pipeline_id,
+            )
+            if sid in by_id
+        ]
+        unsupported = [
+            step.name for step in ordered
+            if step.step_type in (
+                StepType.BRANCH, StepType.MERGE,
+            )
+            or len(deps.get(step.step_id, [])) > 1
+        ]
+        if unsupported:
+            return {
+                "success": False,
+                "reason": "not_linear",
+                "steps": unsupported,
+            }
+
+        size = chunk_size or self._chunk_size
+        source: Iterator[Chunk] | None = None
+        if rows is not None:
+            source = iter_chunks(rows, size)
+        stages: list[tuple[str, Any]] = [("extract", {})]
+        # Adim ID -> asama sirasi
+        stage_of: dict[str, int] = {}
+        for step in ordered:
+            cfg = self.builder.get_step_config(step.step_id)
+            if step.step_type == StepType.EXTRACT:
+                stage_of[step.step_id] = 0
+                if source is None:
+                    source = self.extractor.extract_stream(
+                        cfg.get("source", ""),
+                        cfg.get("query", ""),
+                        cfg.get("limit", 0), size,
+                    )
+            elif step.step_type == StepType.TRANSFORM:
+                specs = cfg.get("steps") or [cfg]
+                if stages[-1][0] == "transform":
+                    stages[-1][1].extend(specs)
+                else:
+                    stages.append(("transform", list(specs)))
+                stage_of[step.step_id] = len(stages) - 1
+            elif step.step_type == StepType.VALIDATE:
+                stages.append(("validate", cfg))
+                stage_of[step.step_id] = len(stages) - 1
+            elif step.step_type == StepType.LOAD:
+                stages.append(("load", cfg))
+                stage_of[step.step_id] = len(stages) - 1
+                break
+        keys = self._stage_keys(stages)
+
+        if source is None:
+            return {
+                "success": False,
+                "reason": "source_not_found",
+            }
+
+        pipeline.status = PipelineStatus.RUNNING
+        for step in ordered:
+            step.status = PipelineStatus.RUNNING
+
+        start = time.time()
+        with peak_memory(trace_memory) as memory:
+            run = self._drive_stream(
+                source, stages, prefetch,
+            )
+        duration = time.time() - start
+
+        status = (
+            PipelineStatus.COMPLETED if run["success"]
+            else PipelineStatus.FAILED
+        )
+        pipeline.status = status
+        stage_stats = run.get("stages", {})
+        for step in ordered:
+            step.status = status
+            idx = stage_of.get(step.step_id)
+            stage = keys[idx] if idx is not None else ""
+            if stage in stage_stats:
+                step.output_count = stage_stats[stage]["rows"]
+            elif step.step_type == StepType.LOAD and run["success"]:
+                step.output_count = run["load"]["loaded"]
+
+        extracted = run.get("extracted", 0)
+        result = {
+            **{k: v for k, v in run.items() if k != "load"},
+            "pipeline_id": pipeline_id,
+            "name": pipeline.name,
+            "steps_completed": len(ordered) if run["success"] else 0,
+            "steps_failed": 0 if run["success"] else 1,
+            "rows_per_sec": round(
+                extracted / duration, 1,
+            ) if duration > 0 else 0.0,
+            "duration": round(duration, 4),
+            "streamed": True,
+            **memory,
+        }
+        if run["success"]:
+            result["loaded"] = run["load"]["loaded"]
+        self._executions.append(result)
+        return result
+
     def run_pipeline(
         self,
         pipeline_id: str,
@@ -0,0 +1,323 @@
+"""ATLAS gorev durum gunlugu (write-behind).
+
+Gorev durum gecislerini gorev basina birlestirir ve
+PostgreSQL'e belirli araliklarla toplu yazar. Opsiyonel
+yerel gunluk dosyasi, cokme sonrasi yazilmamis gecislerin
+yeniden oynatilmasini saglar.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from app.core.memory.long_term import LongTermMemory
+
+logger = logging.getLogger(__name__)
+
+_DT_KEY = "__dt__"
+
+
+def _encode(value: Any) -> Any:
+    """JSON'a yazilamayan degerleri kodlar."""
+    if isinstance(value, datetime):
+        return {_DT_KEY: value.isoformat()}
+    return str(value)
+
+
+def _decode(obj: dict[str, Any]) -> Any:
+    """Kodlanmis degerleri geri cevirir."""
+    if len(obj) == 1 and _DT_KEY in obj:
+        return datetime.fromisoformat(obj[_DT_KEY])
+    return obj
+
+
+class TaskStateJournal:
+    """Gorev durumlari icin write-behind gunlugu.
+
+    ``record`` cagrilari bellekte gorev basina birlestirilir
+    (son yazilan alan kazanir). Arkaplan dongusu her
+    ``flush_interval`` saniyede veya bekleyen gorev sayisi
+    ``max_batch``'e ulastiginda hepsini tek
+    ``bulk_update_tasks`` ile yazar. Yazma basarisiz olursa
+    kayitlar, sonradan gelen gecisleri ezmeden bekleyenlere
+    geri eklenir.
+
+    ``path`` verilirse her kayit once yerel gunluk dosyasina
+    eklenip isletim sistemine aktarilir; fsync en gec
+    ``sync_interval`` saniye sonra toplu (group commit)
+    yapilir. Dosya basarili yazmadan sonra silinir. ``start`` yarim kalan
+    dosyalari veritabanina uygular, boylece ``_recover_tasks``
+    guncel durumlari gorur.
+
+    Attributes:
+        long_term: PostgreSQL hafiza.
+        flush_interval: Flush araligi (saniye).
+        max_batch: Erken flush tetikleyen bekleyen gorev sayisi.
+        path: Yerel gunluk dosyasi (opsiyonel).
+        sync_interval: Toplu fsync gecikmesi (saniye).
+    """
+
+    def __init__(
+        self,
+        long_term: LongTermMemory,
+        flush_interval: float = 0.5,
+        max_batch: int = 500,
+        path: str | Path | None = None,
+        sync_interval: float = 0.01,
+    ) -> None:
+        """Gunlugu olusturur.
+
+        Args:
+            long_term: PostgreSQL hafiza.
+            flush_interval: Flush araligi (saniye).
+            max_batch: Erken flush esigi.
+            path: Yerel gunluk dosyasi yolu.
+            sync_interval: Toplu fsync gecikmesi (saniye).
+        """
+        self.long_term = long_term
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.path = Path(path) if path else None
+        self.sync_interval = sync_interval
+
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._file: Any = None
+        self._sync_handle: asyncio.TimerHandle | None = None
+        self._segments: list[Path] = []
+        self._stats = {
+            "records": 0,
+            "flushes": 0,
+            "flushed_tasks": 0,
+            "failures": 0,
+        }
+
+    # === Yasam dongusu ===
+
+    async def start(self) -> int:
+        """Yarim kalan gunlugu uygular ve flush dongusunu baslatir.
+
+        Returns:
+            Yeniden oynatilan gorev sayisi.
+        """
+        replayed = await self.replay()
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        self._task = asyncio.create_task(
+            self._flush_loop(), name="task_state_journal"
+        )
+        return replayed
+
+    async def close(self) -> None:
+        """Donguyu durdurur ve bekleyen tum gecisleri yazar.
+
+        Yazma basarisiz olursa kayitlar gunluk dosyasinda
+        kalir ve sonraki ``start`` ile uygulanir.
+        """
+        if self._task is not None:
+            # Suren flush bitmeden iptal edilmez
+            async with self._flush_lock:
+                self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        try:
+            await self.flush()
+        except Exception as exc:
+            logger.error(
+                "Gunluk kapanis flush hatasi (%d gorev): %s",
+                len(self._pending), exc,
+            )
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    # === Kayit ===
+
+    def record(self, task_id: str, updates: dict[str, Any]) -> None:
+        """Durum gecisini kaydeder.
+
+        Args:
+            task_id: Gorev ID'si.
+            updates: Guncellenecek alanlar.
+        """
+        entry = self._pending.get(task_id)
+        if entry is None:
+            self._pending[task_id] = dict(updates)
+        else:
+            entry.update(updates)
+        self._stats["records"] += 1
+
+        if self._file is not None:
+            self._file.write(
+                json.dumps({"id": task_id, "u": updates}, default=_encode) + "\n"
+            )
+            # Surec cokmesine karsi hemen, disk icin toplu
+            self._file.flush()
+            self._schedule_sync()
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+
+    def pending(self, task_id: str) -> dict[str, Any] | None:
+        """Gorevin henuz yazilmamis alanlari.
+
+        Args:
+            task_id: Gorev ID'si.
+
+        Returns:
+            Alan sozlugu veya None.
+        """
+        entry = self._pending.get(task_id)
+        return dict(entry) if entry is not None else None
+
+    def _schedule_sync(self) -> None:
+        """Bekleyen fsync yoksa kisa gecikmeyle planlar."""
+        if self._sync_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._sync()
+            return
+        self._sync_handle = loop.call_later(self.sync_interval, self._sync)
+
+    def _sync(self) -> None:
+        """Aktif gunluk dosyasini diske fsync eder."""
+        if self._sync_handle is not None:
+            self._sync_handle.cancel()
+            self._sync_handle = None
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    @property
+    def pending_count(self) -> int:
+        """Yazilmayi bekleyen gorev sayisi."""
+        return len(self._pending)
+
+    # === Flush ===
+
+    async def flush(self) -> int:
+        """Bekleyen gecisleri tek toplu yazimla veritabanina yazar.
+
+        Returns:
+            Yazilan gorev sayisi.
+
+        Raises:
+            Exception: Veritabani hatasi (kayitlar geri eklenir;
+                iptal de dahil).
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            self._rotate()
+
+            try:
+                await self.long_term.bulk_update_tasks(batch)
+            except BaseException:
+                # Sonraki gecisler eskileri ezer
+                for task_id, fields in batch.items():
+                    newer = self._pending.get(task_id)
+                    self._pending[task_id] = {**fields, **newer} if newer else fields
+                self._stats["failures"] += 1
+                raise
+
+            # Geri eklenen eski kayitlar da bu batch'teydi
+            for segment in self._segments:
+                segment.unlink(missing_ok=True)
+            self._segments.clear()
+            self._stats["flushes"] += 1
+            self._stats["flushed_tasks"] += len(batch)
+            return len(batch)
+
+    def _rotate(self) -> None:
+        """Aktif gunluk dosyasini numarali flush segmentine cevirir."""
+        if self._file is None or self.path is None:
+            return
+        self._sync()
+        self._file.close()
+
+        index = 0
+        while True:
+            segment = self.path.with_name(f"{self.path.name}.{index}")
+            if not segment.exists():
+                break
+            index += 1
+        self.path.rename(segment)
+        self._segments.append(segment)
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+
+    async def _flush_loop(self) -> None:
+        """Periyodik flush dongusu."""
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "Gunluk flush hatasi, %d gorev tekrar denenecek: %s",
+                    len(self._pending), exc,
+                )
+
+    # === Kurtarma ===
+
+    async def replay(self) -> int:
+        """Yarim kalan gunluk dosyalarini veritabanina uygular.
+
+        Returns:
+            Uygulanan gorev sayisi.
+        """
+        if self.path is None:
+            return 0
+        segments = sorted(
+            self.path.parent.glob(f"{self.path.name}.*"),
+            key=lambda p: int(p.suffix[1:]) if p.suffix[1:].isdigit() else -1,
+        )
+        files = [p for p in segments if p.suffix[1:].isdigit()]
+        if self.path.exists():
+            files.append(self.path)
+        if not files:
+            return 0
+
+        merged: dict[str, dict[str, Any]] = {}
+        for file in files:
+            for line in file.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line, object_hook=_decode)
+                except json.JSONDecodeError:
+                    # Yarim yazilmis son satir
+                    continue
+                merged.setdefault(entry["id"], {}).update(entry["u"])
+
+        if merged:
+            await self.long_term.bulk_update_tasks(merged)
+        for file in files:
+            file.unlink(missing_ok=True)
+        logger.info("Gorev gunlugu yeniden oynatildi: %d gorev", len(merged))
+        return len(merged)
+
+    # === Metrikler ===
+
+    def get_stats(self) -> dict[str, Any]:
+        """Gunluk istatistikleri.
+
+        Returns:
+            Kayit, flush, yazilan gorev, hata ve bekleyen sayilari.
+        """
+        return {**self._stats, "pending": len(self._pending)}
@@ -20,7 +20,9 @@ from app.core.decision_matrix import ActionType, DecisionMatrix
 from app.core.memory.long_term import LongTermMemory
 from app.core.memory.short_term import ShortTermMemory
 from app.core.memory.semantic import SemanticMemory
-from app.models.task import TaskCreate, TaskResponse, TaskStatus
+from app.core.task_journal import TaskStateJournal
+from app.core.task_scheduler import FairTaskScheduler
+from app.models.task import TaskCreate, TaskPage, TaskResponse, TaskStatus
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +106,9 @@ class TaskMetrics(BaseModel):
         success_rate: Basari orani (0.0 - 1.0).
         by_agent: Agent bazli tamamlanan gorev sayilari.
         by_status: Durum bazli gorev sayilari.
+        agent_queues: Adil zamanlayici agent kuyruk istatistikleri
+            (bekleme/calisma histogramlari dahil; fifo modunda bos).
+        write_behind: Durum gunlugu istatistikleri (kapaliysa bos).
     """
 
     total_submitted: int = 0
@@ -115,6 +120,8 @@ class TaskMetrics(BaseModel):
     success_rate: float = 0.0
     by_agent: dict[str, int] = Field(default_factory=dict)
     by_status: dict[str, int] = Field(default_factory=dict)
+    agent_queues: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    write_behind: dict[str, Any] = Field(default_factory=dict)
 
 
 # === Oncelik hesaplama tablosu ===
@@ -140,6 +147,7 @@ class TaskManager:
         telegram_bot: Bildirim gonderici (opsiyonel).
         max_retries: Maksimum yeniden deneme sayisi.
         max_concurrent: Esanli calistirilacak maks gorev sayisi.
+        scheduler_mode: Dagitim modu (fifo: tek kuyruk, fair: agent basina kuyruk).
     """
 
     def __init__(
@@ -151,6 +159,11 @@ class TaskManager:
         telegram_bot: Any = None,
         max_retries: int | None = None,
         max_concurrent: int | None = None,
+        scheduler: str | None = None,
+        agent_concurrency: dict[str, int] | None = None,
+        agent_weights: dict[str, float] | None = None,
+        write_behind: bool | None = None,
+        journal_path: str | None = None,
     ) -> None:
         """TaskManager'i baslatir.
 
@@ -162,6 +175,15 @@ class TaskManager:
             telegram_bot: TelegramBot nesnesi (opsiyonel, bildirimler).
             max_retries: Maks yeniden deneme. None ise config'den alinir.
             max_concurrent: Esanli gorev limiti. None ise config'den alinir.
+            scheduler: "fifo" veya "fair". None ise config'den alinir.
+            agent_concurrency: fair modda agent basina esanlilik limitleri.
+            agent_weights: fair modda agent basina adil paylasim agirliklari.
+            write_behind: Durum gecislerini toplu yaz. None ise config'den alinir.
+            journal_path: Write-behind yerel gunluk dosyasi. Verilmezse
+                write-behind kapali kalir (write-through).
+
+        Raises:
+            ValueError: Bilinmeyen zamanlayici modu.
         """
         self.master_agent = master_agent
         self.long_term = long_term
@@ -171,6 +193,9 @@ class TaskManager:
 
         self.max_retries = max_retries or settings.master_agent_max_retries
         _max_concurrent = max_concurrent or settings.task_manager_max_concurrent
+        self.scheduler_mode = scheduler or settings.task_manager_scheduler
+        if self.scheduler_mode not in ("fifo", "fair"):
+            raise ValueError(f"Bilinmeyen zamanlayici modu: {self.scheduler_mode}")
 
         # Karar matrisi (oncelik hesaplama icin)
         self._decision_matrix = DecisionMatrix()
@@ -181,6 +206,46 @@ class TaskManager:
         # Calisan gorevler: task_id -> asyncio.Task
         self._active_tasks: dict[str, asyncio.Task[None]] = {}
 
+        # Adil zamanlayici (agent basina kuyruk + work stealing)
+        self._scheduler: FairTaskScheduler | None = None
+        if self.scheduler_mode == "fair":
+            self._scheduler = FairTaskScheduler(
+                workers=_max_concurrent,
+                agent_limits=(
+                    agent_concurrency
+                    if agent_concurrency is not None
+                    else settings.task_manager_agent_concurrency
+                ),
+                weights=(
+                    agent_weights
+                    if agent_weights is not None
+                    else settings.task_manager_agent_weights
+                ),
+                agent_of=lambda q: q.submission.target_agent or "auto",
+                priority_of=lambda q: q.priority.value,
+            )
+            self._active_tasks = self._scheduler.active
+
+        # Write-behind durum gunlugu
+        self._journal: TaskStateJournal | None = None
+        use_journal = (
+            write_behind if write_behind is not None
+            else settings.task_manager_write_behind
+        )
+        _journal_path = journal_path or settings.task_manager_journal_path
+        if use_journal and not _journal_path:
+            # Gunluk dosyasi olmadan write-behind cokmede gecis kaybeder
+            logger.warning(
+                "Write-behind gunluk yolu olmadan acilamaz, write-through kullaniliyor",
+            )
+        elif use_journal:
+            self._journal = TaskStateJournal(
+                long_term,
+                flush_interval=settings.task_manager_flush_interval,
+                max_batch=settings.task_manager_flush_max_batch,
+                path=_journal_path,
+            )
+
         # Bagimlillik takibi
         self._dependencies: dict[str, set[str]] = {}   # task_id -> bekledigi ID'ler
         self._dependents: dict[str, set[str]] = {}      # task_id -> onu bekleyen ID'ler
@@ -207,9 +272,10 @@ class TaskManager:
         self._agent_counters: dict[str, int] = {}
 
         logger.info(
-            "TaskManager olusturuldu (max_retries=%d, max_concurrent=%d)",
+            "TaskManager olusturuldu (max_retries=%d, max_concurrent=%d, scheduler=%s)",
             self.max_retries,
             _max_concurrent,
+            self.scheduler_mode,
         )
 
     # === Lifecycle ===
@@ -222,18 +288,25 @@ class TaskManager:
         """
         self._running = True
 
+        # Yarim kalan durum gunlugunu uygula (recovery guncel durumu gorsun)
+        if self._journal is not None:
+            await self._journal.start()
+
         # Crash recovery: tamamlanmamis gorevleri kuyruga yukle
         await self._recover_tasks()
 
         # Arkaplan donguleri basalt
-        self._worker_task = asyncio.create_task(
-            self._worker_loop(), name="task_manager_worker"
-        )
+        if self._scheduler is not None:
+            self._scheduler.start(self._execute_task)
+        else:
+            self._worker_task = asyncio.create_task(
+                self._worker_loop(), name="task_manager_worker"
+            )
         self._scheduler_task = asyncio.create_task(
             self._scheduler_loop(), name="task_manager_scheduler"
         )
 
-        logger.info("TaskManager baslatildi (kuyruk=%d)", self._queue.qsize())
+        logger.info("TaskManager baslatildi (kuyruk=%d)", self._queue_size())
 
     async def stop(self) -> None:
         """Gorev yoneticisini durdurur.
@@ -252,6 +325,8 @@ class TaskManager:
                     await bg_task
                 except asyncio.CancelledError:
                     pass
+        if self._scheduler is not None:
+            await self._scheduler.stop()
 
         # Aktif gorevlerin tamamlanmasini bekle (maks 30 saniye)
         if self._active_tasks:
@@ -262,6 +337,10 @@ class TaskManager:
             pending = list(self._active_tasks.values())
             await asyncio.wait(pending, timeout=30)
 
+        # Bekleyen durum gecislerini yaz
+        if self._journal is not None:
+            await self._journal.close()
+
         logger.info("TaskManager durduruldu")
 
     # === CRUD ===
@@ -320,7 +399,7 @@ class TaskManager:
 
         # Bagimlilik yoksa veya hepsi cozulmusse kuyruga ekle
         if not has_unmet:
-            await self._queue.put(queued)
+            await self._enqueue(queued)
         else:
             # Kuyruga alinmayi bekleyen gorev — QueuedTask'i saklayalim
             await self._cache_task_status(task_response.id + ":queued", queued.model_dump(mode="json"))
@@ -346,8 +425,8 @@ class TaskManager:
         Returns:
             Gorev yaniti veya None.
         """
-        # PostgreSQL'den kalici kayit
-        return await self.long_term.get_task(task_id)
+        # PostgreSQL'den kalici kayit (+ yazilmamis gecisler)
+        return await self._load_task(task_id)
 
     async def list_tasks(
         self,
@@ -367,9 +446,42 @@ class TaskManager:
         Returns:
             Gorev yanitlari listesi.
         """
-        return await self.long_term.list_tasks(
+        flushed = await self._flush_before_query()
+        tasks = await self.long_term.list_tasks(
             status=status, agent=agent, limit=limit, offset=offset
         )
+        return tasks if flushed else [self._overlay(t) for t in tasks]
+
+    async def list_tasks_page(
+        self,
+        status: str | None = None,
+        agent: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        offset: int = 0,
+    ) -> TaskPage:
+        """Gorevleri keyset imleci ve toplam sayiyla listeler.
+
+        Args:
+            status: Durum filtresi.
+            agent: Agent adi filtresi.
+            limit: Sayfa boyutu.
+            cursor: Onceki sayfanin imleci.
+            offset: Baslangic ofseti (cursor yoksa).
+
+        Returns:
+            Gorev sayfasi.
+
+        Raises:
+            ValueError: Gecersiz imlec.
+        """
+        flushed = await self._flush_before_query()
+        page = await self.long_term.list_tasks_page(
+            status=status, agent=agent, limit=limit, cursor=cursor, offset=offset,
+        )
+        if not flushed:
+            page.tasks = [self._overlay(t) for t in page.tasks]
+        return page
 
     async def cancel_task(self, task_id: str) -> TaskResponse | None:
         """Gorevi iptal eder.
@@ -383,7 +495,7 @@ class TaskManager:
         Returns:
             Guncellenmis gorev yaniti veya None (bulunamazsa).
         """
-        task = await self.long_term.get_task(task_id)
+        task = await self._load_task(task_id)
         if task is None:
             return None
 
@@ -397,7 +509,7 @@ class TaskManager:
                 self._active_tasks[task_id].cancel()
 
         # DB guncelle
-        updated = await self.long_term.update_task(task_id, {
+        updated = await self._write_through(task_id, {
             "status": TaskStatus.CANCELLED.value,
             "result_message": "Gorev kullanici tarafindan iptal edildi",
         })
@@ -422,7 +534,7 @@ class TaskManager:
         Returns:
             Guncellenmis gorev yaniti veya None.
         """
-        task = await self.long_term.get_task(task_id)
+        task = await self._load_task(task_id)
         if task is None:
             return None
 
@@ -431,7 +543,7 @@ class TaskManager:
             return task
 
         # DB durumunu sifirla
-        updated = await self.long_term.update_task(task_id, {
+        updated = await self._write_through(task_id, {
             "status": TaskStatus.PENDING.value,
             "result_message": None,
             "result_success": None,
@@ -448,7 +560,7 @@ class TaskManager:
             source="retry",
         )
         queued = QueuedTask(id=task_id, priority=priority, submission=submission)
-        await self._queue.put(queued)
+        await self._enqueue(queued)
 
         logger.info("Gorev tekrar kuyruga eklendi: %s", task_id[:8])
         return updated
@@ -519,17 +631,19 @@ class TaskManager:
             total_completed=completed,
             total_failed=failed,
             total_cancelled=self._counters["cancelled"],
-            queue_size=self._queue.qsize(),
+            queue_size=self._queue_size(),
             active_count=len(self._active_tasks),
             success_rate=completed / total_finished if total_finished > 0 else 0.0,
             by_agent=dict(self._agent_counters),
             by_status={
-                "pending": self._queue.qsize(),
+                "pending": self._queue_size(),
                 "running": len(self._active_tasks),
                 "completed": completed,
                 "failed": failed,
                 "cancelled": self._counters["cancelled"],
             },
+            agent_queues=self._scheduler.stats() if self._scheduler else {},
+            write_behind=self._journal.get_stats() if self._journal else {},
         )
 
     async def search_similar_tasks(
@@ -577,9 +691,12 @@ class TaskManager:
         Returns:
             Kuyrukta bekleyen gorev bilgileri.
         """
-        # PriorityQueue dogrudan iterate edilemez,
-        # internal _queue listesine eriselim
-        items = list(self._queue._queue)  # type: ignore[attr-defined]
+        if self._scheduler is not None:
+            items = self._scheduler.items()
+        else:
+            # PriorityQueue dogrudan iterate edilemez,
+            # internal _queue listesine eriselim
+            items = sorted(self._queue._queue)  # type: ignore[attr-defined]
         return [
             {
                 "id": item.id,
@@ -588,7 +705,7 @@ class TaskManager:
                 "retry_count": item.retry_count,
                 "created_at": item.created_at.isoformat(),
             }
-            for item in sorted(items)
+            for item in items
         ]
 
     # === Internal: Oncelik Hesaplama ===
@@ -615,6 +732,25 @@ class TaskManager:
         except (ValueError, KeyError):
             return TaskPriority.MEDIUM
 
+    # === Internal: Kuyruk ===
+
+    async def _enqueue(self, queued: QueuedTask) -> None:
+        """Gorevi aktif zamanlayici moduna gore kuyruga ekler.
+
+        Args:
+            queued: Kuyruga eklenecek gorev.
+        """
+        if self._scheduler is not None:
+            await self._scheduler.put(queued)
+        else:
+            await self._queue.put(queued)
+
+    def _queue_size(self) -> int:
+        """Kuyrukta bekleyen gorev sayisi."""
+        if self._scheduler is not None:
+            return self._scheduler.qsize()
+        return self._queue.qsize()
+
     # === Internal: Worker Loop ===
 
     async def _worker_loop(self) -> None:
@@ -677,7 +813,7 @@ class TaskManager:
         )
 
         # DB durumunu RUNNING'e guncelle
-        await self.long_term.update_task(task_id, {
+        await self._persist_task(task_id, {
             "status": TaskStatus.RUNNING.value,
             "agent": submission.target_agent,
         })
@@ -733,7 +869,7 @@ class TaskManager:
         submission = queued_task.submission
 
         # PostgreSQL guncelle
-        await self.long_term.update_task(task_id, {
+        await self._persist_task(task_id, {
             "status": TaskStatus.COMPLETED.value,
             "result_message": result.message,
             "result_success": True,
@@ -807,10 +943,10 @@ class TaskManager:
             # Backoff sonrasi tekrar kuyruga ekle
             await asyncio.sleep(backoff)
             if self._running:
-                await self._queue.put(queued_task)
+                await self._enqueue(queued_task)
         else:
             # Final basarisizlik
-            await self.long_term.update_task(task_id, {
+            await self._persist_task(task_id, {
                 "status": TaskStatus.FAILED.value,
                 "result_message": result.message,
                 "result_success": False,
@@ -893,7 +1029,7 @@ class TaskManager:
         # Tamamlanmis bagimliliklari filtrele
         unmet: set[str] = set()
         for dep_id in depends_on:
-            dep_task = await self.long_term.get_task(dep_id)
+            dep_task = await self._load_task(dep_id)
             if dep_task is None or dep_task.status != TaskStatus.COMPLETED:
                 unmet.add(dep_id)
 
@@ -949,7 +1085,7 @@ class TaskManager:
 
                 if cached:
                     queued = QueuedTask.model_validate(cached)
-                    await self._queue.put(queued)
+                    await self._enqueue(queued)
                     logger.info(
                         "Gorev bagimlilik cozuldu, kuyruga eklendi: %s",
                         waiting_id[:8],
@@ -966,7 +1102,7 @@ class TaskManager:
         for waiting_id in waiting_tasks:
             self._dependencies.pop(waiting_id, None)
 
-            await self.long_term.update_task(waiting_id, {
+            await self._persist_task(waiting_id, {
                 "status": TaskStatus.CANCELLED.value,
                 "result_message": f"Bagimli gorev basarisiz: {failed_task_id[:8]}",
             })
@@ -1020,7 +1156,7 @@ class TaskManager:
                 priority=priority,
                 submission=submission,
             )
-            await self._queue.put(queued)
+            await self._enqueue(queued)
             recovered += 1
 
         if recovered > 0:
@@ -1091,6 +1227,100 @@ class TaskManager:
                 "Beklenen format: 'every_Xm' veya 'every_Xh'"
             )
 
+    # === Internal: Kalici Durum ===
+
+    async def _persist_task(self, task_id: str, updates: dict[str, Any]) -> None:
+        """Durum gecisini kaydeder.
+
+        Write-behind acikken gunluge eklenir ve toplu yazilir,
+        degilse dogrudan PostgreSQL'e yazilir.
+
+        Args:
+            task_id: Gorev ID'si.
+            updates: Guncellenecek alanlar.
+        """
+        if self._journal is not None:
+            self._journal.record(task_id, updates)
+        else:
+            await self.long_term.update_task(task_id, updates)
+
+    async def _write_through(
+        self, task_id: str, updates: dict[str, Any]
+    ) -> TaskResponse | None:
+        """Kullanici islemleri icin hemen yazilan durum gecisi.
+
+        Write-behind acikken gecis gunluge eklenip gunluk hemen
+        flush edilir; boylece daha eski bekleyen gecisler bu
+        degisikligi ezemez.
+
+        Args:
+            task_id: Gorev ID'si.
+            updates: Guncellenecek alanlar.
+
+        Returns:
+            Guncel gorev yaniti veya None.
+        """
+        if self._journal is None:
+            return await self.long_term.update_task(task_id, updates)
+        self._journal.record(task_id, updates)
+        try:
+            await self._journal.flush()
+        except Exception as exc:
+            logger.warning("Gunluk flush hatasi (%s): %s", task_id[:8], exc)
+        return await self._load_task(task_id)
+
+    async def _load_task(self, task_id: str) -> TaskResponse | None:
+        """Gorevi okur; yazilmamis gecisleri uzerine uygular.
+
+        Args:
+            task_id: Gorev ID'si.
+
+        Returns:
+            Gorev yaniti veya None.
+        """
+        task = await self.long_term.get_task(task_id)
+        if task is None:
+            return None
+        return self._overlay(task)
+
+    def _overlay(self, task: TaskResponse) -> TaskResponse:
+        """Gorevin yazilmamis gecislerini uzerine uygular.
+
+        Args:
+            task: Veritabanindaki gorev.
+
+        Returns:
+            Guncel gorev yaniti.
+        """
+        if self._journal is None:
+            return task
+        pending = self._journal.pending(task.id)
+        if not pending:
+            return task
+        return TaskResponse.model_validate({**task.model_dump(), **{
+            k: v for k, v in pending.items() if k in TaskResponse.model_fields
+        }})
+
+    async def _flush_before_query(self) -> bool:
+        """Liste sorgusundan once bekleyen gecisleri yazar.
+
+        Durum filtresi, keyset imleci ve toplam sayi
+        veritabaninda hesaplandigindan gecisler sorgudan
+        once yazilmalidir.
+
+        Returns:
+            Bekleyen gecis kalmadiysa True; flush basarisizsa
+            False (sonuclara gunluk uzerine uygulanir).
+        """
+        if self._journal is None or not self._journal.pending_count:
+            return True
+        try:
+            await self._journal.flush()
+        except Exception as exc:
+            logger.warning("Listeleme oncesi gunluk flush hatasi: %s", exc)
+            return False
+        return True
+
     # === Internal: Helpers ===
 
     async def _cache_task_status(
@@ -0,0 +1,322 @@
+"""ATLAS adil gorev zamanlayicisi.
+
+Agent basina oncelik kuyruklari, agent basina esanlilik
+limitleri, agirlikli adil paylasim ve bos isci
+calmasi (work stealing) ile gorev dagitimi.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.core.observability.histogram import BucketHistogram
+
+logger = logging.getLogger(__name__)
+
+# Saniye cinsinden bekleme / calisma suresi kovalari
+_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0,
+)
+
+
+class _AgentQueue:
+    """Tek agent'in kuyruk durumu."""
+
+    __slots__ = (
+        "name", "heap", "limit", "weight", "running", "vtime",
+        "dispatched", "remote", "wait_hist", "run_hist",
+    )
+
+    def __init__(self, name: str, limit: int, weight: float) -> None:
+        self.name = name
+        self.heap: list[tuple[int, int, float, Any]] = []
+        self.limit = limit
+        self.weight = weight
+        self.running = 0
+        self.vtime = 0.0
+        self.dispatched = 0
+        self.remote = 0  # ev kuyrugu baska agent olan isciye dagitilan
+        self.wait_hist = BucketHistogram(_LATENCY_BUCKETS)
+        self.run_hist = BucketHistogram(_LATENCY_BUCKETS)
+
+    def eligible(self) -> bool:
+        """Dagitilabilir is ve bos slot var mi."""
+        return bool(self.heap) and self.running < self.limit
+
+
+class FairTaskScheduler:
+    """Agent basina kuyruklu adil zamanlayici.
+
+    Her agent kendi oncelik kuyruguna sahiptir. Isciler
+    once oncelik sinifina, sonra agirlikli sanal zamana
+    (stride scheduling) gore kuyruk secer; boylece yavas
+    bir agent digerlerini ac birakamaz. Her isci bir ev
+    kuyruguna baglidir ve en fazla bir adim geride kaldigi
+    surece onu tercih eder; ev kuyrugu bos, limitte veya
+    geride ise en uygun diger kuyruktan calar. Bos isciler
+    yoklama yapmaz, yeni is veya bosalan slot ile uyanir.
+
+    Attributes:
+        workers: Isci (toplam esanlilik) sayisi.
+        active: Calisan gorevler (gorev ID -> asyncio.Task).
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        agent_limits: dict[str, int] | None = None,
+        default_limit: int | None = None,
+        weights: dict[str, float] | None = None,
+        agent_of: Callable[[Any], str] | None = None,
+        priority_of: Callable[[Any], int] | None = None,
+    ) -> None:
+        """Zamanlayiciyi olusturur.
+
+        Args:
+            workers: Isci sayisi.
+            agent_limits: Agent basina esanlilik limitleri.
+            default_limit: Tanimsiz agent'lar icin limit (None ise isci sayisi).
+            weights: Agent basina adil paylasim agirliklari (varsayilan 1.0).
+            agent_of: Ogeden agent/kuyruk adini cikaran fonksiyon.
+            priority_of: Ogeden oncelik sinifini cikaran fonksiyon (dusuk = once).
+        """
+        if workers < 1:
+            raise ValueError("Isci sayisi en az 1 olmalidir")
+        self.workers = workers
+        self.active: dict[str, asyncio.Task[None]] = {}
+
+        self._agent_limits = dict(agent_limits or {})
+        self._default_limit = default_limit or workers
+        self._weights = dict(weights or {})
+        self._agent_of = agent_of or (lambda item: "default")
+        self._priority_of = priority_of or (lambda item: 0)
+
+        self._queues: dict[str, _AgentQueue] = {}
+        self._size = 0
+        self._seq = itertools.count()
+        self._vtime = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._worker_tasks: list[asyncio.Task[None]] = []
+        self._handler: Callable[[Any], Awaitable[None]] | None = None
+        self._running = False
+
+    # === Kuyruk ===
+
+    async def put(self, item: Any) -> None:
+        """Ogeyi kuyruga ekler ve bos bir isciyi uyandirir.
+
+        Args:
+            item: Kuyruk ogesi (``id`` alani olmalidir).
+        """
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any) -> None:
+        """Ogeyi beklemeden kuyruga ekler.
+
+        Args:
+            item: Kuyruk ogesi.
+        """
+        queue = self._queue_for(self._agent_of(item))
+        if not queue.heap and queue.running == 0:
+            # Bosta gecen sure kredi biriktirmesin
+            queue.vtime = max(queue.vtime, self._vtime)
+        heapq.heappush(queue.heap, (
+            self._priority_of(item), next(self._seq), time.monotonic(), item,
+        ))
+        self._size += 1
+        self._wake()
+
+    def qsize(self) -> int:
+        """Bekleyen oge sayisi."""
+        return self._size
+
+    def items(self) -> list[Any]:
+        """Bekleyen ogeler (oncelik ve gelis sirasiyla).
+
+        Returns:
+            Oge listesi.
+        """
+        entries = [e for q in self._queues.values() for e in q.heap]
+        return [e[3] for e in sorted(entries, key=lambda e: (e[0], e[1]))]
+
+    def _queue_for(self, name: str) -> _AgentQueue:
+        """Agent kuyrugunu getirir, yoksa olusturur."""
+        queue = self._queues.get(name)
+        if queue is None:
+            queue = _AgentQueue(
+                name,
+                limit=self._agent_limits.get(name, self._default_limit),
+                weight=self._weights.get(name, 1.0),
+            )
+            self._queues[name] = queue
+        return queue
+
+    # === Secim ===
+
+    def _select(self, worker: int) -> _AgentQueue | None:
+        """Iscinin alacagi kuyrugu secer.
+
+        Args:
+            worker: Isci indeksi.
+
+        Returns:
+            Secilen kuyruk veya None (uygun is yok).
+        """
+        best: _AgentQueue | None = None
+        for queue in self._queues.values():
+            if not queue.eligible():
+                continue
+            if best is None or (queue.heap[0][0], queue.vtime) < (
+                best.heap[0][0], best.vtime,
+            ):
+                best = queue
+        if best is None:
+            return None
+
+        names = list(self._queues)
+        home = self._queues[names[worker % len(names)]]
+        if (
+            home is not best
+            and home.eligible()
+            and home.heap[0][0] <= best.heap[0][0]
+            and home.vtime < best.vtime + 1.0 / home.weight
+        ):
+            return home
+        if home is not best:
+            best.remote += 1
+        return best
+
+    # === Isciler ===
+
+    def start(self, handler: Callable[[Any], Awaitable[None]]) -> None:
+        """Iscileri baslatir.
+
+        Args:
+            handler: Her oge icin calistirilacak coroutine fonksiyonu.
+        """
+        self._handler = handler
+        self._running = True
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(i), name=f"task_scheduler_worker_{i}")
+            for i in range(self.workers)
+        ]
+        logger.info("FairTaskScheduler baslatildi (isci=%d)", self.workers)
+
+    async def stop(self) -> None:
+        """Iscileri durdurur.
+
+        Calisan gorevler iptal edilmez; ``active`` uzerinden beklenebilir.
+        """
+        self._running = False
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        logger.info("FairTaskScheduler durduruldu")
+
+    async def _worker(self, index: int) -> None:
+        """Isci dongusu.
+
+        Args:
+            index: Isci indeksi.
+        """
+        loop = asyncio.get_running_loop()
+        while self._running:
+            queue = self._select(index)
+            if queue is None:
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._waiters.append(waiter)
+                await waiter
+                continue
+
+            task = self._dispatch(queue)
+            # Gorev iptali isciyi etkilemesin diye wait ile beklenir
+            await asyncio.wait((task,))
+
+    def _dispatch(self, queue: _AgentQueue) -> asyncio.Task[None]:
+        """Kuyrugun basindaki ogeyi calistirir.
+
+        Args:
+            queue: Secilen kuyruk.
+
+        Returns:
+            Ogeyi calistiran gorev.
+        """
+        assert self._handler is not None
+        _, _, enqueued, item = heapq.heappop(queue.heap)
+        self._size -= 1
+        queue.running += 1
+        queue.dispatched += 1
+        self._vtime = queue.vtime
+        queue.vtime += 1.0 / queue.weight
+
+        started = time.monotonic()
+        queue.wait_hist.observe(started - enqueued)
+
+        task = asyncio.create_task(self._handler(item), name=f"task_{item.id[:8]}")
+        self.active[item.id] = task
+
+        def _done(_: asyncio.Task[None]) -> None:
+            queue.running -= 1
+            queue.run_hist.observe(time.monotonic() - started)
+            if self.active.get(item.id) is task:
+                del self.active[item.id]
+            self._wake()
+
+        task.add_done_callback(_done)
+        return task
+
+    def _wake(self) -> None:
+        """Bekleyen bir isciyi uyandirir."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    # === Metrikler ===
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Agent basina kuyruk istatistikleri.
+
+        Returns:
+            Agent adi -> kuyruk boyu, calisan, limit, agirlik,
+            dagitilan, ev disi isciye dagitilan (bos ev kuyrugundan
+            calma dahil) ve bekleme/calisma histogram ozetleri.
+        """
+        out: dict[str, dict[str, Any]] = {}
+        for name, queue in self._queues.items():
+            out[name] = {
+                "queued": len(queue.heap),
+                "running": queue.running,
+                "limit": queue.limit,
+                "weight": queue.weight,
+                "dispatched": queue.dispatched,
+                "remote": queue.remote,
+                "queue_wait": _summary(queue.wait_hist),
+                "run_time": _summary(queue.run_hist),
+            }
+        return out
+
+
+def _summary(hist: BucketHistogram) -> dict[str, Any]:
+    """Histogram ozeti ve kovalari.
+
+    Args:
+        hist: Histogram.
+
+    Returns:
+        Ozet sozlugu (bos histogram icin yalnizca sayi).
+    """
+    if hist.count == 0:
+        return {"count": 0}
+    summary = hist.summary()
+    summary["bounds"] = list(hist.bounds)
+    summary["counts"] = list(hist.counts)
+    return summary
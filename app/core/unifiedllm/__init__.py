@@ -2,6 +2,7 @@
 
 from app.core.unifiedllm.anthropic_adapter import AnthropicAdapter
 from app.core.unifiedllm.api_key_rotator import APIKeyRotator
+from app.core.unifiedllm.execution_policy import ExecutionPolicy, SingleFlight
 from app.core.unifiedllm.gemini_adapter import GeminiAdapter
 from app.core.unifiedllm.model_registry import LLMModelRegistry
 from app.core.unifiedllm.ollama_adapter import OllamaAdapter
@@ -12,10 +13,12 @@ from app.core.unifiedllm.unified_client import UnifiedLLMClient
 __all__ = [
     "AnthropicAdapter",
     "APIKeyRotator",
+    "ExecutionPolicy",
     "GeminiAdapter",
     "LLMModelRegistry",
     "OllamaAdapter",
     "OpenAIAdapter",
     "OpenRouterAdapter",
+    "SingleFlight",
     "UnifiedLLMClient",
 ]
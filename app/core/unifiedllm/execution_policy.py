@@ -0,0 +1,204 @@
+"""Unified LLM yurutme politikasi.
+
+Jitter'li ustel geri cekilme, saglayici basina
+gecikme histogramlari ile hedge gecikmesi ve
+ayni anda gelen ozdes istekler icin singleflight.
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+from app.core.observability.histogram import BucketHistogram
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Saniye cinsinden LLM yanit suresi kovalari
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0,
+    8.0, 13.0, 20.0, 30.0, 60.0, 120.0,
+)
+
+
+class ExecutionPolicy:
+    """Yeniden deneme ve hedge politikasi.
+
+    Denemeler arasinda ``full jitter`` ile ustel bekleme
+    yapar: ``uniform(0, min(backoff_max, backoff_base * 2**n))``.
+    Hedge gecikmesi saglayicinin gozlenen gecikme
+    yuzdeliginden (varsayilan p95) alinir; yeterli ornek
+    yoksa ``hedge_default_delay`` kullanilir. Hedge
+    sonrasi iptal edilen cagrilar da iptal anindaki
+    sureyle (alt sinir) kaydedilir; aksi halde yalnizca
+    hizli kalanlar gorulur ve gecikme giderek kisalir.
+
+    Attributes:
+        backoff_base: Ilk bekleme ust siniri (saniye).
+        backoff_max: Bekleme ust siniri (saniye).
+        hedge: Hedge istekleri acik mi.
+        hedge_quantile: Hedge gecikmesi yuzdeligi.
+        hedge_default_delay: Ornek yokken hedge gecikmesi.
+        hedge_min_delay: En kisa hedge gecikmesi.
+        hedge_min_samples: Yuzdelik icin gereken ornek sayisi.
+        max_inflight: Ayni anda calisan saglayici siniri.
+    """
+
+    def __init__(
+        self,
+        backoff_base: float = 0.2,
+        backoff_max: float = 5.0,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_default_delay: float = 2.0,
+        hedge_min_delay: float = 0.05,
+        hedge_min_samples: int = 20,
+        max_inflight: int = 2,
+    ) -> None:
+        """Politikayi olusturur.
+
+        Args:
+            backoff_base: Ilk bekleme ust siniri (saniye).
+            backoff_max: Bekleme ust siniri (saniye).
+            hedge: Hedge istekleri acik mi.
+            hedge_quantile: Hedge gecikmesi yuzdeligi.
+            hedge_default_delay: Ornek yokken hedge gecikmesi.
+            hedge_min_delay: En kisa hedge gecikmesi.
+            hedge_min_samples: Yuzdelik icin gereken ornek sayisi.
+            max_inflight: Ayni anda calisan saglayici siniri.
+        """
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_default_delay = hedge_default_delay
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+        self.max_inflight = max(1, max_inflight)
+        self._latency: dict[str, BucketHistogram] = {}
+        self._censored: dict[str, int] = {}
+        self._rng = random.Random()
+
+    def backoff(self, attempt: int) -> float:
+        """Deneme sonrasi bekleme suresi.
+
+        Args:
+            attempt: Basarisiz deneme indeksi (0'dan).
+
+        Returns:
+            Bekleme (saniye).
+        """
+        if self.backoff_base <= 0:
+            return 0.0
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return self._rng.uniform(0.0, ceiling)
+
+    def observe(
+        self,
+        provider: str,
+        seconds: float,
+        censored: bool = False,
+    ) -> None:
+        """Cagri suresini kaydeder.
+
+        Args:
+            provider: Saglayici adi.
+            seconds: Sure (saniye).
+            censored: Cagri bitmeden iptal edildi; sure
+                gercek gecikmenin alt siniridir.
+        """
+        hist = self._latency.get(provider)
+        if hist is None:
+            hist = self._latency[provider] = BucketHistogram(LATENCY_BUCKETS)
+        hist.observe(seconds)
+        if censored:
+            self._censored[provider] = self._censored.get(provider, 0) + 1
+
+    def hedge_delay(self, provider: str) -> float:
+        """Saglayici icin hedge gecikmesi.
+
+        Args:
+            provider: Saglayici adi.
+
+        Returns:
+            Gecikme (saniye).
+        """
+        hist = self._latency.get(provider)
+        if hist is None or hist.count < self.hedge_min_samples:
+            return self.hedge_default_delay
+        return max(self.hedge_min_delay, hist.quantile(self.hedge_quantile))
+
+    def latency_summary(self) -> dict[str, dict[str, Any]]:
+        """Saglayici basina gecikme ozeti.
+
+        Returns:
+            Saglayici adi -> histogram ozeti.
+        """
+        return {
+            name: {**hist.summary(), "censored": self._censored.get(name, 0)}
+            for name, hist in self._latency.items()
+        }
+
+
+class SingleFlight(Generic[T]):
+    """Ayni anahtarli esanli cagrilari tek cagrida birlestirir.
+
+    Ilk cagiran isi baslatir; is bitene kadar ayni anahtarla
+    gelenler ayni sonucu (veya hatayi) bekler. Is ayri bir
+    gorevde calisir; bekleyenlerden biri iptal edilirse
+    digerleri etkilenmez, son bekleyen iptal edilirse is de
+    iptal edilir.
+    """
+
+    def __init__(self) -> None:
+        """Bos grup olusturur."""
+        self._flights: dict[Hashable, tuple[asyncio.Task[T], list[int]]] = {}
+        self.shared = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[T]],
+    ) -> tuple[T, bool]:
+        """Isi calistirir veya devam eden ise katilir.
+
+        Args:
+            key: Istek anahtari.
+            fn: Isi baslatan fonksiyon.
+
+        Returns:
+            (sonuc, paylasildi mi) ikilisi.
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            task = asyncio.ensure_future(fn())
+            flight = (task, [0])
+            self._flights[key] = flight
+            task.add_done_callback(lambda t: self._land(key, t))
+        else:
+            self.shared += 1
+
+        task, waiters = flight
+        waiters[0] += 1
+        try:
+            return await asyncio.shield(task), shared
+        except asyncio.CancelledError:
+            if waiters[0] == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            waiters[0] -= 1
+
+    def _land(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        """Biten isi kayittan siler."""
+        flight = self._flights.get(key)
+        if flight is not None and flight[0] is task:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        """Devam eden is sayisi."""
+        return len(self._flights)
@@ -5,10 +5,22 @@ provider soyutlama, yanit normalizasyonu,
 hata yonetimi ve yeniden deneme saglar.
 """
 
+import asyncio
+import hashlib
 import logging
 import time
-from typing import Any, AsyncIterator
+from collections.abc import AsyncIterator
+from typing import Any
 
+from app.core.llmrouter.response_cache import LLMResponseCache
+from app.core.unifiedllm.anthropic_adapter import AnthropicAdapter
+from app.core.unifiedllm.api_key_rotator import APIKeyRotator
+from app.core.unifiedllm.execution_policy import ExecutionPolicy, SingleFlight
+from app.core.unifiedllm.gemini_adapter import GeminiAdapter
+from app.core.unifiedllm.model_registry import LLMModelRegistry
+from app.core.unifiedllm.ollama_adapter import OllamaAdapter
+from app.core.unifiedllm.openai_adapter import OpenAIAdapter
+from app.core.unifiedllm.openrouter_adapter import OpenRouterAdapter
 from app.models.unifiedllm_models import (
     FinishReason,
     LLMProvider,
@@ -19,13 +31,6 @@ from app.models.unifiedllm_models import (
     StreamChunk,
     UnifiedLLMSnapshot,
 )
-from app.core.unifiedllm.anthropic_adapter import AnthropicAdapter
-from app.core.unifiedllm.openai_adapter import OpenAIAdapter
-from app.core.unifiedllm.gemini_adapter import GeminiAdapter
-from app.core.unifiedllm.ollama_adapter import OllamaAdapter
-from app.core.unifiedllm.openrouter_adapter import OpenRouterAdapter
-from app.core.unifiedllm.model_registry import LLMModelRegistry
-from app.core.unifiedllm.api_key_rotator import APIKeyRotator
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +54,9 @@ class UnifiedLLMClient:
         _total_cost: Toplam maliyet.
         _errors: Hata sayisi.
         _provider_errors: Saglayici bazli hata.
+        _policy: Geri cekilme ve hedge politikasi.
+        _flights: Esanli ozdes istek birlestirici.
+        _response_cache: Yanit onbellegi (opsiyonel).
     """
 
     def __init__(
@@ -62,6 +70,9 @@ class UnifiedLLMClient:
         gemini_api_key: str = "",
         openrouter_api_key: str = "",
         ollama_base_url: str = "http://localhost:11434",
+        policy: ExecutionPolicy | None = None,
+        singleflight: bool = True,
+        response_cache: LLMResponseCache | None = None,
     ) -> None:
         """UnifiedLLMClient baslatir.
 
@@ -75,6 +86,9 @@ class UnifiedLLMClient:
             gemini_api_key: Gemini API anahtari.
             openrouter_api_key: OpenRouter API anahtari.
             ollama_base_url: Ollama sunucu URL.
+            policy: Geri cekilme/hedge politikasi (varsayilan hedge kapali).
+            singleflight: Esanli ozdes istekleri birlestir.
+            response_cache: Yanit onbellegi (varsayilan kapali).
         """
         self._default_provider = default_provider
         self._fallback_chain = [
@@ -82,6 +96,10 @@ class UnifiedLLMClient:
         ]
         self._retry_count = retry_count
         self._timeout = timeout_seconds
+        self._policy = policy or ExecutionPolicy()
+        self._singleflight = singleflight
+        self._flights: SingleFlight[LLMResponse] = SingleFlight()
+        self._response_cache = response_cache
 
         # Alt bilesenleri olustur
         self._registry = LLMModelRegistry()
@@ -130,6 +148,8 @@ class UnifiedLLMClient:
         self._total_cost: float = 0.0
         self._errors: int = 0
         self._provider_errors: dict[str, int] = {}
+        self._hedges: int = 0
+        self._hedge_wins: int = 0
 
         logger.info(
             "UnifiedLLMClient baslatildi: default=%s, fallback=%s",
@@ -236,6 +256,11 @@ class UnifiedLLMClient:
     async def chat(self, request: LLMRequest) -> LLMResponse:
         """Sohbet istegi gonderir (failover ile).
 
+        Yanit onbellegi verilmisse once onbellege bakilir
+        (``metadata["no_cache"]`` ile atlanabilir). Ayni anda
+        gelen ozdes istekler (singleflight acikken) tek
+        upstream cagrisini paylasir.
+
         Args:
             request: LLM istegi.
 
@@ -245,6 +270,63 @@ class UnifiedLLMClient:
         # maxTokens kisitla
         self._clamp_request_tokens(request)
 
+        cache = self._response_cache
+        use_cache = (
+            cache is not None
+            and not request.metadata.get("no_cache")
+        )
+        if cache is not None and use_cache:
+            cached = await cache.lookup(request)
+            if cached is not None:
+                return cached
+
+        fetch = self._chat_cached if use_cache else self._chat_upstream
+        if not self._singleflight:
+            return await fetch(request)
+
+        response, shared = await self._flights.do(
+            self._request_key(request),
+            lambda: fetch(request),
+        )
+        return response.model_copy(deep=True) if shared else response
+
+    async def _chat_cached(self, request: LLMRequest) -> LLMResponse:
+        """Upstream yanitini alir ve onbellege yazar.
+
+        Args:
+            request: LLM istegi.
+
+        Returns:
+            LLM yaniti.
+        """
+        response = await self._chat_upstream(request)
+        cache = self._response_cache
+        if cache is not None:
+            await cache.store(request, response)
+        return response
+
+    @staticmethod
+    def _request_key(request: LLMRequest) -> str:
+        """Singleflight icin istek anahtari (request_id haric).
+
+        Args:
+            request: LLM istegi.
+
+        Returns:
+            Istek ozeti.
+        """
+        payload = request.model_dump_json(exclude={"request_id"})
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def _chat_upstream(self, request: LLMRequest) -> LLMResponse:
+        """Saglayici zincirini seri veya hedge ile dener.
+
+        Args:
+            request: LLM istegi.
+
+        Returns:
+            LLM yaniti.
+        """
         primary = self._resolve_provider(request)
         providers_to_try = [primary]
 
@@ -253,44 +335,31 @@ class UnifiedLLMClient:
             if fb != primary and fb not in providers_to_try:
                 providers_to_try.append(fb)
 
-        last_error: str = ""
-
-        for provider_name in providers_to_try:
-            adapter = self._get_adapter(provider_name)
-            if not adapter:
-                continue
-
-            for attempt in range(self._retry_count):
-                try:
-                    response = await adapter.chat(request)
-
-                    if response.finish_reason != FinishReason.ERROR:
-                        self._request_count += 1
-                        if response.usage:
-                            self._total_tokens += response.usage.total_tokens
-                            self._total_cost += response.usage.cost_usd
-                        return response
-
-                    last_error = str(
-                        response.raw_response.get("error", "unknown")
-                        if response.raw_response else "unknown"
-                    )
+        candidates = [
+            name for name in providers_to_try if self._get_adapter(name)
+        ]
 
-                except Exception as e:
-                    last_error = str(e)
-                    self._provider_errors[provider_name] = (
-                        self._provider_errors.get(provider_name, 0) + 1
-                    )
-                    logger.warning(
-                        "Saglayici hatasi: %s, deneme %d/%d: %s",
-                        provider_name, attempt + 1,
-                        self._retry_count, e,
-                    )
+        if self._policy.hedge and len(candidates) > 1:
+            response, last_error = await self._chat_hedged(candidates, request)
+        else:
+            response, last_error = None, ""
+            for provider_name in candidates:
+                response, last_error = await self._try_provider(
+                    provider_name, request,
+                )
+                if response is not None:
+                    break
+                logger.warning(
+                    "Saglayici basarisiz, sonrakine geciliyor: %s",
+                    provider_name,
+                )
 
-            logger.warning(
-                "Saglayici basarisiz, sonrakine geciliyor: %s",
-                provider_name,
-            )
+        if response is not None:
+            self._request_count += 1
+            if response.usage:
+                self._total_tokens += response.usage.total_tokens
+                self._total_cost += response.usage.cost_usd
+            return response
 
         # Tum saglayicilar basarisiz
         self._errors += 1
@@ -305,6 +374,136 @@ class UnifiedLLMClient:
             raw_response={"error": f"Tum saglayicilar basarisiz: {last_error}"},
         )
 
+    async def _try_provider(
+        self,
+        provider_name: str,
+        request: LLMRequest,
+    ) -> tuple[LLMResponse | None, str]:
+        """Tek saglayiciyi jitter'li geri cekilme ile dener.
+
+        Args:
+            provider_name: Saglayici adi.
+            request: LLM istegi.
+
+        Returns:
+            (basarili yanit veya None, son hata) ikilisi.
+        """
+        adapter = self._get_adapter(provider_name)
+        last_error = ""
+
+        for attempt in range(self._retry_count):
+            if attempt > 0:
+                delay = self._policy.backoff(attempt - 1)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            started = time.monotonic()
+            try:
+                response = await adapter.chat(request)
+            except asyncio.CancelledError:
+                # Hedge kaybeden cagri en az bu kadar surerdi
+                self._policy.observe(
+                    provider_name, time.monotonic() - started,
+                    censored=True,
+                )
+                raise
+            except Exception as e:
+                last_error = str(e)
+                self._provider_errors[provider_name] = (
+                    self._provider_errors.get(provider_name, 0) + 1
+                )
+                logger.warning(
+                    "Saglayici hatasi: %s, deneme %d/%d: %s",
+                    provider_name, attempt + 1,
+                    self._retry_count, e,
+                )
+                continue
+
+            if response.finish_reason != FinishReason.ERROR:
+                self._policy.observe(
+                    provider_name, time.monotonic() - started,
+                )
+                return response, ""
+
+            last_error = str(
+                response.raw_response.get("error", "unknown")
+                if response.raw_response else "unknown"
+            )
+
+        return None, last_error
+
+    async def _chat_hedged(
+        self,
+        providers: list[str],
+        request: LLMRequest,
+    ) -> tuple[LLMResponse | None, str]:
+        """Saglayicilari hedge ile dener, ilk basariliyi dondurur.
+
+        Calisan saglayici hedge gecikmesi (gecikme yuzdeligi)
+        icinde yanit vermezse veya basarisiz olursa siradaki
+        baslatilir; esanli saglayici sayisi ``max_inflight``
+        ile sinirlidir. Ilk basarili yanit gelince digerleri
+        iptal edilir.
+
+        Args:
+            providers: Adaptoru olan saglayicilar (oncelik sirasiyla).
+            request: LLM istegi.
+
+        Returns:
+            (basarili yanit veya None, son hata) ikilisi.
+        """
+        queue = list(providers)
+        running: dict[asyncio.Task[tuple[LLMResponse | None, str]], str] = {}
+        last_error = ""
+        latest = ""
+
+        def _launch() -> asyncio.Task[tuple[LLMResponse | None, str]]:
+            nonlocal latest
+            latest = queue.pop(0)
+            task = asyncio.create_task(self._try_provider(latest, request))
+            running[task] = latest
+            return task
+
+        primary = _launch()
+        try:
+            while running:
+                can_hedge = bool(queue) and len(running) < self._policy.max_inflight
+                timeout = self._policy.hedge_delay(latest) if can_hedge else None
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:
+                    self._hedges += 1
+                    logger.info(
+                        "Hedge istegi: %s yanit vermedi, %s baslatiliyor",
+                        latest, queue[0],
+                    )
+                    _launch()
+                    continue
+
+                for task in done:
+                    provider_name = running.pop(task)
+                    response, error = task.result()
+                    if response is not None:
+                        # Yalnizca hala calisan birincili gecen hedge;
+                        # hata sonrasi gecis (failover) sayilmaz
+                        if task is not primary and primary in running:
+                            self._hedge_wins += 1
+                        return response, ""
+                    last_error = error
+                    logger.warning(
+                        "Saglayici basarisiz, sonrakine geciliyor: %s",
+                        provider_name,
+                    )
+
+                while queue and len(running) < self._policy.max_inflight:
+                    _launch()
+            return None, last_error
+        finally:
+            for task in running:
+                task.cancel()
+
     async def stream(
         self, request: LLMRequest
     ) -> AsyncIterator[StreamChunk]:
@@ -415,6 +614,16 @@ class UnifiedLLMClient:
         """Model kayit defterini dondurur."""
         return self._registry
 
+    @property
+    def policy(self) -> ExecutionPolicy:
+        """Yurutme politikasini dondurur."""
+        return self._policy
+
+    @property
+    def response_cache(self) -> LLMResponseCache | None:
+        """Yanit onbellegini dondurur."""
+        return self._response_cache
+
     @property
     def rotator(self) -> APIKeyRotator:
         """API anahtar rotatorunu dondurur."""
@@ -470,6 +679,14 @@ class UnifiedLLMClient:
             "total_cost": self._total_cost,
             "errors": self._errors,
             "provider_errors": dict(self._provider_errors),
+            "hedges": self._hedges,
+            "hedge_wins": self._hedge_wins,
+            "singleflight_shared": self._flights.shared,
+            "latency": self._policy.latency_summary(),
+            "response_cache": (
+                self._response_cache.get_stats()
+                if self._response_cache is not None else None
+            ),
             "registry": self._registry.get_stats(),
             "rotator": self._rotator.get_stats(),
         }
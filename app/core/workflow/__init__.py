@@ -6,6 +6,9 @@ from app.core.workflow.action_executor import (
 from app.core.workflow.condition_evaluator import (
     ConditionEvaluator,
 )
+from app.core.workflow.dag_executor import (
+    DagExecutor,
+)
 from app.core.workflow.error_handler import (
     WorkflowErrorHandler,
 )
@@ -31,6 +34,7 @@ from app.core.workflow.workflow_orchestrator import (
 __all__ = [
     "ActionExecutor",
     "ConditionEvaluator",
+    "DagExecutor",
     "ExecutionTracker",
     "LoopController",
     "TriggerManager",
@@ -5,6 +5,8 @@ API cagrilari, script calistirma
 ve agent delege etme.
 """
 
+import asyncio
+import inspect
 import logging
 import time
 from typing import Any, Callable
@@ -123,6 +125,87 @@ class ActionExecutor:
         except Exception as e:
             error = str(e)
 
+        return self._record(
+            action, action_name,
+            start, result_data, error,
+        )
+
+    async def execute_async(
+        self,
+        action_name: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Aksiyonu olay dongusunu bloklamadan calistirir.
+
+        Coroutine isleyiciler beklenir; senkron ozel
+        isleyiciler thread havuzunda calisir. Zaman asimi
+        veya iptal thread'deki isleyiciyi durdurmaz.
+
+        Args:
+            action_name: Aksiyon adi.
+            params: Parametreler.
+
+        Returns:
+            Calistirma sonucu.
+        """
+        action = self._actions.get(action_name)
+        if not action or not action["enabled"]:
+            return {
+                "success": False,
+                "action": action_name,
+                "reason": "action_not_found",
+            }
+
+        start = time.time()
+        result_data: Any = None
+        error = ""
+
+        try:
+            handler = self._custom_handlers.get(
+                action_name,
+            )
+            if handler is None:
+                result_data = self._run_builtin(
+                    action_name, params or {},
+                )
+            elif inspect.iscoroutinefunction(handler):
+                result_data = await handler(
+                    **(params or {}),
+                )
+            else:
+                result_data = await asyncio.to_thread(
+                    handler, **(params or {}),
+                )
+                if inspect.isawaitable(result_data):
+                    result_data = await result_data
+        except Exception as e:
+            error = str(e)
+
+        return self._record(
+            action, action_name,
+            start, result_data, error,
+        )
+
+    def _record(
+        self,
+        action: dict[str, Any],
+        action_name: str,
+        start: float,
+        result_data: Any,
+        error: str,
+    ) -> dict[str, Any]:
+        """Calistirma sonucunu olusturur ve gecmise ekler.
+
+        Args:
+            action: Aksiyon tanimi.
+            action_name: Aksiyon adi.
+            start: Baslangic zamani.
+            result_data: Sonuc verisi.
+            error: Hata mesaji.
+
+        Returns:
+            Calistirma sonucu.
+        """
         duration = time.time() - start
         success = not error
 
@@ -0,0 +1,361 @@
+"""ATLAS Kosul Derleyici modulu.
+
+Kosul ifadelerini bir kez ayristirip
+closure agacina derler; ``and``/``or``/
+``not``, parantez ve alan yollari.
+"""
+
+import logging
+import operator
+import re
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+Predicate = Callable[[Mapping[str, Any]], bool]
+
+# Arama sirasi eski ayristiriciyla aynidir
+_OPERATORS = (">=", "<=", "!=", "==", ">", "<")
+
+_OP_FUNCS: dict[str, Callable[[Any, Any], Any]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "!=": operator.ne,
+    "==": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+# Tirnakli metin, parantez ve bosluk/parantezle ayrilmis anahtar kelimeler
+_TOKEN_RE = re.compile(
+    r"""('[^']*'|"[^"]*")"""
+    r"|(\()|(\))"
+    r"|(?<![^\s()])(and|or|not)(?![^\s()])",
+    re.IGNORECASE,
+)
+
+_QUOTED_RE = re.compile(r"""'[^']*'|"[^"]*\"""")
+
+_MISSING = object()
+
+
+class ConditionSyntaxError(ValueError):
+    """Ifade mantiksal yapisi gecersiz."""
+
+
+class CompiledCondition:
+    """Derlenmis kosul.
+
+    Baglam alip bool donduren closure'u sarar;
+    tek baglam veya baglam listesi uzerinde
+    yeniden ayristirma olmadan calisir.
+
+    Attributes:
+        expression: Kaynak ifade.
+    """
+
+    __slots__ = ("expression", "_fn")
+
+    def __init__(
+        self,
+        expression: str,
+        fn: Predicate,
+    ) -> None:
+        """Derlenmis kosulu olusturur.
+
+        Args:
+            expression: Kaynak ifade.
+            fn: Derlenmis predicate.
+        """
+        self.expression = expression
+        self._fn = fn
+
+    def __call__(
+        self,
+        context: Mapping[str, Any] | None = None,
+    ) -> bool:
+        """Tek baglamda degerlendirir."""
+        return bool(self._fn(context or {}))
+
+    def evaluate_batch(
+        self,
+        contexts: Iterable[Mapping[str, Any]],
+    ) -> list[bool]:
+        """Baglam listesini toplu degerlendirir.
+
+        Args:
+            contexts: Baglamlar.
+
+        Returns:
+            Baglam basina sonuc.
+        """
+        fn = self._fn
+        return [bool(fn(ctx)) for ctx in contexts]
+
+    def filter(
+        self,
+        contexts: Iterable[Mapping[str, Any]],
+    ) -> list[Mapping[str, Any]]:
+        """Kosulu saglayan baglamlari dondurur.
+
+        Args:
+            contexts: Baglamlar.
+
+        Returns:
+            Eslesen baglamlar.
+        """
+        fn = self._fn
+        return [ctx for ctx in contexts if fn(ctx)]
+
+    def __repr__(self) -> str:
+        return f"CompiledCondition({self.expression!r})"
+
+
+def compile_condition(expression: str) -> CompiledCondition:
+    """Ifadeyi derler.
+
+    Mantiksal yapi bozuksa (ornegin kapanmamis
+    parantez) tum ifade tek karsilastirma olarak
+    derlenir; eski davranis korunur.
+
+    Args:
+        expression: Kosul ifadesi.
+
+    Returns:
+        Derlenmis kosul.
+    """
+    try:
+        fn = _Parser(_tokenize(expression)).parse()
+    except ConditionSyntaxError as exc:
+        logger.debug(
+            "Kosul tek ifade olarak derlendi: %r (%s)",
+            expression, exc,
+        )
+        fn = _compile_leaf(expression.strip())
+    return CompiledCondition(expression, fn)
+
+
+def _tokenize(expression: str) -> list[tuple[str, str]]:
+    """Ifadeyi mantiksal parcalara ayirir.
+
+    Args:
+        expression: Ifade.
+
+    Returns:
+        (tur, metin) listesi; tur leaf, (, ), and, or, not.
+    """
+    tokens: list[tuple[str, str]] = []
+    leaf: list[str] = []
+    pos = 0
+
+    def _flush() -> None:
+        text = "".join(leaf).strip()
+        leaf.clear()
+        if text:
+            tokens.append(("leaf", text))
+
+    for match in _TOKEN_RE.finditer(expression):
+        leaf.append(expression[pos:match.start()])
+        pos = match.end()
+        if match.group(1):
+            # Tirnakli metin karsilastirmanin parcasidir
+            leaf.append(match.group(1))
+            continue
+        _flush()
+        kind = match.group(2) or match.group(3) or match.group(4).lower()
+        tokens.append((kind, kind))
+    leaf.append(expression[pos:])
+    _flush()
+    return tokens
+
+
+class _Parser:
+    """Ozyinelemeli inis ayristiricisi.
+
+    or_expr  := and_expr ("or" and_expr)*
+    and_expr := not_expr ("and" not_expr)*
+    not_expr := "not" not_expr | "(" or_expr ")" | leaf
+    """
+
+    def __init__(self, tokens: list[tuple[str, str]]) -> None:
+        self._tokens = tokens
+        self._pos = 0
+
+    def parse(self) -> Predicate:
+        if not self._tokens:
+            return _compile_leaf("")
+        fn = self._or()
+        if self._pos != len(self._tokens):
+            raise ConditionSyntaxError(
+                f"beklenmeyen parca: {self._tokens[self._pos][1]}",
+            )
+        return fn
+
+    def _peek(self) -> str:
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos][0]
+        return ""
+
+    def _or(self) -> Predicate:
+        fn = self._and()
+        while self._peek() == "or":
+            self._pos += 1
+            fn = _either(fn, self._and())
+        return fn
+
+    def _and(self) -> Predicate:
+        fn = self._not()
+        while self._peek() == "and":
+            self._pos += 1
+            fn = _both(fn, self._not())
+        return fn
+
+    def _not(self) -> Predicate:
+        kind = self._peek()
+        if kind == "not":
+            self._pos += 1
+            inner = self._not()
+            return lambda ctx: not inner(ctx)
+        if kind == "(":
+            self._pos += 1
+            fn = self._or()
+            if self._peek() != ")":
+                raise ConditionSyntaxError("kapanmamis parantez")
+            self._pos += 1
+            return fn
+        if kind == "leaf":
+            text = self._tokens[self._pos][1]
+            self._pos += 1
+            return _compile_leaf(text)
+        raise ConditionSyntaxError(f"beklenmeyen parca: {kind or 'son'}")
+
+
+def _either(left: Predicate, right: Predicate) -> Predicate:
+    return lambda ctx: bool(left(ctx)) or bool(right(ctx))
+
+
+def _both(left: Predicate, right: Predicate) -> Predicate:
+    return lambda ctx: bool(left(ctx)) and bool(right(ctx))
+
+
+def _compile_leaf(text: str) -> Predicate:
+    """Tek karsilastirma veya degisken kontrolunu derler.
+
+    Semantik eski ``_eval_expression`` ile aynidir:
+    sol taraf baglamda yoksa metnin kendisi kullanilir,
+    iki taraf da sayiya cevrilebiliyorsa sayisal
+    karsilastirilir.
+
+    Args:
+        text: Parca metni.
+
+    Returns:
+        Predicate.
+    """
+    lowered = text.lower()
+    if lowered == "true":
+        return lambda ctx: True
+    if lowered == "false":
+        return lambda ctx: False
+
+    # Operator tirnak icinde aranmaz
+    masked = _QUOTED_RE.sub(lambda m: "_" * len(m.group()), text)
+    for op in _OPERATORS:
+        idx = masked.find(op)
+        if idx >= 0:
+            return _compile_comparison(
+                text[:idx].strip(), op,
+                text[idx + len(op):].strip(),
+            )
+
+    get = _getter(text)
+    return lambda ctx: bool(get(ctx, None))
+
+
+def _compile_comparison(
+    left_key: str,
+    op: str,
+    right: str,
+) -> Predicate:
+    """Karsilastirma predicate'i uretir.
+
+    Args:
+        left_key: Sol alan yolu.
+        op: Operator.
+        right: Sag literal.
+
+    Returns:
+        Predicate.
+    """
+    fn = _OP_FUNCS[op]
+    get = _getter(left_key)
+
+    if len(right) >= 2 and right[0] == right[-1] and right[0] in "'\"":
+        # Tirnakli literal: sayisal donusum yok
+        literal = right[1:-1]
+
+        def _compare_text(ctx: Mapping[str, Any]) -> bool:
+            try:
+                return fn(get(ctx, left_key), literal)
+            except (TypeError, ValueError):
+                return False
+
+        return _compare_text
+
+    try:
+        number: Any = float(right)
+    except ValueError:
+        number = right
+
+    def _compare(ctx: Mapping[str, Any]) -> bool:
+        left = get(ctx, left_key)
+        try:
+            left = float(left)
+        except (TypeError, ValueError):
+            rhs: Any = right
+        else:
+            rhs = number
+        try:
+            return fn(left, rhs)
+        except (TypeError, ValueError):
+            return False
+
+    return _compare
+
+
+def _getter(path: str) -> Callable[[Mapping[str, Any], Any], Any]:
+    """Alan yolu okuyucusu uretir.
+
+    Duz anahtar once denenir; yoksa noktali yol
+    sozluk anahtari veya liste indeksi olarak yurunur.
+
+    Args:
+        path: Alan yolu (ornegin ``user.age``).
+
+    Returns:
+        (baglam, varsayilan) -> deger.
+    """
+    if "." not in path:
+        return lambda ctx, default: ctx.get(path, default)
+
+    parts = tuple(path.split("."))
+
+    def _walk(ctx: Mapping[str, Any], default: Any) -> Any:
+        value = ctx.get(path, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = ctx
+        for part in parts:
+            if isinstance(value, Mapping):
+                value = value.get(part, _MISSING)
+            elif isinstance(value, (list, tuple)) and part.isdigit():
+                idx = int(part)
+                value = value[idx] if idx < len(value) else _MISSING
+            else:
+                return default
+            if value is _MISSING:
+                return default
+        return value
+
+    return _walk
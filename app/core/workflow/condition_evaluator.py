@@ -7,8 +7,15 @@ zaman tabanli ve karmasik kosullar.
 
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from typing import Any
 
+from app.core.workflow.condition_compiler import (
+    CompiledCondition,
+    compile_condition,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,21 +23,37 @@ class ConditionEvaluator:
     """Kosul degerlendirici.
 
     Is akisi kosullarini degerlendirir
-    ve kararlastirir.
+    ve kararlastirir. Ifadeler bir kez
+    derlenir ve metne gore sinirli LRU
+    onbellekte tutulur.
 
     Attributes:
         _conditions: Kayitli kosullar.
         _evaluations: Degerlendirme gecmisi.
+        _compiled: Derlenmis ifade onbellegi.
     """
 
-    def __init__(self) -> None:
-        """Kosul degerlendiriciyi baslatir."""
+    def __init__(
+        self,
+        max_compiled: int = 512,
+    ) -> None:
+        """Kosul degerlendiriciyi baslatir.
+
+        Args:
+            max_compiled: Onbellekteki maks derlenmis ifade.
+        """
         self._conditions: dict[
             str, dict[str, Any]
         ] = {}
         self._evaluations: list[
             dict[str, Any]
         ] = []
+        self._compiled: OrderedDict[
+            str, CompiledCondition
+        ] = OrderedDict()
+        self._max_compiled = max(1, max_compiled)
+        self._compile_hits = 0
+        self._compile_misses = 0
 
         logger.info(
             "ConditionEvaluator baslatildi",
@@ -75,9 +98,7 @@ class ConditionEvaluator:
             Sonuc.
         """
         ctx = context or {}
-        result = self._eval_expression(
-            expression, ctx,
-        )
+        result = self.compile(expression)(ctx)
 
         self._evaluations.append({
             "expression": expression,
@@ -88,6 +109,62 @@ class ConditionEvaluator:
 
         return result
 
+    def compile(
+        self,
+        expression: str,
+    ) -> CompiledCondition:
+        """Ifadeyi derler veya onbellekten dondurur.
+
+        Args:
+            expression: Kosul ifadesi.
+
+        Returns:
+            Derlenmis kosul.
+        """
+        compiled = self._compiled.get(expression)
+        if compiled is not None:
+            self._compile_hits += 1
+            self._compiled.move_to_end(expression)
+            return compiled
+
+        self._compile_misses += 1
+        compiled = compile_condition(expression)
+        self._compiled[expression] = compiled
+        if len(self._compiled) > self._max_compiled:
+            self._compiled.popitem(last=False)
+        return compiled
+
+    def evaluate_batch(
+        self,
+        expression: str,
+        contexts: Iterable[Mapping[str, Any]],
+    ) -> list[bool]:
+        """Ifadeyi baglam listesi uzerinde degerlendirir.
+
+        Dongu dugumleri ve tetikleyici filtreleri
+        icindir; ifade bir kez derlenir, gecmise
+        tek kayit yazilir.
+
+        Args:
+            expression: Kosul ifadesi.
+            contexts: Baglamlar.
+
+        Returns:
+            Baglam basina sonuc.
+        """
+        results = self.compile(expression).evaluate_batch(
+            contexts,
+        )
+
+        self._evaluations.append({
+            "expression": expression,
+            "batch_size": len(results),
+            "matched": sum(results),
+            "at": time.time(),
+        })
+
+        return results
+
     def evaluate_named(
         self,
         name: str,
@@ -222,48 +299,24 @@ class ConditionEvaluator:
         Returns:
             Sonuc.
         """
-        expr = expression.strip()
+        return self.compile(expression)(context)
 
-        # "true" / "false"
-        if expr.lower() == "true":
-            return True
-        if expr.lower() == "false":
-            return False
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Derleme onbellegi istatistiklerini getirir.
 
-        # Karsilastirma: "field op value"
-        for op in [">=", "<=", "!=", "==", ">", "<"]:
-            if op in expr:
-                parts = expr.split(op, 1)
-                if len(parts) == 2:
-                    left_key = parts[0].strip()
-                    right_val = parts[1].strip()
-                    left_val = context.get(
-                        left_key, left_key,
-                    )
-                    # Sayisal donusum
-                    try:
-                        left_val = float(left_val)
-                        right_val = float(right_val)
-                    except (ValueError, TypeError):
-                        pass
-
-                    op_map = {
-                        "==": "eq", "!=": "ne",
-                        ">": "gt", ">=": "gte",
-                        "<": "lt", "<=": "lte",
-                    }
-                    return self.compare(
-                        left_val,
-                        op_map[op],
-                        right_val,
-                    )
-
-        # Degisken kontrolu
-        val = context.get(expr)
-        if val is not None:
-            return bool(val)
-
-        return False
+        Returns:
+            Boyut, isabet ve iskalar.
+        """
+        lookups = self._compile_hits + self._compile_misses
+        return {
+            "size": len(self._compiled),
+            "max_size": self._max_compiled,
+            "hits": self._compile_hits,
+            "misses": self._compile_misses,
+            "hit_rate": round(
+                self._compile_hits / lookups, 4,
+            ) if lookups else 0.0,
+        }
 
     @property
     def condition_count(self) -> int:
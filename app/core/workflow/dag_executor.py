@@ -0,0 +1,293 @@
+"""ATLAS Is Akisi DAG Yurutucu modulu.
+
+Baglantilardan turetilen bagimlilik grafigi,
+hazir dugumlerin esanli calistirilmasi,
+dugum zaman asimi, iptal ve zamanlama izleri.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.core.workflow.execution_tracker import (
+    ExecutionTracker,
+)
+
+logger = logging.getLogger(__name__)
+
+NodeRunner = Callable[
+    [dict[str, Any]], Awaitable[dict[str, Any]]
+]
+
+# Alt dugumleri bloklayan durumlar
+_BLOCKING = frozenset({
+    "failed", "timeout", "blocked", "cancelled",
+})
+
+# Kosul sonucuna bagli baglanti etiketleri
+_BRANCH_LABELS = frozenset({"true", "false"})
+
+
+def build_dag(
+    nodes: list[dict[str, Any]],
+    connections: list[dict[str, Any]],
+) -> dict[str, list[tuple[str, str]]]:
+    """Dugum basina (onceki dugum, etiket) listesi cikarir.
+
+    Args:
+        nodes: Dugumler.
+        connections: Baglantilar.
+
+    Returns:
+        Dugum ID -> gelen kenarlar.
+    """
+    incoming: dict[str, list[tuple[str, str]]] = {
+        n["id"]: [] for n in nodes
+    }
+    for conn in connections:
+        if conn["from"] in incoming and conn["to"] in incoming:
+            incoming[conn["to"]].append(
+                (conn["from"], conn.get("label", "")),
+            )
+    return incoming
+
+
+def find_cycle(
+    incoming: dict[str, list[tuple[str, str]]],
+) -> list[str]:
+    """Grafikte dongu arar (Kahn algoritmasi).
+
+    Args:
+        incoming: Dugum -> gelen kenarlar.
+
+    Returns:
+        Donguye katilan dugumler (yoksa bos).
+    """
+    indegree = {nid: len(edges) for nid, edges in incoming.items()}
+    children: dict[str, list[str]] = {nid: [] for nid in incoming}
+    for nid, edges in incoming.items():
+        for src, _ in edges:
+            children[src].append(nid)
+
+    ready = [nid for nid, deg in indegree.items() if deg == 0]
+    while ready:
+        nid = ready.pop()
+        for child in children[nid]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+    return [nid for nid, deg in indegree.items() if deg > 0]
+
+
+class DagExecutor:
+    """Is akisi DAG yurutucu.
+
+    Tum onculleri biten dugumleri ``max_parallel``
+    sinirina kadar esanli calistirir. Basarisiz, zaman
+    asimina ugrayan veya iptal edilen dugumun altindaki
+    dugumler ``blocked`` olur; ``true``/``false``
+    etiketli baglantilar kosul sonucuna gore secilir,
+    secilmeyen daldaki dugumler ``skipped`` olur. Her
+    dugum icin takipciye zamanlama izi yazilir.
+
+    Attributes:
+        max_parallel: Esanli dugum siniri.
+        node_timeout: Varsayilan dugum zaman asimi (0 ise yok).
+    """
+
+    def __init__(
+        self,
+        max_parallel: int = 4,
+        node_timeout: float = 0.0,
+    ) -> None:
+        """Yurutucuyu baslatir.
+
+        Args:
+            max_parallel: Esanli dugum siniri.
+            node_timeout: Varsayilan dugum zaman asimi (saniye).
+        """
+        self.max_parallel = max(1, max_parallel)
+        self.node_timeout = node_timeout
+
+    async def run(
+        self,
+        execution_id: str,
+        nodes: list[dict[str, Any]],
+        incoming: dict[str, list[tuple[str, str]]],
+        run_node: NodeRunner,
+        tracker: ExecutionTracker,
+    ) -> dict[str, Any]:
+        """Grafigi calistirir.
+
+        Args:
+            execution_id: Calistirma ID.
+            nodes: Dugumler (sira, hazir dugum onceligi).
+            incoming: Dugum -> gelen kenarlar.
+            run_node: Dugumu calistiran coroutine fonksiyonu.
+            tracker: Yurutme takipcisi.
+
+        Returns:
+            Dugum durumlari ve sayaclar.
+
+        Raises:
+            asyncio.CancelledError: Calistirma iptal edilirse.
+        """
+        by_id = {n["id"]: n for n in nodes}
+        children: dict[str, list[str]] = {nid: [] for nid in by_id}
+        for nid, edges in incoming.items():
+            for src, _ in edges:
+                children[src].append(nid)
+
+        status: dict[str, str] = {}
+        outputs: dict[str, Any] = {}
+        waiting = {nid: len(edges) for nid, edges in incoming.items()}
+        ready = [n["id"] for n in nodes if waiting[n["id"]] == 0]
+        running: dict[asyncio.Task[dict[str, Any]], str] = {}
+
+        def _resolve(nid: str) -> None:
+            """Biten dugumun cocuklarini hazirlar."""
+            stack = [nid]
+            while stack:
+                for child in children[stack.pop()]:
+                    waiting[child] -= 1
+                    if waiting[child] > 0:
+                        continue
+                    verdict = self._verdict(incoming[child], status, outputs)
+                    if verdict == "run":
+                        ready.append(child)
+                        continue
+                    # Calismayacak dugum kendi cocuklarini da cozer
+                    status[child] = verdict
+                    tracker.log_step(
+                        execution_id, by_id[child]["name"], verdict,
+                    )
+                    stack.append(child)
+
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_parallel:
+                    nid = ready.pop(0)
+                    task = asyncio.ensure_future(
+                        self._run_one(
+                            execution_id, by_id[nid],
+                            [src for src, _ in incoming[nid]],
+                            run_node, tracker,
+                        ),
+                    )
+                    running[task] = nid
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    nid = running.pop(task)
+                    outcome = task.result()
+                    status[nid] = outcome["status"]
+                    outputs[nid] = outcome.get("result")
+                    _resolve(nid)
+        except asyncio.CancelledError:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            for nid in by_id:
+                if nid not in status and nid not in running.values():
+                    tracker.log_step(
+                        execution_id, by_id[nid]["name"], "cancelled",
+                    )
+            raise
+
+        counts: dict[str, int] = {}
+        for value in status.values():
+            counts[value] = counts.get(value, 0) + 1
+        return {
+            "nodes": status,
+            "completed": counts.get("completed", 0),
+            "failed": sum(
+                counts.get(s, 0) for s in ("failed", "timeout")
+            ),
+            "skipped": counts.get("skipped", 0),
+            "blocked": counts.get("blocked", 0),
+        }
+
+    async def _run_one(
+        self,
+        execution_id: str,
+        node: dict[str, Any],
+        deps: list[str],
+        run_node: NodeRunner,
+        tracker: ExecutionTracker,
+    ) -> dict[str, Any]:
+        """Tek dugumu zaman asimi ve iz kaydiyla calistirir.
+
+        Args:
+            execution_id: Calistirma ID.
+            node: Dugum.
+            deps: Oncul dugum ID'leri.
+            run_node: Dugumu calistiran fonksiyon.
+            tracker: Yurutme takipcisi.
+
+        Returns:
+            Durum, sonuc ve hata.
+        """
+        timeout = node.get("timeout") or self.node_timeout
+        tracker.log_step(execution_id, node["name"], "running")
+        started = time.time()
+        outcome: dict[str, Any]
+        try:
+            result = await asyncio.wait_for(
+                run_node(node), timeout or None,
+            )
+            outcome = {
+                "status": "completed" if result.get("success") else "failed",
+                "result": result.get("result"),
+                "error": result.get("error", ""),
+            }
+        except TimeoutError:
+            outcome = {"status": "timeout", "error": f"timeout:{timeout}s"}
+        except asyncio.CancelledError:
+            outcome = {"status": "cancelled", "error": "cancelled"}
+            raise
+        except Exception as exc:
+            outcome = {"status": "failed", "error": str(exc)}
+        finally:
+            ended = time.time()
+            tracker.record_span(
+                execution_id, node["id"], node["name"],
+                started, ended, outcome["status"], deps,
+            )
+            tracker.log_step(
+                execution_id, node["name"], outcome["status"],
+                {"error": outcome["error"]} if outcome.get("error") else None,
+            )
+        return outcome
+
+    @staticmethod
+    def _verdict(
+        edges: list[tuple[str, str]],
+        status: dict[str, str],
+        outputs: dict[str, Any],
+    ) -> str:
+        """Onculleri biten dugumun kaderini belirler.
+
+        Args:
+            edges: Gelen kenarlar.
+            status: Dugum durumlari.
+            outputs: Dugum sonuclari.
+
+        Returns:
+            run, blocked veya skipped.
+        """
+        active = False
+        for src, label in edges:
+            if status[src] in _BLOCKING:
+                return "blocked"
+            if status[src] != "completed":
+                continue
+            label = label.lower()
+            if label not in _BRANCH_LABELS or (
+                label == str(bool(outputs.get(src))).lower()
+            ):
+                active = True
+        return "run" if active else "skipped"
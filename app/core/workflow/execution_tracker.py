@@ -26,6 +26,7 @@ class ExecutionTracker:
     Attributes:
         _executions: Calistirma kayitlari.
         _step_logs: Adim loglari.
+        _spans: Dugum zamanlama izleri.
         _audit: Denetim kayitlari.
     """
 
@@ -37,6 +38,9 @@ class ExecutionTracker:
         self._step_logs: dict[
             str, list[dict[str, Any]]
         ] = {}
+        self._spans: dict[
+            str, list[dict[str, Any]]
+        ] = {}
         self._audit: list[dict[str, Any]] = []
         self._debug_logs: list[
             dict[str, Any]
@@ -182,6 +186,138 @@ class ExecutionTracker:
 
         return True
 
+    def cancel_execution(
+        self,
+        execution_id: str,
+        reason: str = "",
+    ) -> bool:
+        """Calistirmayi iptal edildi isaretler.
+
+        Args:
+            execution_id: Calistirma ID.
+            reason: Iptal nedeni.
+
+        Returns:
+            Basarili ise True.
+        """
+        execution = self._executions.get(
+            execution_id,
+        )
+        if not execution:
+            return False
+
+        execution.status = WorkflowStatus.CANCELLED
+        execution.duration = (
+            time.time()
+            - execution.started_at.timestamp()
+        )
+
+        self._audit.append({
+            "event": "execution_cancelled",
+            "execution_id": execution_id,
+            "reason": reason,
+            "at": time.time(),
+        })
+
+        return True
+
+    def record_span(
+        self,
+        execution_id: str,
+        node_id: str,
+        name: str,
+        started: float,
+        ended: float,
+        status: str,
+        deps: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Dugum zamanlama izi kaydeder.
+
+        Args:
+            execution_id: Calistirma ID.
+            node_id: Dugum ID.
+            name: Dugum adi.
+            started: Baslangic (epoch saniye).
+            ended: Bitis (epoch saniye).
+            status: Dugum durumu.
+            deps: Oncul dugum ID'leri.
+
+        Returns:
+            Iz kaydi.
+        """
+        span = {
+            "node_id": node_id,
+            "name": name,
+            "start": started,
+            "end": ended,
+            "duration": round(ended - started, 6),
+            "status": status,
+            "deps": list(deps or []),
+        }
+        self._spans.setdefault(
+            execution_id, [],
+        ).append(span)
+        return span
+
+    def get_spans(
+        self,
+        execution_id: str,
+    ) -> list[dict[str, Any]]:
+        """Zamanlama izlerini getirir.
+
+        Args:
+            execution_id: Calistirma ID.
+
+        Returns:
+            Iz kayitlari (bitis sirasina gore).
+        """
+        return self._spans.get(execution_id, [])
+
+    def get_critical_path(
+        self,
+        execution_id: str,
+    ) -> dict[str, Any]:
+        """Kritik yolu cikarir.
+
+        En gec biten dugumden geriye, her adimda
+        en gec biten (dugumu bekleten) onculu izler.
+
+        Args:
+            execution_id: Calistirma ID.
+
+        Returns:
+            Yol uzerindeki dugumler ve toplam sure.
+        """
+        spans = {
+            s["node_id"]: s
+            for s in self._spans.get(execution_id, [])
+        }
+        if not spans:
+            return {"path": [], "duration": 0.0}
+
+        current = max(
+            spans.values(), key=lambda s: s["end"],
+        )
+        path = [current]
+        while True:
+            deps = [
+                spans[d] for d in current["deps"]
+                if d in spans
+            ]
+            if not deps:
+                break
+            current = max(deps, key=lambda s: s["end"])
+            path.append(current)
+        path.reverse()
+
+        return {
+            "path": [s["node_id"] for s in path],
+            "names": [s["name"] for s in path],
+            "duration": round(
+                path[-1]["end"] - path[0]["start"], 6,
+            ),
+        }
+
     def debug_log(
         self,
         execution_id: str,
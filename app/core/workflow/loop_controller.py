@@ -6,8 +6,13 @@ limitleri.
 """
 
 import logging
+from collections.abc import Mapping
 from typing import Any, Callable
 
+from app.core.workflow.condition_compiler import (
+    CompiledCondition,
+    compile_condition,
+)
 from app.models.workflow_engine import LoopType
 
 logger = logging.getLogger(__name__)
@@ -134,12 +139,15 @@ class LoopController:
         self,
         loop_id: str,
         break_on: Callable[[Any], bool] | None = None,
+        where: str | CompiledCondition | None = None,
     ) -> dict[str, Any]:
         """For-each calistirir.
 
         Args:
             loop_id: Dongu ID.
             break_on: Kirilma kosulu.
+            where: Oge filtresi; sozluk olmayan oge
+                ``item`` adiyla degerlendirilir.
 
         Returns:
             Calistirma sonucu.
@@ -156,7 +164,22 @@ class LoopController:
         results: list[Any] = []
         broken = False
 
-        for i, item in enumerate(items):
+        selected = items
+        if where is not None:
+            if isinstance(where, str):
+                where = compile_condition(where)
+            # Ifade bir kez derlenir, tum ogeler tek geciste
+            matches = where.evaluate_batch(
+                item if isinstance(item, Mapping)
+                else {"item": item}
+                for item in items
+            )
+            selected = [
+                item for item, ok in zip(items, matches, strict=True)
+                if ok
+            ]
+
+        for i, item in enumerate(selected):
             if i >= self._max_iterations:
                 break
             if action:
@@ -174,6 +197,8 @@ class LoopController:
             "broken": broken,
             "success": True,
         }
+        if where is not None:
+            record["matched"] = len(selected)
         self._history.append(record)
         return {**record, "results": results}
 
@@ -6,8 +6,13 @@ ve kosullu tetikleyiciler.
 
 import logging
 import time
+from collections.abc import Iterable
 from typing import Any
 
+from app.core.workflow.condition_compiler import (
+    CompiledCondition,
+    compile_condition,
+)
 from app.models.workflow_engine import (
     TriggerRecord,
     TriggerType,
@@ -25,6 +30,7 @@ class TriggerManager:
     Attributes:
         _triggers: Kayitli tetikleyiciler.
         _fired: Ateslenme gecmisi.
+        _filters: Tetikleyici -> derlenmis veri filtresi.
     """
 
     def __init__(self) -> None:
@@ -36,6 +42,9 @@ class TriggerManager:
         self._event_map: dict[
             str, list[str]
         ] = {}
+        self._filters: dict[
+            str, CompiledCondition
+        ] = {}
 
         logger.info("TriggerManager baslatildi")
 
@@ -47,6 +56,9 @@ class TriggerManager:
     ) -> TriggerRecord:
         """Tetikleyici olusturur.
 
+        ``config["filter"]`` verilirse olay verisine
+        uygulanan kosul ifadesi olarak bir kez derlenir.
+
         Args:
             workflow_id: Is akisi ID.
             trigger_type: Tetikleyici turu.
@@ -62,6 +74,12 @@ class TriggerManager:
         )
         self._triggers[trigger.trigger_id] = trigger
 
+        expression = (config or {}).get("filter")
+        if expression:
+            self._filters[trigger.trigger_id] = (
+                compile_condition(expression)
+            )
+
         # Olay esleme
         if trigger_type == TriggerType.EVENT:
             event_name = (config or {}).get(
@@ -101,6 +119,12 @@ class TriggerManager:
 
         for tid in trigger_ids:
             trigger = self._triggers.get(tid)
+            event_filter = self._filters.get(tid)
+            if (
+                event_filter is not None
+                and not event_filter(data)
+            ):
+                continue
             if trigger and trigger.enabled:
                 triggered.append(
                     trigger.workflow_id,
@@ -117,6 +141,25 @@ class TriggerManager:
 
         return triggered
 
+    def filter_events(
+        self,
+        trigger_id: str,
+        events: Iterable[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Olay verilerinden filtreye uyanlari secer.
+
+        Args:
+            trigger_id: Tetikleyici ID.
+            events: Olay verileri.
+
+        Returns:
+            Eslesen olaylar (filtre yoksa hepsi).
+        """
+        event_filter = self._filters.get(trigger_id)
+        if event_filter is None:
+            return list(events)
+        return event_filter.filter(events)
+
     def check_schedule(
         self,
         current_time: float | None = None,
@@ -278,6 +321,7 @@ class TriggerManager:
         """
         if trigger_id in self._triggers:
             del self._triggers[trigger_id]
+            self._filters.pop(trigger_id, None)
             return True
         return False
 
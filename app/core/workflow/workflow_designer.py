@@ -8,6 +8,7 @@ sablon kutuphanesi ve dogrulama.
 import logging
 from typing import Any
 
+from app.core.workflow.dag_executor import build_dag
 from app.models.workflow_engine import (
     NodeType,
     WorkflowRecord,
@@ -64,6 +65,7 @@ class WorkflowDesigner:
         name: str,
         node_type: NodeType,
         config: dict[str, Any] | None = None,
+        timeout: float = 0.0,
     ) -> dict[str, Any] | None:
         """Dugum ekler.
 
@@ -72,6 +74,7 @@ class WorkflowDesigner:
             name: Dugum adi.
             node_type: Dugum turu.
             config: Yapilandirma.
+            timeout: Dugum zaman asimi (saniye, 0 ise yok).
 
         Returns:
             Dugum bilgisi veya None.
@@ -87,6 +90,8 @@ class WorkflowDesigner:
             "type": node_type.value,
             "config": config or {},
         }
+        if timeout:
+            node["timeout"] = timeout
         wf.nodes.append(node)
         return node
 
@@ -231,6 +236,24 @@ class WorkflowDesigner:
             "connection_count": len(wf.connections),
         }
 
+    def get_dag(
+        self,
+        workflow_id: str,
+    ) -> dict[str, list[tuple[str, str]]] | None:
+        """Bagimlilik grafigini cikarir.
+
+        Args:
+            workflow_id: Is akisi ID.
+
+        Returns:
+            Dugum ID -> (onceki dugum, etiket) listesi
+            veya None.
+        """
+        wf = self._workflows.get(workflow_id)
+        if not wf:
+            return None
+        return build_dag(wf.nodes, wf.connections)
+
     def save_template(
         self,
         name: str,
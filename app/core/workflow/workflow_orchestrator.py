@@ -5,35 +5,20 @@ yonetimi, es zamanli is akislari,
 oncelik islemleri ve analitik.
 """
 
+import asyncio
 import logging
 import time
 from typing import Any
 
-from app.models.workflow_engine import (
-    NodeType,
-    TriggerType,
-    WorkflowRecord,
-    WorkflowSnapshot,
-    WorkflowStatus,
-)
-
-from app.core.workflow.workflow_designer import (
-    WorkflowDesigner,
-)
-from app.core.workflow.trigger_manager import (
-    TriggerManager,
-)
 from app.core.workflow.action_executor import (
     ActionExecutor,
 )
 from app.core.workflow.condition_evaluator import (
     ConditionEvaluator,
 )
-from app.core.workflow.variable_manager import (
-    VariableManager,
-)
-from app.core.workflow.loop_controller import (
-    LoopController,
+from app.core.workflow.dag_executor import (
+    DagExecutor,
+    find_cycle,
 )
 from app.core.workflow.error_handler import (
     WorkflowErrorHandler,
@@ -41,6 +26,25 @@ from app.core.workflow.error_handler import (
 from app.core.workflow.execution_tracker import (
     ExecutionTracker,
 )
+from app.core.workflow.loop_controller import (
+    LoopController,
+)
+from app.core.workflow.trigger_manager import (
+    TriggerManager,
+)
+from app.core.workflow.variable_manager import (
+    VariableManager,
+)
+from app.core.workflow.workflow_designer import (
+    WorkflowDesigner,
+)
+from app.models.workflow_engine import (
+    NodeType,
+    TriggerType,
+    WorkflowRecord,
+    WorkflowSnapshot,
+    WorkflowStatus,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +65,7 @@ class WorkflowOrchestrator:
         loops: Dongu kontrolcusu.
         errors: Hata yoneticisi.
         tracker: Yurutme takipcisi.
+        dag: Async DAG yurutucu.
     """
 
     def __init__(
@@ -68,6 +73,8 @@ class WorkflowOrchestrator:
         max_concurrent: int = 10,
         default_timeout: int = 3600,
         max_loop_iterations: int = 1000,
+        max_parallel_nodes: int = 4,
+        node_timeout: float = 0.0,
     ) -> None:
         """Orkestratoru baslatir.
 
@@ -75,6 +82,8 @@ class WorkflowOrchestrator:
             max_concurrent: Maks es zamanli.
             default_timeout: Varsayilan zaman asimi.
             max_loop_iterations: Maks dongu.
+            max_parallel_nodes: Async modda esanli dugum siniri.
+            node_timeout: Async modda dugum zaman asimi (0 ise yok).
         """
         self.designer = WorkflowDesigner()
         self.triggers = TriggerManager()
@@ -86,10 +95,15 @@ class WorkflowOrchestrator:
         )
         self.errors = WorkflowErrorHandler()
         self.tracker = ExecutionTracker()
+        self.dag = DagExecutor(
+            max_parallel=max_parallel_nodes,
+            node_timeout=node_timeout,
+        )
 
         self._max_concurrent = max_concurrent
         self._default_timeout = default_timeout
         self._running: set[str] = set()
+        self._dag_runs: dict[str, asyncio.Task[Any]] = {}
 
         logger.info(
             "WorkflowOrchestrator baslatildi",
@@ -211,6 +225,185 @@ class WorkflowOrchestrator:
             "duration": round(duration, 4),
         }
 
+    async def execute_workflow_async(
+        self,
+        workflow_id: str,
+        input_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Is akisini bagimlilik grafigine gore async calistirir.
+
+        Baglantilardan turetilen grafikte onculleri biten
+        dugumler esanli calisir; bagimsiz dallar ortusur.
+        Tum calistirma ``default_timeout`` ile sinirlidir ve
+        ``cancel_execution`` ile iptal edilebilir.
+
+        Args:
+            workflow_id: Is akisi ID.
+            input_data: Giris verisi.
+
+        Returns:
+            Calistirma sonucu, dugum durumlari ve kritik yol.
+        """
+        wf = self.designer.get_workflow(
+            workflow_id,
+        )
+        if not wf:
+            return {
+                "success": False,
+                "reason": "workflow_not_found",
+            }
+
+        incoming = self.designer.get_dag(workflow_id) or {}
+        cycle = find_cycle(incoming)
+        if cycle:
+            return {
+                "success": False,
+                "reason": "cycle_detected",
+                "nodes": cycle,
+            }
+
+        if len(self._running) >= self._max_concurrent:
+            return {
+                "success": False,
+                "reason": "max_concurrent_reached",
+            }
+
+        execution = self.tracker.start_execution(
+            workflow_id,
+        )
+        execution_id = execution.execution_id
+        self._running.add(execution_id)
+
+        if input_data:
+            for key, val in input_data.items():
+                self.variables.set_variable(
+                    key, val,
+                    workflow_id=workflow_id,
+                )
+
+        async def _run_node(
+            node: dict[str, Any],
+        ) -> dict[str, Any]:
+            return await self._run_node_async(
+                node, workflow_id,
+            )
+
+        start = time.time()
+        runner = asyncio.ensure_future(
+            self.dag.run(
+                execution_id, list(wf.nodes),
+                incoming, _run_node, self.tracker,
+            ),
+        )
+        self._dag_runs[execution_id] = runner
+        reason = ""
+        summary: dict[str, Any] = {}
+        try:
+            summary = await asyncio.wait_for(
+                asyncio.shield(runner),
+                self._default_timeout or None,
+            )
+        except TimeoutError:
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+            reason = "timeout"
+        except asyncio.CancelledError:
+            if not runner.cancelled():
+                # Cagiran iptal edildi
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
+                self.tracker.cancel_execution(
+                    execution_id, "caller_cancelled",
+                )
+                raise
+            reason = "cancelled"
+        finally:
+            self._dag_runs.pop(execution_id, None)
+            self._running.discard(execution_id)
+
+        duration = time.time() - start
+        if reason:
+            self.tracker.cancel_execution(
+                execution_id, reason,
+            )
+            success = False
+        else:
+            success = summary["failed"] == 0 and summary["blocked"] == 0
+            self.tracker.complete_execution(
+                execution_id, success,
+            )
+
+        result = {
+            "success": success,
+            "execution_id": execution_id,
+            "workflow_id": workflow_id,
+            "steps_completed": summary.get("completed", 0),
+            "steps_failed": summary.get("failed", 0),
+            "steps_skipped": summary.get("skipped", 0),
+            "steps_blocked": summary.get("blocked", 0),
+            "nodes": summary.get("nodes", {}),
+            "critical_path": self.tracker.get_critical_path(
+                execution_id,
+            ),
+            "duration": round(duration, 4),
+        }
+        if reason:
+            result["reason"] = reason
+        return result
+
+    def cancel_execution(
+        self,
+        execution_id: str,
+    ) -> bool:
+        """Async calistirmayi iptal eder.
+
+        Args:
+            execution_id: Calistirma ID.
+
+        Returns:
+            Calisan bir calistirma bulunduysa True.
+        """
+        runner = self._dag_runs.get(execution_id)
+        if runner is None or runner.done():
+            return False
+        runner.cancel()
+        return True
+
+    async def _run_node_async(
+        self,
+        node: dict[str, Any],
+        workflow_id: str,
+    ) -> dict[str, Any]:
+        """Tek dugumu async calistirir.
+
+        Args:
+            node: Dugum.
+            workflow_id: Is akisi ID.
+
+        Returns:
+            Basari, sonuc ve hata.
+        """
+        node_type = node["type"]
+        if node_type == NodeType.ACTION.value:
+            return await self.actions.execute_async(
+                node["name"],
+                node.get("config"),
+            )
+        if node_type == NodeType.CONDITION.value:
+            expr = node.get("config", {}).get(
+                "expression", "true",
+            )
+            ctx = self.variables.get_scope_variables(
+                workflow_id=workflow_id,
+            )
+            return {
+                "success": True,
+                "result": self.conditions.evaluate(
+                    expr, ctx,
+                ),
+            }
+        return {"success": True}
+
     def trigger_workflow(
         self,
         event_name: str,
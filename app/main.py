@@ -23,9 +23,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("ATLAS baslatiliyor... ortam=%s", settings.app_env)
 
     # Redis baglantisi
+    from app.core.caching.near_cache import NearCache
     from app.core.memory.short_term import ShortTermMemory
 
-    short_term: ShortTermMemory | None = ShortTermMemory()
+    near_cache = (
+        NearCache(
+            max_size=settings.redis_near_cache_size,
+            ttl=settings.redis_near_cache_ttl,
+            channel=settings.redis_invalidation_channel,
+        )
+        if settings.redis_near_cache_enabled
+        else None
+    )
+    short_term: ShortTermMemory | None = ShortTermMemory(near_cache=near_cache)
     try:
         await short_term.connect()
         logger.info("Redis baglantisi hazir")
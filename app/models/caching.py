@@ -19,6 +19,7 @@ class CacheStrategy(str, Enum):
     LFU = "lfu"
     TTL = "ttl"
     FIFO = "fifo"
+    TINYLFU = "tinylfu"
 
 
 class CacheLayer(str, Enum):
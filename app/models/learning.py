@@ -66,11 +66,13 @@ class PrioritizedExperience(BaseModel):
         experience: Deneyim.
         priority: Oncelik degeri (TD-hata tabanli).
         weight: Onem ornekleme agirligi.
+        index: Tampondaki agac indeksi (oncelik guncellemesi icin).
     """
 
     experience: Experience
     priority: float = 1.0
     weight: float = 1.0
+    index: int | None = None
 
 
 class RewardSignal(BaseModel):
@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 from enum import Enum
 
 from pydantic import BaseModel
-from sqlalchemy import Boolean, DateTime, Float, String, Text
+from sqlalchemy import Boolean, DateTime, Float, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -46,6 +46,12 @@ class TaskRecord(Base):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset sayfalama (created_at, id) ve filtreli listeleme icin
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_tasks_agent_created_at_id", "agent", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -142,3 +148,19 @@ class TaskResponse(BaseModel):
     completed_at: datetime | None = None
 
     model_config = {"from_attributes": True}
+
+
+class TaskPage(BaseModel):
+    """Keyset sayfalamali gorev listesi.
+
+    Attributes:
+        tasks: Sayfadaki gorevler.
+        next_cursor: Sonraki sayfa imleci (son sayfada None).
+        total: Filtreye uyan toplam gorev sayisi.
+        total_exact: Toplam kesin mi (False ise planlayici tahmini).
+    """
+
+    tasks: list[TaskResponse]
+    next_cursor: str | None = None
+    total: int = 0
+    total_exact: bool = True
@@ -5,6 +5,7 @@ Periyodik monitor gorevleri ve diger arkaplan islemleri.
 
 from app.tasks.monitor_tasks import (
     run_ads_monitor,
+    run_monitor_group,
     run_opportunity_monitor,
     run_security_monitor,
     run_server_monitor,
@@ -12,6 +13,7 @@ from app.tasks.monitor_tasks import (
 
 __all__ = [
     "run_ads_monitor",
+    "run_monitor_group",
     "run_opportunity_monitor",
     "run_security_monitor",
     "run_server_monitor",
@@ -1,27 +1,92 @@
 """ATLAS monitor Celery gorevleri.
 
 Her monitor icin periyodik Celery task tanimlar.
-Async monitor.check() metodunu asyncio.run() ile calistirir,
+Async monitor.check() metodunu worker surecinin kalici
+olay dongusunde (yoksa asyncio.run() ile) calistirir,
 sonucu loglar ve gerektiginde Telegram bildirimi gonderir.
 """
 
 import asyncio
 import logging
-from typing import Any
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
 
 from celery import Task
 
-from app.celery_app import celery_app
+from app.celery_app import MONITOR_SOFT_TIME_LIMITS, celery_app, group_time_limits
 from app.config import settings
 from app.monitors.ads_monitor import AdsMonitor
-from app.monitors.base_monitor import MonitorResult
+from app.monitors.base_monitor import BaseMonitor, MonitorResult
 from app.monitors.opportunity_monitor import OpportunityMonitor
 from app.monitors.security_monitor import SecurityMonitor
 from app.monitors.server_monitor import ServerMonitor
+from app.tasks.runtime import get_runtime
 from app.tools.telegram_bot import TelegramBot
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Monitor adi -> fabrika (modul isimleri cagri aninda cozulur)
+_MONITOR_FACTORIES: dict[str, Callable[[], BaseMonitor]] = {
+    "server": lambda: ServerMonitor(check_interval=settings.server_monitor_interval),
+    "security": lambda: SecurityMonitor(check_interval=settings.security_monitor_interval),
+    "ads": lambda: AdsMonitor(check_interval=settings.ads_monitor_interval),
+    "opportunity": lambda: OpportunityMonitor(
+        check_interval=settings.opportunity_monitor_interval,
+    ),
+}
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Coroutine'i worker'in kalici dongusunde, yoksa asyncio.run ile calistirir.
+
+    Args:
+        coro: Calistirilacak coroutine.
+
+    Returns:
+        Coroutine sonucu.
+    """
+    runtime = get_runtime()
+    if runtime.running:
+        return runtime.run(coro)
+    return asyncio.run(coro)
+
+
+def _get_monitor(name: str) -> BaseMonitor:
+    """Monitoru getirir.
+
+    Kalici dongu calisiyorsa monitor (ve agent'inin istemcileri)
+    surec boyunca tekrar kullanilir; aksi halde her cagrida
+    yeni monitor olusturulur.
+
+    Args:
+        name: Monitor adi.
+
+    Returns:
+        Monitor nesnesi.
+    """
+    factory = _MONITOR_FACTORIES[name]
+    runtime = get_runtime()
+    if runtime.running:
+        return runtime.resource(f"monitor:{name}", factory)
+    return factory()
+
+
+def _get_telegram_bot() -> TelegramBot:
+    """Telegram bot'u getirir (kalici dongude paylasilir)."""
+    runtime = get_runtime()
+    if runtime.running:
+        return runtime.resource("telegram_bot", TelegramBot, closer=_close_bot)
+    return TelegramBot()
+
+
+async def _close_bot(bot: TelegramBot) -> None:
+    """Paylasilan bot'un HTTP istemcisini kapatir."""
+    if bot.app is not None:
+        await bot.app.bot.shutdown()
+
 
 def _handle_result(result: MonitorResult) -> None:
     """Monitor sonucunu isler: loglar ve gerekirse bildirim gonderir.
@@ -50,9 +115,9 @@ def _send_telegram_notification(result: MonitorResult) -> None:
         result: Monitor kontrol sonucu.
     """
     try:
-        bot = TelegramBot()
+        bot = _get_telegram_bot()
         message = _format_notification(result)
-        asyncio.run(bot.send_message(message))
+        _run(bot.send_message(message))
         logger.info("[%s] Telegram bildirimi gonderildi", result.monitor_name)
     except Exception as exc:
         logger.error(
@@ -93,7 +158,7 @@ def _format_notification(result: MonitorResult) -> str:
     bind=True,
     max_retries=3,
     default_retry_delay=60,
-    soft_time_limit=270,
+    soft_time_limit=MONITOR_SOFT_TIME_LIMITS["server"],
     time_limit=300,
 )
 def run_server_monitor(self: Task) -> dict[str, Any]:
@@ -110,10 +175,8 @@ def run_server_monitor(self: Task) -> dict[str, Any]:
     """
     try:
         logger.info("Sunucu monitor taski baslatiliyor...")
-        monitor = ServerMonitor(
-            check_interval=settings.server_monitor_interval,
-        )
-        result = asyncio.run(monitor.check())
+        monitor = _get_monitor("server")
+        result = _run(monitor.check())
         _handle_result(result)
         return result.model_dump(mode="json")
     except Exception as exc:
@@ -126,7 +189,7 @@ def run_server_monitor(self: Task) -> dict[str, Any]:
     bind=True,
     max_retries=3,
     default_retry_delay=120,
-    soft_time_limit=3300,
+    soft_time_limit=MONITOR_SOFT_TIME_LIMITS["security"],
     time_limit=3600,
 )
 def run_security_monitor(self: Task) -> dict[str, Any]:
@@ -143,10 +206,8 @@ def run_security_monitor(self: Task) -> dict[str, Any]:
     """
     try:
         logger.info("Guvenlik monitor taski baslatiliyor...")
-        monitor = SecurityMonitor(
-            check_interval=settings.security_monitor_interval,
-        )
-        result = asyncio.run(monitor.check())
+        monitor = _get_monitor("security")
+        result = _run(monitor.check())
         _handle_result(result)
         return result.model_dump(mode="json")
     except Exception as exc:
@@ -159,7 +220,7 @@ def run_security_monitor(self: Task) -> dict[str, Any]:
     bind=True,
     max_retries=3,
     default_retry_delay=120,
-    soft_time_limit=3300,
+    soft_time_limit=MONITOR_SOFT_TIME_LIMITS["ads"],
     time_limit=3600,
 )
 def run_ads_monitor(self: Task) -> dict[str, Any]:
@@ -176,10 +237,8 @@ def run_ads_monitor(self: Task) -> dict[str, Any]:
     """
     try:
         logger.info("Reklam monitor taski baslatiliyor...")
-        monitor = AdsMonitor(
-            check_interval=settings.ads_monitor_interval,
-        )
-        result = asyncio.run(monitor.check())
+        monitor = _get_monitor("ads")
+        result = _run(monitor.check())
         _handle_result(result)
         return result.model_dump(mode="json")
     except Exception as exc:
@@ -192,7 +251,7 @@ def run_ads_monitor(self: Task) -> dict[str, Any]:
     bind=True,
     max_retries=3,
     default_retry_delay=300,
-    soft_time_limit=82800,
+    soft_time_limit=MONITOR_SOFT_TIME_LIMITS["opportunity"],
     time_limit=86400,
 )
 def run_opportunity_monitor(self: Task) -> dict[str, Any]:
@@ -209,12 +268,88 @@ def run_opportunity_monitor(self: Task) -> dict[str, Any]:
     """
     try:
         logger.info("Firsat monitor taski baslatiliyor...")
-        monitor = OpportunityMonitor(
-            check_interval=settings.opportunity_monitor_interval,
-        )
-        result = asyncio.run(monitor.check())
+        monitor = _get_monitor("opportunity")
+        result = _run(monitor.check())
         _handle_result(result)
         return result.model_dump(mode="json")
     except Exception as exc:
         logger.error("Firsat monitor taski hatasi: %s", exc)
         raise self.retry(exc=exc)
+
+
+# Monitor adi -> tekil task (soft time limit icin)
+_MONITOR_TASKS: dict[str, Task] = {
+    "server": run_server_monitor,
+    "security": run_security_monitor,
+    "ads": run_ads_monitor,
+    "opportunity": run_opportunity_monitor,
+}
+
+# Varsayilan grup butcesi (elle cagri); beat girdileri grubun
+# kendi sinirlarini options ile gecer
+_GROUP_SOFT_TIME_LIMIT, _GROUP_TIME_LIMIT = group_time_limits(list(_MONITOR_TASKS))
+
+
+async def _check_group(names: list[str]) -> list[MonitorResult | BaseException]:
+    """Monitorleri ayni dongude esanli calistirir.
+
+    Her monitor kendi task'inin soft time limit'i ile sinirlanir.
+
+    Args:
+        names: Monitor adlari.
+
+    Returns:
+        Monitor basina sonuc veya hata.
+    """
+    checks = [
+        asyncio.wait_for(
+            _get_monitor(name).check(),
+            timeout=_MONITOR_TASKS[name].soft_time_limit,
+        )
+        for name in names
+    ]
+    return await asyncio.gather(*checks, return_exceptions=True)
+
+
+@celery_app.task(
+    name="app.tasks.monitor_tasks.run_monitor_group",
+    bind=True,
+    soft_time_limit=_GROUP_SOFT_TIME_LIMIT,
+    time_limit=_GROUP_TIME_LIMIT,
+)
+def run_monitor_group(self: Task, names: list[str]) -> dict[str, Any]:
+    """Ayni tick'teki monitorleri tek task icinde esanli calistirir.
+
+    Beat fan-out modunda ayni araliga sahip monitorler bu task
+    ile birlikte calisir. Bir monitorun hatasi digerlerini
+    etkilemez ve tekrar denenmez; hata sonucta raporlanir.
+    Soft time limit kalici dongudeki coroutine'i de iptal eder.
+
+    Args:
+        self: Celery task nesnesi (bind=True).
+        names: Monitor adlari.
+
+    Returns:
+        Monitor adi -> sonuc dict'i (hata icin {"error": ...}).
+    """
+    unknown = [name for name in names if name not in _MONITOR_FACTORIES]
+    if unknown:
+        raise ValueError(f"Bilinmeyen monitor: {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    results = _run(_check_group(names))
+    elapsed = time.perf_counter() - started
+
+    output: dict[str, Any] = {}
+    for name, result in zip(names, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("[%s] Grup monitor hatasi: %s", name, result)
+            output[name] = {"error": str(result) or type(result).__name__}
+            continue
+        _handle_result(result)
+        output[name] = result.model_dump(mode="json")
+
+    logger.info(
+        "Monitor grubu tamamlandi (%s): %.2fs", ", ".join(names), elapsed,
+    )
+    return output
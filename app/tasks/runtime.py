@@ -0,0 +1,195 @@
+"""ATLAS Celery worker async calisma ortami.
+
+Her worker sureci icin tek, uzun omurlu bir olay dongusu
+ve surec boyunca paylasilan istemciler (monitorler, SSH
+havuzu, Telegram bot) saglar. Dongu ``worker_process_init``
+ile baslar, ``worker_process_shutdown`` ile kapanir.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from app.config import settings
+from app.tools.ssh_pool import SSHConnectionPool, get_ssh_pool
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerAsyncRuntime:
+    """Worker sureci basina kalici olay dongusu.
+
+    Dongu ayri bir thread'de calisir; senkron Celery
+    task'lari coroutine'leri ``run`` ile bu donguye
+    gonderip sonucu bekler. Boylece tick basina yeni
+    dongu ve yeni istemci kurulmaz. Bekleme kesilirse
+    (ornegin soft time limit) coroutine iptal edilir.
+
+    ``resource`` ile olusturulan nesneler surec boyunca
+    tekrar kullanilir; ``stop`` kayitli kapaticilari
+    ters sirayla dongu icinde calistirir.
+    """
+
+    def __init__(self) -> None:
+        """Baslatilmamis calisma ortami olusturur."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._resources: dict[str, Any] = {}
+        self._closers: dict[str, Callable[[Any], Awaitable[None]]] = {}
+        self._lock = threading.Lock()
+        self._stats: dict[str, Any] = {
+            "runs": 0,
+            "failures": 0,
+            "run_seconds": 0.0,
+            "last_run_seconds": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Dongu calisiyor mu."""
+        return self._loop is not None and self._loop.is_running()
+
+    def start(self) -> None:
+        """Donguyu ayri bir thread'de baslatir."""
+        if self.running:
+            return
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _main() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=_main, name="atlas-async-runtime", daemon=True)
+        thread.start()
+        ready.wait()
+        self._loop, self._thread = loop, thread
+        logger.info("Worker async calisma ortami baslatildi")
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Coroutine'i kalici dongude calistirir ve sonucu bekler.
+
+        Args:
+            coro: Calistirilacak coroutine.
+            timeout: Bekleme siniri (saniye, opsiyonel).
+
+        Returns:
+            Coroutine sonucu.
+
+        Raises:
+            RuntimeError: Dongu calismiyorsa.
+        """
+        if self._loop is None or not self.running:
+            coro.close()
+            raise RuntimeError("Async calisma ortami baslatilmamis")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        started = time.perf_counter()
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            self._stats["failures"] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._stats["runs"] += 1
+            self._stats["run_seconds"] += elapsed
+            self._stats["last_run_seconds"] = elapsed
+
+    def resource(
+        self,
+        name: str,
+        factory: Callable[[], T],
+        closer: Callable[[T], Awaitable[None]] | None = None,
+    ) -> T:
+        """Surec boyunca paylasilan nesneyi getirir, yoksa olusturur.
+
+        Args:
+            name: Kaynak adi.
+            factory: Nesneyi olusturan fonksiyon.
+            closer: Kapanista cagrilacak async fonksiyon (opsiyonel).
+
+        Returns:
+            Paylasilan nesne.
+        """
+        with self._lock:
+            if name not in self._resources:
+                self._resources[name] = factory()
+                if closer is not None:
+                    self._closers[name] = closer
+            return self._resources[name]
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Kaynaklari kapatir ve donguyu durdurur.
+
+        Args:
+            timeout: Kapanis bekleme siniri (saniye).
+        """
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+
+        async def _close_all() -> None:
+            for name in reversed(list(self._closers)):
+                try:
+                    await self._closers[name](self._resources[name])
+                except Exception as exc:
+                    logger.warning("Kaynak kapatma hatasi [%s]: %s", name, exc)
+
+        if self.running:
+            try:
+                self.run(_close_all(), timeout)
+            except Exception as exc:
+                logger.warning("Kaynaklar kapatilamadi: %s", exc)
+            loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        loop.close()
+
+        self._loop = self._thread = None
+        self._resources.clear()
+        self._closers.clear()
+        logger.info("Worker async calisma ortami durduruldu")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Calisma istatistikleri.
+
+        Returns:
+            Calistirma, hata, toplam/son sure ve kaynak adlari.
+        """
+        return {
+            **self._stats,
+            "running": self.running,
+            "resources": sorted(self._resources),
+        }
+
+
+_runtime = WorkerAsyncRuntime()
+
+
+def get_runtime() -> WorkerAsyncRuntime:
+    """Surecin calisma ortamini dondurur."""
+    return _runtime
+
+
+@worker_process_init.connect
+def _start_runtime(**_: Any) -> None:
+    """Worker sureci basladiginda donguyu ve ortak havuzlari kurar."""
+    if not settings.celery_async_runtime:
+        return
+    _runtime.start()
+    _runtime.resource("ssh_pool", get_ssh_pool, closer=SSHConnectionPool.close)
+
+
+@worker_process_shutdown.connect
+def _stop_runtime(**_: Any) -> None:
+    """Worker sureci kapanirken kaynaklari kapatir."""
+    _runtime.stop()
@@ -32,6 +32,7 @@ class SSHManager:
         key_path: str = "~/.ssh/id_rsa",
         port: int = 22,
         timeout: int = 10,
+        keepalive: int = 0,
     ) -> None:
         """SSH yoneticisini baslatir.
 
@@ -41,12 +42,14 @@ class SSHManager:
             key_path: SSH ozel anahtar dosya yolu.
             port: SSH port numarasi.
             timeout: Baglanti zaman asimi (saniye).
+            keepalive: Keep-alive paket araligi (saniye, 0 ise kapali).
         """
         self.host = host
         self.user = user
         self.key_path = str(Path(key_path).expanduser())
         self.port = port
         self.timeout = timeout
+        self.keepalive = keepalive
         self._client: paramiko.SSHClient | None = None
 
     async def connect(self) -> None:
@@ -65,6 +68,17 @@ class SSHManager:
             key_filename=self.key_path,
             timeout=self.timeout,
         )
+        transport = self._client.get_transport()
+        if transport is not None and self.keepalive > 0:
+            transport.set_keepalive(self.keepalive)
+
+    @property
+    def is_active(self) -> bool:
+        """Baglanti acik ve kullanilabilir mi."""
+        if self._client is None:
+            return False
+        transport = self._client.get_transport()
+        return transport is not None and transport.is_active()
 
     async def execute_command(self, command: str) -> tuple[str, str, int]:
         """Uzak sunucuda komut calistirir.
@@ -0,0 +1,256 @@
+"""SSH baglanti havuzu modulu.
+
+(host, port, kullanici, anahtar) basina tek kalici SSH
+baglantisi tutar; ayni baglanti uzerinden birden fazla
+kanal (exec) esanli calisabilir. Keep-alive ile canli
+tutulur, bosta kalan baglantilar kapatilir.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+from app.tools.ssh_manager import SSHManager
+
+logger = logging.getLogger("atlas.tools.ssh_pool")
+
+_PoolKey = tuple[str, int, str, str]
+
+
+class _PooledConnection:
+    """Havuzdaki tek baglanti."""
+
+    __slots__ = ("manager", "channels", "leases", "last_used", "uses")
+
+    def __init__(self, manager: SSHManager, max_channels: int) -> None:
+        self.manager = manager
+        self.channels = asyncio.Semaphore(max_channels)
+        self.leases = 0
+        self.last_used = time.monotonic()
+        self.uses = 0
+
+
+class SSHConnectionPool:
+    """Anahtarli SSH baglanti havuzu.
+
+    ``lease`` ayni hedef icin mevcut baglantiyi dondurur;
+    yoksa veya kopmussa yenisini kurar. Ayni hedefe esanli
+    ilk istekler tek baglanti kurulumunda birlesir. Baglanti
+    basina esanli kanal sayisi ``max_channels`` ile sinirlanir.
+    ``idle_timeout`` suresince kullanilmayan baglantilar her
+    ``lease`` cagrisinda ve ``evict_idle`` ile kapatilir.
+
+    Kullanim:
+        async with pool.lease(host, user, key_path) as ssh:
+            stdout, stderr, code = await ssh.execute_command("uptime")
+
+    Attributes:
+        idle_timeout: Bosta kalma suresi siniri (saniye).
+        keepalive: Keep-alive araligi (saniye).
+        max_channels: Baglanti basina esanli kanal limiti.
+        connect_timeout: Baglanti zaman asimi (saniye).
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = 300.0,
+        keepalive: int = 30,
+        max_channels: int = 4,
+        connect_timeout: int = 10,
+        connector: Callable[..., SSHManager] | None = None,
+    ) -> None:
+        """Havuzu olusturur.
+
+        Args:
+            idle_timeout: Bosta kalma suresi siniri (saniye).
+            keepalive: Keep-alive araligi (saniye).
+            max_channels: Baglanti basina esanli kanal limiti.
+            connect_timeout: Baglanti zaman asimi (saniye).
+            connector: SSHManager ureten fonksiyon (varsayilan SSHManager).
+        """
+        self.idle_timeout = idle_timeout
+        self.keepalive = keepalive
+        self.max_channels = max(1, max_channels)
+        self.connect_timeout = connect_timeout
+        self._connector = connector or SSHManager
+
+        self._connections: dict[_PoolKey, _PooledConnection] = {}
+        self._locks: dict[_PoolKey, asyncio.Lock] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stats = {
+            "connects": 0,
+            "reuses": 0,
+            "evictions": 0,
+            "failures": 0,
+        }
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        host: str,
+        user: str = "root",
+        key_path: str = "~/.ssh/id_rsa",
+        port: int = 22,
+    ) -> AsyncIterator[SSHManager]:
+        """Hedef icin bagli bir SSHManager kiralar.
+
+        Args:
+            host: Sunucu adresi.
+            user: SSH kullanici adi.
+            key_path: SSH ozel anahtar dosya yolu.
+            port: SSH port numarasi.
+
+        Yields:
+            Bagli SSHManager (kapatilmamalidir).
+
+        Raises:
+            Exception: Baglanti kurulamazsa.
+        """
+        self._bind_loop()
+        await self.evict_idle()
+
+        key = (host, port, user, str(Path(key_path).expanduser()))
+        conn = await self._acquire(key, host, user, key_path, port)
+
+        async with conn.channels:
+            conn.leases += 1
+            conn.uses += 1
+            try:
+                yield conn.manager
+            except Exception:
+                if not conn.manager.is_active:
+                    await self._discard(key, conn)
+                raise
+            finally:
+                conn.leases -= 1
+                conn.last_used = time.monotonic()
+
+    async def _acquire(
+        self,
+        key: _PoolKey,
+        host: str,
+        user: str,
+        key_path: str,
+        port: int,
+    ) -> _PooledConnection:
+        """Mevcut baglantiyi getirir veya yenisini kurar.
+
+        Args:
+            key: Havuz anahtari.
+            host: Sunucu adresi.
+            user: SSH kullanici adi.
+            key_path: SSH ozel anahtar dosya yolu.
+            port: SSH port numarasi.
+
+        Returns:
+            Havuz baglantisi.
+        """
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            conn = self._connections.get(key)
+            if conn is not None:
+                if conn.manager.is_active:
+                    self._stats["reuses"] += 1
+                    return conn
+                logger.info("Kopmus SSH baglantisi yenileniyor: %s", host)
+                await self._discard(key, conn)
+
+            manager = self._connector(
+                host=host,
+                user=user,
+                key_path=key_path,
+                port=port,
+                timeout=self.connect_timeout,
+                keepalive=self.keepalive,
+            )
+            try:
+                await manager.connect()
+            except Exception:
+                self._stats["failures"] += 1
+                raise
+            conn = _PooledConnection(manager, self.max_channels)
+            self._connections[key] = conn
+            self._stats["connects"] += 1
+            return conn
+
+    def _bind_loop(self) -> None:
+        """Olay dongusu degistiyse asyncio kilitlerini yeniler.
+
+        Paramiko baglantilari donguden bagimsizdir; yalnizca
+        kilit ve semaforlar yeni donguye tasinir.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        self._loop = loop
+        self._locks.clear()
+        for conn in self._connections.values():
+            conn.channels = asyncio.Semaphore(self.max_channels)
+
+    async def _discard(self, key: _PoolKey, conn: _PooledConnection) -> None:
+        """Baglantiyi havuzdan cikarir ve kapatir.
+
+        Args:
+            key: Havuz anahtari.
+            conn: Havuz baglantisi.
+        """
+        if self._connections.get(key) is conn:
+            del self._connections[key]
+        try:
+            await conn.manager.close()
+        except Exception as exc:
+            logger.debug("SSH kapatma hatasi [%s]: %s", key[0], exc)
+
+    async def evict_idle(self) -> int:
+        """Bosta kalma suresini asan baglantilari kapatir.
+
+        Returns:
+            Kapatilan baglanti sayisi.
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [
+            (key, conn) for key, conn in self._connections.items()
+            if conn.leases == 0 and conn.last_used < cutoff
+        ]
+        for key, conn in idle:
+            await self._discard(key, conn)
+        self._stats["evictions"] += len(idle)
+        return len(idle)
+
+    async def close(self) -> None:
+        """Tum baglantilari kapatir."""
+        for key, conn in list(self._connections.items()):
+            await self._discard(key, conn)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Havuz istatistikleri.
+
+        Returns:
+            Acik baglanti, kiralik, kurulum, yeniden kullanim,
+            tahliye ve hata sayilari.
+        """
+        return {
+            **self._stats,
+            "open": len(self._connections),
+            "leased": sum(c.leases for c in self._connections.values()),
+        }
+
+
+_default_pool: SSHConnectionPool | None = None
+
+
+def get_ssh_pool() -> SSHConnectionPool:
+    """Surec genelinde paylasilan varsayilan havuzu dondurur."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = SSHConnectionPool(
+            idle_timeout=settings.ssh_pool_idle_timeout,
+            keepalive=settings.ssh_pool_keepalive,
+            max_channels=settings.ssh_pool_max_channels,
+        )
+    return _default_pool
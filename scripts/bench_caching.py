@@ -0,0 +1,174 @@
+"""ATLAS bellek onbellegi benchmark scripti.
+
+Girdi basina bellek kullanimini ve cok is
+parcacikli islem/sn degerlerini tek kilitli
+MemoryCache ile SegmentedCache arasinda
+karsilastirir.
+
+Kullanim:
+    python -m scripts.bench_caching [--entries N] [--threads 1,4,8]
+"""
+
+import argparse
+import gc
+import threading
+import time
+import tracemalloc
+from typing import Any
+
+from app.core.caching.memory_cache import CacheRecord, MemoryCache
+from app.core.caching.segmented_cache import SegmentedCache
+
+
+def _dict_entry(value: Any, now: float) -> dict[str, Any]:
+    """Eski sozluk tabanli girdi bicimi."""
+    return {
+        "value": value,
+        "hits": 0,
+        "created_at": now,
+        "last_access": now,
+        "expires_at": now + 300,
+    }
+
+
+def measure_memory(entries: int) -> dict[str, float]:
+    """Girdi basina bellek olcer.
+
+    Args:
+        entries: Girdi sayisi.
+
+    Returns:
+        Yapi -> bayt/girdi.
+    """
+    results: dict[str, float] = {}
+    now = time.time()
+
+    builders: dict[str, Any] = {
+        "dict_entries": lambda: {
+            f"k{i}": _dict_entry(i, now) for i in range(entries)
+        },
+        "slot_entries": lambda: {
+            f"k{i}": CacheRecord(i, now, now + 300)
+            for i in range(entries)
+        },
+        "memory_cache": lambda: _fill(
+            MemoryCache(max_size=entries), entries,
+        ),
+        "segmented_cache": lambda: _fill(
+            SegmentedCache(max_size=entries, segments=16), entries,
+        ),
+    }
+    for name, build in builders.items():
+        gc.collect()
+        tracemalloc.start()
+        obj = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = current / entries
+        del obj
+    return results
+
+
+def _fill(cache: Any, entries: int) -> Any:
+    """Onbellegi doldurur."""
+    cache.set_many({f"k{i}": i for i in range(entries)})
+    return cache
+
+
+def measure_throughput(
+    cache: Any,
+    threads: int,
+    ops_per_thread: int,
+    keyspace: int,
+) -> float:
+    """Cok is parcacikli islem/sn olcer.
+
+    Her is parcacigi %80 okuma, %20 yazma yapar.
+
+    Args:
+        cache: Onbellek.
+        threads: Is parcacigi sayisi.
+        ops_per_thread: Is parcacigi basina islem.
+        keyspace: Anahtar uzayi.
+
+    Returns:
+        Saniyedeki islem sayisi.
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(offset: int) -> None:
+        barrier.wait()
+        for i in range(ops_per_thread):
+            key = f"k{(i * 7 + offset) % keyspace}"
+            if i % 5 == 0:
+                cache.set(key, i)
+            else:
+                cache.get(key)
+
+    workers = [
+        threading.Thread(target=worker, args=(n,))
+        for n in range(threads)
+    ]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops_per_thread / elapsed
+
+
+def main() -> None:
+    """Benchmark'i calistirir."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--threads", default="1,4,8")
+    args = parser.parse_args()
+
+    print(f"== Bellek ({args.entries} girdi) ==")
+    for name, per_entry in measure_memory(args.entries).items():
+        print(f"{name:>18}: {per_entry:8.1f} bayt/girdi")
+
+    print("== Islem/sn (%80 get, %20 set) ==")
+    for threads in (int(t) for t in args.threads.split(",")):
+        ops = args.ops // threads
+        for name, factory in (
+            ("memory_cache", lambda: MemoryCache(max_size=args.entries)),
+            (
+                "segmented_cache",
+                lambda: SegmentedCache(max_size=args.entries, segments=16),
+            ),
+        ):
+            cache = _fill(factory(), args.entries)
+            rate = measure_throughput(cache, threads, ops, args.entries)
+            print(f"{name:>18} x{threads:<2}: {rate:12,.0f} islem/sn")
+
+    print("== Toplu okuma (1000 anahtar) ==")
+    keys = [f"k{i}" for i in range(1000)]
+    for name, cache in (
+        ("memory_cache", _fill(MemoryCache(max_size=args.entries), args.entries)),
+        (
+            "segmented_cache",
+            _fill(
+                SegmentedCache(max_size=args.entries, segments=16),
+                args.entries,
+            ),
+        ),
+    ):
+        start = time.perf_counter()
+        for key in keys * 20:
+            cache.get(key)
+        single = 20 * len(keys) / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for _ in range(20):
+            cache.get_many(keys)
+        batch = 20 * len(keys) / (time.perf_counter() - start)
+        print(
+            f"{name:>18}: get {single:12,.0f} / get_many {batch:12,.0f} anahtar/sn"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""ATLAS kosul degerlendirme benchmark scripti.
+
+Eski her-cagrida-ayristirma yolunu derlenmis ve
+onbellekli ConditionEvaluator ile, tekli cagri ve
+toplu (batch) degerlendirmede karsilastirir.
+
+Kullanim:
+    python -m scripts.bench_conditions [--contexts 200000]
+"""
+
+import argparse
+import random
+import time
+from typing import Any
+
+from app.core.workflow.condition_evaluator import ConditionEvaluator
+
+
+def _legacy_eval(expression: str, context: dict[str, Any]) -> bool:
+    """Eski yol: her cagrida operator arama ve split."""
+    expr = expression.strip()
+    if expr.lower() == "true":
+        return True
+    if expr.lower() == "false":
+        return False
+    for op in [">=", "<=", "!=", "==", ">", "<"]:
+        if op in expr:
+            left_key, right_val = (p.strip() for p in expr.split(op, 1))
+            left_val = context.get(left_key, left_key)
+            try:
+                left_val = float(left_val)
+                right_val = float(right_val)
+            except (ValueError, TypeError):
+                pass
+            op_map = {
+                "==": lambda a, b: a == b, "!=": lambda a, b: a != b,
+                ">": lambda a, b: a > b, ">=": lambda a, b: a >= b,
+                "<": lambda a, b: a < b, "<=": lambda a, b: a <= b,
+            }
+            try:
+                return op_map[op](left_val, right_val)
+            except (TypeError, ValueError):
+                return False
+    return bool(context.get(expr))
+
+
+def _timed(label: str, n: int, fn) -> float:
+    """Fonksiyonu calistirip hizi yazdirir."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:7.3f}s  ({n / elapsed:>12,.0f} eval/s)")
+    return elapsed
+
+
+def main() -> None:
+    """Benchmark'i calistirir."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contexts", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    contexts = [
+        {"score": rng.randint(0, 100), "retries": rng.randint(0, 5),
+         "status": rng.choice(["ok", "bad"])}
+        for _ in range(args.contexts)
+    ]
+    conditions = ["score > 50", "retries <= 3", "status != bad"]
+    combined = "score > 50 and retries <= 3 and status != 'bad'"
+    n = len(contexts) * len(conditions)
+
+    print(f"== {args.contexts:,} baglam x {len(conditions)} kosul ==")
+    _timed("eski (all, her cagrida ayristir)", n, lambda: [
+        all(_legacy_eval(c, ctx) for c in conditions) for ctx in contexts
+    ])
+
+    ce = ConditionEvaluator()
+    compiled = [ce.compile(c) for c in conditions]
+    _timed("derlenmis (all, tekli)", n, lambda: [
+        all(c(ctx) for c in compiled) for ctx in contexts
+    ])
+
+    ce = ConditionEvaluator()
+    _timed("derlenmis (and ifadesi, batch)", n, lambda: (
+        ce.evaluate_batch(combined, contexts)
+    ))
+    print(ce.get_cache_stats())
+
+
+if __name__ == "__main__":
+    main()
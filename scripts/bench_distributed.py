@@ -0,0 +1,120 @@
+"""ATLAS dagitik kuyruk ve bolumleme benchmark scripti.
+
+Heap tabanli DistributedQueue ile bisect halkali
+PartitionManager'i olcer; eski dogrusal algoritmalar
+(liste taramali ekleme, ``pop(0)``, halka yuruyusu)
+kucuk orneklerde karsilastirma icin calistirilir.
+
+Kullanim:
+    python -m scripts.bench_distributed [--messages 1000000] [--keys 10000000]
+"""
+
+import argparse
+import hashlib
+import random
+import time
+
+from app.core.distributed.message_queue import DistributedQueue
+from app.core.distributed.partition_manager import PartitionManager
+
+
+def _legacy_queue(n: int, priorities: list[int]) -> None:
+    """Eski yol: oncelik yeri icin tarama, pop(0)."""
+    queue: list[dict] = []
+    for i in range(n):
+        message = {"priority": priorities[i]}
+        for j, existing in enumerate(queue):
+            if message["priority"] < existing["priority"]:
+                queue.insert(j, message)
+                break
+        else:
+            queue.append(message)
+    while queue:
+        queue.pop(0)
+
+
+def _heap_queue(n: int, priorities: list[int]) -> None:
+    """Yeni yol: DistributedQueue heap'i."""
+    q = DistributedQueue()
+    for i in range(n):
+        q.enqueue("bench", priority=priorities[i])
+    while q.dequeue("bench") is not None:
+        pass
+
+
+def _legacy_assign(
+    ring: list[tuple[int, str]], keys: list[str],
+) -> dict[str, str]:
+    """Eski yol: anahtar basina halka yuruyusu."""
+    assigned: dict[str, str] = {}
+    for key in keys:
+        h = int(hashlib.md5(key.encode()).hexdigest()[:8], 16)
+        node_id = ring[0][1]
+        for ring_hash, nid in ring:
+            if ring_hash >= h:
+                node_id = nid
+                break
+        assigned[key] = node_id
+    return assigned
+
+
+def _timed(fn, *args) -> float:
+    """Fonksiyonu calistirip sureyi dondurur."""
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Benchmark'i calistirir."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--keys", type=int, default=10_000_000)
+    parser.add_argument("--nodes", type=int, default=32)
+    parser.add_argument("--virtual-nodes", type=int, default=64)
+    parser.add_argument("--legacy-sample", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+
+    print("== DistributedQueue ==")
+    for n in (args.legacy_sample, args.messages):
+        priorities = [rng.randint(1, 10) for _ in range(n)]
+        heap_s = _timed(_heap_queue, n, priorities)
+        line = f"{n:>10} mesaj  heap: {heap_s:7.2f}s ({n / heap_s:,.0f} msg/s)"
+        if n <= args.legacy_sample:
+            legacy_s = _timed(_legacy_queue, n, priorities)
+            line += f"  eski: {legacy_s:7.2f}s"
+        print(line)
+
+    print("== PartitionManager ==")
+    pm = PartitionManager(virtual_nodes=args.virtual_nodes)
+    for i in range(args.nodes):
+        pm.add_node(f"node-{i}")
+
+    sample = [f"key:{i}" for i in range(args.legacy_sample)]
+    legacy_s = _timed(_legacy_assign, pm._ring, sample)
+    bisect_s = _timed(PartitionManager.assign_keys, pm, sample)
+    print(
+        f"{len(sample):>10} anahtar  bisect: {bisect_s:7.2f}s  "
+        f"eski: {legacy_s:7.2f}s  (halka {len(pm._ring)} nokta)"
+    )
+
+    keys = (f"key:{i}" for i in range(args.keys))
+    assign_s = _timed(PartitionManager.assign_keys, pm, keys)
+    pm.rebalance()
+    print(f"{args.keys:>10} anahtar  assign_keys: {assign_s:7.2f}s "
+          f"({args.keys / assign_s:,.0f} key/s)")
+
+    start = time.perf_counter()
+    pm.add_node(f"node-{args.nodes}")
+    record = pm.rebalance()
+    print(
+        f"dugum ekleme + rebalance: {time.perf_counter() - start:7.2f}s  "
+        f"taranan={record['scanned']:,} tasinan={record['moved']:,} "
+        f"toplam={record['total_keys']:,}"
+    )
+
+
+if __name__ == "__main__":
+    main()
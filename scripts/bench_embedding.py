@@ -0,0 +1,178 @@
+"""ATLAS embedding servisi benchmark scripti.
+
+Eski senkron embedding yolu (olay dongusu icinde,
+metin basina bir model cagrisi) ile EmbeddingService
+(is parcacigi havuzu, mikro parti, icerik onbellegi)
+arasinda metin/sn, istek p50/p99 gecikmesini ve
+olay dongusunun en uzun bloklanma suresini karsilastirir.
+Eski yol istek basina kisa gorunur ama o surede dongu
+tamamen durur; diger tum korutinler bekler.
+
+Varsayilan model, parti basina sabit ek yuk ve metin
+basina maliyeti olan sentetik bir modeldir; ``--model``
+verilirse gercek fastembed modeli kullanilir.
+
+Kullanim:
+    python -m scripts.bench_embedding [--requests N] [--concurrency 64]
+        [--repeat 0.3] [--model BAAI/bge-small-en-v1.5]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any
+
+from app.core.memory.embedding_service import EmbeddingService
+
+
+class _SyntheticModel:
+    """Parti ek yuku + metin basina maliyetli sahte model."""
+
+    def __init__(self, overhead_ms: float, per_text_ms: float) -> None:
+        self._overhead = overhead_ms / 1000
+        self._per_text = per_text_ms / 1000
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        # Gercek ONNX cagrisi gibi GIL'i birakan bekleme
+        time.sleep(self._overhead + self._per_text * len(texts))
+        return [[float(len(t))] * 384 for t in texts]
+
+
+def _load_model(args: argparse.Namespace) -> Any:
+    """Benchmark modelini yukler."""
+    if args.model:
+        from fastembed import TextEmbedding
+
+        return TextEmbedding(model_name=args.model)
+    return _SyntheticModel(args.overhead_ms, args.per_text_ms)
+
+
+def _workload(requests: int, repeat: float, seed: int = 7) -> list[str]:
+    """Tekrar oranli sorgu metinleri uretir."""
+    rng = random.Random(seed)
+    seen: list[str] = []
+    texts: list[str] = []
+    for i in range(requests):
+        if seen and rng.random() < repeat:
+            texts.append(rng.choice(seen))
+        else:
+            text = f"sunucu {i} disk kullanimi yuksek, uyari {i % 97}"
+            seen.append(text)
+            texts.append(text)
+    return texts
+
+
+async def _run(
+    embed: Any,
+    texts: list[str],
+    concurrency: int,
+) -> tuple[float, list[float], float]:
+    """Sabit eszamanlilikla istekleri calistirir.
+
+    Returns:
+        (metin/sn, istek gecikmeleri ms, maks dongu gecikmesi ms).
+    """
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for text in texts:
+        queue.put_nowait(text)
+    latencies: list[float] = []
+
+    async def client() -> None:
+        while not queue.empty():
+            text = queue.get_nowait()
+            start = time.perf_counter()
+            await embed(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    max_lag = 0.0
+    running = True
+
+    async def heartbeat() -> None:
+        nonlocal max_lag
+        while running:
+            tick = time.perf_counter()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, (time.perf_counter() - tick) * 1000 - 1)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    running = False
+    await beat
+    return len(texts) / elapsed, latencies, max_lag
+
+
+def _pct(samples: list[float], pct: float) -> float:
+    """Yuzdelik hesaplar."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main() -> None:
+    """Benchmark'i calistirir."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--repeat", type=float, default=0.3)
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--wait-ms", type=float, default=5.0)
+    parser.add_argument("--overhead-ms", type=float, default=4.0)
+    parser.add_argument("--per-text-ms", type=float, default=0.2)
+    parser.add_argument("--model", default="")
+    args = parser.parse_args()
+
+    model = _load_model(args)
+    texts = _workload(args.requests, args.repeat)
+
+    async def legacy(text: str) -> list[float]:
+        # Eski SemanticMemory._generate_embedding davranisi
+        vector = list(model.embed([text]))[0]
+        return vector.tolist() if hasattr(vector, "tolist") else list(vector)
+
+    service = EmbeddingService(
+        loader=lambda: model,
+        model_name=args.model or "synthetic",
+        max_batch=args.batch,
+        max_wait_ms=args.wait_ms,
+    )
+    no_cache = EmbeddingService(
+        loader=lambda: model,
+        model_name=args.model or "synthetic",
+        max_batch=args.batch,
+        max_wait_ms=args.wait_ms,
+        cache_size=0,
+    )
+
+    print(
+        f"== {args.requests} istek, eszamanlilik {args.concurrency}, "
+        f"tekrar %{args.repeat * 100:.0f} =="
+    )
+    for name, embed in (
+        ("senkron (eski)", legacy),
+        ("servis, onbelleksiz", no_cache.embed),
+        ("servis", service.embed),
+    ):
+        rate, latencies, lag = asyncio.run(
+            _run(embed, texts, args.concurrency)
+        )
+        print(
+            f"{name:>20}: {rate:10,.0f} metin/sn  "
+            f"p50 {_pct(latencies, 50):8.2f} ms  "
+            f"p99 {_pct(latencies, 99):8.2f} ms  "
+            f"dongu blok {lag:9.2f} ms"
+        )
+    stats = service.get_stats()
+    print(
+        f"servis: ortalama parti {stats['avg_batch_size']}, "
+        f"onbellek isabeti {stats['hit_rate']}, "
+        f"birlestirilen {stats['coalesced']}"
+    )
+    service.close()
+    no_cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""ATLAS deneyim tamponu benchmark scripti.
+
+Ornek basina agac inisi (eski yol) ile toplu
+vektorel inisin saniyedeki ornek sayisini ve
+tekli/toplu oncelik guncellemesini karsilastirir.
+
+Kullanim:
+    python -m scripts.bench_experience_buffer [--capacity 1000000] [--batch 256]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.core.learning.experience_buffer import ExperienceBuffer
+from app.models.learning import Experience, PrioritizedExperience
+
+
+def _fill(capacity: int) -> ExperienceBuffer:
+    """Tamponu rasgele onceliklerle doldurur."""
+    buf = ExperienceBuffer(max_size=capacity)
+    exp = Experience(state={}, action="a", reward=0.0, next_state={})
+    priorities = np.random.uniform(0.01, 2.0, capacity)
+    for p in priorities.tolist():
+        buf.add(exp, priority=p)
+    return buf
+
+
+def _per_sample(buf: ExperienceBuffer, n: int) -> list[PrioritizedExperience]:
+    """Eski ornekleme yolu: segment basina tek agac inisi."""
+    tree = buf._tree
+    total = tree.total()
+    segment = total / n
+    min_prob = max(1e-6, np.min(tree.leaf_priorities()) / total)
+    max_weight = (min_prob * tree.size) ** (-buf.beta)
+    out = []
+    for i in range(n):
+        s = np.random.uniform(segment * i, segment * (i + 1))
+        _, priority, data = tree.get(s)
+        weight = (priority / total * tree.size) ** (-buf.beta) / max_weight
+        out.append(PrioritizedExperience(
+            experience=data, priority=priority, weight=weight,
+        ))
+    return out
+
+
+def _rate(fn, rounds: int, batch: int) -> float:
+    """Saniyedeki ornek sayisi."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return rounds * batch / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Benchmark'i calistirir."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--capacity", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"== Doldurma ({args.capacity:,} kapasite) ==")
+    start = time.perf_counter()
+    buf = _fill(args.capacity)
+    print(f"{'add':>18}: {time.perf_counter() - start:8.2f} sn")
+
+    print(f"== Ornekleme (batch={args.batch}) ==")
+    results = {
+        "per_sample (eski)": _rate(
+            lambda: _per_sample(buf, args.batch), args.rounds, args.batch,
+        ),
+        "sample_arrays": _rate(
+            lambda: buf.sample_arrays(args.batch), args.rounds, args.batch,
+        ),
+        "sample": _rate(
+            lambda: buf.sample(args.batch), args.rounds, args.batch,
+        ),
+    }
+    for name, rate in results.items():
+        print(f"{name:>18}: {rate:12,.0f} ornek/sn")
+
+    print("== Oncelik guncelleme ==")
+    indices, _, _, _ = buf.sample_arrays(args.batch)
+    new = np.random.uniform(0.01, 2.0, len(indices))
+    tree = buf._tree
+
+    def single() -> None:
+        for idx, p in zip(indices.tolist(), new.tolist()):
+            tree.update(idx, p)
+
+    for name, fn in (
+        ("tekli update", single),
+        ("update_priorities", lambda: buf.update_priorities(indices, new)),
+    ):
+        rate = _rate(fn, args.rounds, len(indices))
+        print(f"{name:>18}: {rate:12,.0f} guncelleme/sn")
+
+
+if __name__ == "__main__":
+    main()
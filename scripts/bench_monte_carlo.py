@@ -0,0 +1,114 @@
+"""ATLAS Monte Carlo benchmark scripti.
+
+Ayni risk modelinin skaler (ornek basina cagri),
+process havuzu, vektorel ve parcali vektorel
+degerlendirme surelerini ve tepe bellek
+kullanimini karsilastirir.
+
+Kullanim:
+    python -m scripts.bench_monte_carlo [--sizes 10000,100000,1000000]
+        [--workers 4] [--max-scalar 100000]
+"""
+
+import argparse
+import math
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import numpy as np
+
+from app.core.autonomy.monte_carlo import MonteCarloSimulator, vectorized
+from app.models.probability import SimulationConfig
+
+_VARIABLES = {
+    "revenue": {"distribution": "normal", "params": {"mean": 1000, "std": 150}},
+    "cost": {"distribution": "triangular", "params": {"left": 500, "mode": 650, "right": 900}},
+    "churn": {"distribution": "beta", "params": {"a": 2, "b": 20}},
+}
+
+
+def _risk_model(revenue: float, cost: float, churn: float) -> float:
+    """Skaler risk modeli."""
+    return (revenue * (1 - churn) - cost) * math.exp(-churn)
+
+
+@vectorized
+def _risk_model_vec(
+    revenue: np.ndarray,
+    cost: np.ndarray,
+    churn: np.ndarray,
+) -> np.ndarray:
+    """Dizi-uyumlu risk modeli."""
+    return (revenue * (1 - churn) - cost) * np.exp(-churn)
+
+
+def _measure(run: Callable[[], Any]) -> tuple[float, float, Any]:
+    """Sure ve tepe bellegi olcer.
+
+    Args:
+        run: Calistirilacak kosu.
+
+    Returns:
+        (saniye, tepe MB, sonuc).
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6, result
+
+
+def main() -> None:
+    """Benchmark'i calistirir."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk", type=int, default=100_000)
+    parser.add_argument("--max-scalar", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for n in (int(s) for s in args.sizes.split(",")):
+        cfg = SimulationConfig(
+            n_simulations=n, random_seed=42, variables=_VARIABLES,
+        )
+        runs: dict[str, Callable[[], Any]] = {
+            "vectorized": partial(
+                MonteCarloSimulator().simulate, _risk_model_vec, cfg,
+            ),
+            "streaming": partial(
+                MonteCarloSimulator().simulate_streaming,
+                _risk_model_vec, cfg, chunk_size=args.chunk,
+            ),
+        }
+        if n <= args.max_scalar:
+            runs["scalar"] = partial(
+                MonteCarloSimulator().simulate, _risk_model, cfg,
+            )
+            runs[f"process_pool x{args.workers}"] = partial(
+                MonteCarloSimulator(workers=args.workers).simulate,
+                _risk_model, cfg,
+            )
+            runs[f"streaming pool x{args.workers}"] = partial(
+                MonteCarloSimulator(workers=args.workers).simulate_streaming,
+                _risk_model, cfg, chunk_size=args.chunk,
+            )
+
+        print(f"== {n:,} ornek ==")
+        for name, run in runs.items():
+            elapsed, peak_mb, result = _measure(run)
+            print(
+                f"{name:>18}: {elapsed:8.3f} sn  "
+                f"tepe {peak_mb:8.1f} MB  "
+                f"ortalama {result.mean:10.3f}"
+            )
+        if n > args.max_scalar:
+            print(f"{'scalar':>18}: atlandi (--max-scalar {args.max_scalar})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""ATLAS pipeline akis modu benchmark scripti.
+
+Sentetik veri uzerinde parcali akis ETL'ini
+(birlesik donusum + parca bazli dogrulama)
+calistirip satir/saniye ve tepe bellegi raporlar;
+kucuk ornekte eski tam-liste yoluyla bellek
+karsilastirmasi yapar.
+
+Kullanim:
+    python -m scripts.bench_pipeline_stream [--rows 10000000] [--chunk-size 10000]
+"""
+
+import argparse
+import resource
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any
+
+from app.core.pipeline.pipeline_orchestrator import PipelineOrchestrator
+from app.models.pipeline import SourceType
+
+_STEPS = [
+    {"type": "mapping", "name": "bench"},
+    {"type": "clean"},
+    {"type": "convert_types", "type_map": {"amount": "float", "qty": "int"}},
+    {"type": "enrich", "name": "bench"},
+]
+
+
+def _synthetic(n: int) -> Iterator[dict[str, Any]]:
+    """Sentetik satir uretir."""
+    for i in range(n):
+        yield {
+            "id": i,
+            "customer": f" cust-{i % 5000} ",
+            "amount": f"{(i % 997) * 1.25:.2f}",
+            "qty": str(i % 13),
+            "note": None if i % 11 == 0 else "ok",
+        }
+
+
+def _orchestrator(chunk_size: int) -> PipelineOrchestrator:
+    """Benchmark icin orkestrator kurar."""
+    orch = PipelineOrchestrator(chunk_size=chunk_size)
+    orch.loader.register_target("sink", SourceType.DATABASE)
+    orch.transformer.add_mapping("bench", {
+        "id": "order_id", "customer": "customer",
+        "amount": "amount", "qty": "qty", "note": "note",
+    })
+    orch.transformer.add_enrichment("bench", {"currency": "TRY"})
+    return orch
+
+
+def _max_rss_mb() -> float:
+    """Surecin tepe RSS degeri (MB)."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS bayt dondurur
+    return rss / (1048576 if sys.platform == "darwin" else 1024)
+
+
+def _materialized(orch: PipelineOrchestrator, n: int) -> dict[str, Any]:
+    """Eski yol: her asama tam liste."""
+    dt = orch.transformer
+    start = time.perf_counter()
+    data = list(_synthetic(n))
+    data = dt.apply_mapping(data, "bench")
+    data = dt.clean(data)
+    data = dt.convert_types(data, {"amount": "float", "qty": "int"})
+    data = dt.enrich(data, "bench")
+    orch.validator.check_quality(data)
+    orch.loader.load("sink", data)
+    return {"rows": len(data), "duration": time.perf_counter() - start}
+
+
+def main() -> None:
+    """Benchmark'i calistirir."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--prefetch", type=int, default=0)
+    parser.add_argument("--compare-rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    print(f"== akis ETL ({args.rows:,} satir, parca {args.chunk_size:,}) ==")
+    # Akis once calisir; tepe RSS tam liste yolundan etkilenmez
+    orch = _orchestrator(args.chunk_size)
+    rss_before = _max_rss_mb()
+    result = orch.run_etl_stream(
+        "synthetic", "sink", transforms=_STEPS,
+        rows=_synthetic(args.rows), prefetch=args.prefetch,
+    )
+    print(
+        f"yuklenen {result['loaded']:,} satir, {result['chunks']:,} parca, "
+        f"{result['duration']:.1f}s, {result['rows_per_sec']:,.0f} satir/s"
+    )
+    print(
+        f"tepe RSS {_max_rss_mb():.1f} MB "
+        f"(baslangicta {rss_before:.1f} MB)"
+    )
+
+    print(f"== bellek karsilastirmasi ({args.compare_rows:,} satir) ==")
+    orch = _orchestrator(args.chunk_size)
+    tracemalloc.start()
+    legacy = _materialized(orch, args.compare_rows)
+    _, legacy_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stream = orch.run_etl_stream(
+        "synthetic", "sink", transforms=_STEPS,
+        rows=_synthetic(args.compare_rows), trace_memory=True,
+    )
+    print(
+        f"tam liste: tepe {legacy_peak / 1048576:8.1f} MB  "
+        f"{legacy['rows'] / legacy['duration']:>10,.0f} satir/s"
+    )
+    print(
+        f"akis     : tepe {stream['peak_memory_mb']:8.1f} MB  "
+        f"{stream['rows_per_sec']:>10,.0f} satir/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""ATLAS Q-learning benchmark scripti.
+
+Dizi tabanli Q-tablosunun guncelleme ve en iyi
+aksiyon secimi hizini, eski JSON+MD5 anahtar
+maliyetiyle birlikte olcer.
+
+Kullanim:
+    python -m scripts.bench_q_learning [--states 10000] [--actions 16]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.core.learning.q_learning import QLearner
+from app.core.learning.q_table import state_key
+from app.models.learning import LearningConfig
+
+
+def _rate(fn, n: int) -> float:
+    """Saniyedeki islem sayisi."""
+    start = time.perf_counter()
+    fn()
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Benchmark'i calistirir."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--states", type=int, default=10_000)
+    parser.add_argument("--actions", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=200_000)
+    parser.add_argument("--double-q", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    states = [
+        {"pos": i, "load": i % 7, "mode": "m" + str(i % 3)}
+        for i in range(args.states)
+    ]
+    actions = [f"a{i}" for i in range(args.actions)]
+    s_idx = rng.integers(0, args.states, args.steps).tolist()
+    n_idx = rng.integers(0, args.states, args.steps).tolist()
+    a_idx = rng.integers(0, args.actions, args.steps).tolist()
+    rewards = rng.normal(0, 1, args.steps).tolist()
+
+    learner = QLearner(config=LearningConfig(double_q=args.double_q))
+
+    def updates() -> None:
+        for s, n, a, r in zip(s_idx, n_idx, a_idx, rewards, strict=True):
+            learner.update(states[s], actions[a], r, states[n], False)
+
+    def best() -> None:
+        for s in s_idx:
+            learner.get_best_action(states[s], actions)
+
+    def keys() -> None:
+        for s in s_idx:
+            state_key(states[s])
+
+    print(f"== {args.states:,} durum, {args.actions} aksiyon ==")
+    for name, fn in (
+        ("update", updates),
+        ("get_best_action", best),
+        ("json+md5 anahtar", keys),
+    ):
+        print(f"{name:>18}: {_rate(fn, args.steps):12,.0f} islem/sn")
+    print(f"{'q_table_size':>18}: {learner.get_metrics().q_table_size:,}")
+
+
+if __name__ == "__main__":
+    main()
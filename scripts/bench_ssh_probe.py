@@ -0,0 +1,180 @@
+"""ATLAS SSH probe benchmark scripti.
+
+Surec ici bir paramiko SSH sunucusuna karsi eski
+(kontrol basina baglanti + metrik basina exec) yol ile
+havuzlu baglanti + tek probe yolunu karsilastirir.
+
+Kullanim:
+    python -m scripts.bench_ssh_probe [--servers 50] [--rounds 3] [--rtt-ms 2]
+"""
+
+import argparse
+import asyncio
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import paramiko
+
+from app.agents.server_monitor_agent import ServerMonitorAgent
+from app.models.server import ServerConfig
+from app.tools.ssh_manager import SSHManager
+from app.tools.ssh_pool import SSHConnectionPool
+
+_CANNED = (
+    ("top -bn1", "12.5"),
+    ("/proc/loadavg", "0.50 0.40 0.30 1/200 12345"),
+    ("free -m", "Mem:           8000       3000        200        100       4800       5000"),
+    ("df -BG", "/              100G        40G        60G  40%"),
+    ("systemctl", "active"),
+)
+
+
+def _respond(command: str, services: list[str]) -> str:
+    """Komuta sahte cikti uretir."""
+    if "@@atlas:" in command:
+        out = []
+        for section, (_, body) in zip(("cpu", "load", "mem", "disk"), _CANNED[:-1], strict=True):
+            out.append(f"@@atlas:{section}\n{body}")
+        out.append("@@atlas:svc")
+        out.extend(f"{svc} active" for svc in services)
+        return "\n".join(out)
+    for needle, body in _CANNED:
+        if needle in command:
+            return body
+    return ""
+
+
+class _StubServer(paramiko.ServerInterface):
+    """Her acik anahtari kabul eden, exec isteklerini yanitlayan sunucu."""
+
+    def __init__(self, services: list[str], rtt: float) -> None:
+        self.services = services
+        self.rtt = rtt
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "publickey"
+
+    def check_auth_publickey(self, username: str, key: paramiko.PKey) -> int:
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED_OPEN_REQUEST
+
+    def check_channel_exec_request(self, channel: paramiko.Channel, command: bytes) -> bool:
+        def _run() -> None:
+            time.sleep(self.rtt)
+            channel.sendall(_respond(command.decode(), self.services).encode())
+            channel.send_exit_status(0)
+            channel.close()
+
+        threading.Thread(target=_run, daemon=True).start()
+        return True
+
+
+def _serve(sock: socket.socket, host_key: paramiko.PKey, services: list[str], rtt: float) -> None:
+    """Gelen baglantilari kabul eder."""
+    while True:
+        try:
+            client, _ = sock.accept()
+        except OSError:
+            return
+        transport = paramiko.Transport(client)
+        transport.add_server_key(host_key)
+        transport.start_server(server=_StubServer(services, rtt))
+
+
+async def _legacy_round(configs: list[ServerConfig]) -> None:
+    """Eski yol: kontrol basina baglanti, metrik basina exec."""
+
+    async def _one(server: ServerConfig) -> None:
+        async with SSHManager(
+            host=server.host, user=server.user,
+            key_path=server.key_path, port=server.port,
+        ) as ssh:
+            for command in (
+                "top -bn1 | grep 'Cpu(s)' | awk '{print $2+$4}'",
+                "cat /proc/loadavg",
+                "free -m | grep Mem",
+                "df -BG --output=target,size,used,avail,pcent | tail -n +2",
+            ):
+                await ssh.execute_command(command)
+            for svc in server.services:
+                await ssh.execute_command(f"systemctl is-active {svc}")
+
+    await asyncio.gather(*[_one(s) for s in configs])
+
+
+async def _pooled_round(agent: ServerMonitorAgent, configs: list[ServerConfig]) -> None:
+    """Yeni yol: havuzlu baglanti, tek probe."""
+    await asyncio.gather(*[agent._check_server(s) for s in configs])
+
+
+async def _run(args: argparse.Namespace, port: int, key_path: str) -> None:
+    """Iki yolu olcer."""
+    services = ["nginx", "postgresql", "redis"]
+    # Her sunucu ayri havuz anahtari alsin diye kullanici adi farkli
+    configs = [
+        ServerConfig(host="127.0.0.1", port=port, user=f"u{i}",
+                     key_path=key_path, services=services)
+        for i in range(args.servers)
+    ]
+    pool = SSHConnectionPool(max_channels=4)
+    agent = ServerMonitorAgent(servers=configs, ssh_pool=pool)
+
+    async def _reachable(host: str) -> bool:
+        return True
+
+    agent._check_ping = _reachable  # type: ignore[method-assign]
+
+    print(f"== {args.servers} sunucu, {args.rounds} tur, rtt={args.rtt_ms}ms ==")
+    for name, round_fn in (
+        ("legacy", lambda: _legacy_round(configs)),
+        ("pooled+probe", lambda: _pooled_round(agent, configs)),
+    ):
+        timings = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            await round_fn()
+            timings.append(time.perf_counter() - start)
+        rounds = " ".join(f"{t * 1000:8.1f}" for t in timings)
+        print(f"{name:>14}: tur ms = {rounds}")
+    print(f"{'pool':>14}: {pool.get_stats()}")
+    await pool.close()
+
+
+def main() -> None:
+    """Benchmark'i calistirir."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--servers", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    host_key = paramiko.RSAKey.generate(2048)
+    client_key = paramiko.RSAKey.generate(2048)
+    with tempfile.TemporaryDirectory() as tmp:
+        key_path = str(Path(tmp) / "id_rsa")
+        client_key.write_private_key_file(key_path)
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(256)
+        threading.Thread(
+            target=_serve,
+            args=(sock, host_key, ["nginx", "postgresql", "redis"], args.rtt_ms / 1000),
+            daemon=True,
+        ).start()
+        try:
+            asyncio.run(_run(args, sock.getsockname()[1], key_path))
+        finally:
+            sock.close()
+
+
+if __name__ == "__main__":
+    main()
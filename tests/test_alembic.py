@@ -49,7 +49,7 @@ class TestAlembicMigrations:
         cfg = Config(str(PROJECT_ROOT / "alembic.ini"))
         scripts = ScriptDirectory.from_config(cfg)
         head = scripts.get_current_head()
-        assert head == "b2c3d4e5f6g7"
+        assert head == "c3d4e5f6a7b8"
 
     def test_initial_revision_has_no_parent(self) -> None:
         cfg = Config(str(PROJECT_ROOT / "alembic.ini"))
@@ -9,6 +9,7 @@ CachingOrchestrator testleri.
 import time
 
 import pytest
+from redis import RedisError
 
 from app.models.caching import (
     BatchRecord,
@@ -31,6 +32,30 @@ from app.core.caching.memory_cache import (
 from app.core.caching.distributed_cache import (
     DistributedCache,
 )
+from app.core.caching.eviction_policy import (
+    FIFOPolicy,
+    FrequencySketch,
+    LFUPolicy,
+    LRUPolicy,
+    TinyLFUPolicy,
+    create_policy,
+)
+from app.core.caching.hash_ring import (
+    ConsistentHashRing,
+    stable_hash,
+)
+from app.core.caching.memory_cache import (
+    CacheRecord,
+)
+from app.core.caching.redis_cache import (
+    RedisDistributedCache,
+)
+from app.core.caching.segmented_cache import (
+    SegmentedCache,
+)
+from app.core.caching.timer_wheel import (
+    TimerWheel,
+)
 from app.core.caching.query_optimizer import (
     QueryOptimizer,
 )
@@ -210,6 +235,39 @@ class TestCacheManager:
         assert cm.get("a") is not None
         assert cm.size == 2
 
+    def test_eviction_fifo(self):
+        cm = CacheManager(
+            strategy=CacheStrategy.FIFO,
+        )
+        cm._max_size = 2
+        cm.set("a", 1)
+        cm.set("b", 2)
+        cm.get("a")
+        cm.set("c", 3)
+        assert cm.exists("a") is False
+        assert cm.get_stats()["evictions"] == 1
+
+    def test_eviction_ttl_nearest(self):
+        cm = CacheManager(
+            strategy=CacheStrategy.TTL,
+        )
+        cm._max_size = 2
+        cm.set("a", 1, ttl=500)
+        cm.set("b", 2, ttl=5)
+        cm.set("c", 3, ttl=100)
+        assert cm.exists("b") is False
+        assert cm.exists("a") is True
+
+    def test_ttl_expiry_clock(self):
+        clock = [1000.0]
+        cm = CacheManager(default_ttl=60)
+        cm._wheel._clock = lambda: clock[0]
+        cm.set("k1", "v1", ttl=5)
+        clock[0] += 6
+        assert cm.get("k1") is None
+        assert cm.size == 0
+        assert cm.get_stats()["expirations"] == 1
+
 
 # ---- MemoryCache Testleri ----
 
@@ -294,6 +352,297 @@ class TestMemoryCache:
         mc.set("c", 3)  # evict b
         assert mc.size == 2
 
+    def test_eviction_lru_victim(self):
+        mc = MemoryCache(max_size=2)
+        mc.set("a", 1)
+        mc.set("b", 2)
+        mc.get("a")
+        mc.set("c", 3)
+        assert mc.exists("a") is True
+        assert mc.exists("b") is False
+        assert mc.get_stats()["evictions"] == 1
+
+    def test_eviction_fifo(self):
+        mc = MemoryCache(max_size=2, policy="fifo")
+        mc.set("a", 1)
+        mc.set("b", 2)
+        mc.get("a")
+        mc.set("c", 3)  # a ilk giren
+        assert mc.exists("a") is False
+        assert mc.exists("b") is True
+
+    def test_eviction_lfu(self):
+        mc = MemoryCache(max_size=2, policy="lfu")
+        mc.set("a", 1)
+        mc.set("b", 2)
+        mc.get("a")
+        mc.get("a")
+        mc.get("b")
+        mc.set("c", 3)  # b daha az sik
+        assert mc.exists("a") is True
+        assert mc.exists("b") is False
+
+    def test_eviction_tinylfu(self):
+        mc = MemoryCache(
+            max_size=100, policy="tinylfu",
+        )
+        for i in range(100):
+            mc.set(f"hot{i}", i)
+        for _ in range(3):
+            for i in range(100):
+                mc.get(f"hot{i}")
+        # Tek seferlik taramalar sicak
+        # girdileri yerinden etmemeli
+        for i in range(500):
+            mc.set(f"scan{i}", i)
+        hot = sum(
+            mc.exists(f"hot{i}")
+            for i in range(100)
+        )
+        assert hot >= 95
+        assert mc.size == 100
+        stats = mc.get_stats()
+        assert stats["policy"] == "tinylfu"
+        assert stats["rejections"] > 0
+
+    def test_cleanup_expired_counts(self):
+        clock = [1000.0]
+        mc = MemoryCache(max_size=10)
+        mc._wheel._clock = lambda: clock[0]
+        mc.set("a", 1, ttl=5)
+        mc.set("b", 2, ttl=50)
+        clock[0] += 10
+        assert mc.cleanup_expired() == 1
+        assert mc.exists("a") is False
+        assert mc.exists("b") is True
+        assert mc.get_stats()["expirations"] == 1
+
+
+# ---- SegmentedCache Testleri ----
+
+class TestSegmentedCache:
+    """SegmentedCache testleri."""
+
+    def setup_method(self):
+        self.sc = SegmentedCache(
+            max_size=100, segments=4,
+        )
+
+    def test_set_get(self):
+        self.sc.set("k1", "v1")
+        assert self.sc.get("k1") == "v1"
+        assert self.sc.get("nope", 42) == 42
+
+    def test_delete_exists(self):
+        self.sc.set("k1", "v1")
+        assert self.sc.exists("k1") is True
+        assert self.sc.delete("k1") is True
+        assert self.sc.delete("k1") is False
+
+    def test_get_many(self):
+        self.sc.set_many(
+            {f"k{i}": i for i in range(20)},
+        )
+        result = self.sc.get_many(
+            ["k1", "k5", "k19", "nope"],
+        )
+        assert result == {
+            "k1": 1, "k5": 5, "k19": 19,
+        }
+
+    def test_set_many_count(self):
+        count = self.sc.set_many(
+            {f"k{i}": i for i in range(30)},
+        )
+        assert count == 30
+        assert self.sc.size == 30
+
+    def test_clear(self):
+        self.sc.set_many({"a": 1, "b": 2})
+        assert self.sc.clear() == 2
+        assert self.sc.size == 0
+
+    def test_bounded(self):
+        sc = SegmentedCache(
+            max_size=8, segments=4,
+        )
+        sc.set_many(
+            {f"k{i}": i for i in range(50)},
+        )
+        assert sc.size <= 8
+
+    def test_get_stats(self):
+        self.sc.set("a", 1)
+        self.sc.get("a")
+        self.sc.get("b")
+        stats = self.sc.get_stats()
+        assert stats["segments"] == 4
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+        assert len(stats["segment_sizes"]) == 4
+
+    def test_orchestrator_segmented_mode(self):
+        orch = CachingOrchestrator(
+            memory_segments=4,
+        )
+        orch.cached_set("k", "v")
+        assert isinstance(
+            orch.memory, SegmentedCache,
+        )
+        assert orch.cached_get("k") == "v"
+        assert orch.get_analytics()[
+            "memory_cache_size"
+        ] == 1
+
+    def test_record_slots(self):
+        rec = CacheRecord("v", 10.0, 0)
+        assert not hasattr(rec, "__dict__")
+        assert rec.value == "v"
+
+
+# ---- EvictionPolicy Testleri ----
+
+class TestEvictionPolicy:
+    """Tahliye politikasi testleri."""
+
+    def test_lru_order(self):
+        p = LRUPolicy(3)
+        for k in ("a", "b", "c"):
+            p.on_insert(k)
+        p.on_access("a")
+        assert p.select_victim() == "b"
+
+    def test_lru_remove(self):
+        p = LRUPolicy(3)
+        p.on_insert("a")
+        p.on_insert("b")
+        p.on_remove("a")
+        assert p.select_victim() == "b"
+
+    def test_fifo_ignores_access(self):
+        p = FIFOPolicy(3)
+        p.on_insert("a")
+        p.on_insert("b")
+        p.on_access("a")
+        assert p.select_victim() == "a"
+
+    def test_lfu_min_frequency(self):
+        p = LFUPolicy(3)
+        for k in ("a", "b", "c"):
+            p.on_insert(k)
+        p.on_access("a")
+        p.on_access("b")
+        assert p.select_victim() == "c"
+        assert p.frequency("a") == 2
+
+    def test_lfu_remove_min_bucket(self):
+        p = LFUPolicy(3)
+        p.on_insert("a")
+        p.on_insert("b")
+        p.on_access("b")
+        p.on_remove("a")
+        assert p.select_victim() == "b"
+
+    def test_empty_victim(self):
+        assert LRUPolicy().select_victim() is None
+        assert LFUPolicy().select_victim() is None
+        assert TinyLFUPolicy().select_victim() is None
+
+    def test_tinylfu_rejects_cold_candidate(self):
+        p = TinyLFUPolicy(10, window_ratio=0.1)
+        for i in range(10):
+            p.on_insert(f"k{i}")
+            p.on_access(f"k{i}")
+        victim = p.select_victim("new")
+        assert victim is not None
+        p.on_remove(victim)
+        p.on_insert("new")
+        victim = p.select_victim("new2")
+        assert victim == "new"
+        assert p.get_stats()["rejections"] >= 1
+
+    def test_create_policy(self):
+        assert isinstance(
+            create_policy("lru"), LRUPolicy,
+        )
+        assert isinstance(
+            create_policy(CacheStrategy.LFU),
+            LFUPolicy,
+        )
+        assert isinstance(
+            create_policy("tinylfu"),
+            TinyLFUPolicy,
+        )
+
+    def test_create_policy_invalid(self):
+        with pytest.raises(ValueError):
+            create_policy("random")
+
+    def test_sketch_estimate(self):
+        sk = FrequencySketch(64)
+        for _ in range(5):
+            sk.increment("a")
+        sk.increment("b")
+        assert sk.estimate("a") >= 5
+        assert sk.estimate("a") > sk.estimate("b")
+
+    def test_sketch_aging(self):
+        sk = FrequencySketch(16)
+        for _ in range(15):
+            sk.increment("a")
+        for i in range(200):
+            sk.increment(f"x{i}")
+        assert sk.estimate("a") < 15
+
+
+# ---- TimerWheel Testleri ----
+
+class TestTimerWheel:
+    """Zamanlayici carki testleri."""
+
+    def test_schedule_and_expire(self):
+        w = TimerWheel(resolution=1.0, clock=lambda: 0.0)
+        w.schedule("a", 5.0)
+        w.schedule("b", 10.0)
+        assert w.advance(4.0) == []
+        assert w.advance(5.0) == ["a"]
+        assert w.advance(20.0) == ["b"]
+        assert w.scheduled_count == 0
+
+    def test_never_early(self):
+        w = TimerWheel(resolution=1.0, clock=lambda: 0.0)
+        w.schedule("a", 5.5)
+        assert w.advance(5.9) == []
+        assert w.advance(6.0) == ["a"]
+
+    def test_cancel(self):
+        w = TimerWheel(clock=lambda: 0.0)
+        w.schedule("a", 5.0)
+        assert w.cancel("a") is True
+        assert w.cancel("a") is False
+        assert w.advance(10.0) == []
+
+    def test_reschedule(self):
+        w = TimerWheel(clock=lambda: 0.0)
+        w.schedule("a", 5.0)
+        w.schedule("a", 50.0)
+        assert w.advance(10.0) == []
+        assert "a" in w
+
+    def test_peek(self):
+        w = TimerWheel(clock=lambda: 0.0)
+        assert w.peek() is None
+        w.schedule("late", 50.0)
+        w.schedule("soon", 5.0)
+        assert w.peek() == "soon"
+        w.cancel("soon")
+        assert w.peek() == "late"
+
+    def test_invalid_resolution(self):
+        with pytest.raises(ValueError):
+            TimerWheel(resolution=0)
+
 
 # ---- DistributedCache Testleri ----
 
@@ -381,6 +730,309 @@ class TestDistributedCache:
         # ttl=0 means no expiry
         assert self.dc.get("k1") == "v1"
 
+    def test_shard_stable_across_processes(self):
+        other = DistributedCache(num_shards=4)
+        for i in range(50):
+            key = f"key{i}"
+            assert (
+                self.dc._get_shard(key)
+                == other._get_shard(key)
+            )
+
+
+# ---- ConsistentHashRing Testleri ----
+
+class TestConsistentHashRing:
+    """Tutarli hash halkasi testleri."""
+
+    def test_stable_hash(self):
+        assert stable_hash("abc") == stable_hash("abc")
+        assert stable_hash("abc") != stable_hash("abd")
+
+    def test_empty_ring(self):
+        ring = ConsistentHashRing()
+        assert ring.get_node("k") is None
+        assert ring.group_keys(["k"]) == {}
+
+    def test_get_node(self):
+        ring = ConsistentHashRing()
+        ring.add_node("a")
+        ring.add_node("b")
+        assert ring.get_node("k1") in ("a", "b")
+        assert ring.get_node("k1") == ring.get_node("k1")
+
+    def test_balanced(self):
+        ring = ConsistentHashRing()
+        for n in ("a", "b", "c", "d"):
+            ring.add_node(n)
+        groups = ring.group_keys(
+            f"k{i}" for i in range(4000)
+        )
+        for keys in groups.values():
+            assert 600 < len(keys) < 1400
+
+    def test_add_node_remaps_fraction(self):
+        ring = ConsistentHashRing()
+        for n in ("a", "b", "c", "d"):
+            ring.add_node(n)
+        keys = [f"k{i}" for i in range(5000)]
+        before = {k: ring.get_node(k) for k in keys}
+        arcs = ring.add_node("e")
+        moved = [
+            k for k in keys
+            if ring.get_node(k) != before[k]
+        ]
+        assert all(
+            ring.get_node(k) == "e" for k in moved
+        )
+        assert 0.1 < len(moved) / len(keys) < 0.3
+        assert {prev for _, _, prev in arcs} <= {
+            "a", "b", "c", "d",
+        }
+
+    def test_remove_node(self):
+        ring = ConsistentHashRing()
+        ring.add_node("a")
+        ring.add_node("b")
+        assert ring.remove_node("b") is True
+        assert ring.remove_node("b") is False
+        assert ring.get_node("k") == "a"
+        assert len(ring) == 1
+
+    def test_get_nodes_distinct(self):
+        ring = ConsistentHashRing()
+        for n in ("a", "b", "c"):
+            ring.add_node(n)
+        nodes = ring.get_nodes("k", 2)
+        assert len(nodes) == 2
+        assert len(set(nodes)) == 2
+        assert nodes[0] == ring.get_node("k")
+
+    def test_in_arc_wraps(self):
+        assert ConsistentHashRing.in_arc(5, 1, 10)
+        assert not ConsistentHashRing.in_arc(1, 1, 10)
+        assert ConsistentHashRing.in_arc(20, 10, 3)
+        assert ConsistentHashRing.in_arc(2, 10, 3)
+
+
+# ---- RedisDistributedCache Testleri ----
+
+class TestRedisDistributedCache:
+    """Redis dagitik onbellek testleri (fakeredis)."""
+
+    def setup_method(self):
+        self.fakeredis = pytest.importorskip("fakeredis")
+        self.servers = {}
+        self.dc = RedisDistributedCache(
+            nodes={
+                "n1": self._client("n1"),
+                "n2": self._client("n2"),
+            },
+        )
+
+    def _client(self, name):
+        server = self.fakeredis.FakeServer()
+        self.servers[name] = server
+        return self.fakeredis.FakeRedis(
+            server=server, decode_responses=True,
+        )
+
+    def test_set_get(self):
+        self.dc.set("k1", {"a": 1})
+        assert self.dc.get("k1") == {"a": 1}
+        assert self.dc.get("nope", 42) == 42
+
+    def test_delete_exists(self):
+        self.dc.set("k1", "v1")
+        assert self.dc.exists("k1") is True
+        assert self.dc.delete("k1") is True
+        assert self.dc.exists("k1") is False
+
+    def test_ttl(self):
+        self.dc.set("k1", "v1", ttl=60)
+        node = self.dc._node_for("k1")
+        ttl = self.dc._clients[node].ttl(
+            self.dc._key("k1"),
+        )
+        assert 0 < ttl <= 60
+
+    def test_keys_spread_over_nodes(self):
+        self.dc.set_many(
+            {f"k{i}": i for i in range(200)},
+        )
+        entries = [
+            s["entries"]
+            for s in self.dc.get_shard_stats()
+        ]
+        assert sum(entries) == 200
+        assert min(entries) > 0
+
+    def test_get_many_batched(self):
+        self.dc.set_many(
+            {f"k{i}": i for i in range(50)},
+        )
+        before = {
+            s["shard"]: s["ops"]
+            for s in self.dc.get_shard_stats()
+        }
+        result = self.dc.get_many(
+            [f"k{i}" for i in range(50)] + ["nope"],
+        )
+        assert len(result) == 50
+        assert result["k7"] == 7
+        after = {
+            s["shard"]: s["ops"]
+            for s in self.dc.get_shard_stats()
+        }
+        # Dugum basina tek MGET (+ dbsize)
+        for node in before:
+            assert after[node] - before[node] <= 2
+
+    def test_add_node_migrates_subset(self):
+        self.dc.set_many(
+            {f"k{i}": i for i in range(300)},
+        )
+        info = self.dc.add_node(
+            "n3", self._client("n3"),
+        )
+        assert 0 < info["migrated_in"] < 200
+        result = self.dc.get_many(
+            [f"k{i}" for i in range(300)],
+        )
+        assert len(result) == 300
+        assert self.dc.shard_count == 3
+
+    def test_remove_node_moves_keys(self):
+        self.dc.set_many(
+            {f"k{i}": i for i in range(100)},
+        )
+        assert self.dc.remove_node("n2") is True
+        assert self.dc.get("k42") == 42
+        assert self.dc.total_entries == 100
+        assert self.dc.remove_node("n2") is False
+
+    def test_failover_promotes_replica(self):
+        self.dc.add_node(
+            "r1", self._client("r1"), role="replica",
+        )
+        result = self.dc.failover("n1")
+        assert result["success"] is True
+        assert result["promoted"] == "r1"
+        assert "r1" in self.dc._ring
+        assert "n1" not in self.dc._ring
+
+    def test_shard_stats_latency(self):
+        self.dc.set("k1", "v1")
+        self.dc.get("k1")
+        stats = self.dc.get_shard_stats()
+        assert {s["shard"] for s in stats} == {
+            "n1", "n2",
+        }
+        assert all("p95_ms" in s for s in stats)
+        assert sum(s["ops"] for s in stats) >= 2
+
+    def test_flush(self):
+        self.dc.set_many({"a": 1, "b": 2, "c": 3})
+        assert self.dc.flush() == 3
+        assert self.dc.total_entries == 0
+
+    def test_entries_ignore_foreign_keys(self):
+        self.dc.set("a", 1)
+        for client in self.dc._clients.values():
+            client.set("other:key", "x")
+        assert self.dc.total_entries == 1
+        assert sum(
+            s["entries"]
+            for s in self.dc.get_shard_stats()
+        ) == 1
+
+    def test_flush_survives_node_error(self):
+        self.dc.set_many({f"k{i}": i for i in range(20)})
+        broken = next(iter(self.dc._clients))
+        self.dc._clients[broken].scan_iter = (
+            lambda **kw: (_ for _ in ()).throw(
+                RedisError("down"),
+            )
+        )
+        assert 0 < self.dc.flush() < 20
+
+    def test_get_stats(self):
+        self.dc.set("k1", "v1")
+        self.dc.get("k1")
+        self.dc.get("k2")
+        stats = self.dc.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["nodes"] == 2
+
+    def test_orchestrator_redis_nodes(self):
+        orch = CachingOrchestrator(
+            distributed_nodes={
+                "n1": self._client("o1"),
+            },
+        )
+        orch.cached_set("k", {"v": 1})
+        orch.memory.clear()
+        assert orch.cached_get("k") == {"v": 1}
+        orch.close()
+
+    def test_orchestrator_cross_worker_invalidation(self):
+        server = self.fakeredis.FakeServer()
+
+        def worker():
+            return CachingOrchestrator(
+                distributed_nodes={
+                    "n1": self.fakeredis.FakeRedis(
+                        server=server,
+                        decode_responses=True,
+                    ),
+                },
+            )
+
+        a, b = worker(), worker()
+        try:
+            assert b.get_tier_stats()[
+                "invalidation_listening"
+            ] is True
+            a.cached_set("k", 1)
+            assert b.cached_get("k") == 1
+            b.memory.set("k", 1)
+            a.cached_set("k", 2)
+            deadline = time.time() + 3
+            while (
+                b.memory.get("k") is not None
+                and time.time() < deadline
+            ):
+                time.sleep(0.01)
+            assert b.memory.get("k") is None
+            assert b.cached_get("k") == 2
+            # Kendi yayini kendi L1'ini dusurmez
+            assert a.memory.get("k") == 2
+        finally:
+            a.close()
+            b.close()
+
+    def test_orchestrator_skips_fill_after_invalidation(self):
+        orch = CachingOrchestrator(
+            distributed_nodes={
+                "n1": self._client("o2"),
+            },
+        )
+        orch.close()
+        orch.distributed.set("k", "old")
+        real_get = orch.distributed.get
+
+        def racing_get(key, default=None):
+            value = real_get(key, default)
+            orch._on_invalidation(
+                '{"origin": "other", "keys": ["k"]}',
+            )
+            return value
+
+        orch.distributed.get = racing_get
+        assert orch.cached_get("k") == "old"
+        assert orch.memory.get("k") is None
+
 
 # ---- QueryOptimizer Testleri ----
 
@@ -924,6 +1576,19 @@ class TestCachingOrchestrator:
         val2 = self.co.cached_get("key1")
         assert val2 == "loaded"
 
+    def test_tier_stats(self):
+        self.co.cached_get("k", loader=lambda: 1)
+        self.co.cached_get("k")
+        self.co.memory.delete("k")
+        self.co.cached_get("k")
+        stats = self.co.get_tier_stats()
+        assert stats["l1_hits"] == 1
+        assert stats["l2_hits"] == 1
+        assert stats["loads"] == 1
+        analytics = self.co.get_analytics()
+        assert analytics["l1_hit_ratio"] == round(1 / 3, 3)
+        assert analytics["l2_hit_ratio"] == 0.5
+
     def test_cached_get_no_loader(self):
         val = self.co.cached_get("nope")
         assert val is None
@@ -11,7 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from celery.exceptions import MaxRetriesExceededError
 
-from app.celery_app import celery_app
+from app.celery_app import build_beat_schedule, celery_app, group_time_limits
 from app.config import settings
 from app.monitors.base_monitor import MonitorResult
 from app.tasks.monitor_tasks import (
@@ -19,10 +19,17 @@ from app.tasks.monitor_tasks import (
     _handle_result,
     _send_telegram_notification,
     run_ads_monitor,
+    run_monitor_group,
     run_opportunity_monitor,
     run_security_monitor,
     run_server_monitor,
 )
+from app.tasks.runtime import (
+    WorkerAsyncRuntime,
+    _start_runtime,
+    _stop_runtime,
+    get_runtime,
+)
 
 
 # === Yardimci fonksiyonlar ===
@@ -774,3 +781,254 @@ class TestTaskNames:
     def test_opportunity_task_name(self) -> None:
         """Opportunity task adi dogru olmali."""
         assert run_opportunity_monitor.name == "app.tasks.monitor_tasks.run_opportunity_monitor"
+
+
+# === TestWorkerAsyncRuntime ===
+
+
+@pytest.fixture
+def runtime():
+    """Baslatilmis surec calisma ortami (test sonunda durdurulur)."""
+    rt = get_runtime()
+    rt.start()
+    yield rt
+    rt.stop()
+
+
+class TestWorkerAsyncRuntime:
+    """Kalici worker olay dongusu testleri."""
+
+    def test_run_uses_same_loop(self, runtime) -> None:
+        """Ardisik calistirmalar ayni donguyu kullanmali."""
+
+        async def _loop_id() -> int:
+            return id(asyncio.get_running_loop())
+
+        assert runtime.run(_loop_id()) == runtime.run(_loop_id())
+        assert runtime.get_stats()["runs"] == 2
+
+    def test_run_without_start_raises(self) -> None:
+        """Baslatilmamis ortam RuntimeError firlatmali."""
+
+        async def _noop() -> None:
+            return None
+
+        with pytest.raises(RuntimeError):
+            WorkerAsyncRuntime().run(_noop())
+
+    def test_exception_propagates(self, runtime) -> None:
+        """Coroutine hatasi cagirana iletilmeli."""
+
+        async def _fail() -> None:
+            raise ValueError("hata")
+
+        with pytest.raises(ValueError):
+            runtime.run(_fail())
+        assert runtime.get_stats()["failures"] == 1
+
+    def test_timeout_cancels_coroutine(self, runtime) -> None:
+        """Bekleme kesilirse coroutine iptal edilmeli."""
+        cancelled = []
+
+        async def _slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with pytest.raises(TimeoutError):
+            runtime.run(_slow(), timeout=0.05)
+
+        async def _settle() -> None:
+            await asyncio.sleep(0.01)
+
+        runtime.run(_settle())
+        assert cancelled == [True]
+
+    def test_resource_shared_and_closed(self) -> None:
+        """Kaynak bir kez olusturulmali, stop'ta kapatilmali."""
+        rt = WorkerAsyncRuntime()
+        rt.start()
+        factory = MagicMock(return_value=object())
+        closer = AsyncMock()
+
+        first = rt.resource("x", factory, closer=closer)
+        second = rt.resource("x", factory, closer=closer)
+        rt.stop()
+
+        assert first is second
+        factory.assert_called_once()
+        closer.assert_awaited_once_with(first)
+        assert rt.running is False
+
+    def test_worker_init_registers_ssh_pool(self) -> None:
+        """worker_process_init sinyali donguyu ve SSH havuzunu kurmali."""
+        _start_runtime()
+        try:
+            stats = get_runtime().get_stats()
+            assert stats["running"] is True
+            assert "ssh_pool" in stats["resources"]
+        finally:
+            _stop_runtime()
+        assert get_runtime().running is False
+
+
+class TestMonitorTasksOnRuntime:
+    """Kalici dongu calisirken monitor tasklari testleri."""
+
+    @patch("app.tasks.monitor_tasks._handle_result")
+    @patch("app.tasks.monitor_tasks.asyncio.run")
+    @patch("app.tasks.monitor_tasks.ServerMonitor")
+    def test_monitor_reused_across_ticks(
+        self,
+        mock_monitor_cls: MagicMock,
+        mock_asyncio_run: MagicMock,
+        mock_handle: MagicMock,
+        runtime,
+    ) -> None:
+        """Monitor surec boyunca tekrar kullanilmali, asyncio.run cagrilmamali."""
+        mock_monitor_cls.return_value = _make_mock_monitor(
+            _make_monitor_result(monitor_name="server"),
+        )
+
+        run_server_monitor()
+        result = run_server_monitor()
+
+        mock_monitor_cls.assert_called_once()
+        mock_asyncio_run.assert_not_called()
+        assert result["monitor_name"] == "server"
+        assert mock_handle.call_count == 2
+
+    @patch("app.tasks.monitor_tasks.TelegramBot")
+    def test_telegram_bot_shared(self, mock_bot_cls: MagicMock, runtime) -> None:
+        """Telegram bot surec boyunca paylasilmali."""
+        mock_bot = MagicMock()
+        mock_bot.send_message = AsyncMock()
+        mock_bot_cls.return_value = mock_bot
+
+        _send_telegram_notification(_make_monitor_result(action="notify"))
+        _send_telegram_notification(_make_monitor_result(action="notify"))
+
+        mock_bot_cls.assert_called_once()
+        assert mock_bot.send_message.await_count == 2
+
+
+class TestRunMonitorGroup:
+    """Monitor grubu (fan-out) taski testleri."""
+
+    @patch("app.tasks.monitor_tasks._handle_result")
+    @patch("app.tasks.monitor_tasks.AdsMonitor")
+    @patch("app.tasks.monitor_tasks.SecurityMonitor")
+    def test_runs_monitors_concurrently(
+        self,
+        mock_security_cls: MagicMock,
+        mock_ads_cls: MagicMock,
+        mock_handle: MagicMock,
+        runtime,
+    ) -> None:
+        """Monitorler ayni dongude esanli calismali."""
+        events: list[str] = []
+
+        def _monitor(name: str) -> MagicMock:
+            async def _check() -> MonitorResult:
+                events.append(f"start:{name}")
+                await asyncio.sleep(0.01)
+                events.append(f"end:{name}")
+                return _make_monitor_result(monitor_name=name)
+
+            monitor = MagicMock()
+            monitor.check = _check
+            return monitor
+
+        mock_security_cls.return_value = _monitor("security")
+        mock_ads_cls.return_value = _monitor("ads")
+
+        result = run_monitor_group(["security", "ads"])
+
+        assert events[:2] == ["start:security", "start:ads"]
+        assert result["security"]["monitor_name"] == "security"
+        assert result["ads"]["monitor_name"] == "ads"
+        assert mock_handle.call_count == 2
+
+    @patch("app.tasks.monitor_tasks._handle_result")
+    @patch("app.tasks.monitor_tasks.AdsMonitor")
+    @patch("app.tasks.monitor_tasks.SecurityMonitor")
+    def test_failure_isolated(
+        self,
+        mock_security_cls: MagicMock,
+        mock_ads_cls: MagicMock,
+        mock_handle: MagicMock,
+    ) -> None:
+        """Bir monitorun hatasi digerini etkilememeli."""
+        failing = MagicMock()
+        failing.check = AsyncMock(side_effect=ConnectionError("baglanti"))
+        mock_security_cls.return_value = failing
+        mock_ads_cls.return_value = _make_mock_monitor(
+            _make_monitor_result(monitor_name="ads"),
+        )
+
+        result = run_monitor_group(["security", "ads"])
+
+        assert result["security"] == {"error": "baglanti"}
+        assert result["ads"]["monitor_name"] == "ads"
+        mock_handle.assert_called_once()
+
+    def test_unknown_monitor_rejected(self) -> None:
+        """Bilinmeyen monitor adi ValueError firlatmali."""
+        with pytest.raises(ValueError):
+            run_monitor_group(["bilinmeyen"])
+
+    def test_task_registered(self) -> None:
+        """Grup task'i Celery'de kayitli olmali."""
+        assert "app.tasks.monitor_tasks.run_monitor_group" in celery_app.tasks
+
+    def test_soft_time_limit_covers_monitor_budgets(self) -> None:
+        """Grup soft limit'i en uzun monitor butcesini kapsamali."""
+        limit = run_monitor_group.soft_time_limit
+        assert limit is not None
+        assert limit > run_opportunity_monitor.soft_time_limit
+        assert limit < run_monitor_group.time_limit
+
+
+class TestBeatFanout:
+    """Beat fan-out zamanlama testleri."""
+
+    def test_default_schedule_unchanged(self) -> None:
+        """Fan-out kapaliyken her monitor kendi girdisine sahip olmali."""
+        assert build_beat_schedule(False) == celery_app.conf.beat_schedule
+
+    def test_fanout_groups_equal_intervals(self) -> None:
+        """Ayni aralikli monitorler tek grup girdisinde toplanmali."""
+        schedule = build_beat_schedule(True)
+        groups = [
+            e for e in schedule.values()
+            if e["task"] == "app.tasks.monitor_tasks.run_monitor_group"
+        ]
+        grouped = [name for g in groups for name in g["args"][0]]
+        singles = [
+            e for e in schedule.values()
+            if e["task"] != "app.tasks.monitor_tasks.run_monitor_group"
+        ]
+
+        assert len(grouped) + len(singles) == 4
+        for group in groups:
+            assert len(group["args"][0]) > 1
+
+    def test_group_limits_follow_members(self) -> None:
+        """Grup girdisi uyelerinin en uzun limiti + pay ile sinirlanmali."""
+        schedule = build_beat_schedule(True)
+        for entry in schedule.values():
+            if entry["task"] != "app.tasks.monitor_tasks.run_monitor_group":
+                continue
+            names = entry["args"][0]
+            soft, hard = group_time_limits(names)
+            assert entry["options"] == {"soft_time_limit": soft, "time_limit": hard}
+
+    def test_short_group_not_given_longest_budget(self) -> None:
+        """Kisa monitorlerin grubu en uzun monitorun butcesini almamali."""
+        soft, hard = group_time_limits(["server", "security"])
+
+        assert soft == run_security_monitor.soft_time_limit + 60
+        assert soft < run_opportunity_monitor.soft_time_limit
+        assert soft < hard
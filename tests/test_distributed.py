@@ -2,6 +2,8 @@
 
 import time
 
+import pytest
+
 from app.models.distributed import (
     NodeStatus,
     LockState,
@@ -38,6 +40,9 @@ from app.core.distributed.cluster_monitor import (
 from app.core.distributed.message_queue import (
     DistributedQueue,
 )
+from app.core.distributed.segment_log import (
+    SegmentLog,
+)
 from app.core.distributed.distributed_orchestrator import (
     DistributedOrchestrator,
 )
@@ -621,6 +626,74 @@ class TestPartitionMgr:
         pm.assign_key("k2")
         assert pm.key_count == 2
 
+    def test_assign_matches_linear_ring_walk(self):
+        pm = PartitionManager(virtual_nodes=8)
+        for n in ("n1", "n2", "n3"):
+            pm.add_node(n)
+        for i in range(200):
+            key = f"k{i}"
+            h = pm._hash(key)
+            expected = next(
+                (n for rh, n in pm._ring if rh >= h),
+                pm._ring[0][1],
+            )
+            assert pm.assign_key(key)["node_id"] == expected
+
+    def test_assign_keys_batch(self):
+        pm = PartitionManager()
+        pm.add_node("n1")
+        pm.add_node("n2")
+        r = pm.assign_keys(f"k{i}" for i in range(100))
+        assert r["assigned"] == 100
+        assert sum(r["nodes"].values()) == 100
+        single = PartitionManager()
+        single.add_node("n1")
+        single.add_node("n2")
+        assert all(
+            single.assign_key(f"k{i}")["node_id"]
+            == pm.lookup_key(f"k{i}")
+            for i in range(100)
+        )
+
+    def test_assign_keys_no_nodes(self):
+        pm = PartitionManager()
+        r = pm.assign_keys(["k1"])
+        assert r["reason"] == "no_nodes"
+
+    def test_rebalance_only_scans_affected_arcs(self):
+        pm = PartitionManager(virtual_nodes=16)
+        for n in ("n1", "n2", "n3", "n4"):
+            pm.add_node(n)
+        keys = [f"k{i}" for i in range(2000)]
+        pm.assign_keys(keys)
+        pm.rebalance()
+
+        pm.add_node("n5")
+        r = pm.rebalance()
+        assert 0 < r["moved"] <= r["scanned"] < len(keys)
+
+        fresh = PartitionManager(virtual_nodes=16)
+        for n in ("n1", "n2", "n3", "n4", "n5"):
+            fresh.add_node(n)
+        fresh.assign_keys(keys)
+        assert all(
+            pm.lookup_key(k) == fresh.lookup_key(k)
+            for k in keys
+        )
+
+    def test_rebalance_after_remove(self):
+        pm = PartitionManager(virtual_nodes=8)
+        pm.add_node("n1")
+        pm.add_node("n2")
+        pm.assign_keys(f"k{i}" for i in range(500))
+        pm.remove_node("n1")
+        r = pm.rebalance()
+        assert r["moved"] > 0
+        assert all(
+            pm.lookup_key(f"k{i}") == "n2"
+            for i in range(500)
+        )
+
 
 # ---- ReplicationManager Testleri ----
 
@@ -939,6 +1012,176 @@ class TestDistQueue:
         assert s["enqueued"] == 1
         assert s["queues"] == 1
 
+    def test_same_priority_is_fifo(self):
+        q = DistributedQueue()
+        for i in range(20):
+            q.enqueue("tasks", {"i": i}, priority=i % 3)
+        order = [
+            q.dequeue("tasks")["data"]["i"]
+            for _ in range(20)
+        ]
+        assert order == sorted(
+            range(20), key=lambda i: (i % 3, i),
+        )
+
+    def test_requeue_respects_priority(self):
+        q = DistributedQueue()
+        q.enqueue("tasks", {"id": "high"}, priority=1)
+        q.enqueue("tasks", {"id": "low"}, priority=9)
+        msg = q.dequeue("tasks")
+        q.nack(msg["message_id"])
+        assert q.dequeue("tasks")["data"]["id"] == "high"
+
+    def test_dedup_pending_message(self):
+        q = DistributedQueue()
+        q.enqueue("tasks", {}, dedup_id="d1")
+        r = q.enqueue("tasks", {}, dedup_id="d1")
+        assert r["status"] == "duplicate"
+        assert q.total_depth == 1
+        q.purge_queue("tasks")
+        r = q.enqueue("tasks", {}, dedup_id="d1")
+        assert r["status"] == "enqueued"
+
+
+# ---- Kalici DistributedQueue Testleri ----
+
+class TestSegmentLog:
+    def test_append_read_release(self, tmp_path):
+        log = SegmentLog(tmp_path, segment_bytes=256)
+        seqs = [
+            log.append(1, f"m{i}".encode())
+            for i in range(50)
+        ]
+        assert seqs == list(range(50))
+        assert log.read(7) == (1, b"m7")
+        assert log.get_stats()["segments"] > 1
+        for seq in seqs[:40]:
+            log.release(seq)
+        assert log.get_stats()["compacted_segments"] > 0
+        live = [seq for seq, _, _ in log.replay()]
+        assert live == seqs[40:]
+        log.close()
+
+    def test_reopen_and_truncate_torn_tail(self, tmp_path):
+        log = SegmentLog(tmp_path, fsync="always")
+        for i in range(5):
+            log.append(1, f"m{i}".encode())
+        log.release(0)
+        log.close()
+        seg = sorted(tmp_path.glob("*.log"))[-1]
+        with open(seg, "ab") as f:
+            f.write(b"\x10\x00\x00")
+
+        log = SegmentLog(tmp_path)
+        assert [p for _, _, p in log.replay()] == [
+            b"m1", b"m2", b"m3", b"m4",
+        ]
+        assert log.get_stats()["truncated_bytes"] == 3
+        assert log.append(1, b"m5") == 5
+        log.close()
+
+    def test_invalid_fsync_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            SegmentLog(tmp_path, fsync="sometimes")
+
+
+class TestDurableQueue:
+    def test_restart_restores_queue_state(self, tmp_path):
+        q = DistributedQueue(
+            max_retries=1, data_dir=str(tmp_path),
+        )
+        q.enqueue("tasks", {"id": "low"}, priority=9)
+        q.enqueue("tasks", {"id": "high"}, priority=1)
+        q.enqueue("tasks", {"id": "done"}, dedup_id="d1")
+        q.enqueue("tasks", {"id": "dead"}, priority=0)
+
+        dead = q.dequeue("tasks")
+        q.nack(dead["message_id"])
+        high = q.dequeue("tasks")
+        assert high["data"]["id"] == "high"
+        done = q.dequeue("tasks")
+        q.ack(done["message_id"])
+        q.close()
+
+        q = DistributedQueue(data_dir=str(tmp_path))
+        # Havadaki mesaj yeniden teslim edilir
+        assert q.total_depth == 2
+        assert q.dead_letter_count == 1
+        assert q.dequeue("tasks")["data"]["id"] == "high"
+        assert q.dequeue("tasks")["data"]["id"] == "low"
+        r = q.enqueue("tasks", {}, dedup_id="d1")
+        assert r["status"] == "duplicate"
+        assert q.retry_dead_letters()["retried"] == 1
+        q.close()
+
+        q = DistributedQueue(data_dir=str(tmp_path))
+        assert q.dead_letter_count == 0
+        assert q.total_depth == 3
+        q.close()
+
+    def test_heap_entries_hold_message_ids(self, tmp_path):
+        for q in (
+            DistributedQueue(), DistributedQueue(data_dir=str(tmp_path)),
+        ):
+            ids = {q.enqueue("tasks", {"i": i})["message_id"] for i in range(3)}
+            msg = q.dequeue("tasks")
+            q.nack(msg["message_id"])
+            entries = q._queues["tasks"]
+            assert {entry[2] for entry in entries} == ids
+            assert q.peek("tasks")["message_id"] in ids
+            assert q.purge_queue("tasks") == 3
+            q.close()
+
+    def test_idle_writes_durable_within_interval(self, tmp_path):
+        q = DistributedQueue(
+            data_dir=str(tmp_path), fsync_interval_ms=50,
+        )
+        q.enqueue("tasks", {"id": 1}, dedup_id="a")
+        q.enqueue("tasks", {"id": 2})
+        msg = q.dequeue("tasks")
+        q.ack(msg["message_id"])
+        # Baska islem yok; zamanlayici commit etmeli
+        time.sleep(0.3)
+
+        # Kapatmadan yeniden ac (cokme benzetimi)
+        recovered = DistributedQueue(data_dir=str(tmp_path))
+        assert recovered.total_depth == 1
+        assert recovered.dequeue("tasks")["data"]["id"] == 2
+        r = recovered.enqueue("tasks", {}, dedup_id="a")
+        assert r["status"] == "duplicate"
+        assert q.get_stats()["log"]["timer_commits"] >= 1
+        recovered.close()
+        q.close()
+
+    def test_acked_segments_are_compacted(self, tmp_path):
+        q = DistributedQueue(
+            data_dir=str(tmp_path),
+            segment_bytes=1024,
+            fsync="never",
+        )
+        for i in range(200):
+            q.enqueue("tasks", {"i": i})
+        while (msg := q.dequeue("tasks")) is not None:
+            q.ack(msg["message_id"])
+        stats = q.get_stats()["log"]
+        assert stats["compacted_segments"] > 0
+        assert stats["live_records"] == 0
+        q.close()
+        assert len(list(tmp_path.glob("*.log"))) == 1
+
+    def test_purge_is_durable(self, tmp_path):
+        q = DistributedQueue(data_dir=str(tmp_path))
+        q.enqueue("tasks", {}, dedup_id="d1")
+        q.enqueue("tasks", {})
+        assert q.purge_queue("tasks") == 2
+        q.close()
+
+        q = DistributedQueue(data_dir=str(tmp_path))
+        assert q.total_depth == 0
+        r = q.enqueue("tasks", {}, dedup_id="d1")
+        assert r["status"] == "enqueued"
+        q.close()
+
 
 # ---- DistributedOrchestrator Testleri ----
 
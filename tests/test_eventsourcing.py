@@ -2,6 +2,8 @@
 
 import time
 
+import pytest
+
 from app.models.eventsourcing import (
     EventType,
     CommandStatus,
@@ -14,6 +16,9 @@ from app.models.eventsourcing import (
     SagaRecord,
     ESSnapshot,
 )
+from app.core.eventsourcing.event_log import (
+    EventLog,
+)
 from app.core.eventsourcing.event_store import (
     EventStore,
 )
@@ -230,6 +235,115 @@ class TestEventStore:
         assert s.snapshot_count == 1
         assert s.global_position == 2
 
+    def test_read_all_from_position(self):
+        s = EventStore()
+        for i in range(10):
+            s.append(f"s{i % 3}", f"e{i}")
+        events = s.read_all(from_position=4, limit=3)
+        assert [e["position"] for e in events] == [4, 5, 6]
+
+    def test_truncation_keeps_versions(self):
+        s = EventStore(max_stream_size=4)
+        for i in range(5):
+            s.append("s1", f"e{i}")
+        events = s.read_stream("s1")
+        assert [e["version"] for e in events] == [3, 4, 5]
+        assert s.event_count == 3
+        e = s.append("s1", "e5", expected_version=5)
+        assert e["version"] == 6
+        assert [x["version"] for x in s.read_all()] == [3, 4, 5, 6]
+
+    def test_delete_skipped_in_read_all(self):
+        s = EventStore()
+        s.append("s1", "e1")
+        s.append("s2", "e2")
+        s.delete_stream("s1")
+        assert [e["stream_id"] for e in s.read_all()] == ["s2"]
+        assert s.append("s1", "e3")["version"] == 1
+
+    def test_truncated_rows_are_compacted(self):
+        s = EventStore(max_stream_size=100)
+        for i in range(20_000):
+            s.append(f"s{i % 3}", "e", {"i": i})
+        stats = s.get_log_stats()
+        assert s.event_count <= 303
+        assert stats["compactions"] > 0
+        assert stats["rows"] <= 2 * 1024 + 303
+        assert s.read_stream("s1")[-1]["version"] == 6667
+        positions = [e["position"] for e in s.read_all(limit=1000)]
+        assert positions == sorted(positions)
+        assert len(positions) == s.event_count
+        assert positions[-1] == 20_000
+
+    def test_persistent_log_reopen(self, tmp_path):
+        s = EventStore(
+            max_stream_size=6,
+            log_dir=str(tmp_path),
+            segment_bytes=512,
+        )
+        for i in range(40):
+            s.append(f"s{i % 4}", "e", {"i": i})
+        s.delete_stream("s2")
+        before = s.read_all(limit=100)
+        stream = s.read_stream("s1", from_version=8)
+        assert s.get_log_stats()["segments"] > 1
+        s.close()
+
+        reopened = EventStore(
+            max_stream_size=6,
+            log_dir=str(tmp_path),
+            segment_bytes=512,
+        )
+        assert reopened.read_all(limit=100) == before
+        assert reopened.read_stream("s1", from_version=8) == stream
+        assert reopened.global_position == 40
+        assert reopened.get_stream_version("s1") == 10
+        assert reopened.append("s1", "e")["position"] == 41
+        reopened.close()
+
+
+class TestEventLog:
+    def test_position_must_increase(self):
+        log = EventLog()
+        log.append({"stream_id": "s", "version": 1, "position": 5})
+        try:
+            log.append({"stream_id": "s", "version": 2, "position": 5})
+            pytest.fail("Should raise")
+        except ValueError:
+            pass
+
+    def test_iter_all_is_lazy(self):
+        log = EventLog()
+        for i in range(1, 6):
+            log.append({"stream_id": "s", "version": i, "position": i})
+        it = log.iter_all(from_position=3)
+        assert next(it)["position"] == 3
+
+    def test_iter_all_survives_compaction(self):
+        log = EventLog()
+        for i in range(1, 3001):
+            log.append({"stream_id": f"s{i % 2}", "version": i, "position": i})
+        it = log.iter_all(from_position=2000)
+        assert next(it)["position"] == 2000
+        log.delete_stream("s1")
+        assert log.compact() == 1500
+        assert log.get_stats()["rows"] == 1500
+        assert [e["position"] for e in it][:3] == [2002, 2004, 2006]
+
+    def test_torn_write_recovered(self, tmp_path):
+        log = EventLog(directory=str(tmp_path))
+        for i in range(1, 4):
+            log.append({"stream_id": "s", "version": i, "position": i})
+        log.close()
+        segment = next(tmp_path.iterdir())
+        with open(segment, "ab") as fh:
+            fh.write(b"\x40\x00\x00\x00{\"par")
+        log = EventLog(directory=str(tmp_path))
+        assert log.event_count == 3
+        log.append({"stream_id": "s", "version": 4, "position": 4})
+        assert [e["version"] for e in log.read_stream("s", 3)] == [3, 4]
+        log.close()
+
 
 # ---- EventPublisher Testleri ----
 
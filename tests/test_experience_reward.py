@@ -6,6 +6,7 @@ kapsamli birim testleri.
 
 import math
 
+import numpy as np
 import pytest
 
 from app.agents.base_agent import TaskResult
@@ -147,6 +148,39 @@ class TestSumTree:
         tree = SumTree(capacity=4)
         assert tree.total() == pytest.approx(0.0)
 
+    def test_get_batch_matches_get(self) -> None:
+        """Toplu indirme tekli get() ile ayni yapraklari bulmali."""
+        tree = SumTree(capacity=7)
+        for i, p in enumerate([1.0, 0.5, 2.0, 3.0, 0.1, 4.0, 1.5]):
+            tree.add(p, f"d{i}")
+        values = np.linspace(0.0, tree.total() * 0.999, 50)
+        indices, priorities, data_idx = tree.get_batch(values)
+        for v, idx, p, d in zip(values, indices, priorities, data_idx):
+            single_idx, single_p, data = tree.get(v)
+            assert idx == single_idx
+            assert p == pytest.approx(single_p)
+            assert tree.data[d] == data
+
+    def test_update_batch_deduplicates(self) -> None:
+        """Tekrarlanan indekste son deger kazanmali."""
+        tree = SumTree(capacity=5)
+        for i in range(5):
+            tree.add(1.0, i)
+        leaf = tree.capacity - 1
+        tree.update_batch(np.array([leaf, leaf + 3, leaf]), np.array([4.0, 2.0, 6.0]))
+        assert tree.tree[leaf] == pytest.approx(6.0)
+        assert tree.total() == pytest.approx(6.0 + 2.0 + 3.0)
+
+    def test_min_priority_tracks_updates(self) -> None:
+        """Minimum agaci guncellemelerle tutarli kalmali."""
+        tree = SumTree(capacity=4)
+        assert tree.min_priority() == math.inf
+        tree.add(3.0, "a")
+        tree.add(0.5, "b")
+        assert tree.min_priority() == pytest.approx(0.5)
+        tree.update(tree.capacity, 5.0)
+        assert tree.min_priority() == pytest.approx(3.0)
+
 
 # === ExperienceBuffer Testleri ===
 
@@ -315,6 +349,30 @@ class TestExperienceBuffer:
             stats_after = buf.get_stats()
             assert stats_after["total_priority"] != pytest.approx(total_before)
 
+    def test_sample_exposes_tree_indices(self) -> None:
+        """Ornekler oncelik guncellemesi icin agac indeksi tasimali."""
+        buf = ExperienceBuffer(max_size=64)
+        for i in range(40):
+            buf.add(_make_experience(action=f"a_{i}"), priority=1.0)
+        samples = buf.sample(batch_size=8)
+        indices = [s.index for s in samples]
+        assert all(i is not None for i in indices)
+        buf.update_priorities(indices, [0.0] * len(indices))
+        total = buf.get_stats()["total_priority"]
+        assert total == pytest.approx(40 - len(set(indices)) + 1e-6 * len(set(indices)))
+
+    def test_sample_arrays_prefers_high_priority(self) -> None:
+        """Yuksek oncelikli deneyim daha sik orneklenmeli."""
+        np.random.seed(0)
+        buf = ExperienceBuffer(max_size=16, alpha=1.0)
+        for i in range(16):
+            buf.add(_make_experience(action=f"a_{i}"), priority=100.0 if i == 3 else 1.0)
+        indices, priorities, weights, experiences = buf.sample_arrays(batch_size=16)
+        actions = [e.action for e in experiences]
+        assert actions.count("a_3") >= 8
+        assert len(weights) == len(experiences) == len(indices)
+        assert weights.max() <= 1.0 + 1e-9
+
 
 # === RewardFunction Testleri ===
 
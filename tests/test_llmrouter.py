@@ -22,6 +22,18 @@ from app.core.llmrouter.cost_per_token_tracker import (
 from app.core.llmrouter.latency_optimizer import (
     LatencyOptimizer,
 )
+from app.core.llmrouter.response_cache import (
+    LLMResponseCache,
+    TTLLRUCache,
+)
+from app.models.unifiedllm_models import (
+    ChatMessage,
+    FinishReason,
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    UsageInfo,
+)
 from app.core.llmrouter.model_performance_comparator import (
     ModelPerformanceComparator,
 )
@@ -823,6 +835,191 @@ class TestLatencyOptimizer:
         assert s["retrieved"] is True
         assert "cache_entries" in s
 
+    def test_cache_is_bounded_lru(self):
+        opt = LatencyOptimizer(max_cache_entries=2)
+        opt.cache_response(cache_key="a", response="1")
+        opt.cache_response(cache_key="b", response="2")
+        opt.lookup_cache("a")
+        opt.cache_response(cache_key="c", response="3")
+        assert opt.lookup_cache("b")["hit"] is False
+        assert opt.lookup_cache("a")["hit"] is True
+        assert opt.get_summary()["cache_entries"] == 2
+        assert opt.get_summary()["cache_evictions"] == 1
+
+
+# ============================================================
+# LLMResponseCache Testleri
+# ============================================================
+def _llm_request(text, **kwargs):
+    return LLMRequest(
+        provider=LLMProvider.ANTHROPIC,
+        model="claude",
+        messages=[ChatMessage(content=text)],
+        **kwargs,
+    )
+
+
+def _llm_response(text="yanit", tokens=100):
+    return LLMResponse(
+        content=text,
+        usage=UsageInfo(
+            total_tokens=tokens, cost_usd=0.01,
+        ),
+    )
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLLRUCache:
+    """TTLLRUCache testleri."""
+
+    def test_evicts_least_recently_used(self):
+        c = TTLLRUCache(max_entries=2)
+        c.set("a", 1)
+        c.set("b", 2)
+        c.get("a")
+        c.set("c", 3)
+        assert "b" not in c
+        assert c.get("a") == 1
+        assert c.evictions == 1
+
+    def test_expires_after_ttl(self):
+        clock = _Clock()
+        c = TTLLRUCache(ttl_seconds=10, clock=clock)
+        c.set("a", 1)
+        clock.now = 11
+        assert c.get("a") is None
+        assert c.expirations == 1
+        assert len(c) == 0
+
+
+class TestLLMResponseCache:
+    """LLMResponseCache testleri."""
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_ignores_request_id(self):
+        cache = LLMResponseCache()
+        await cache.store(
+            _llm_request("soru"), _llm_response(),
+        )
+        hit = await cache.lookup(
+            _llm_request("  soru "),
+        )
+        assert hit is not None
+        assert hit.content == "yanit"
+        assert hit.raw_response["cache_hit"] == "exact"
+        stats = cache.get_stats()
+        assert stats["exact_hits"] == 1
+        assert stats["saved_tokens"] == 100
+        assert stats["saved_cost_usd"] == 0.01
+
+    @pytest.mark.asyncio
+    async def test_parameters_change_key(self):
+        cache = LLMResponseCache()
+        await cache.store(
+            _llm_request("soru"), _llm_response(),
+        )
+        assert await cache.lookup(
+            _llm_request("soru", temperature=0.2),
+        ) is None
+        assert cache.hit_rate == 0.0
+
+    @pytest.mark.asyncio
+    async def test_error_response_not_stored(self):
+        cache = LLMResponseCache()
+        stored = await cache.store(
+            _llm_request("soru"),
+            LLMResponse(
+                finish_reason=FinishReason.ERROR,
+            ),
+        )
+        assert stored is False
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_semantic_hit_within_scope(self):
+        vectors = {
+            "hava nasil": [1.0, 0.0],
+            "hava nasil?": [0.99, 0.05],
+            "saat kac": [0.0, 1.0],
+        }
+
+        async def embed(text):
+            return vectors[text]
+
+        cache = LLMResponseCache(
+            embed_fn=embed,
+            similarity_threshold=0.95,
+        )
+        await cache.store(
+            _llm_request("hava nasil"),
+            _llm_response("gunesli"),
+        )
+        hit = await cache.lookup(
+            _llm_request("hava nasil?"),
+        )
+        assert hit is not None
+        assert hit.raw_response["cache_hit"] == "semantic"
+        assert await cache.lookup(
+            _llm_request("saat kac"),
+        ) is None
+        # Farkli model ayni kapsamda degil
+        other = _llm_request("hava nasil?")
+        other.model = "gpt"
+        assert await cache.lookup(other) is None
+
+    @pytest.mark.asyncio
+    async def test_semantic_skips_expired_candidates(self):
+        vectors = {
+            "hava nasil": [1.0, 0.0],
+            "hava nasil!": [0.97, 0.24],
+            "hava nasil?": [0.99, 0.05],
+        }
+        clock = _Clock()
+        cache = LLMResponseCache(
+            ttl_seconds=10,
+            embed_fn=lambda text: vectors[text],
+            similarity_threshold=0.95,
+            clock=clock,
+        )
+        await cache.store(
+            _llm_request("hava nasil"), _llm_response("eski"),
+        )
+        clock.now = 5
+        await cache.store(
+            _llm_request("hava nasil!"), _llm_response("yeni"),
+        )
+        clock.now = 11
+        hit = await cache.lookup(_llm_request("hava nasil?"))
+        assert hit is not None
+        assert hit.content == "yeni"
+        assert len(cache) == 1
+        assert cache.get_stats()["expirations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_eviction_drops_vectors(self):
+        cache = LLMResponseCache(
+            max_entries=1,
+            embed_fn=lambda text: [1.0, 0.0],
+        )
+        await cache.store(
+            _llm_request("a"), _llm_response(),
+        )
+        await cache.store(
+            _llm_request("b", temperature=0.1),
+            _llm_response(),
+        )
+        assert len(cache) == 1
+        assert sum(
+            len(v) for v in cache._vectors.values()
+        ) == 1
+
 
 # ============================================================
 # ModelPerformanceComparator Testleri
@@ -1,33 +1,34 @@
 """ATLAS Logging & Audit Trail testleri."""
 
+import random
 import time
 
 import pytest
 
-from app.models.logging_models import (
-    LogLevel,
-    LogFormat,
-    AuditAction,
-    ComplianceStandard,
-    ExportTarget,
-    RetentionPolicy,
-    LogRecord,
-    AuditRecord,
-    ComplianceRecord,
-    LoggingSnapshot,
-)
 from app.core.logging import (
-    LogManager,
-    LogFormatter,
-    LogAggregator,
     AuditRecorder,
-    LogSearcher,
-    LogAnalyzer,
     ComplianceReporter,
+    LogAggregator,
+    LogAnalyzer,
     LogExporter,
+    LogFormatter,
     LoggingOrchestrator,
+    LogIndex,
+    LogManager,
+    LogSearcher,
+)
+from app.models.logging_models import (
+    AuditAction,
+    AuditRecord,
+    ComplianceRecord,
+    ComplianceStandard,
+    ExportTarget,
+    LogFormat,
+    LoggingSnapshot,
+    LogLevel,
+    LogRecord,
+    RetentionPolicy,
 )
-
 
 # ==================== Model Testleri ====================
 
@@ -529,6 +530,123 @@ class TestLogSearcher:
         assert s.search_count == 2
 
 
+class TestLogIndex:
+    """LogIndex testleri."""
+
+    def _records(self, count, seed=3):
+        rng = random.Random(seed)
+        words = ["disk", "Login", "timeout", "db", "cache", "hata"]
+        return [
+            {
+                "message": " ".join(rng.choices(words, k=3)) + f" #{i}",
+                "level": rng.choice(["info", "ERROR", "warning"]),
+                "source": rng.choice(["app", "db"]),
+                "timestamp": 1000 + rng.random() * 100,
+            }
+            for i in range(count)
+        ]
+
+    def _naive(self, logs, text="", level="", source="", start=None, end=None):
+        return [
+            r for r in logs
+            if text.lower() in r["message"].lower()
+            and (not level or r["level"].lower() == level.lower())
+            and (not source or r["source"] == source)
+            and (start is None or r["timestamp"] >= start)
+            and (end is None or r["timestamp"] <= end)
+        ]
+
+    def test_matches_linear_scan(self):
+        logs = self._records(500)
+        idx = LogIndex(segment_size=64)
+        idx.add_many(logs)
+        for kwargs in (
+            {"text": "login"},
+            {"text": "out d"},
+            {"text": "db", "level": "error"},
+            {"level": "ERROR", "source": "db"},
+            {"start": 1020, "end": 1040},
+            {"text": "hata", "source": "app", "start": 1050},
+            {"text": "#49"},
+            {"text": "yok-boyle-bir-sey"},
+        ):
+            assert idx.query(**kwargs) == self._naive(logs, **kwargs)
+        assert idx.get_stats()["segments"] == 8
+
+    def test_case_sensitive(self):
+        idx = LogIndex()
+        idx.add_many([{"message": "User Login"}, {"message": "user login"}])
+        assert len(idx.query(text="Login", case_sensitive=True)) == 1
+        assert len(idx.query(text="LOGIN")) == 2
+
+    def test_out_of_order_timestamps(self):
+        idx = LogIndex()
+        idx.add_many([
+            {"message": "c", "timestamp": 30},
+            {"message": "a", "timestamp": 10},
+            {"message": "b", "timestamp": 20},
+        ])
+        result = idx.query(start=15, end=30)
+        assert [r["message"] for r in result] == ["c", "b"]
+
+    def test_bounded_without_spill_drops_oldest(self):
+        idx = LogIndex(segment_size=10, max_segments=2)
+        idx.add_many({"message": f"m{i}"} for i in range(50))
+        stats = idx.get_stats()
+        assert stats["dropped_records"] == 20
+        assert idx.count == 30
+        assert idx.query(text="m1") == []
+        assert idx.query(text="m2")[0]["message"] == "m20"
+
+    def test_spill_to_disk(self, tmp_path):
+        logs = self._records(300, seed=9)
+        idx = LogIndex(segment_size=50, max_segments=1, spill_dir=str(tmp_path))
+        idx.add_many(logs)
+        stats = idx.get_stats()
+        assert stats["spilled_segments"] == 4
+        assert stats["records"] == 300
+        assert len(list(tmp_path.iterdir())) == 4
+        assert idx.query(text="timeout", level="info") == self._naive(
+            logs, text="timeout", level="info",
+        )
+        assert list(idx.scan()) == logs
+
+        assert idx.clear() == 300
+        assert list(tmp_path.iterdir()) == []
+
+    def test_spilled_segment_pruned_by_time(self, tmp_path):
+        idx = LogIndex(segment_size=2, max_segments=0, spill_dir=str(tmp_path))
+        idx.add_many(
+            {"message": "x", "timestamp": t} for t in (1, 2, 3, 4, 5)
+        )
+        for path in tmp_path.iterdir():
+            path.write_text("bozuk")
+        # Zaman araligi disindaki disk segmentleri yuklenmez
+        assert [r["timestamp"] for r in idx.query(start=5)] == [5]
+
+    def test_drop_is_logged(self, caplog):
+        idx = LogIndex(segment_size=10, max_segments=0)
+        with caplog.at_level("WARNING", logger="app.core.logging.log_index"):
+            idx.add_many({"message": f"m{i}"} for i in range(11))
+        assert "kayit atildi" in caplog.text
+
+    def test_searcher_default_keeps_all_records(self):
+        s = LogSearcher(segment_size=2, max_segments=1)
+        s.index_logs([{"message": f"olay {i}"} for i in range(7)])
+        stats = s.get_index_stats()
+        assert stats["dropped_records"] == 0
+        assert stats["spilled_segments"] == 2
+        assert len(s.search("olay 0")) == 1
+        s.clear_index()
+
+    def test_searcher_uses_index(self, tmp_path):
+        s = LogSearcher(segment_size=2, max_segments=1, spill_dir=str(tmp_path))
+        s.index_logs([{"message": f"olay {i}", "level": "info"} for i in range(7)])
+        assert s.indexed_count == 7
+        assert len(s.filter_by_level("INFO")) == 7
+        assert s.get_index_stats()["spilled_segments"] == 2
+
+
 # ==================== LogAnalyzer Testleri ====================
 
 
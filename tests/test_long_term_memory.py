@@ -3,12 +3,16 @@
 SQLAlchemy session mock'lanarak uzun sureli hafiza islemleri test edilir.
 """
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.core.memory.long_term import LongTermMemory
+from app.core.memory.long_term import (
+    LongTermMemory,
+    decode_task_cursor,
+    encode_task_cursor,
+)
 from app.models.agent_log import AgentLogCreate
 from app.models.decision import DecisionCreate
 from app.models.task import TaskCreate, TaskStatus
@@ -239,6 +243,92 @@ class TestTaskCRUD:
         mock_session.execute.assert_awaited_once()
 
 
+    @pytest.mark.asyncio
+    async def test_bulk_update_groups_by_columns(self, memory: LongTermMemory) -> None:
+        """Toplu guncelleme alan kumesi basina tek executemany yapmali."""
+        mock_session = _make_mock_session()
+
+        with patch.object(memory, "_get_session", return_value=mock_session):
+            count = await memory.bulk_update_tasks({
+                "t1": {"status": TaskStatus.COMPLETED.value, "result_message": "ok"},
+                "t2": {"status": TaskStatus.COMPLETED.value, "result_message": "ok2"},
+                "t3": {"status": TaskStatus.RUNNING.value},
+                "t4": {"unknown": 1},
+            })
+
+        assert count == 3
+        assert mock_session.execute.await_count == 2
+        mock_session.commit.assert_awaited_once()
+        rows = [c.args[1] for c in mock_session.execute.await_args_list]
+        completed = next(r for r in rows if len(r) == 2)
+        assert {r["b_id"] for r in completed} == {"t1", "t2"}
+        assert all(r["b_completed_at"] is not None for r in completed)
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_empty_skips_session(self, memory: LongTermMemory) -> None:
+        """Bos toplu guncelleme veritabanina gitmemeli."""
+        with patch.object(memory, "_get_session") as get_session:
+            assert await memory.bulk_update_tasks({}) == 0
+        get_session.assert_not_called()
+
+
+# === Sayfalama testleri ===
+
+
+class TestTaskPagination:
+    """Keyset sayfalama ve sayim testleri."""
+
+    def test_cursor_round_trip(self) -> None:
+        """Imlec created_at ve id'yi geri vermeli."""
+        created = datetime(2026, 10, 16, 12, 30, tzinfo=UTC)
+        task = MagicMock(id="task-001", created_at=created)
+
+        cursor = encode_task_cursor(task)
+
+        assert "=" not in cursor
+        assert decode_task_cursor(cursor) == (created, "task-001")
+
+    def test_invalid_cursor_raises(self) -> None:
+        """Gecersiz imlec ValueError firlatmali."""
+        with pytest.raises(ValueError):
+            decode_task_cursor("bozuk-imlec")
+
+    @pytest.mark.asyncio
+    async def test_page_sets_next_cursor(self, memory: LongTermMemory) -> None:
+        """limit+1 satir gelirse sonraki sayfa imleci donmeli."""
+        records = [_make_task_mock(id=f"t{i}") for i in range(3)]
+        list_result = MagicMock()
+        list_result.scalars.return_value.all.return_value = records
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 7
+
+        session = _make_mock_session()
+        session.execute = AsyncMock(side_effect=[list_result, count_result])
+
+        with patch.object(memory, "_get_session", return_value=session):
+            page = await memory.list_tasks_page(limit=2)
+
+        assert [t.id for t in page.tasks] == ["t0", "t1"]
+        assert decode_task_cursor(page.next_cursor)[1] == "t1"
+        assert page.total == 7
+        assert page.total_exact is True
+
+    @pytest.mark.asyncio
+    async def test_count_is_cached(self, memory: LongTermMemory) -> None:
+        """Ayni filtre TTL icinde tekrar sayilmamali."""
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 4
+        session = _make_mock_session()
+        session.execute = AsyncMock(return_value=count_result)
+
+        with patch.object(memory, "_get_session", return_value=session):
+            first = await memory.count_tasks(status=TaskStatus.PENDING.value)
+            second = await memory.count_tasks(status=TaskStatus.PENDING.value)
+
+        assert first == second == (4, True)
+        session.execute.assert_awaited_once()
+
+
 # === Karar gecmisi testleri ===
 
 
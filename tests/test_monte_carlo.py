@@ -3,7 +3,7 @@
 import numpy as np
 import pytest
 
-from app.core.autonomy.monte_carlo import MonteCarloSimulator
+from app.core.autonomy.monte_carlo import MonteCarloSimulator, vectorized
 from app.models.probability import SimulationConfig
 
 
@@ -305,3 +305,149 @@ class TestReproducibility:
         r1 = mc1.simulate(lambda x: x, cfg)
         r2 = mc2.simulate(lambda x: x, cfg)
         assert r1.mean == pytest.approx(r2.mean, abs=0.001)
+
+
+@vectorized
+def _vector_linear_model(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Dizi-uyumlu lineer test modeli."""
+    return 2 * x + 3 * y
+
+
+class TestVectorized:
+    """Vektorel degerlendirme testleri."""
+
+    def _cfg(self, n: int = 5000) -> SimulationConfig:
+        return SimulationConfig(
+            n_simulations=n,
+            random_seed=42,
+            variables={
+                "x": {"distribution": "normal", "params": {"mean": 1, "std": 0.1}},
+                "y": {"distribution": "normal", "params": {"mean": 2, "std": 0.1}},
+            },
+        )
+
+    def test_matches_scalar_model(self) -> None:
+        """Vektorel ve skaler model ayni sonucu vermelidir."""
+        scalar = MonteCarloSimulator().simulate(_linear_model, self._cfg())
+        vector = MonteCarloSimulator().simulate(
+            _vector_linear_model, self._cfg(),
+        )
+        assert vector.mean == pytest.approx(scalar.mean)
+        assert vector.std == pytest.approx(scalar.std)
+        assert vector.percentiles == pytest.approx(scalar.percentiles)
+        assert vector.metadata["mode"] == "vectorized"
+        assert scalar.metadata["mode"] == "scalar"
+
+    def test_scalar_output_broadcast(self) -> None:
+        """Sabit cikti ornek sayisina yayinlanmalidir."""
+        result = MonteCarloSimulator().simulate(
+            vectorized(lambda x, y: 7.0), self._cfg(),
+        )
+        assert result.mean == 7.0
+        assert result.std == 0.0
+
+    def test_sensitivity_vectorized(self) -> None:
+        """Duyarlilik analizi vektorel modelle calismalidir."""
+        results = MonteCarloSimulator().sensitivity_analysis(
+            _vector_linear_model, self._cfg(2000),
+        )
+        assert results["x"].correlation_coefficients["x"] > 0
+
+    def test_process_pool(self) -> None:
+        """Skaler model process havuzunda ayni sonucu vermelidir."""
+        serial = MonteCarloSimulator().simulate(_linear_model, self._cfg())
+        pooled = MonteCarloSimulator(workers=2).simulate(
+            _linear_model, self._cfg(),
+        )
+        assert pooled.metadata["mode"] == "process_pool"
+        assert pooled.mean == pytest.approx(serial.mean)
+
+    def test_process_pool_unpicklable_falls_back(self) -> None:
+        """Pickle edilemeyen model seri calismalidir."""
+        result = MonteCarloSimulator(workers=2).simulate(
+            lambda x, y: x + y, self._cfg(),
+        )
+        assert result.metadata["mode"] == "scalar"
+
+
+class TestSimulateStreaming:
+    """simulate_streaming testleri."""
+
+    def _cfg(self, n: int) -> SimulationConfig:
+        return SimulationConfig(
+            n_simulations=n,
+            random_seed=7,
+            variables={
+                "x": {"distribution": "normal", "params": {"mean": 10, "std": 2}},
+            },
+        )
+
+    def test_moments_match_full_run(self) -> None:
+        """Parcali moment'ler tek parcali kosuyla ayni olmalidir."""
+        mc = MonteCarloSimulator()
+        full = mc.simulate_streaming(
+            vectorized(lambda x: x), self._cfg(20000), chunk_size=20000,
+        )
+        chunked = mc.simulate_streaming(
+            vectorized(lambda x: x), self._cfg(20000), chunk_size=3000,
+        )
+        assert chunked.metadata["chunks"] == 7
+        assert chunked.n_simulations == 20000
+        assert chunked.mean == pytest.approx(10, abs=0.1)
+        assert chunked.std == pytest.approx(2, abs=0.1)
+        assert full.metadata["chunks"] == 1
+
+    def test_exact_moments(self) -> None:
+        """Birlestirilen varyans np.std ile ayni olmalidir."""
+        mc = MonteCarloSimulator()
+        cfg = self._cfg(10000)
+        streamed = mc.simulate_streaming(
+            vectorized(lambda x: x * x), cfg, chunk_size=999,
+        )
+        samples = np.random.default_rng(7)
+        values = []
+        for size in [999] * 10 + [10]:
+            x = samples.normal(10, 2, size)
+            samples.random(size)
+            values.append(x * x)
+        values = np.concatenate(values)
+        assert streamed.mean == pytest.approx(values.mean())
+        assert streamed.std == pytest.approx(values.std(ddof=1))
+
+    def test_process_pool_opened_once(self, monkeypatch) -> None:
+        """Parcali kosu tek process havuzu kullanmalidir."""
+        from app.core.autonomy import monte_carlo
+
+        opened = []
+        real = monte_carlo.ProcessPoolExecutor
+
+        def _counting(*args, **kwargs):
+            opened.append(kwargs)
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(monte_carlo, "ProcessPoolExecutor", _counting)
+        result = MonteCarloSimulator(workers=2).simulate_streaming(
+            _linear_model, self._cfg(20000), chunk_size=5000,
+        )
+        assert result.metadata["mode"] == "process_pool"
+        assert result.metadata["chunks"] == 4
+        assert len(opened) == 1
+
+    def test_bounded_reservoir(self) -> None:
+        """Yuzdelik rezervuari sinirli kalmalidir."""
+        result = MonteCarloSimulator().simulate_streaming(
+            vectorized(lambda x: x), self._cfg(50000),
+            chunk_size=10000, reservoir_size=5000,
+        )
+        assert result.metadata["reservoir_size"] == 5000
+        assert result.percentiles["50"] == pytest.approx(10, abs=0.2)
+        assert result.percentiles["5"] < result.percentiles["95"]
+
+    def test_early_stop(self) -> None:
+        """Yakinsayinca erken durmalidir."""
+        result = MonteCarloSimulator().simulate_streaming(
+            vectorized(lambda x: x), self._cfg(1_000_000),
+            chunk_size=10000, early_stop=True,
+        )
+        assert result.convergence_achieved is True
+        assert result.n_simulations < 1_000_000
@@ -5,12 +5,14 @@ import pytest
 from app.core.observability import (
     AlertManager,
     AnomalyDetector,
+    BucketHistogram,
     DashboardBuilder,
     HealthChecker,
     MetricsCollector,
     ObservabilityOrchestrator,
     SLAMonitor,
     SpanCollector,
+    TDigest,
     TraceManager,
 )
 from app.models.observability import (
@@ -506,6 +508,109 @@ class TestMetricsCollector:
         mc.observe("a", 1.0)
         assert mc.histogram_count == 1
 
+    def test_histogram_fixed_memory(self):
+        mc = MetricsCollector()
+        for i in range(20000):
+            mc.observe("lat", float(i % 1000))
+        entry = mc._histograms["lat"]
+        assert "values" not in entry
+        assert entry["histogram"].centroid_count <= 100
+        h = mc.get_histogram("lat")
+        assert h["count"] == 20000
+        assert h["p50"] == pytest.approx(500, rel=0.05)
+        assert h["p99"] == pytest.approx(990, rel=0.02)
+
+    def test_configure_bucket_histogram(self):
+        mc = MetricsCollector()
+        mc.configure_histogram("req", buckets=[0.1, 1.0])
+        for v in (0.05, 0.5, 0.7, 3.0):
+            mc.observe("req", v, {"path": "/a"})
+        h = mc.get_histogram("req", {"path": "/a"})
+        assert h["type"] == "bucket"
+        assert h["max"] == 3.0
+
+    def test_prometheus_histogram_series(self):
+        mc = MetricsCollector()
+        mc.configure_histogram("req", buckets=[0.1, 1.0])
+        for v in (0.05, 0.5, 0.7, 3.0):
+            mc.observe("req", v, {"path": "/a"})
+        lines = mc.export_prometheus().splitlines()
+        assert "# TYPE req histogram" in lines
+        assert 'req_bucket{path="/a",le="0.1"} 1' in lines
+        assert 'req_bucket{path="/a",le="1.0"} 3' in lines
+        assert 'req_bucket{path="/a",le="+Inf"} 4' in lines
+        assert 'req_sum{path="/a"} 4.25' in lines
+        assert 'req_count{path="/a"} 4' in lines
+
+    def test_tdigest_prometheus_buckets(self):
+        mc = MetricsCollector(buckets=[10, 50, 100])
+        for i in range(100):
+            mc.observe("lat", float(i))
+        output = mc.export_prometheus()
+        assert 'lat_bucket{le="100"} 100' in output
+        assert "lat_count 100" in output
+
+    def test_merge_collectors(self):
+        a = MetricsCollector()
+        b = MetricsCollector()
+        for i in range(500):
+            a.observe("lat", float(i))
+            b.observe("lat", float(i + 500))
+        a.increment("req", 2)
+        b.increment("req", 3)
+        b.set_gauge("cpu", 40.0)
+        a.merge(b)
+        assert a.get_counter("req") == 5
+        assert a.get_gauge("cpu") == 40.0
+        h = a.get_histogram("lat")
+        assert h["count"] == 1000
+        assert h["max"] == 999
+        assert h["p50"] == pytest.approx(500, rel=0.03)
+
+    def test_merge_histogram_state(self):
+        worker = MetricsCollector(histogram_type="bucket")
+        worker.observe("lat", 0.2)
+        state = worker.get_histogram_state("lat")
+        mc = MetricsCollector(histogram_type="bucket")
+        mc.observe("lat", 0.3)
+        mc.merge_histogram("lat", state)
+        assert mc.get_histogram("lat")["count"] == 2
+
+    def test_invalid_histogram_type(self):
+        with pytest.raises(ValueError):
+            MetricsCollector(histogram_type="hdr")
+
+
+class TestStreamingHistograms:
+    """Akan histogram testleri."""
+
+    def test_bucket_le_inclusive(self):
+        h = BucketHistogram([1.0, 2.0])
+        for v in (1.0, 1.5, 2.0, 5.0):
+            h.observe(v)
+        assert h.cumulative_counts([1.0, 2.0]) == [1, 3]
+        assert h.counts == [1, 2, 1]
+
+    def test_bucket_merge_requires_same_bounds(self):
+        h = BucketHistogram([1.0])
+        with pytest.raises(ValueError):
+            h.merge(BucketHistogram([2.0]))
+        with pytest.raises(TypeError):
+            h.merge(TDigest())
+
+    def test_tdigest_roundtrip(self):
+        d = TDigest(compression=50)
+        for i in range(1000):
+            d.observe(float(i))
+        restored = TDigest.from_dict(d.to_dict())
+        assert restored.count == 1000
+        assert restored.quantile(0.9) == pytest.approx(
+            d.quantile(0.9),
+        )
+
+    def test_tdigest_empty(self):
+        assert TDigest().quantile(0.5) == 0.0
+
 
 # ===================== HealthChecker =====================
 
@@ -24,6 +24,11 @@ from app.models.pipeline import (
     WindowType,
 )
 
+from app.core.pipeline.chunk_stream import (
+    StreamStats,
+    bounded_prefetch,
+    iter_chunks,
+)
 from app.core.pipeline.data_extractor import (
     DataExtractor,
 )
@@ -1349,6 +1354,255 @@ class TestPipelineOrchestrator:
         assert quality["completeness"] == 1.0
 
 
+# ========== Streaming Pipeline ==========
+
+
+def _rows(n: int):
+    for i in range(n):
+        yield {"id": i, "name": f" user{i} ", "score": str(i % 7)}
+
+
+class TestChunkStream:
+    """Parcali akis yardimcilari testleri."""
+
+    def test_iter_chunks(self) -> None:
+        chunks = list(iter_chunks(_rows(7), 3))
+        assert [len(c) for c in chunks] == [3, 3, 1]
+
+    def test_prefetch_backpressure(self) -> None:
+        produced = []
+
+        def source():
+            for i in range(10):
+                produced.append(i)
+                yield [{"i": i}]
+
+        stream = bounded_prefetch(source(), 2)
+        assert next(stream) == [{"i": 0}]
+        time.sleep(0.05)
+        # 1 tuketilen + en fazla 2 kuyrukta + 1 bekleyen put
+        assert len(produced) <= 4
+        rest = list(stream)
+        assert len(rest) == 9
+
+    def test_prefetch_propagates_error(self) -> None:
+        def source():
+            yield [{"i": 0}]
+            raise RuntimeError("kaynak hatasi")
+
+        with pytest.raises(RuntimeError):
+            list(bounded_prefetch(source(), 1))
+
+    def test_stream_stats(self) -> None:
+        stats = StreamStats()
+        list(stats.track(iter_chunks(_rows(5), 2)))
+        data = stats.to_dict()
+        assert data["rows"] == 5
+        assert data["chunks"] == 3
+        assert data["max_chunk_rows"] == 2
+
+
+class TestStreamingPipeline:
+    """Akis modu testleri."""
+
+    def test_fused_matches_batch(self) -> None:
+        dt = DataTransformer()
+        dt.add_mapping("m", {"id": "key", "name": "label", "score": "score"})
+        dt.add_enrichment("e", {"region": "tr"})
+        rows = list(_rows(20))
+        expected = dt.enrich(
+            dt.convert_types(
+                dt.clean(dt.apply_mapping(rows, "m")),
+                {"score": "int"},
+            ),
+            "e",
+        )
+        fused = dt.fuse([
+            {"type": "mapping", "name": "m"},
+            {"type": "clean"},
+            {"type": "convert_types", "type_map": {"score": "int"}},
+            {"type": "enrich", "name": "e"},
+        ])
+        assert fused(rows) == expected
+
+    def test_fused_does_not_mutate_source(self) -> None:
+        dt = DataTransformer()
+        rows = [{"score": "5"}]
+        out = dt.fuse([
+            {"type": "convert_types", "type_map": {"score": "int"}},
+        ])(rows)
+        assert out == [{"score": 5}]
+        assert rows == [{"score": "5"}]
+
+    def test_fuse_unknown_step(self) -> None:
+        with pytest.raises(ValueError):
+            DataTransformer().fuse([{"type": "pivot"}])
+
+    def test_validate_stream_stops_on_low_quality(self) -> None:
+        dv = DataValidator()
+        report: dict = {}
+        chunks = [[{"a": 1, "b": 2}], [{"a": None, "b": ""}], [{"a": 1, "b": 1}]]
+        passed = list(dv.validate_stream(chunks, min_score=0.5, report=report))
+        assert passed == chunks[:1]
+        assert not report["valid"]
+        assert report["failed_at_row"] == 1
+
+    def test_run_etl_stream_rows(self) -> None:
+        orch = PipelineOrchestrator(chunk_size=1000)
+        orch.loader.register_target("wh", SourceType.DATABASE)
+        result = orch.run_etl_stream(
+            "synthetic", "wh",
+            transforms=[{"type": "convert_types", "type_map": {"score": "int"}}],
+            rows=_rows(5500), trace_memory=True,
+        )
+        assert result["success"]
+        assert result["loaded"] == 5500
+        assert result["chunks"] == 6
+        assert result["stages"]["extract"]["max_chunk_rows"] == 1000
+        assert result["rows_per_sec"] > 0
+        assert "peak_memory_mb" in result
+        assert orch.lineage.entry_count == 1
+
+    def test_run_etl_stream_source(self) -> None:
+        orch = PipelineOrchestrator(chunk_size=4)
+        orch.extractor.register_source("db", SourceType.DATABASE)
+        orch.loader.register_target("wh", SourceType.DATABASE)
+        orch.transformer.add_mapping("m", {"id": "key"})
+        result = orch.run_etl_stream(
+            "db", "wh", "m", limit=10, prefetch=2,
+        )
+        assert result["extracted"] == 10
+        assert result["loaded"] == 10
+        assert orch.extractor.extraction_count == 1
+
+    def test_run_etl_stream_errors(self) -> None:
+        orch = PipelineOrchestrator()
+        assert orch.run_etl_stream("none", "wh")["stage"] == "extract"
+        result = orch.run_etl_stream("x", "missing", rows=_rows(3))
+        assert result["stage"] == "load"
+        orch.loader.register_target("wh", SourceType.DATABASE)
+        result = orch.run_etl_stream(
+            "x", "wh", rows=({"a": None} for _ in range(3)),
+        )
+        assert result["stage"] == "validate"
+
+    def test_run_pipeline_stream(self) -> None:
+        orch = PipelineOrchestrator(chunk_size=3)
+        orch.extractor.register_source("db", SourceType.DATABASE)
+        orch.loader.register_target("wh", SourceType.DATABASE)
+        orch.transformer.add_mapping("m", {"id": "key"})
+        p = orch.builder.create_pipeline("stream")
+        steps = [
+            orch.builder.add_step(
+                p.pipeline_id, "extract", StepType.EXTRACT,
+                {"source": "db", "limit": 7},
+            ),
+            orch.builder.add_step(
+                p.pipeline_id, "map", StepType.TRANSFORM,
+                {"type": "mapping", "name": "m"},
+            ),
+            orch.builder.add_step(
+                p.pipeline_id, "types", StepType.TRANSFORM,
+                {"type": "convert_types", "type_map": {"key": "str"}},
+            ),
+            orch.builder.add_step(
+                p.pipeline_id, "load", StepType.LOAD,
+                {"target": "wh"},
+            ),
+        ]
+        orch.builder.chain_steps(
+            p.pipeline_id, [st.step_id for st in steps],
+        )
+        result = orch.run_pipeline_stream(p.pipeline_id)
+        assert result["success"]
+        assert result["loaded"] == 7
+        assert result["steps_completed"] == 4
+        assert p.status == PipelineStatus.COMPLETED
+        assert all(st.output_count == 7 for st in steps)
+        # Iki transform adimi tek geciste
+        assert orch.transformer.transform_count == 1
+
+    def test_empty_transform_stream_batch_parity(self) -> None:
+        orch = PipelineOrchestrator(chunk_size=4)
+        orch.extractor.register_source("db", SourceType.DATABASE)
+        orch.loader.register_target("wh", SourceType.DATABASE)
+        p = orch.builder.create_pipeline("passthrough")
+        steps = [
+            orch.builder.add_step(
+                p.pipeline_id, "extract", StepType.EXTRACT,
+                {"source": "db"},
+            ),
+            orch.builder.add_step(p.pipeline_id, "noop", StepType.TRANSFORM),
+            orch.builder.add_step(
+                p.pipeline_id, "load", StepType.LOAD, {"target": "wh"},
+            ),
+        ]
+        orch.builder.chain_steps(
+            p.pipeline_id, [st.step_id for st in steps],
+        )
+        stream = orch.run_pipeline_stream(p.pipeline_id)
+        batch = orch.run_etl("db", "wh", validate=False)
+        assert stream["success"] and batch["success"]
+        assert stream["extracted"] == batch["extracted"] > 0
+        assert stream["loaded"] == batch["loaded"]
+
+        rows = list(_rows(10))
+        fused = orch.transformer.fuse([{}, {"type": ""}])
+        assert fused(rows) == rows
+
+    def test_stream_validate_stages_keyed_and_partial_load(self) -> None:
+        orch = PipelineOrchestrator(chunk_size=3)
+        orch.loader.register_target("wh", SourceType.DATABASE)
+        p = orch.builder.create_pipeline("two-checks")
+        steps = [
+            orch.builder.add_step(
+                p.pipeline_id, "loose", StepType.VALIDATE, {"min_score": 0.0},
+            ),
+            orch.builder.add_step(
+                p.pipeline_id, "strict", StepType.VALIDATE,
+                {"fields": ["a"], "min_score": 0.5},
+            ),
+            orch.builder.add_step(
+                p.pipeline_id, "load", StepType.LOAD, {"target": "wh"},
+            ),
+        ]
+        orch.builder.chain_steps(
+            p.pipeline_id, [st.step_id for st in steps],
+        )
+        rows = [{"a": 1, "b": 1}] * 6 + [{"a": None, "b": 1}] * 3
+        result = orch.run_pipeline_stream(p.pipeline_id, rows=rows)
+        assert not result["success"]
+        assert result["stage_key"] == "validate_2"
+        assert result["failed_at_row"] == 6
+        assert result["loaded"] == 6
+        assert result["target"] == "wh"
+        assert result["validation"]["validate"]["valid"]
+        assert result["validation"]["validate"]["total_rows"] == 9
+        assert not result["validation"]["validate_2"]["valid"]
+        assert steps[0].output_count == 9
+        assert steps[1].output_count == 6
+
+    def test_run_pipeline_stream_not_linear(self) -> None:
+        orch = PipelineOrchestrator()
+        p = orch.builder.create_pipeline("dag")
+        a = orch.builder.add_step(p.pipeline_id, "a", StepType.EXTRACT)
+        b = orch.builder.add_step(p.pipeline_id, "b", StepType.EXTRACT)
+        c = orch.builder.add_step(p.pipeline_id, "c", StepType.MERGE)
+        orch.builder.add_merge(
+            p.pipeline_id, [a.step_id, b.step_id], c.step_id,
+        )
+        result = orch.run_pipeline_stream(p.pipeline_id)
+        assert result["reason"] == "not_linear"
+
+    def test_step_config_stored(self) -> None:
+        pb = PipelineBuilder()
+        p = pb.create_pipeline("cfg")
+        step = pb.add_step(
+            p.pipeline_id, "load", StepType.LOAD, {"target": "wh"},
+        )
+        assert pb.get_step_config(step.step_id) == {"target": "wh"}
+
+
 # ============ Config ============
 
 
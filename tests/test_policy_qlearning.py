@@ -436,8 +436,8 @@ class TestQLearnerInit:
     def test_empty_q_tables(self) -> None:
         """Baslangicta Q-tablolari bos olmalidir."""
         learner = QLearner()
-        assert learner._q1 == {}
-        assert learner._q2 == {}
+        assert len(learner._q1) == 0
+        assert len(learner._q2) == 0
 
     def test_initial_metrics_zero(self) -> None:
         """Baslangic metrikleri sifir olmalidir."""
@@ -542,10 +542,11 @@ class TestQLearnerDoubleQ:
         for _ in range(50):
             learner.update(STATE, "act_a", 1.0, NEXT_STATE, False)
 
-        key = QLearner._state_to_key(STATE)
+        sid = learner._states.lookup(STATE)
+        aid = learner._actions.lookup("act_a")
         # Her iki tabloda da giris olmali
-        has_q1 = key in learner._q1 and "act_a" in learner._q1.get(key, {})
-        has_q2 = key in learner._q2 and "act_a" in learner._q2.get(key, {})
+        has_q1 = aid in learner._q1.known_actions(sid)
+        has_q2 = aid in learner._q2.known_actions(sid)
         assert has_q1 or has_q2
 
     def test_double_q_average_returned(self) -> None:
@@ -553,9 +554,10 @@ class TestQLearnerDoubleQ:
         cfg = LearningConfig(double_q=True)
         learner = QLearner(config=cfg)
 
-        key = QLearner._state_to_key(STATE)
-        learner._q1[key] = {"act_a": 4.0}
-        learner._q2[key] = {"act_a": 6.0}
+        sid = learner._states.intern(STATE)
+        aid = learner._actions.intern("act_a")
+        learner._q1.set(sid, aid, 4.0)
+        learner._q2.set(sid, aid, 6.0)
 
         q = learner.get_q_value(STATE, "act_a")
         assert q == pytest.approx(5.0)
@@ -599,9 +601,9 @@ class TestQLearnerDoubleQ:
         for _ in range(100):
             learner.update(STATE, "act_a", 1.0, NEXT_STATE, True)
 
-        key = QLearner._state_to_key(STATE)
-        q1_has = key in learner._q1 and len(learner._q1[key]) > 0
-        q2_has = key in learner._q2 and len(learner._q2[key]) > 0
+        sid = learner._states.lookup(STATE)
+        q1_has = len(learner._q1.known_actions(sid)) > 0
+        q2_has = len(learner._q2.known_actions(sid)) > 0
         # Rastgele secim ile 100 iterasyonda her iki tablo da dolu olacak
         assert q1_has and q2_has
 
@@ -708,8 +710,10 @@ class TestQLearnerSaveLoad:
         new_learner.load(path)
 
         key = QLearner._state_to_key(STATE)
-        assert new_learner._q1[key]["act_a"] == pytest.approx(5.0)
-        assert new_learner._q1[key]["act_b"] == pytest.approx(3.0)
+        data = new_learner._table_to_dict(new_learner._q1)
+        assert data[key]["act_a"] == pytest.approx(5.0)
+        assert data[key]["act_b"] == pytest.approx(3.0)
+        assert new_learner.get_q_value(STATE, "act_a") == pytest.approx(5.0)
 
     def test_save_load_preserves_metrics(self, tmp_path: pytest.TempPathFactory) -> None:
         """Save/load metrik degerlerini korumalidir."""
@@ -803,3 +807,157 @@ class TestQLearnerDecay:
 
         learner.decay_learning_rate()
         assert learner.config.gamma == pytest.approx(0.99)
+
+    def test_save_load_npz_roundtrip(self, tmp_path: pytest.TempPathFactory) -> None:
+        """.npz kaydi tablolari ve metrikleri korumalidir."""
+        cfg = LearningConfig(double_q=True, alpha=0.5, gamma=0.9)
+        learner = QLearner(config=cfg)
+        for i in range(40):
+            learner.update(STATE, ACTIONS[i % 3], float(i), NEXT_STATE, False)
+
+        path = str(tmp_path / "q_table.npz")
+        learner.save(path)
+
+        new_learner = QLearner(config=cfg)
+        new_learner.load(path)
+
+        for a in ACTIONS:
+            assert new_learner.get_q_value(STATE, a) == pytest.approx(
+                learner.get_q_value(STATE, a),
+            )
+        assert new_learner.get_metrics().q_table_size == learner.get_metrics().q_table_size
+        assert new_learner._total_episodes == 40
+        assert new_learner._total_reward == pytest.approx(sum(range(40)))
+
+    def test_load_legacy_json_then_save_npz(self, tmp_path: pytest.TempPathFactory) -> None:
+        """Eski JSON tablosu yuklenip .npz olarak yazilabilmelidir."""
+        key = QLearner._state_to_key(STATE)
+        legacy = {
+            "q1": {key: {"act_a": 2.5, "act_b": -1.0}},
+            "q2": {},
+            "config": LearningConfig().model_dump(),
+            "metrics": {"total_episodes": 3, "total_reward": 1.5},
+        }
+        json_path = tmp_path / "legacy.json"
+        json_path.write_text(json.dumps(legacy))
+
+        learner = QLearner()
+        learner.load(str(json_path))
+        assert learner.get_q_value(STATE, "act_a") == pytest.approx(2.5)
+        assert learner.get_best_action(STATE, ACTIONS) == "act_a"
+
+        npz_path = str(tmp_path / "legacy.npz")
+        learner.save(npz_path)
+        reloaded = QLearner()
+        reloaded.load(npz_path)
+        assert reloaded.get_q_value(STATE, "act_b") == pytest.approx(-1.0)
+
+
+# ===========================================================================
+# Q-tablosu dizi katmani testleri
+# ===========================================================================
+
+
+class TestQTableArrays:
+    """Durum interning ve dizi tabanli Q-tablosu testleri."""
+
+    def test_state_interning_order_independent(self) -> None:
+        """Anahtar sirasi farkli ayni durum ayni kimligi almalidir."""
+        from app.core.learning.q_table import StateIndex
+
+        index = StateIndex()
+        sid = index.intern({"a": 1, "b": [1, 2]})
+        assert index.intern({"b": [1, 2], "a": 1}) == sid
+        assert index.lookup({"a": 1, "b": [1, 2]}) == sid
+        assert index.intern({"a": 2, "b": [1, 2]}) != sid
+        assert len(index) == 2
+
+    def test_unhashable_state_falls_back_to_key(self) -> None:
+        """Hash'lenemeyen degerli durumlar da interning yapilmalidir."""
+        from app.core.learning.q_table import StateIndex
+
+        class Opaque:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __str__(self) -> str:
+                return "opaque"
+
+        index = StateIndex()
+        sid = index.intern({"obj": Opaque()})
+        assert index.lookup({"obj": Opaque()}) == sid
+
+    def test_bool_int_float_states_distinct(self) -> None:
+        """Python'da esit ama JSON'da farkli durumlar ayrilmalidir."""
+        from app.core.learning.q_table import StateIndex
+
+        index = StateIndex()
+        ids = {
+            index.intern({"flag": True}),
+            index.intern({"flag": 1}),
+            index.intern({"flag": 1.0}),
+            index.intern({"flag": [1.0]}),
+            index.intern({"flag": [True]}),
+        }
+        assert len(ids) == 5
+        assert index.lookup({"flag": 1}) != index.lookup({"flag": True})
+
+        learner = QLearner()
+        learner.update({"flag": True}, "a", 1.0, {"flag": True}, done=True)
+        assert learner.get_q_value({"flag": True}, "a") != 0.0
+        assert learner.get_q_value({"flag": 1}, "a") == 0.0
+        assert learner.get_q_value({"flag": 1.0}, "a") == 0.0
+
+    def test_table_grows(self) -> None:
+        """Tablo kapasiteyi asan kimliklerle buyumelidir."""
+        from app.core.learning.q_table import QTable
+
+        table = QTable(states=2, actions=1)
+        table.set(100, 5, 1.5)
+        assert table.get(100, 5) == pytest.approx(1.5)
+        assert table.get(3, 0) == 0.0
+        assert table.get(10_000, 0) == 0.0
+        assert len(table) == 1
+
+    def test_best_ignores_unvisited_cells(self) -> None:
+        """Satir maksimumu yalnizca yazilmis hucrelerden alinmalidir."""
+        from app.core.learning.q_table import QTable
+
+        table = QTable()
+        table.set(0, 2, -3.0)
+        table.set(0, 4, -1.0)
+        assert table.best(0) == (4, -1.0)
+        assert table.best(1) is None
+
+    def test_negative_next_values_used(self) -> None:
+        """Sonraki durumun negatif maksimumu hedefe yansimalidir."""
+        cfg = LearningConfig(gamma=1.0, alpha=1.0)
+        learner = QLearner(config=cfg)
+        learner.update(NEXT_STATE, "act_a", -4.0, STATE, True)
+        learner.update(STATE, "act_a", 0.0, NEXT_STATE, False)
+        assert learner.get_q_value(STATE, "act_a") == pytest.approx(-4.0)
+
+    def test_best_action_unknown_actions_zero(self) -> None:
+        """Bilinmeyen aksiyonlar 0.0 degerli sayilmalidir."""
+        cfg = LearningConfig(alpha=1.0, gamma=0.0)
+        learner = QLearner(config=cfg)
+        learner.update(STATE, "act_a", -2.0, NEXT_STATE, True)
+        assert learner.get_best_action(STATE, ["act_a", "new"]) == "new"
+        assert learner.get_best_action({"unseen": 1}, ACTIONS) == "act_a"
+
+    def test_best_cache_matches_bruteforce(self) -> None:
+        """Artimli argmax onbellegi tam taramayla ayni olmalidir."""
+        from app.core.learning.q_table import QTable
+
+        rng = np.random.default_rng(7)
+        table = QTable(states=2, actions=2)
+        for _ in range(2000):
+            sid, aid = int(rng.integers(0, 5)), int(rng.integers(0, 6))
+            table.set(sid, aid, float(rng.integers(-3, 4)))
+            for row in range(5):
+                known = table.known_actions(row)
+                if not len(known):
+                    assert table.best(row) is None
+                    continue
+                vals = table.values[row, known]
+                expected = int(known[int(np.argmax(vals))])
+                assert table.best(row) == (expected, float(vals.max()))
@@ -12,7 +12,7 @@ from fastapi.testclient import TestClient
 
 from app.api.routes import router
 from app.main import app
-from app.models.task import TaskResponse, TaskStatus
+from app.models.task import TaskPage, TaskResponse, TaskStatus
 
 
 @pytest.fixture
@@ -111,7 +111,7 @@ class TestListTasks:
     def test_list_tasks_empty(self, client: TestClient) -> None:
         """Bos gorev listesi."""
         mock_tm = AsyncMock()
-        mock_tm.list_tasks = AsyncMock(return_value=[])
+        mock_tm.list_tasks_page = AsyncMock(return_value=TaskPage(tasks=[]))
 
         with patch.object(app.state, "task_manager", mock_tm, create=True):
             resp = client.get("/api/tasks")
@@ -131,7 +131,9 @@ class TestListTasks:
         ]
 
         mock_tm = AsyncMock()
-        mock_tm.list_tasks = AsyncMock(return_value=tasks)
+        mock_tm.list_tasks_page = AsyncMock(
+            return_value=TaskPage(tasks=tasks, total=2),
+        )
 
         with patch.object(app.state, "task_manager", mock_tm, create=True):
             resp = client.get("/api/tasks")
@@ -144,14 +146,14 @@ class TestListTasks:
     def test_list_tasks_with_status_filter(self, client: TestClient) -> None:
         """Durum filtresi ile listeleme."""
         mock_tm = AsyncMock()
-        mock_tm.list_tasks = AsyncMock(return_value=[])
+        mock_tm.list_tasks_page = AsyncMock(return_value=TaskPage(tasks=[]))
 
         with patch.object(app.state, "task_manager", mock_tm, create=True):
             resp = client.get("/api/tasks?status=completed")
 
         assert resp.status_code == 200
-        mock_tm.list_tasks.assert_called_once_with(
-            status="completed", agent=None, limit=50, offset=0,
+        mock_tm.list_tasks_page.assert_called_once_with(
+            status="completed", agent=None, limit=50, cursor=None, offset=0,
         )
 
     def test_list_tasks_invalid_status(self, client: TestClient) -> None:
@@ -166,7 +168,7 @@ class TestListTasks:
     def test_list_tasks_with_pagination(self, client: TestClient) -> None:
         """Sayfalama parametreleri."""
         mock_tm = AsyncMock()
-        mock_tm.list_tasks = AsyncMock(return_value=[])
+        mock_tm.list_tasks_page = AsyncMock(return_value=TaskPage(tasks=[]))
 
         with patch.object(app.state, "task_manager", mock_tm, create=True):
             resp = client.get("/api/tasks?limit=10&offset=20")
@@ -175,21 +177,21 @@ class TestListTasks:
         data = resp.json()
         assert data["limit"] == 10
         assert data["offset"] == 20
-        mock_tm.list_tasks.assert_called_once_with(
-            status=None, agent=None, limit=10, offset=20,
+        mock_tm.list_tasks_page.assert_called_once_with(
+            status=None, agent=None, limit=10, cursor=None, offset=20,
         )
 
     def test_list_tasks_with_agent_filter(self, client: TestClient) -> None:
         """Agent filtresi ile listeleme."""
         mock_tm = AsyncMock()
-        mock_tm.list_tasks = AsyncMock(return_value=[])
+        mock_tm.list_tasks_page = AsyncMock(return_value=TaskPage(tasks=[]))
 
         with patch.object(app.state, "task_manager", mock_tm, create=True):
             resp = client.get("/api/tasks?agent=research")
 
         assert resp.status_code == 200
-        mock_tm.list_tasks.assert_called_once_with(
-            status=None, agent="research", limit=50, offset=0,
+        mock_tm.list_tasks_page.assert_called_once_with(
+            status=None, agent="research", limit=50, cursor=None, offset=0,
         )
 
     def test_list_tasks_no_task_manager(self, client: TestClient) -> None:
@@ -199,6 +201,39 @@ class TestListTasks:
 
         assert resp.status_code == 503
 
+    def test_list_tasks_cursor_and_total(self, client: TestClient) -> None:
+        """Imlec iletilir, sonraki imlec ve tahmini toplam doner."""
+        page = TaskPage(
+            tasks=[_make_task_response(id="task-9")],
+            next_cursor="abc",
+            total=12_000_000,
+            total_exact=False,
+        )
+        mock_tm = AsyncMock()
+        mock_tm.list_tasks_page = AsyncMock(return_value=page)
+
+        with patch.object(app.state, "task_manager", mock_tm, create=True):
+            resp = client.get("/api/tasks?limit=1&cursor=xyz")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["next_cursor"] == "abc"
+        assert data["total"] == 12_000_000
+        assert data["total_exact"] is False
+        mock_tm.list_tasks_page.assert_called_once_with(
+            status=None, agent=None, limit=1, cursor="xyz", offset=0,
+        )
+
+    def test_list_tasks_invalid_cursor(self, client: TestClient) -> None:
+        """Gecersiz imlec 400 doner."""
+        mock_tm = AsyncMock()
+        mock_tm.list_tasks_page = AsyncMock(side_effect=ValueError("Gecersiz imlec"))
+
+        with patch.object(app.state, "task_manager", mock_tm, create=True):
+            resp = client.get("/api/tasks?cursor=bozuk")
+
+        assert resp.status_code == 400
+
 
 # === GET /api/tasks/{task_id} testleri ===
 
@@ -4,6 +4,7 @@ Qdrant istemcisi ve embedding modeli mock'lanarak
 semantik hafiza islemleri test edilir.
 """
 
+import asyncio
 import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -62,8 +63,17 @@ def _ensure_qdrant_mock():
         mock_qdrant_models.FieldCondition = _MockFieldCondition
         mock_qdrant_models.MatchValue = _MockMatchValue
         mock_qdrant_models.VectorParams = _MockVectorParams
+        mock_qdrant_exceptions = MagicMock()
+        mock_qdrant_exceptions.UnexpectedResponse = type(
+            "UnexpectedResponse", (Exception,), {},
+        )
+        mock_qdrant_exceptions.ResponseHandlingException = type(
+            "ResponseHandlingException", (Exception,), {},
+        )
         sys.modules["qdrant_client"] = mock_qdrant
         sys.modules["qdrant_client.models"] = mock_qdrant_models
+        sys.modules["qdrant_client.http"] = MagicMock()
+        sys.modules["qdrant_client.http.exceptions"] = mock_qdrant_exceptions
 
     if "fastembed" not in sys.modules:
         mock_fastembed = MagicMock()
@@ -72,13 +82,19 @@ def _ensure_qdrant_mock():
 
 _ensure_qdrant_mock()
 
+from app.core.memory.embedding_service import EmbeddingService  # noqa: E402
 from app.core.memory.semantic import (  # noqa: E402
     COLLECTIONS,
     SemanticEntry,
     SemanticMemory,
     SemanticSearchResult,
 )
-
+from app.core.memory.text_index import (  # noqa: E402
+    BM25Index,
+    normalize,
+    reciprocal_rank_fusion,
+    tokenize,
+)
 
 # === Fixtures ===
 
@@ -176,6 +192,7 @@ class TestConnection:
             return_value=MagicMock(collections=[])
         )
         mock_client.collection_exists = AsyncMock(return_value=True)
+        mock_client.scroll = AsyncMock(return_value=([], None))
 
         with patch(
             "app.core.memory.semantic.AsyncQdrantClient",
@@ -213,6 +230,7 @@ class TestConnection:
         )
         mock_client.collection_exists = AsyncMock(return_value=True)
         mock_client.create_collection = AsyncMock()
+        mock_client.scroll = AsyncMock(return_value=([], None))
 
         with patch(
             "app.core.memory.semantic.AsyncQdrantClient",
@@ -861,6 +879,361 @@ class TestEmbedding:
         assert len(result) == 384
         mock_embedder.embed.assert_called_once_with(["test metin"])
 
+    @pytest.mark.asyncio
+    async def test_store_batch_embeds_in_one_batch(self, connected_memory):
+        """store_batch metinleri tek model cagrisinda gommeli."""
+        embedder = _FakeEmbedder()
+        connected_memory._embedder = embedder
+        entries = [
+            SemanticEntry(text=f"giris {i}", source="test") for i in range(5)
+        ]
+
+        await connected_memory.store_batch("task_history", entries)
+
+        assert embedder.calls == [[f"giris {i}" for i in range(5)]]
+
+    def test_set_embedding_model_resets_cache(self, memory):
+        """Model degisince embedding onbellegi bosalmali."""
+        memory._embedding_service._remember(b"x", [1.0])
+        memory.set_embedding_model("baska-model")
+        stats = memory.get_embedding_stats()
+        assert stats["cache_size"] == 0
+        assert stats["model"] == "baska-model"
+
+
+# === EmbeddingService testleri ===
+
+
+class _FakeEmbedder:
+    """Cagrilari kaydeden sahte embedding modeli."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.fail = fail
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        if self.fail:
+            raise RuntimeError("model hatasi")
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+class TestEmbeddingService:
+    """EmbeddingService testleri."""
+
+    def setup_method(self):
+        self.model = _FakeEmbedder()
+        self.svc = EmbeddingService(
+            loader=lambda: self.model,
+            model_name="m",
+            max_batch=4,
+            max_wait_ms=1.0,
+            cache_size=3,
+        )
+
+    def teardown_method(self):
+        self.svc.close()
+
+    @pytest.mark.asyncio
+    async def test_embed_single(self):
+        """Tek metin gomulebilmeli."""
+        assert await self.svc.embed("abc") == [3.0, 1.0]
+        assert self.model.calls == [["abc"]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_batched(self):
+        """Eszamanli istekler partilere toplanmali."""
+        texts = [f"t{i}" for i in range(10)]
+        result = await asyncio.gather(*(self.svc.embed(t) for t in texts))
+
+        assert result == [[2.0, 1.0]] * 10
+        assert [len(c) for c in self.model.calls] == [4, 4, 2]
+        assert self.svc.get_stats()["batches"] == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_model(self):
+        """Tekrar eden metin modeli cagirmamali."""
+        await self.svc.embed("abc")
+        await self.svc.embed("abc")
+        assert len(self.model.calls) == 1
+        assert self.svc.get_stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_inflight_coalesced(self):
+        """Ayni anda gelen ayni metin tek kez gomulmeli."""
+        await asyncio.gather(self.svc.embed("x"), self.svc.embed("x"))
+        assert self.model.calls == [["x"]]
+        assert self.svc.get_stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_lru_bounded(self):
+        """Onbellek kapasiteyi asmamali, en eskiyi atmali."""
+        for text in ("a", "b", "c", "d"):
+            await self.svc.embed(text)
+        assert self.svc.get_stats()["cache_size"] == 3
+        await self.svc.embed("a")
+        assert self.model.calls[-1] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_returned_vector_is_copy(self):
+        """Donen liste onbellegi bozmamali."""
+        vec = await self.svc.embed("abc")
+        vec.append(9.0)
+        assert await self.svc.embed("abc") == [3.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_model_error_propagates(self):
+        """Model hatasi bekleyen tum isteklere iletilmeli."""
+        self.model.fail = True
+        results = await asyncio.gather(
+            self.svc.embed("a"), self.svc.embed("b"),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        self.model.fail = False
+        assert await self.svc.embed("a") == [1.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_embed_many_keeps_order(self):
+        """embed_many sirayi korumali."""
+        result = await self.svc.embed_many(["a", "bbb", "cc"])
+        assert result == [[1.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+        assert await self.svc.embed_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_model_name_in_cache_key(self):
+        """Model degisince eski vektor kullanilmamali."""
+        await self.svc.embed("abc")
+        self.svc.reset("m2")
+        await self.svc.embed("abc")
+        assert len(self.model.calls) == 2
+
+
+# === BM25 / hibrit arama testleri ===
+
+
+class TestBM25Index:
+    """BM25Index testleri."""
+
+    def setup_method(self):
+        self.index = BM25Index()
+        self.index.add("1", "Sunucu disk kullanimi yuksek", {"source": "mon"})
+        self.index.add("2", "Veritabani yedegi tamamlandi", {"source": "db"})
+        self.index.add("3", "Disk disk disk temizligi", {"source": "mon"})
+
+    def test_turkish_normalize(self):
+        """Turkce I/İ ve aksanlar katlanmali."""
+        assert normalize("IŞIK İzmir Çğöü") == "isik izmir cgou"
+        assert tokenize("Şehir, ŞEHİR!") == ["sehir", "sehir"]
+
+    def test_prefix_stemming(self):
+        """Onek govdeleme cekimli bicimleri birlestirmeli."""
+        assert tokenize("sunucular sunucudan", prefix_len=5) == [
+            "sunuc", "sunuc",
+        ]
+
+    def test_search_ranks_by_bm25(self):
+        """Terim frekansi yuksek belge one gecmeli."""
+        results = self.index.search("disk")
+        assert [doc for doc, _ in results] == ["3", "1"]
+        assert results[0][1] > results[1][1] > 0
+
+    def test_search_no_match(self):
+        """Eslesmeyen sorgu bos donmeli."""
+        assert self.index.search("xyz") == []
+
+    def test_add_replaces_document(self):
+        """Ayni kimlikle ekleme belgeyi degistirmeli."""
+        self.index.add("1", "ag gecikmesi")
+        assert len(self.index) == 3
+        assert [d for d, _ in self.index.search("disk")] == ["3"]
+
+    def test_remove_cleans_postings(self):
+        """Cikarilan belgenin terimleri silinmeli."""
+        assert self.index.remove("2") is True
+        assert self.index.remove("2") is False
+        assert self.index.search("veritabani") == []
+        assert "veritabani" not in self.index._postings
+
+    def test_remove_where(self):
+        """Veri kosuluna gore toplu cikarma."""
+        assert self.index.remove_where(lambda p: p["source"] == "mon") == 2
+        assert len(self.index) == 1
+
+    def test_predicate_filters(self):
+        """Arama filtresi uygulanmali."""
+        results = self.index.search("disk", predicate=lambda p: False)
+        assert results == []
+
+    def test_rrf(self):
+        """RRF iki listede de ust sirada olani one almali."""
+        fused = reciprocal_rank_fusion(["a", "b", "c"], ["b", "d"])
+        assert fused[0][0] == "b"
+        assert {doc for doc, _ in fused} == {"a", "b", "c", "d"}
+
+
+class TestHybridSearch:
+    """Yerel indeks ve hibrit arama testleri."""
+
+    @pytest.mark.asyncio
+    async def test_store_and_delete_update_index(self, connected_memory):
+        """store/delete yerel indeksi guncellemeli."""
+        with patch.object(
+            connected_memory, "_generate_embedding",
+            return_value=MOCK_EMBEDDING,
+        ):
+            pid = await connected_memory.store(
+                "task_history", "Nginx yeniden baslatildi", source="ops",
+            )
+        hits = connected_memory.fts_search(
+            None, "nginx", collection="task_history",
+        )
+        assert hits[0]["id"] == pid
+
+        await connected_memory.delete("task_history", [pid])
+        assert connected_memory.fts_search(
+            None, "nginx", collection="task_history",
+        ) == []
+
+    @pytest.mark.asyncio
+    async def test_delete_by_source_updates_index(self, connected_memory):
+        """Kaynaga gore silme indeksten de dusurmeli."""
+        with patch.object(
+            connected_memory, "_generate_embedding",
+            return_value=MOCK_EMBEDDING,
+        ):
+            await connected_memory.store("decisions", "yedek al", source="a")
+            await connected_memory.store("decisions", "yedek sil", source="b")
+        await connected_memory.delete_by_source("decisions", "a")
+        hits = connected_memory.fts_search(None, "yedek", collection="decisions")
+        assert [h["source"] for h in hits] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_search_falls_back_to_bm25(self, connected_memory):
+        """Qdrant hatasinda BM25 sonuclari donmeli."""
+        with patch.object(
+            connected_memory, "_generate_embedding",
+            return_value=MOCK_EMBEDDING,
+        ):
+            await connected_memory.store("task_history", "disk dolu", source="x")
+            connected_memory.client.search = AsyncMock(
+                side_effect=ConnectionError("qdrant yok"),
+            )
+            results = await connected_memory.search("task_history", "disk")
+        assert len(results) == 1
+        assert results[0].text == "disk dolu"
+
+    @pytest.mark.asyncio
+    async def test_search_error_without_index_raises(self, connected_memory):
+        """Yerel indeks yoksa hata yukselmeli."""
+        connected_memory.client.search = AsyncMock(
+            side_effect=ConnectionError("qdrant yok"),
+        )
+        with patch.object(
+            connected_memory, "_generate_embedding",
+            return_value=MOCK_EMBEDDING,
+        ), pytest.raises(ConnectionError):
+            await connected_memory.search("task_history", "disk")
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_fuses(self, connected_memory):
+        """Hibrit arama iki kaynagi RRF ile birlestirmeli."""
+        with patch.object(
+            connected_memory, "_generate_embedding",
+            return_value=MOCK_EMBEDDING,
+        ):
+            kw = await connected_memory.store("task_history", "disk dolu")
+            vec = await connected_memory.store("task_history", "bellek")
+            hit = MagicMock(
+                id=vec, score=0.9, payload={"text": "bellek", "source": ""},
+            )
+            connected_memory.client.search = AsyncMock(return_value=[hit])
+            results = await connected_memory.search(
+                "task_history", "disk", limit=5, hybrid=True,
+            )
+
+        assert {r.id for r in results} == {kw, vec}
+        assert connected_memory.client.search.call_args.kwargs["limit"] == 15
+        assert all(r.score < 1 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_text_index(self, connected_memory):
+        """Qdrant scroll ile indeks yeniden kurulmali."""
+        points = [
+            MagicMock(id=f"p{i}", payload={"text": f"kayit {i}"})
+            for i in range(3)
+        ]
+        connected_memory.client.scroll = AsyncMock(
+            side_effect=[(points[:2], "next"), (points[2:], None)],
+        )
+        count = await connected_memory.rebuild_text_index("task_history")
+        assert count == 3
+        hits = connected_memory.fts_search(
+            None, "kayit", limit=10, collection="task_history",
+        )
+        assert len(hits) == 3
+
+    @pytest.mark.asyncio
+    async def test_connect_loads_existing_corpus(self, memory):
+        """connect() mevcut koleksiyonlarin BM25 indeksini kurmali."""
+        point = MagicMock(id="p1", payload={"text": "eski disk kaydi"})
+        mock_client = AsyncMock()
+        mock_client.get_collections = AsyncMock(
+            return_value=MagicMock(collections=[]),
+        )
+        mock_client.collection_exists = AsyncMock(return_value=True)
+        mock_client.scroll = AsyncMock(return_value=([point], None))
+
+        with patch(
+            "app.core.memory.semantic.AsyncQdrantClient",
+            return_value=mock_client,
+        ):
+            await memory.connect()
+
+        assert mock_client.scroll.await_count == len(COLLECTIONS)
+        hits = memory.fts_search(None, "disk", collection="task_history")
+        assert [h["id"] for h in hits] == ["p1"]
+
+    @pytest.mark.asyncio
+    async def test_connect_survives_index_load_error(self, memory):
+        """Indeks kurulamazsa baglanti yine kurulmali."""
+        mock_client = AsyncMock()
+        mock_client.get_collections = AsyncMock(
+            return_value=MagicMock(collections=[]),
+        )
+        mock_client.collection_exists = AsyncMock(return_value=True)
+        mock_client.scroll = AsyncMock(side_effect=ConnectionError("kopuk"))
+
+        with patch(
+            "app.core.memory.semantic.AsyncQdrantClient",
+            return_value=mock_client,
+        ):
+            await memory.connect()
+
+        assert memory.client is not None
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_not_masked(self, connected_memory):
+        """Qdrant disi hatalar BM25 ile gizlenmemeli."""
+        with patch.object(
+            connected_memory, "_generate_embedding",
+            return_value=MOCK_EMBEDDING,
+        ):
+            await connected_memory.store("task_history", "disk dolu")
+            connected_memory.client.search = AsyncMock(
+                side_effect=KeyError("hata"),
+            )
+            with pytest.raises(KeyError):
+                await connected_memory.search("task_history", "disk")
+
+    def test_short_query_matches_by_substring(self, memory):
+        """Govdeden kisa sorgu eski alt metin eslesmesini korumali."""
+        texts = ["server yeniden baslatildi", "disk dolu", "observer hazir"]
+
+        hits = memory.fts_search(texts, "serv")
+        assert {h["index"] for h in hits} == {0, 2}
+        assert memory.fts_search(texts, "xyz") == []
+
 
 # === Init testleri ===
 
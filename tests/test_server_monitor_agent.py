@@ -20,11 +20,32 @@ from app.models.server import (
     ServerMetrics,
     ServiceStatus,
 )
+from app.tools.ssh_pool import SSHConnectionPool
 
 
 # === Fixtures ===
 
 
+def _probe_output(
+    cpu: str = "",
+    load: str = "",
+    mem: str = "",
+    disk: str = "",
+    svc: str = "",
+) -> str:
+    """Ornek probe ciktisi olusturur."""
+    sections = {"cpu": cpu, "load": load, "mem": mem, "disk": disk, "svc": svc}
+    return "\n".join(f"@@atlas:{name}\n{body}" for name, body in sections.items())
+
+
+def _make_ssh_mock(outputs: list[str]) -> AsyncMock:
+    """Sirayla probe ciktisi donen mock SSHManager."""
+    ssh = AsyncMock()
+    ssh.is_active = True
+    ssh.execute_command = AsyncMock(side_effect=[(out, "", 0) for out in outputs])
+    return ssh
+
+
 @pytest.fixture
 def server_config() -> ServerConfig:
     """Ornek sunucu yapilandirmasi."""
@@ -389,38 +410,34 @@ class TestExecute:
 
     @pytest.mark.asyncio
     async def test_execute_with_mock_ssh(self, server_config: ServerConfig) -> None:
-        """Mock SSH ile basarili metrik toplama."""
-        agent = ServerMonitorAgent(servers=[server_config])
-
-        mock_ssh_instance = AsyncMock()
-        mock_ssh_instance.execute_command = AsyncMock(side_effect=[
-            # CPU - top
-            ("25.5", "", 0),
-            # CPU - loadavg
-            ("0.50 0.40 0.30 1/200 12345", "", 0),
-            # RAM - free
-            ("Mem:           8000       3000        200        100       4800       5000", "", 0),
-            # Disk - df
-            ("/              100G        40G        60G  40%", "", 0),
-            # Service nginx
-            ("active", "", 0),
-            # Service postgresql
-            ("active", "", 0),
+        """Mock SSH ile basarili metrik toplama (tek probe)."""
+        mock_ssh_instance = _make_ssh_mock([
+            _probe_output(
+                cpu="25.5",
+                load="0.50 0.40 0.30 1/200 12345",
+                mem="Mem:           8000       3000        200        100       4800       5000",
+                disk="/              100G        40G        60G  40%",
+                svc="nginx active\npostgresql active",
+            ),
         ])
-        mock_ssh_instance.__aenter__ = AsyncMock(return_value=mock_ssh_instance)
-        mock_ssh_instance.__aexit__ = AsyncMock(return_value=None)
+        agent = ServerMonitorAgent(
+            servers=[server_config],
+            ssh_pool=SSHConnectionPool(connector=lambda **kw: mock_ssh_instance),
+        )
 
         with patch.object(agent, "_check_ping", return_value=True):
-            with patch(
-                "app.agents.server_monitor_agent.SSHManager",
-                return_value=mock_ssh_instance,
-            ):
-                result = await agent.execute({"description": "Sunucu kontrolu"})
+            result = await agent.execute({"description": "Sunucu kontrolu"})
 
         assert result.success is True
         assert "metrics" in result.data
         assert len(result.data["metrics"]) == 1
-        assert result.data["metrics"][0]["reachable"] is True
+        metrics = result.data["metrics"][0]
+        assert metrics["reachable"] is True
+        assert metrics["cpu"]["usage_percent"] == 25.5
+        assert metrics["ram"]["total_mb"] == 8000
+        assert metrics["disks"][0]["usage_percent"] == 40.0
+        assert all(svc["is_active"] for svc in metrics["services"])
+        mock_ssh_instance.execute_command.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_execute_unreachable_server(self, server_config: ServerConfig) -> None:
@@ -439,31 +456,71 @@ class TestExecute:
     @pytest.mark.asyncio
     async def test_execute_with_extra_servers_from_task(self) -> None:
         """Task'tan ek sunucu listesi alinabilmeli."""
-        agent = ServerMonitorAgent(servers=[])
-
-        mock_ssh_instance = AsyncMock()
-        mock_ssh_instance.execute_command = AsyncMock(side_effect=[
-            ("10.0", "", 0),
-            ("0.10 0.20 0.15 1/100 1234", "", 0),
-            ("Mem:           4000       1000        200         50       2800       3000", "", 0),
-            ("/              50G        10G        40G  20%", "", 0),
+        mock_ssh_instance = _make_ssh_mock([
+            _probe_output(
+                cpu="10.0",
+                load="0.10 0.20 0.15 1/100 1234",
+                mem="Mem:           4000       1000        200         50       2800       3000",
+                disk="/              50G        10G        40G  20%",
+            ),
         ])
-        mock_ssh_instance.__aenter__ = AsyncMock(return_value=mock_ssh_instance)
-        mock_ssh_instance.__aexit__ = AsyncMock(return_value=None)
+        agent = ServerMonitorAgent(
+            servers=[],
+            ssh_pool=SSHConnectionPool(connector=lambda **kw: mock_ssh_instance),
+        )
 
         with patch.object(agent, "_check_ping", return_value=True):
-            with patch(
-                "app.agents.server_monitor_agent.SSHManager",
-                return_value=mock_ssh_instance,
-            ):
-                result = await agent.execute({
-                    "description": "Ek sunucu kontrolu",
-                    "servers": [{"host": "10.0.0.1", "user": "admin"}],
-                })
+            result = await agent.execute({
+                "description": "Ek sunucu kontrolu",
+                "servers": [{"host": "10.0.0.1", "user": "admin"}],
+            })
 
         assert result.success is True
         assert len(result.data["metrics"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_checks(
+        self, server_config: ServerConfig,
+    ) -> None:
+        """Ardisik kontroller ayni SSH baglantisini kullanmali."""
+        output = _probe_output(cpu="5.0", svc="nginx active\npostgresql inactive")
+        mock_ssh_instance = _make_ssh_mock([output, output])
+        connector = MagicMock(return_value=mock_ssh_instance)
+        pool = SSHConnectionPool(connector=connector)
+        agent = ServerMonitorAgent(servers=[server_config], ssh_pool=pool)
+
+        with patch.object(agent, "_check_ping", return_value=True):
+            await agent.execute({})
+            result = await agent.execute({})
+
+        connector.assert_called_once()
+        assert pool.get_stats()["reuses"] == 1
+        services = result.data["metrics"][0]["services"]
+        assert [svc["is_active"] for svc in services] == [True, False]
+
+
+class TestProbe:
+    """Toplu probe betigi testleri."""
+
+    def test_probe_quotes_service_names(self) -> None:
+        """Servis adlari shell icin tirnaklanmali."""
+        script = ServerMonitorAgent._build_probe(["nginx; rm -rf /"])
+        assert "'nginx; rm -rf /'" in script
+
+    def test_split_probe_sections(self) -> None:
+        """Cikti bolumlere ayrilmali, eksik bolumler bos kalmali."""
+        sections = ServerMonitorAgent._split_probe(
+            _probe_output(cpu="12.5", load="1.0 2.0 3.0 1/1 1")
+        )
+        assert sections["cpu"] == "12.5"
+        assert sections["load"].startswith("1.0")
+        assert sections["svc"] == ""
+
+    def test_missing_service_is_inactive(self) -> None:
+        """Ciktida olmayan servis durmus sayilmali."""
+        statuses = ServerMonitorAgent._parse_services("nginx active", ["nginx", "redis"])
+        assert [s.is_active for s in statuses] == [True, False]
+
 
 # === Model testleri ===
 
@@ -3,11 +3,14 @@
 Redis mock'lanarak kisa sureli hafiza islemleri test edilir.
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.core.caching import near_cache as near_cache_module
+from app.core.caching.near_cache import NearCache
 from app.core.memory.short_term import ShortTermMemory
 
 
@@ -167,25 +170,95 @@ class TestTaskStatus:
 
     @pytest.mark.asyncio
     async def test_get_active_tasks(self, connected_memory: ShortTermMemory) -> None:
-        """Tum aktif gorevler listelenmeli."""
+        """Aktif gorevler indeksten tek MGET ile listelenmeli."""
         task1 = {"id": "t1", "status": "running"}
         task2 = {"id": "t2", "status": "pending"}
 
-        # scan_iter mock - async generator
-        async def mock_scan_iter(match: str):
-            yield "test:task:t1"
-            yield "test:task:t2"
-
-        connected_memory.redis.scan_iter = mock_scan_iter
-        connected_memory.redis.get = AsyncMock(
-            side_effect=[json.dumps(task1), json.dumps(task2)]
-        )
+        redis = connected_memory.redis
+        redis.zrange = AsyncMock(return_value=["t1", "t2"])
+        redis.mget = AsyncMock(return_value=[json.dumps(task1), json.dumps(task2)])
 
         result = await connected_memory.get_active_tasks()
 
         assert len(result) == 2
         assert result[0] == task1
         assert result[1] == task2
+        redis.zrange.assert_awaited_once_with("test:tasks:active", 0, -1)
+        redis.mget.assert_awaited_once_with(["test:task:t1", "test:task:t2"])
+        redis.zremrangebyscore.assert_awaited_once()
+        redis.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_active_tasks_paging(
+        self, connected_memory: ShortTermMemory,
+    ) -> None:
+        """offset/limit ZRANGE araligina donusmeli."""
+        redis = connected_memory.redis
+        redis.zrange = AsyncMock(return_value=[])
+        redis.mget = AsyncMock(return_value=[])
+
+        assert await connected_memory.get_active_tasks(offset=20, limit=10) == []
+        redis.zrange.assert_awaited_once_with("test:tasks:active", 20, 29)
+        redis.mget.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_active_tasks_drops_stale(
+        self, connected_memory: ShortTermMemory,
+    ) -> None:
+        """Anahtari kaybolan kimlikler indeksten dusurulmeli."""
+        redis = connected_memory.redis
+        redis.zrange = AsyncMock(return_value=["t1", "gone"])
+        redis.mget = AsyncMock(return_value=[json.dumps({"id": "t1"}), None])
+
+        result = await connected_memory.get_active_tasks()
+
+        assert result == [{"id": "t1"}]
+        redis.zrem.assert_awaited_once_with("test:tasks:active", "gone")
+
+    @pytest.mark.asyncio
+    async def test_store_task_status_indexes(
+        self, connected_memory: ShortTermMemory,
+    ) -> None:
+        """store_task_status indekse bitis skoruyla eklemeli."""
+        await connected_memory.store_task_status("t1", {"id": "t1"}, ttl=60)
+
+        key, mapping = connected_memory.redis.zadd.await_args.args
+        assert key == "test:tasks:active"
+        assert list(mapping) == ["t1"]
+
+    @pytest.mark.asyncio
+    async def test_delete_task_status_unindexes(
+        self, connected_memory: ShortTermMemory,
+    ) -> None:
+        """delete_task_status indeksten cikarmali."""
+        await connected_memory.delete_task_status("t1")
+
+        connected_memory.redis.zrem.assert_awaited_once_with(
+            "test:tasks:active", "t1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_active_tasks_fakeredis(self) -> None:
+        """Gercek Redis komutlariyla uctan uca indeks davranisi."""
+        fakeredis = pytest.importorskip("fakeredis")
+        mem = ShortTermMemory(prefix="test")
+        mem.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+        for i in range(5):
+            await mem.store_task_status(f"t{i}", {"id": f"t{i}"}, ttl=600)
+        await mem.store_task_status("old", {"id": "old"}, ttl=1)
+        await mem.redis.zadd("test:tasks:active", {"old": 1})
+        await mem.delete_task_status("t4")
+        await mem.redis.set("test:cache:x", "1")
+
+        assert await mem.count_active_tasks() == 4
+        page = await mem.get_active_tasks(offset=1, limit=2)
+        assert page == [{"id": "t1"}, {"id": "t2"}]
+        assert len(await mem.get_active_tasks()) == 4
+
+        await mem.redis.delete("test:tasks:active")
+        assert await mem.rebuild_task_index() == 5
+        assert await mem.count_active_tasks() == 5
 
 
 # === Oturum cache testleri ===
@@ -294,3 +367,156 @@ class TestCache:
         result = await connected_memory.cache_delete("nonexistent")
 
         assert result is False
+
+
+# === Yakin onbellek (L1) testleri ===
+
+
+@pytest.fixture
+def near_memory() -> ShortTermMemory:
+    """NearCache ile bagli ShortTermMemory."""
+    mem = ShortTermMemory(prefix="test", near_cache=NearCache(ttl=30))
+    mock_redis = AsyncMock()
+    mock_redis.set = AsyncMock()
+    mock_redis.get = AsyncMock(return_value=json.dumps({"data": 42}))
+    mock_redis.delete = AsyncMock(return_value=1)
+    mock_redis.publish = AsyncMock(return_value=1)
+    mem.redis = mock_redis
+    return mem
+
+
+class TestNearCache:
+    """NearCache entegrasyon testleri."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_get_hits_l1(self, near_memory: ShortTermMemory) -> None:
+        """Ikinci okuma Redis'e gitmemeli."""
+        first = await near_memory.cache_get("my_key")
+        second = await near_memory.cache_get("my_key")
+
+        assert first == second == {"data": 42}
+        near_memory.redis.get.assert_awaited_once()
+        stats = near_memory.near_cache.get_stats()
+        assert stats["l1_hits"] == 1
+        assert stats["l2_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_invalidates_and_publishes(
+        self, near_memory: ShortTermMemory,
+    ) -> None:
+        """Yazma yerel kopyayi dusurmeli ve yayinlamali."""
+        await near_memory.cache_get("my_key")
+        await near_memory.cache_set("my_key", {"data": 7})
+
+        near_memory.redis.publish.assert_awaited_once()
+        channel, payload = near_memory.redis.publish.await_args.args
+        assert channel == "atlas:invalidate"
+        assert json.loads(payload)["keys"] == ["test:cache:my_key"]
+
+        await near_memory.cache_get("my_key")
+        assert near_memory.redis.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation(self, near_memory: ShortTermMemory) -> None:
+        """Baska iscinin mesaji L1 kopyasini dusurmeli."""
+        await near_memory.get_session("s1")
+        near = near_memory.near_cache
+        dropped = near.handle_message(
+            json.dumps({"origin": "other", "keys": ["test:session:s1"]}),
+        )
+
+        assert dropped == 1
+        await near_memory.get_session("s1")
+        assert near_memory.redis.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_read_not_cached(
+        self, near_memory: ShortTermMemory,
+    ) -> None:
+        """Okuma surerken gelen gecersiz kilma bayat degeri L1'e yazdirmamali."""
+        near = near_memory.near_cache
+
+        async def racing_get(key: str) -> str:
+            near.handle_message(
+                json.dumps({"origin": "other", "keys": [key]}),
+            )
+            return json.dumps({"data": "stale"})
+
+        near_memory.redis.get = AsyncMock(side_effect=racing_get)
+        assert await near_memory.cache_get("my_key") == {"data": "stale"}
+
+        near_memory.redis.get = AsyncMock(return_value=json.dumps({"data": 1}))
+        assert await near_memory.cache_get("my_key") == {"data": 1}
+        assert near.get_stats()["stale_fills"] == 1
+        assert near._fills == {}
+
+    def test_own_messages_ignored(self) -> None:
+        """Kendi yayinladigi mesaj islenmemeli."""
+        near = NearCache()
+        near.put("k", 1)
+        payload = json.dumps({"origin": near.origin, "keys": ["k"]})
+
+        assert near.handle_message(payload) == 0
+        assert near.get("k") == (True, 1)
+
+    def test_invalid_message(self) -> None:
+        """Bozuk mesaj yok sayilmali."""
+        assert NearCache().handle_message("not-json") == 0
+
+    @pytest.mark.asyncio
+    async def test_miss_not_cached(self, near_memory: ShortTermMemory) -> None:
+        """Redis'te olmayan deger L1'e yazilmamali."""
+        near_memory.redis.get = AsyncMock(return_value=None)
+
+        assert await near_memory.get_task_status("t1") is None
+        assert await near_memory.get_task_status("t1") is None
+        assert near_memory.redis.get.await_count == 2
+        assert near_memory.near_cache.get_stats()["l2_misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_start_stop_listener(self) -> None:
+        """Dinleyici baslatilip durdurulabilmeli."""
+        near = NearCache()
+        pubsub = AsyncMock()
+        pubsub.get_message = AsyncMock(return_value=None)
+        redis = MagicMock()
+        redis.pubsub = MagicMock(return_value=pubsub)
+
+        await near.start(redis)
+        assert near.get_stats()["listening"] is True
+        pubsub.subscribe.assert_awaited_once_with("atlas:invalidate")
+
+        await near.stop()
+        assert near.get_stats()["listening"] is False
+
+    @pytest.mark.asyncio
+    async def test_listener_resubscribes_after_error(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Pub/sub hatasindan sonra L1 bosaltilip yeniden abone olunmali."""
+        monkeypatch.setattr(near_cache_module, "_RECONNECT_MIN", 0.01)
+        near = NearCache()
+        broken = AsyncMock()
+        broken.get_message = AsyncMock(side_effect=ConnectionError("baglanti koptu"))
+        healthy = AsyncMock()
+
+        async def idle(**kwargs: object) -> None:
+            await asyncio.sleep(0.01)
+
+        healthy.get_message = AsyncMock(side_effect=idle)
+        redis = MagicMock()
+        redis.pubsub = MagicMock(side_effect=[broken, healthy])
+
+        await near.start(redis)
+        near.put("k", 1)
+        for _ in range(50):
+            if near.get_stats()["reconnects"]:
+                break
+            await asyncio.sleep(0.01)
+
+        stats = near.get_stats()
+        assert stats["reconnects"] == 1
+        assert stats["listening"] is True
+        assert near.get("k") == (False, None)
+        healthy.subscribe.assert_awaited_once_with("atlas:invalidate")
+        await near.stop()
@@ -0,0 +1,194 @@
+"""SSHConnectionPool unit testleri.
+
+SSHManager yerine sahte baglanti ureten connector kullanilir.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.tools.ssh_pool import SSHConnectionPool
+
+
+def _make_connector() -> MagicMock:
+    """Her cagrida yeni sahte SSHManager ureten connector."""
+
+    def _factory(**kwargs) -> AsyncMock:
+        ssh = AsyncMock()
+        ssh.is_active = True
+        ssh.kwargs = kwargs
+
+        async def _close() -> None:
+            ssh.is_active = False
+
+        ssh.close = AsyncMock(side_effect=_close)
+        return ssh
+
+    return MagicMock(side_effect=_factory)
+
+
+class TestLease:
+    """Kiralama ve yeniden kullanim testleri."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_connection(self) -> None:
+        """Ayni hedef ayni baglantiyi kullanmali."""
+        connector = _make_connector()
+        pool = SSHConnectionPool(connector=connector, keepalive=15)
+
+        async with pool.lease("h1") as first:
+            pass
+        async with pool.lease("h1") as second:
+            pass
+
+        assert first is second
+        connector.assert_called_once()
+        assert connector.call_args.kwargs["keepalive"] == 15
+        stats = pool.get_stats()
+        assert stats["connects"] == 1
+        assert stats["reuses"] == 1
+        assert stats["open"] == 1
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_get_distinct_connections(self) -> None:
+        """Farkli kullanici/port ayri baglanti almali."""
+        connector = _make_connector()
+        pool = SSHConnectionPool(connector=connector)
+
+        async with pool.lease("h1", user="root"):
+            pass
+        async with pool.lease("h1", user="admin"):
+            pass
+        async with pool.lease("h1", port=2222):
+            pass
+
+        assert connector.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_share_one_connect(self) -> None:
+        """Esanli ilk istekler tek baglanti kurmali."""
+        connector = _make_connector()
+        pool = SSHConnectionPool(connector=connector, max_channels=8)
+
+        async def _use() -> None:
+            async with pool.lease("h1"):
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*[_use() for _ in range(10)])
+
+        connector.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_max_channels_limits_concurrency(self) -> None:
+        """Baglanti basina esanli kanal sayisi sinirlanmali."""
+        pool = SSHConnectionPool(connector=_make_connector(), max_channels=2)
+        peak = 0
+
+        async def _use() -> None:
+            nonlocal peak
+            async with pool.lease("h1"):
+                peak = max(peak, pool.get_stats()["leased"])
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[_use() for _ in range(6)])
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_connection_is_replaced(self) -> None:
+        """Kopmus baglanti yenisiyle degistirilmeli."""
+        connector = _make_connector()
+        pool = SSHConnectionPool(connector=connector)
+
+        async with pool.lease("h1") as first:
+            first.is_active = False
+        async with pool.lease("h1") as second:
+            pass
+
+        assert second is not first
+        assert connector.call_count == 2
+        first.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_broken_connection_dropped_on_error(self) -> None:
+        """Hata sirasinda kopan baglanti havuzdan cikarilmali."""
+        pool = SSHConnectionPool(connector=_make_connector())
+
+        with pytest.raises(OSError):
+            async with pool.lease("h1") as ssh:
+                ssh.is_active = False
+                raise OSError("kanal koptu")
+
+        assert pool.get_stats()["open"] == 0
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_not_cached(self) -> None:
+        """Kurulamayan baglanti havuza eklenmemeli."""
+        ssh = AsyncMock()
+        ssh.connect = AsyncMock(side_effect=OSError("baglanti reddedildi"))
+        pool = SSHConnectionPool(connector=MagicMock(return_value=ssh))
+
+        with pytest.raises(OSError):
+            async with pool.lease("h1"):
+                pass
+
+        stats = pool.get_stats()
+        assert stats["open"] == 0
+        assert stats["failures"] == 1
+
+
+class TestEviction:
+    """Bosta kalan baglanti tahliyesi testleri."""
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_evicted(self) -> None:
+        """idle_timeout'u asan baglantilar kapatilmali."""
+        pool = SSHConnectionPool(connector=_make_connector(), idle_timeout=0.0)
+
+        async with pool.lease("h1") as ssh:
+            pass
+        evicted = await pool.evict_idle()
+
+        assert evicted == 1
+        ssh.close.assert_awaited_once()
+        assert pool.get_stats()["open"] == 0
+
+    @pytest.mark.asyncio
+    async def test_leased_connection_not_evicted(self) -> None:
+        """Kullanimdaki baglanti tahliye edilmemeli."""
+        pool = SSHConnectionPool(connector=_make_connector(), idle_timeout=0.0)
+
+        async with pool.lease("h1"):
+            assert await pool.evict_idle() == 0
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all(self) -> None:
+        """close tum baglantilari kapatmali."""
+        pool = SSHConnectionPool(connector=_make_connector())
+        async with pool.lease("h1"):
+            pass
+        async with pool.lease("h2"):
+            pass
+
+        await pool.close()
+
+        assert pool.get_stats()["open"] == 0
+
+
+def test_pool_survives_event_loop_change() -> None:
+    """Baglantilar ardisik asyncio.run cagrilarinda korunmali."""
+    connector = _make_connector()
+    pool = SSHConnectionPool(connector=connector, max_channels=1)
+
+    async def _use() -> None:
+        async def _one() -> None:
+            async with pool.lease("h1"):
+                await asyncio.sleep(0)
+
+        await asyncio.gather(_one(), _one())
+
+    asyncio.run(_use())
+    asyncio.run(_use())
+
+    connector.assert_called_once()
@@ -5,23 +5,26 @@ bagimlillik takibi, crash recovery, zamanlama ve
 uc katmanli hafiza entegrasyonunu test eder.
 """
 
-from datetime import datetime, timezone
+import asyncio
+from datetime import UTC, datetime, timezone
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.agents.base_agent import BaseAgent, TaskResult
 from app.core.decision_matrix import ActionType
+from app.core.task_journal import TaskStateJournal
 from app.core.task_manager import (
+    _ACTION_PRIORITY_MAP,
     QueuedTask,
     TaskManager,
     TaskMetrics,
     TaskPriority,
     TaskSubmission,
-    _ACTION_PRIORITY_MAP,
 )
-from app.models.task import TaskCreate, TaskResponse, TaskStatus
-
+from app.core.task_scheduler import FairTaskScheduler
+from app.models.task import TaskCreate, TaskPage, TaskResponse, TaskStatus
 
 # === Yardimci fonksiyonlar ===
 
@@ -1609,6 +1612,522 @@ class TestLifecycle:
         assert scheduler.done()
 
 
+# === TestFairTaskScheduler ===
+
+
+def _queued(
+    task_id: str,
+    agent: str | None,
+    priority: TaskPriority = TaskPriority.LOW,
+) -> QueuedTask:
+    """Zamanlayici testleri icin kuyruk gorevi."""
+    return QueuedTask(
+        id=task_id,
+        priority=priority,
+        submission=_make_submission(target_agent=agent),
+    )
+
+
+def _fair_scheduler(**kwargs: Any) -> FairTaskScheduler:
+    """TaskManager ile ayni anahtarlarla zamanlayici."""
+    return FairTaskScheduler(
+        agent_of=lambda q: q.submission.target_agent or "auto",
+        priority_of=lambda q: q.priority.value,
+        **kwargs,
+    )
+
+
+class TestFairTaskScheduler:
+    """Agent basina kuyruklu adil zamanlayici testleri."""
+
+    def test_invalid_worker_count_raises(self) -> None:
+        """Sifir isci kabul edilmez."""
+        with pytest.raises(ValueError):
+            FairTaskScheduler(workers=0)
+
+    @pytest.mark.asyncio
+    async def test_qsize_and_items_order(self) -> None:
+        """Bekleyen ogeler oncelik ve gelis sirasiyla listelenir."""
+        sched = _fair_scheduler(workers=2)
+        await sched.put(_queued("low", "a", TaskPriority.LOW))
+        await sched.put(_queued("crit", "b", TaskPriority.CRITICAL))
+        await sched.put(_queued("low2", "a", TaskPriority.LOW))
+
+        assert sched.qsize() == 3
+        assert [q.id for q in sched.items()] == ["crit", "low", "low2"]
+
+    @pytest.mark.asyncio
+    async def test_per_agent_limit_and_fair_share(self) -> None:
+        """Yavas agent limitini asamaz ve digerlerini ac birakmaz."""
+        sched = _fair_scheduler(workers=4, agent_limits={"research": 1})
+        running: dict[str, int] = {"research": 0}
+        peak = {"research": 0}
+        done: list[str] = []
+        release = asyncio.Event()
+
+        async def handler(item: QueuedTask) -> None:
+            agent = item.submission.target_agent
+            if agent == "research":
+                running["research"] += 1
+                peak["research"] = max(peak["research"], running["research"])
+                await release.wait()
+                running["research"] -= 1
+            done.append(item.id)
+
+        for i in range(5):
+            await sched.put(_queued(f"r{i}", "research"))
+        for i in range(5):
+            await sched.put(_queued(f"s{i}", "server"))
+
+        sched.start(handler)
+        for _ in range(50):
+            await asyncio.sleep(0)
+
+        # research 1 slotta takili, server gorevlerinin hepsi bitti
+        assert {f"s{i}" for i in range(5)} <= set(done)
+        assert peak["research"] == 1
+
+        release.set()
+        for _ in range(100):
+            await asyncio.sleep(0)
+        await sched.stop()
+
+        assert len(done) == 10
+        assert sched.qsize() == 0
+        stats = sched.stats()
+        assert stats["research"]["limit"] == 1
+        assert stats["research"]["dispatched"] == 5
+        assert stats["server"]["run_time"]["count"] == 5
+        assert stats["server"]["queue_wait"]["p95"] >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_sharing(self) -> None:
+        """Agirliklar tek isciyle dagitim oranini belirler."""
+        sched = _fair_scheduler(workers=1, weights={"a": 3.0, "b": 1.0})
+        order: list[str] = []
+
+        async def handler(item: QueuedTask) -> None:
+            order.append(item.submission.target_agent or "")
+
+        for i in range(12):
+            await sched.put(_queued(f"a{i}", "a"))
+            await sched.put(_queued(f"b{i}", "b"))
+
+        sched.start(handler)
+        for _ in range(100):
+            await asyncio.sleep(0)
+        await sched.stop()
+
+        first = order[:16]
+        assert 11 <= first.count("a") <= 13
+
+    @pytest.mark.asyncio
+    async def test_priority_beats_fair_share(self) -> None:
+        """Kritik gorev diger agent'in dusuk oncelikli isinden once calisir."""
+        sched = _fair_scheduler(workers=1)
+        order: list[str] = []
+
+        async def handler(item: QueuedTask) -> None:
+            order.append(item.id)
+
+        for i in range(3):
+            await sched.put(_queued(f"bg{i}", "a", TaskPriority.BACKGROUND))
+        await sched.put(_queued("crit", "b", TaskPriority.CRITICAL))
+
+        sched.start(handler)
+        for _ in range(50):
+            await asyncio.sleep(0)
+        await sched.stop()
+
+        assert order[0] == "crit"
+
+    @pytest.mark.asyncio
+    async def test_idle_workers_steal(self) -> None:
+        """Ev kuyrugu bos isciler diger kuyruktan calar."""
+        sched = _fair_scheduler(workers=3)
+        await sched.put(_queued("warm", "other"))
+        release = asyncio.Event()
+
+        async def handler(item: QueuedTask) -> None:
+            await release.wait()
+
+        for i in range(3):
+            await sched.put(_queued(f"h{i}", "hot"))
+        sched.start(handler)
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert len(sched.active) == 3
+        assert sched.stats()["hot"]["remote"] >= 1
+
+        release.set()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        await sched.stop()
+        assert sched.active == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_task_keeps_worker_alive(self) -> None:
+        """Gorev iptali isciyi durdurmaz."""
+        sched = _fair_scheduler(workers=1)
+        done: list[str] = []
+
+        async def handler(item: QueuedTask) -> None:
+            if item.id == "slow":
+                await asyncio.sleep(60)
+            done.append(item.id)
+
+        await sched.put(_queued("slow", "a"))
+        sched.start(handler)
+        await asyncio.sleep(0)
+        sched.active["slow"].cancel()
+        await sched.put(_queued("next", "a"))
+        for _ in range(20):
+            await asyncio.sleep(0)
+        await sched.stop()
+
+        assert done == ["next"]
+
+
+class TestTaskManagerFairMode:
+    """TaskManager fair zamanlayici modu testleri."""
+
+    def test_invalid_mode_raises(
+        self, mock_master: MagicMock, mock_long_term: MagicMock
+    ) -> None:
+        """Bilinmeyen mod ValueError firlatir."""
+        with pytest.raises(ValueError):
+            TaskManager(
+                master_agent=mock_master,
+                long_term=mock_long_term,
+                scheduler="round_robin",
+            )
+
+    @pytest.mark.asyncio
+    async def test_fair_mode_runs_tasks_and_reports_queues(
+        self, mock_master: MagicMock, mock_long_term: MagicMock
+    ) -> None:
+        """Fair modda gorevler calisir ve agent kuyruk metrikleri raporlanir."""
+        manager = TaskManager(
+            master_agent=mock_master,
+            long_term=mock_long_term,
+            max_retries=1,
+            max_concurrent=2,
+            scheduler="fair",
+            agent_concurrency={"research": 1},
+        )
+        assert manager._active_tasks is manager._scheduler.active
+
+        await manager.submit_task(_make_submission(target_agent="research"))
+        metrics = await manager.get_metrics()
+        assert metrics.queue_size == 1
+        snapshot = await manager.get_queue_snapshot()
+        assert len(snapshot) == 1
+
+        await manager.start()
+        for _ in range(50):
+            await asyncio.sleep(0)
+        await manager.stop()
+
+        metrics = await manager.get_metrics()
+        assert metrics.queue_size == 0
+        assert metrics.total_completed == 1
+        research = metrics.agent_queues["research"]
+        assert research["limit"] == 1
+        assert research["dispatched"] == 1
+        assert research["run_time"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fifo_mode_has_no_agent_queues(self, task_manager: TaskManager) -> None:
+        """Varsayilan fifo modunda agent kuyruk metrikleri bostur."""
+        metrics = await task_manager.get_metrics()
+        assert task_manager.scheduler_mode == "fifo"
+        assert metrics.agent_queues == {}
+
+
+# === TestTaskStateJournal ===
+
+
+def _journal_long_term() -> MagicMock:
+    """bulk_update_tasks destekli mock LongTermMemory."""
+    lt = _make_mock_long_term()
+    lt.bulk_update_tasks = AsyncMock(side_effect=lambda batch: len(batch))
+    return lt
+
+
+class TestTaskStateJournal:
+    """Write-behind durum gunlugu testleri."""
+
+    @pytest.mark.asyncio
+    async def test_record_coalesces_per_task(self) -> None:
+        """Ayni gorevin gecisleri tek kayitta birlesir."""
+        lt = _journal_long_term()
+        journal = TaskStateJournal(lt)
+        journal.record("t1", {"status": "running", "agent": "a"})
+        journal.record("t1", {"status": "completed", "result_message": "ok"})
+        journal.record("t2", {"status": "running"})
+
+        assert journal.pending_count == 2
+        assert await journal.flush() == 2
+        batch = lt.bulk_update_tasks.await_args.args[0]
+        assert batch["t1"] == {
+            "status": "completed", "agent": "a", "result_message": "ok",
+        }
+        assert journal.pending_count == 0
+        lt.update_task.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues_without_overwriting_newer(self) -> None:
+        """Basarisiz flush eski kayitlari yeni gecislerin altina geri ekler."""
+        lt = _journal_long_term()
+        journal = TaskStateJournal(lt)
+        journal.record("t1", {"status": "running", "agent": "a"})
+
+        async def fail(batch: dict[str, Any]) -> int:
+            journal.record("t1", {"status": "completed"})
+            raise RuntimeError("db down")
+
+        lt.bulk_update_tasks = AsyncMock(side_effect=fail)
+        with pytest.raises(RuntimeError):
+            await journal.flush()
+
+        assert journal.pending("t1") == {"status": "completed", "agent": "a"}
+        assert journal.get_stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_loop_flushes(self) -> None:
+        """Arkaplan dongusu araliklarla flush eder, close kalanlari yazar."""
+        lt = _journal_long_term()
+        journal = TaskStateJournal(lt, flush_interval=0.01)
+        await journal.start()
+        journal.record("t1", {"status": "running"})
+        await asyncio.sleep(0.05)
+        assert lt.bulk_update_tasks.await_count >= 1
+
+        journal.record("t2", {"status": "completed"})
+        await journal.close()
+        assert journal.pending_count == 0
+        assert lt.bulk_update_tasks.await_args.args[0] == {"t2": {"status": "completed"}}
+
+    @pytest.mark.asyncio
+    async def test_journal_file_replayed_after_crash(self, tmp_path: Any) -> None:
+        """Yazilmamis gecisler gunluk dosyasindan yeniden oynatilir."""
+        path = tmp_path / "tasks.journal"
+        done_at = datetime(2026, 1, 2, tzinfo=UTC)
+
+        lt = _journal_long_term()
+        crashed = TaskStateJournal(lt, flush_interval=60, path=path)
+        await crashed.start()
+        crashed.record("t1", {"status": "running"})
+        crashed.record("t1", {"status": "completed", "completed_at": done_at})
+        crashed.record("t2", {"status": "running"})
+        crashed._task.cancel()  # Cokme: flush yok
+
+        lt2 = _journal_long_term()
+        journal = TaskStateJournal(lt2, path=path)
+        assert await journal.start() == 2
+        batch = lt2.bulk_update_tasks.await_args.args[0]
+        assert batch["t1"] == {"status": "completed", "completed_at": done_at}
+        assert batch["t2"] == {"status": "running"}
+        await journal.close()
+        assert list(tmp_path.iterdir()) == [path]
+        assert path.read_text() == ""
+
+    @pytest.mark.asyncio
+    async def test_failed_segments_kept_until_success(self, tmp_path: Any) -> None:
+        """Basarisiz flush segmenti basarili flush'a kadar silinmez."""
+        path = tmp_path / "tasks.journal"
+        lt = _journal_long_term()
+        journal = TaskStateJournal(lt, flush_interval=60, path=path)
+        await journal.start()
+
+        journal.record("t1", {"status": "running"})
+        lt.bulk_update_tasks = AsyncMock(side_effect=RuntimeError("db down"))
+        with pytest.raises(RuntimeError):
+            await journal.flush()
+        assert (tmp_path / "tasks.journal.0").exists()
+
+        journal.record("t1", {"status": "completed"})
+        lt.bulk_update_tasks = AsyncMock(return_value=1)
+        await journal.flush()
+        assert lt.bulk_update_tasks.await_args.args[0] == {"t1": {"status": "completed"}}
+        assert not (tmp_path / "tasks.journal.0").exists()
+        assert not (tmp_path / "tasks.journal.1").exists()
+        await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_record_reaches_file_and_fsyncs(self, tmp_path: Any) -> None:
+        """Kayit flush beklemeden dosyaya yazilir ve toplu fsync edilir."""
+        path = tmp_path / "tasks.journal"
+        journal = TaskStateJournal(
+            _journal_long_term(), flush_interval=60, path=path, sync_interval=0.01,
+        )
+        await journal.start()
+        journal.record("t1", {"status": "running"})
+
+        assert '"t1"' in path.read_text()
+        assert journal._sync_handle is not None
+        await asyncio.sleep(0.05)
+        assert journal._sync_handle is None
+        await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_requeues(self) -> None:
+        """Iptal edilen flush kayitlari geri ekler."""
+        lt = _journal_long_term()
+        started = asyncio.Event()
+
+        async def hang(batch: dict[str, Any]) -> int:
+            started.set()
+            await asyncio.sleep(60)
+            return len(batch)
+
+        lt.bulk_update_tasks = AsyncMock(side_effect=hang)
+        journal = TaskStateJournal(lt)
+        journal.record("t1", {"status": "running"})
+        flush = asyncio.create_task(journal.flush())
+        await started.wait()
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+
+        assert journal.pending("t1") == {"status": "running"}
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_inflight_flush(self, tmp_path: Any) -> None:
+        """Close, dongunun suren flush'ini kesmeden bekler."""
+        path = tmp_path / "tasks.journal"
+        lt = _journal_long_term()
+        started = asyncio.Event()
+        persisted: dict[str, Any] = {}
+
+        async def slow(batch: dict[str, Any]) -> int:
+            started.set()
+            await asyncio.sleep(0.05)
+            persisted.update(batch)
+            return len(batch)
+
+        lt.bulk_update_tasks = AsyncMock(side_effect=slow)
+        journal = TaskStateJournal(lt, flush_interval=0.01, path=path)
+        await journal.start()
+        journal.record("t1", {"status": "completed"})
+        await started.wait()
+        await journal.close()
+
+        assert persisted == {"t1": {"status": "completed"}}
+        assert journal.pending_count == 0
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestTaskManagerWriteBehind:
+    """TaskManager write-behind modu testleri."""
+
+    @pytest.fixture
+    def wb_manager(self, mock_master: MagicMock, tmp_path: Any) -> TaskManager:
+        """Write-behind acik TaskManager."""
+        return TaskManager(
+            master_agent=mock_master,
+            long_term=_journal_long_term(),
+            max_retries=1,
+            max_concurrent=2,
+            write_behind=True,
+            journal_path=str(tmp_path / "tasks.journal"),
+        )
+
+    def test_write_behind_requires_journal_path(self, mock_master: MagicMock) -> None:
+        """Gunluk yolu yoksa write-through kullanilir."""
+        with patch("app.core.task_manager.settings.task_manager_journal_path", ""):
+            tm = TaskManager(
+                master_agent=mock_master,
+                long_term=_journal_long_term(),
+                write_behind=True,
+            )
+        assert tm._journal is None
+
+    @pytest.mark.asyncio
+    async def test_execution_transitions_are_batched(self, wb_manager: TaskManager) -> None:
+        """RUNNING ve COMPLETED gecisleri tek toplu yazimda birlesir."""
+        queued = QueuedTask(
+            id="wb-1", priority=TaskPriority.LOW, submission=_make_submission(),
+        )
+        await wb_manager._execute_task(queued)
+
+        wb_manager.long_term.update_task.assert_not_awaited()
+        await wb_manager._journal.flush()
+        batch = wb_manager.long_term.bulk_update_tasks.await_args.args[0]
+        assert batch["wb-1"]["status"] == TaskStatus.COMPLETED.value
+        assert batch["wb-1"]["result_success"] is True
+
+    @pytest.mark.asyncio
+    async def test_get_task_overlays_pending(self, wb_manager: TaskManager) -> None:
+        """Yazilmamis gecisler okumalarda gorunur."""
+        wb_manager.long_term.get_task = AsyncMock(
+            return_value=_make_task_response(task_id="wb-2"),
+        )
+        wb_manager._journal.record("wb-2", {"status": TaskStatus.RUNNING.value})
+
+        task = await wb_manager.get_task("wb-2")
+        assert task.status == TaskStatus.RUNNING
+
+    @pytest.mark.asyncio
+    async def test_list_page_flushes_pending_first(self, wb_manager: TaskManager) -> None:
+        """Keyset sorgusu yazilmamis gecislerden sonra calisir."""
+        lt = wb_manager.long_term
+        order: list[str] = []
+        lt.bulk_update_tasks = AsyncMock(
+            side_effect=lambda batch: order.append("flush") or len(batch),
+        )
+        lt.list_tasks_page = AsyncMock(
+            side_effect=lambda **kw: order.append("query") or TaskPage(tasks=[]),
+        )
+        wb_manager._journal.record("wb-5", {"status": TaskStatus.COMPLETED.value})
+
+        await wb_manager.list_tasks_page(status=TaskStatus.COMPLETED.value)
+        assert order == ["flush", "query"]
+        assert wb_manager._journal.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_list_page_overlays_when_flush_fails(
+        self, wb_manager: TaskManager,
+    ) -> None:
+        """Flush basarisizsa sayfa gunlukle guncellenir."""
+        lt = wb_manager.long_term
+        lt.bulk_update_tasks = AsyncMock(side_effect=RuntimeError("db down"))
+        lt.list_tasks_page = AsyncMock(return_value=TaskPage(
+            tasks=[_make_task_response(task_id="wb-6")], total=1,
+        ))
+        wb_manager._journal.record("wb-6", {"status": TaskStatus.RUNNING.value})
+
+        page = await wb_manager.list_tasks_page()
+        assert page.tasks[0].status == TaskStatus.RUNNING
+        assert page.total == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_writes_through(self, wb_manager: TaskManager) -> None:
+        """Iptal, bekleyen eski gecislerle birlikte hemen yazilir."""
+        wb_manager.long_term.get_task = AsyncMock(
+            return_value=_make_task_response(task_id="wb-3"),
+        )
+        wb_manager._journal.record("wb-3", {"status": TaskStatus.RUNNING.value})
+
+        await wb_manager.cancel_task("wb-3")
+
+        batch = wb_manager.long_term.bulk_update_tasks.await_args.args[0]
+        assert batch["wb-3"]["status"] == TaskStatus.CANCELLED.value
+        assert wb_manager._journal.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_journal(self, wb_manager: TaskManager) -> None:
+        """Stop bekleyen gecisleri yazar ve metrik raporlanir."""
+        await wb_manager.start()
+        wb_manager._journal.record("wb-4", {"status": TaskStatus.RUNNING.value})
+        await wb_manager.stop()
+
+        assert wb_manager._journal.pending_count == 0
+        metrics = await wb_manager.get_metrics()
+        assert metrics.write_behind["flushed_tasks"] >= 1
+
+
 # === TestCoreExport ===
 
 
@@ -0,0 +1,357 @@
+"""UnifiedLLMClient yurutme politikasi testleri.
+
+Saglayici adaptorleri sahte async adaptorlerle degistirilir.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.llmrouter.response_cache import LLMResponseCache
+from app.core.unifiedllm.execution_policy import ExecutionPolicy, SingleFlight
+from app.core.unifiedllm.unified_client import UnifiedLLMClient
+from app.models.unifiedllm_models import (
+    ChatMessage,
+    FinishReason,
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+)
+
+
+class _FakeAdapter:
+    """Gecikmeli, sirayla hata/yanit ureten sahte adaptor."""
+
+    def __init__(
+        self,
+        name: str,
+        delay: float = 0.0,
+        failures: int = 0,
+    ) -> None:
+        self.name = name
+        self.delay = delay
+        self.failures = failures
+        self.calls = 0
+        self.cancelled = 0
+
+    async def chat(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.calls <= self.failures:
+            raise ConnectionError(f"{self.name} hata")
+        return LLMResponse(
+            provider=LLMProvider(self.name),
+            content=f"{self.name} yanit",
+        )
+
+    def get_stats(self) -> dict:
+        return {}
+
+
+def _make_client(
+    adapters: dict[str, _FakeAdapter],
+    policy: ExecutionPolicy | None = None,
+    **kwargs,
+) -> UnifiedLLMClient:
+    """Sahte adaptorlu istemci olusturur."""
+    client = UnifiedLLMClient(
+        fallback_chain=",".join(adapters),
+        policy=policy or ExecutionPolicy(backoff_base=0.0),
+        **kwargs,
+    )
+    client._adapters = dict(adapters)
+    return client
+
+
+def _request(text: str = "merhaba") -> LLMRequest:
+    """Ornek istek."""
+    return LLMRequest(
+        provider=LLMProvider.ANTHROPIC,
+        messages=[ChatMessage(content=text)],
+    )
+
+
+class TestExecutionPolicy:
+    """Geri cekilme ve hedge gecikmesi testleri."""
+
+    def test_backoff_is_bounded_and_grows(self) -> None:
+        """Bekleme [0, min(max, base*2^n)] araliginda olmali."""
+        policy = ExecutionPolicy(backoff_base=0.1, backoff_max=0.5)
+        for attempt, ceiling in ((0, 0.1), (1, 0.2), (2, 0.4), (5, 0.5)):
+            for _ in range(50):
+                assert 0.0 <= policy.backoff(attempt) <= ceiling
+
+    def test_backoff_disabled(self) -> None:
+        """backoff_base=0 beklemeyi kapatmali."""
+        assert ExecutionPolicy(backoff_base=0.0).backoff(3) == 0.0
+
+    def test_hedge_delay_uses_default_until_enough_samples(self) -> None:
+        """Yeterli ornek yoksa varsayilan gecikme kullanilmali."""
+        policy = ExecutionPolicy(hedge_default_delay=1.5, hedge_min_samples=5)
+        policy.observe("openai", 0.2)
+        assert policy.hedge_delay("openai") == 1.5
+        assert policy.hedge_delay("gemini") == 1.5
+
+    def test_hedge_delay_tracks_p95(self) -> None:
+        """Hedge gecikmesi gozlenen p95'i izlemeli."""
+        policy = ExecutionPolicy(hedge_min_samples=10, hedge_min_delay=0.0)
+        for _ in range(95):
+            policy.observe("openai", 0.3)
+        for _ in range(5):
+            policy.observe("openai", 10.0)
+        assert 0.25 <= policy.hedge_delay("openai") <= 0.5
+
+
+class TestSingleFlight:
+    """Esanli istek birlestirme testleri."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        """Ayni anahtarli esanli cagrilar tek kez calismali."""
+        flights: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def _work() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*[flights.do("k", _work) for _ in range(5)])
+
+        assert calls == 1
+        assert [r for r, _ in results] == [42] * 5
+        assert [shared for _, shared in results].count(False) == 1
+        assert flights.shared == 4
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self) -> None:
+        """Bir bekleyenin iptali digerlerini etkilememeli."""
+        flights: SingleFlight[str] = SingleFlight()
+
+        async def _work() -> str:
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        first = asyncio.create_task(flights.do("k", _work))
+        second = asyncio.create_task(flights.do("k", _work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second)[0] == "ok"
+
+
+class TestChatRetry:
+    """Seri yeniden deneme ve failover testleri."""
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff_then_succeeds(self) -> None:
+        """Basarisiz denemeler arasinda beklenip yeniden denenmeli."""
+        primary = _FakeAdapter("anthropic", failures=2)
+        policy = ExecutionPolicy(backoff_base=0.01, backoff_max=0.01)
+        client = _make_client({"anthropic": primary}, policy=policy)
+
+        response = await client.chat(_request())
+
+        assert response.content == "anthropic yanit"
+        assert primary.calls == 3
+        assert client.get_stats()["provider_errors"] == {"anthropic": 2}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_after_retries(self) -> None:
+        """Birincil tukenince yedege gecilmeli."""
+        primary = _FakeAdapter("anthropic", failures=10)
+        backup = _FakeAdapter("openai")
+        client = _make_client(
+            {"anthropic": primary, "openai": backup}, retry_count=2,
+        )
+
+        response = await client.chat(_request())
+
+        assert response.content == "openai yanit"
+        assert primary.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_all_providers_fail(self) -> None:
+        """Tum saglayicilar basarisizsa hata yaniti donmeli."""
+        client = _make_client(
+            {"anthropic": _FakeAdapter("anthropic", failures=10)}, retry_count=1,
+        )
+
+        response = await client.chat(_request())
+
+        assert response.finish_reason == FinishReason.ERROR
+        assert client.get_stats()["errors"] == 1
+
+
+class TestChatHedging:
+    """Hedge istekleri testleri."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self) -> None:
+        """Birincil gecikirse ikinci saglayici baslatilip ilk basarili alinmali."""
+        primary = _FakeAdapter("anthropic", delay=1.0)
+        backup = _FakeAdapter("openai", delay=0.01)
+        policy = ExecutionPolicy(
+            backoff_base=0.0, hedge=True, hedge_default_delay=0.02,
+        )
+        client = _make_client({"anthropic": primary, "openai": backup}, policy=policy)
+
+        started = asyncio.get_running_loop().time()
+        response = await client.chat(_request())
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert response.content == "openai yanit"
+        assert elapsed < 0.5
+        await asyncio.sleep(0)
+        assert primary.cancelled == 1
+        stats = client.get_stats()
+        assert stats["hedges"] == 1
+        assert stats["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self) -> None:
+        """Birincil hedge gecikmesinden once yanitlarsa hedge olmamali."""
+        primary = _FakeAdapter("anthropic", delay=0.0)
+        backup = _FakeAdapter("openai")
+        policy = ExecutionPolicy(backoff_base=0.0, hedge=True, hedge_default_delay=0.5)
+        client = _make_client({"anthropic": primary, "openai": backup}, policy=policy)
+
+        response = await client.chat(_request())
+
+        assert response.content == "anthropic yanit"
+        assert backup.calls == 0
+        assert client.get_stats()["hedges"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_starts_next_immediately(self) -> None:
+        """Birincil basarisiz olursa hedge gecikmesi beklenmemeli."""
+        primary = _FakeAdapter("anthropic", failures=10)
+        backup = _FakeAdapter("openai")
+        policy = ExecutionPolicy(backoff_base=0.0, hedge=True, hedge_default_delay=5.0)
+        client = _make_client(
+            {"anthropic": primary, "openai": backup}, policy=policy, retry_count=1,
+        )
+
+        response = await asyncio.wait_for(client.chat(_request()), timeout=1.0)
+
+        assert response.content == "openai yanit"
+        assert client.get_stats()["hedge_wins"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_primary_latency_recorded(self) -> None:
+        """Hedge ile iptal edilen cagri alt sinir olarak kaydedilmeli."""
+        primary = _FakeAdapter("anthropic", delay=1.0)
+        backup = _FakeAdapter("openai", delay=0.01)
+        policy = ExecutionPolicy(
+            backoff_base=0.0, hedge=True, hedge_default_delay=0.05,
+        )
+        client = _make_client({"anthropic": primary, "openai": backup}, policy=policy)
+
+        await client.chat(_request())
+        await asyncio.sleep(0.01)
+
+        latency = client.get_stats()["latency"]["anthropic"]
+        assert latency["count"] == 1
+        assert latency["censored"] == 1
+        assert latency["max"] >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_latency_recorded_per_provider(self) -> None:
+        """Basarili cagrilar saglayici gecikme histogramina yazilmali."""
+        client = _make_client({"anthropic": _FakeAdapter("anthropic")})
+
+        await client.chat(_request("a"))
+        await client.chat(_request("b"))
+
+        assert client.get_stats()["latency"]["anthropic"]["count"] == 2
+
+
+class TestChatSingleflight:
+    """Ozdes esanli isteklerin birlestirilmesi testleri."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_upstream_call(self) -> None:
+        """Ozdes esanli istekler tek upstream cagrisi yapmali."""
+        primary = _FakeAdapter("anthropic", delay=0.02)
+        client = _make_client({"anthropic": primary})
+
+        responses = await asyncio.gather(*[client.chat(_request()) for _ in range(4)])
+
+        assert primary.calls == 1
+        assert {r.content for r in responses} == {"anthropic yanit"}
+        assert len({id(r) for r in responses}) == 4
+        assert client.get_stats()["singleflight_shared"] == 3
+        assert client.get_stats()["request_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_requests_not_merged(self) -> None:
+        """Farkli istekler ayri cagrilmali."""
+        primary = _FakeAdapter("anthropic", delay=0.01)
+        client = _make_client({"anthropic": primary})
+
+        await asyncio.gather(client.chat(_request("a")), client.chat(_request("b")))
+
+        assert primary.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_singleflight_can_be_disabled(self) -> None:
+        """singleflight=False her istegi ayri gondermeli."""
+        primary = _FakeAdapter("anthropic", delay=0.01)
+        client = _make_client({"anthropic": primary}, singleflight=False)
+
+        await asyncio.gather(*[client.chat(_request()) for _ in range(3)])
+
+        assert primary.calls == 3
+
+
+class TestChatResponseCache:
+    """Yanit onbellegi ara katmani testleri."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(self) -> None:
+        """Ayni istek ikinci kez saglayiciya gitmemeli."""
+        primary = _FakeAdapter("anthropic")
+        client = _make_client(
+            {"anthropic": primary}, response_cache=LLMResponseCache(),
+        )
+
+        first = await client.chat(_request())
+        second = await client.chat(_request())
+
+        assert primary.calls == 1
+        assert second.content == first.content
+        assert second.raw_response["cache_hit"] == "exact"
+        assert client.get_stats()["response_cache"]["exact_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_cache_metadata_bypasses(self) -> None:
+        """metadata no_cache onbellegi atlamali."""
+        primary = _FakeAdapter("anthropic")
+        client = _make_client(
+            {"anthropic": primary}, response_cache=LLMResponseCache(),
+        )
+
+        await client.chat(_request())
+        request = _request()
+        request.metadata["no_cache"] = True
+        await client.chat(request)
+
+        assert primary.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_response_not_cached(self) -> None:
+        """Hata yaniti onbellege yazilmamali."""
+        primary = _FakeAdapter("anthropic", failures=100)
+        client = _make_client(
+            {"anthropic": primary}, response_cache=LLMResponseCache(),
+        )
+
+        await client.chat(_request())
+
+        assert len(client.response_cache) == 0
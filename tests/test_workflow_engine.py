@@ -7,51 +7,54 @@ WorkflowErrorHandler, ExecutionTracker,
 WorkflowOrchestrator testleri.
 """
 
+import asyncio
+import threading
 import time
 
 import pytest
 
-from app.models.workflow_engine import (
-    ActionType,
-    ExecutionRecord,
-    LoopType,
-    NodeType,
-    TriggerRecord,
-    TriggerType,
-    VariableScope,
-    WorkflowRecord,
-    WorkflowSnapshot,
-    WorkflowStatus,
-)
-
-from app.core.workflow.workflow_designer import (
-    WorkflowDesigner,
-)
-from app.core.workflow.trigger_manager import (
-    TriggerManager,
-)
 from app.core.workflow.action_executor import (
     ActionExecutor,
 )
+from app.core.workflow.condition_compiler import (
+    compile_condition,
+)
 from app.core.workflow.condition_evaluator import (
     ConditionEvaluator,
 )
-from app.core.workflow.variable_manager import (
-    VariableManager,
-)
-from app.core.workflow.loop_controller import (
-    LoopController,
-)
 from app.core.workflow.error_handler import (
     WorkflowErrorHandler,
 )
 from app.core.workflow.execution_tracker import (
     ExecutionTracker,
 )
+from app.core.workflow.loop_controller import (
+    LoopController,
+)
+from app.core.workflow.trigger_manager import (
+    TriggerManager,
+)
+from app.core.workflow.variable_manager import (
+    VariableManager,
+)
+from app.core.workflow.workflow_designer import (
+    WorkflowDesigner,
+)
 from app.core.workflow.workflow_orchestrator import (
     WorkflowOrchestrator,
 )
-
+from app.models.workflow_engine import (
+    ActionType,
+    ExecutionRecord,
+    LoopType,
+    NodeType,
+    TriggerRecord,
+    TriggerType,
+    VariableScope,
+    WorkflowRecord,
+    WorkflowSnapshot,
+    WorkflowStatus,
+)
 
 # ===================== Models =====================
 
@@ -590,6 +593,97 @@ class TestConditionEvaluator:
         assert ce.evaluation_count == 2
 
 
+class TestConditionCompiler:
+    """Derlenmis kosul testleri."""
+
+    def test_and_or_parentheses(self) -> None:
+        cond = compile_condition(
+            "score > 80 and (status == 'ok' or retries < 3)",
+        )
+        assert cond({"score": 90, "status": "bad", "retries": 1})
+        assert not cond({"score": 90, "status": "bad", "retries": 5})
+        assert not cond({"score": 70, "status": "ok"})
+
+    def test_not_and_precedence(self) -> None:
+        cond = compile_condition("a or b and not c")
+        assert cond({"a": True})
+        assert cond({"b": True, "c": False})
+        assert not cond({"b": True, "c": True})
+
+    def test_field_paths(self) -> None:
+        cond = compile_condition("user.age >= 18 and items.0.id == 7")
+        assert cond({"user": {"age": 20}, "items": [{"id": 7}]})
+        assert not cond({"user": {"age": 12}, "items": [{"id": 7}]})
+        assert not cond({"user": {}, "items": []})
+        # Duz anahtar oncelikli
+        assert compile_condition("user.age > 1")({"user.age": 5})
+
+    def test_quoted_literal(self) -> None:
+        cond = compile_condition("msg == 'a >= b'")
+        assert cond({"msg": "a >= b"})
+        assert compile_condition('code == "200"')({"code": "200"})
+
+    def test_legacy_semantics(self) -> None:
+        assert compile_condition("5 > 3")()
+        assert compile_condition("TRUE")()
+        assert not compile_condition("missing")({})
+        assert not compile_condition("name > 3")({"name": [1]})
+        # Bozuk yapi tek ifade olarak degerlendirilir
+        assert not compile_condition("(a > 1")({"a": 5})
+
+    def test_evaluate_batch_and_filter(self) -> None:
+        cond = compile_condition("v > 2")
+        rows = [{"v": i} for i in range(5)]
+        assert cond.evaluate_batch(rows) == [
+            False, False, False, True, True,
+        ]
+        assert cond.filter(rows) == rows[3:]
+
+    def test_evaluator_cache_bounded(self) -> None:
+        ce = ConditionEvaluator(max_compiled=2)
+        ce.evaluate("a > 1", {"a": 2})
+        ce.evaluate("a > 1", {"a": 0})
+        ce.evaluate("b", {})
+        ce.evaluate("c", {})
+        stats = ce.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+        assert stats["size"] == 2
+        assert ce.compile("c") is ce.compile("c")
+
+    def test_evaluator_batch(self) -> None:
+        ce = ConditionEvaluator()
+        result = ce.evaluate_batch(
+            "level >= 3 or urgent",
+            [{"level": 1}, {"level": 4}, {"level": 0, "urgent": True}],
+        )
+        assert result == [False, True, True]
+        assert ce.evaluation_count == 1
+
+    def test_loop_where(self) -> None:
+        lc = LoopController()
+        loop = lc.create_for_each(
+            "filter", [1, 5, 2, 8], action=lambda x: x * 10,
+        )
+        result = lc.execute_for_each(loop["id"], where="item > 2")
+        assert result["results"] == [50, 80]
+        assert result["matched"] == 2
+        assert result["total_items"] == 4
+
+    def test_trigger_filter(self) -> None:
+        tm = TriggerManager()
+        trigger = tm.create_trigger(
+            "wf1", TriggerType.EVENT,
+            {"event": "order", "filter": "total > 100"},
+        )
+        assert tm.fire_event("order", {"total": 50}) == []
+        assert tm.fire_event("order", {"total": 150}) == ["wf1"]
+        events = [{"total": 10}, {"total": 500}]
+        assert tm.filter_events(
+            trigger.trigger_id, events,
+        ) == [{"total": 500}]
+
+
 # ========= VariableManager =========
 
 
@@ -1145,6 +1239,208 @@ class TestWorkflowOrchestrator:
         assert result["steps_completed"] == 3
 
 
+class TestAsyncDagExecution:
+    """WorkflowOrchestrator async DAG testleri."""
+
+    @staticmethod
+    def _sleeper(orch, name, delay, log=None):
+        async def handler(**kwargs):
+            if log is not None:
+                log.append(("start", name))
+            await asyncio.sleep(delay)
+            if log is not None:
+                log.append(("end", name))
+            return {"name": name}
+
+        orch.actions.register_action(
+            name, ActionType.CUSTOM, handler,
+        )
+
+    def _diamond(self, orch, delay=0.05):
+        wf = orch.designer.create_workflow("diamond")
+        ids = {}
+        for name in ("a", "b", "c", "d"):
+            self._sleeper(orch, name, delay)
+            node = orch.designer.add_node(
+                wf.workflow_id, name, NodeType.ACTION,
+            )
+            ids[name] = node["id"]
+        for src, dst in (("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")):
+            orch.designer.add_connection(
+                wf.workflow_id, ids[src], ids[dst],
+            )
+        return wf, ids
+
+    @pytest.mark.asyncio
+    async def test_parallel_branches_overlap(self) -> None:
+        orch = WorkflowOrchestrator()
+        wf, _ = self._diamond(orch, delay=0.1)
+        start = time.monotonic()
+        result = await orch.execute_workflow_async(
+            wf.workflow_id,
+        )
+        elapsed = time.monotonic() - start
+        assert result["success"]
+        assert result["steps_completed"] == 4
+        # b ve c esanli: 3 dalga, 4 degil
+        assert elapsed < 0.38
+        assert orch.running_count == 0
+
+    @pytest.mark.asyncio
+    async def test_max_parallel_respected(self) -> None:
+        orch = WorkflowOrchestrator(max_parallel_nodes=2)
+        wf = orch.designer.create_workflow("wide")
+        active = {"now": 0, "peak": 0}
+
+        async def handler(**kwargs):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.02)
+            active["now"] -= 1
+            return {}
+
+        orch.actions.register_action(
+            "work", ActionType.CUSTOM, handler,
+        )
+        for _ in range(6):
+            orch.designer.add_node(
+                wf.workflow_id, "work", NodeType.ACTION,
+            )
+        result = await orch.execute_workflow_async(
+            wf.workflow_id,
+        )
+        assert result["steps_completed"] == 6
+        assert active["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_node_timeout_blocks_dependents(self) -> None:
+        orch = WorkflowOrchestrator()
+        wf = orch.designer.create_workflow("slow")
+        self._sleeper(orch, "slow", 1.0)
+        slow = orch.designer.add_node(
+            wf.workflow_id, "slow", NodeType.ACTION,
+            timeout=0.05,
+        )
+        after = orch.designer.add_node(
+            wf.workflow_id, "log", NodeType.ACTION,
+        )
+        orch.designer.add_connection(
+            wf.workflow_id, slow["id"], after["id"],
+        )
+        result = await orch.execute_workflow_async(
+            wf.workflow_id,
+        )
+        assert not result["success"]
+        assert result["nodes"][slow["id"]] == "timeout"
+        assert result["nodes"][after["id"]] == "blocked"
+        assert result["steps_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_condition_labels_skip_branch(self) -> None:
+        orch = WorkflowOrchestrator()
+        wf = orch.designer.create_workflow("branch")
+        check = orch.designer.add_node(
+            wf.workflow_id, "check", NodeType.CONDITION,
+            {"expression": "level > 3"},
+        )
+        yes = orch.designer.add_node(
+            wf.workflow_id, "notify", NodeType.ACTION,
+        )
+        no = orch.designer.add_node(
+            wf.workflow_id, "log", NodeType.ACTION,
+        )
+        orch.designer.add_connection(
+            wf.workflow_id, check["id"], yes["id"], "true",
+        )
+        orch.designer.add_connection(
+            wf.workflow_id, check["id"], no["id"], "false",
+        )
+        result = await orch.execute_workflow_async(
+            wf.workflow_id, input_data={"level": 5},
+        )
+        assert result["success"]
+        assert result["nodes"][yes["id"]] == "completed"
+        assert result["nodes"][no["id"]] == "skipped"
+        assert result["steps_skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_execution(self) -> None:
+        orch = WorkflowOrchestrator()
+        wf, _ = self._diamond(orch, delay=1.0)
+        task = asyncio.ensure_future(
+            orch.execute_workflow_async(wf.workflow_id),
+        )
+        await asyncio.sleep(0.05)
+        execution_id = next(iter(orch._dag_runs))
+        assert orch.cancel_execution(execution_id)
+        result = await task
+        assert not result["success"]
+        assert result["reason"] == "cancelled"
+        record = orch.tracker.get_execution(execution_id)
+        assert record.status == WorkflowStatus.CANCELLED
+        assert not orch.cancel_execution(execution_id)
+
+    @pytest.mark.asyncio
+    async def test_cycle_detected(self) -> None:
+        orch = WorkflowOrchestrator()
+        wf = orch.designer.create_workflow("loop")
+        a = orch.designer.add_node(
+            wf.workflow_id, "log", NodeType.ACTION,
+        )
+        b = orch.designer.add_node(
+            wf.workflow_id, "notify", NodeType.ACTION,
+        )
+        orch.designer.add_connection(wf.workflow_id, a["id"], b["id"])
+        orch.designer.add_connection(wf.workflow_id, b["id"], a["id"])
+        result = await orch.execute_workflow_async(
+            wf.workflow_id,
+        )
+        assert result["reason"] == "cycle_detected"
+        assert set(result["nodes"]) == {a["id"], b["id"]}
+
+    @pytest.mark.asyncio
+    async def test_critical_path(self) -> None:
+        orch = WorkflowOrchestrator()
+        wf = orch.designer.create_workflow("cp")
+        ids = {}
+        for name, delay in (("a", 0.01), ("fast", 0.01), ("slow", 0.08), ("z", 0.01)):
+            self._sleeper(orch, name, delay)
+            ids[name] = orch.designer.add_node(
+                wf.workflow_id, name, NodeType.ACTION,
+            )["id"]
+        for src, dst in (("a", "fast"), ("a", "slow"), ("fast", "z"), ("slow", "z")):
+            orch.designer.add_connection(
+                wf.workflow_id, ids[src], ids[dst],
+            )
+        result = await orch.execute_workflow_async(
+            wf.workflow_id,
+        )
+        critical = result["critical_path"]
+        assert critical["names"] == ["a", "slow", "z"]
+        assert critical["duration"] >= 0.08
+        spans = orch.tracker.get_spans(result["execution_id"])
+        assert len(spans) == 4
+
+    @pytest.mark.asyncio
+    async def test_sync_handler_runs_in_thread(self) -> None:
+        executor = ActionExecutor()
+        seen = []
+        executor.register_action(
+            "sync", ActionType.CUSTOM,
+            lambda **kw: seen.append(threading.current_thread()) or kw,
+        )
+        result = await executor.execute_async("sync", {"x": 1})
+        assert result["success"]
+        assert result["result"] == {"x": 1}
+        assert seen[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_async_nonexistent(self) -> None:
+        orch = WorkflowOrchestrator()
+        result = await orch.execute_workflow_async("invalid")
+        assert result["reason"] == "workflow_not_found"
+
+
 # ============ Config ============
 
 